@@ -0,0 +1,54 @@
+import time
+
+import numpy as np
+
+from landlab import HexModelGrid, RasterModelGrid
+from landlab.ca.celllab_cts import Transition
+from landlab.ca.hex_cts import HexCTS
+from landlab.ca.raster_cts import RasterCTS
+
+
+def _setup(cls, shape):
+    if cls is HexCTS:
+        grid = HexModelGrid(shape, node_layout="rect")
+    else:
+        grid = RasterModelGrid(shape)
+    node_state = (
+        np.random.default_rng(1945).random(grid.number_of_nodes) < 0.5
+    ).astype(int)
+    transitions = [
+        Transition((0, 1, 0), (1, 0, 0), 1.0, "", True),
+        Transition((1, 0, 0), (0, 1, 0), 1.0, "", True),
+        Transition((1, 1, 0), (0, 1, 0), 0.1),
+        Transition((0, 0, 0), (1, 0, 0), 0.1),
+    ]
+    return cls(grid, {0: "empty", 1: "full"}, transitions, node_state)
+
+
+def _events_per_second(ca, run_to):
+    ca.run(ca.current_time)  # build the grid's connectivity arrays first
+    n_popped = ca.priority_queue._n_popped
+    start = time.perf_counter()
+    ca.run(run_to)
+    elapsed = time.perf_counter() - start
+    return (ca.priority_queue._n_popped - n_popped) / elapsed
+
+
+def bench_raster_cts():
+    _setup(RasterCTS, (50, 50)).run(1.0)
+
+
+def bench_hex_cts():
+    _setup(HexCTS, (50, 50)).run(1.0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for cls in [RasterCTS, HexCTS]:
+        for shape in [(100, 100), (300, 300)]:
+            print(
+                "{0}, {1} nodes: {2:.3g} events/s".format(
+                    cls.__name__,
+                    shape[0] * shape[1],
+                    _events_per_second(_setup(cls, shape), 2.0),
+                )
+            )
@@ -0,0 +1,57 @@
+import os
+import time
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.ca.celllab_cts import Transition
+from landlab.ca.raster_cts import RasterCTS
+
+
+def _setup(shape, n_partitions, n_threads):
+    grid = RasterModelGrid(shape)
+    node_state = (
+        np.random.default_rng(1945).random(grid.number_of_nodes) < 0.5
+    ).astype(int)
+    transitions = [
+        Transition((0, 1, 0), (1, 0, 0), 1.0, "", True),
+        Transition((1, 0, 0), (0, 1, 0), 1.0, "", True),
+        Transition((1, 1, 0), (0, 1, 0), 0.1),
+        Transition((0, 0, 0), (1, 0, 0), 0.1),
+    ]
+    return RasterCTS(
+        grid,
+        {0: "empty", 1: "full"},
+        transitions,
+        node_state,
+        n_partitions=n_partitions,
+        n_threads=n_threads,
+    )
+
+
+def _run_time(ca, run_to):
+    ca.run(ca.current_time)  # build the grid's connectivity arrays first
+    start = time.perf_counter()
+    ca.run(run_to)
+    return time.perf_counter() - start
+
+
+def bench_cts_partitioned():
+    _setup((100, 100), 8, 1).run(1.0)
+
+
+def bench_cts_partitioned_threaded():
+    _setup((100, 100), 8, os.cpu_count()).run(1.0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    shape = (400, 400)
+    serial = _run_time(_setup(shape, 1, 1), 2.0)
+    print("serial: {0:.3f} s".format(serial))
+    for n_threads in sorted({1, 2, 4, 8, os.cpu_count()}):
+        elapsed = _run_time(_setup(shape, 8, n_threads), 2.0)
+        print(
+            "8 partitions, {0} threads: {1:.3f} s ({2:.2f}x serial)".format(
+                n_threads, elapsed, serial / elapsed
+            )
+        )
@@ -33,7 +33,7 @@ from numpy import (
 from landlab import HexModelGrid, LinkStatus
 from landlab.core.utils import as_id_array
 
-from ..cfuncs import get_next_event_new  # , update_link_state_new
+from ..cfuncs import reschedule_link_transitions
 
 _DEFAULT_NUM_ROWS = 5
 _DEFAULT_NUM_COLS = 5
@@ -330,6 +330,8 @@ class LatticeNormalFault(HexLatticeTectonicizer):
                 self.num_fw_rows[c] += 1
                 current_row += 1
 
+        self._setup_node_offsets()
+
         # If we're handling properties and property IDs, we need to do some
         # setup
         if self.propid is not None:
@@ -421,6 +423,60 @@ class LatticeNormalFault(HexLatticeTectonicizer):
             # this object
             self.outgoing_node = array(outgoing_node_list, dtype=int)
 
+    def _setup_node_offsets(self):
+        """Set up arrays of the nodes that change with each offset.
+
+        Examples
+        --------
+        >>> from landlab import HexModelGrid
+        >>> grid = HexModelGrid(
+        ...     (5, 5), spacing=1.0, orientation="vertical", node_layout="rect"
+        ... )
+        >>> lnf = LatticeNormalFault(0.0, grid)
+        >>> lnf.base_node
+        array([2, 7, 4, 1, 6, 3])
+        >>> lnf.node_offset_id
+        array([12, 17, 22,  9, 14, 19, 11])
+        >>> lnf.node_offset_from
+        array([ 4,  9, 14,  1,  6, 11,  3])
+        """
+        base_node = []
+        node_offset_id = []
+        node_offset_from = []
+
+        # Go column-by-column, starting from the right side
+        for c in range(self.grid.number_of_node_columns - 1, self.first_fw_col - 1, -1):
+
+            # Odd-numbered rows are shifted up in the hexagonal, vertically
+            # oriented lattice
+            row_offset = 2 - (c % 2)
+
+            # Number of base nodes in the footwall in this column (1 or 2).
+            n_base_nodes = min(self.num_fw_rows[c], row_offset)
+
+            # ID of the bottom footwall node in this column
+            bottom_node = (c // 2) + ((c % 2) * self.n_even_cols)
+
+            # The bottom 1 or 2 nodes in this column are set to rock
+            base_node.append(bottom_node + self.nc * arange(n_base_nodes))
+
+            # The other footwall nodes in this column get the contents of the
+            # nodes in the column to the left and down one or two nodes.
+            first_repl = bottom_node + n_base_nodes * self.nc
+            last_repl = (
+                first_repl + (self.num_fw_rows[c] - (n_base_nodes + 1)) * self.nc
+            )
+            indices = arange(first_repl, last_repl + 1, self.nc)
+            offset = (
+                self.nc + ((self.nc + 1) // 2) + ((c + 1) % 2) * ((self.nc + 1) % 2)
+            )
+            node_offset_id.append(indices)
+            node_offset_from.append(indices - offset)
+
+        self.base_node = as_id_array(np.concatenate(base_node))
+        self.node_offset_id = as_id_array(np.concatenate(node_offset_id))
+        self.node_offset_from = as_id_array(np.concatenate(node_offset_from))
+
     def _link_in_footwall(self, link, node_in_footwall):
         """Return True of both nodes are in footwall, False otherwise."""
         return (
@@ -509,6 +565,12 @@ class LatticeNormalFault(HexLatticeTectonicizer):
                         self.first_link_shifted_from = ln
                         self.first_link_shifted_to = ln + offset
 
+        # Links whose data are shifted, from the top of the grid down
+        self._link_shifted_from = where(
+            self.link_offset_id != arange(self.grid.number_of_links)
+        )[0][::-1]
+        self._link_shifted_to = self.link_offset_id[self._link_shifted_from]
+
     def _setup_links_to_update_after_offset(self, in_footwall):
         """Create and store array with IDs of links for which to update
         transitions after fault offset.
@@ -590,29 +652,16 @@ class LatticeNormalFault(HexLatticeTectonicizer):
         >>> pdata = np.arange(25)
         >>> ohcts = OrientedHexCTS(mg, nsd, xnlist, nsg)
         >>> lnf = LatticeNormalFault(-0.1, grid=mg)
-        >>> pq = ohcts.priority_queue._queue
-        >>> (int(1000 * pq[11][0]), pq[11][1:])
-        (752, (11, 21))
-        >>> (int(1000 * pq[12][0]), pq[12][1:])
-        (483, (9, 18))
-        >>> (int(1000 * pq[30][0]), pq[30][1:])
-        (575, (6, 14))
+        >>> pq = ohcts.priority_queue
+        >>> events = {lnk: (int(1000 * t), i) for (t, i, lnk) in pq._queue}
+        >>> events[21], events[18], events[14]
+        ((752, 11), (483, 9), (575, 6))
         >>> lnf.do_offset(ca=ohcts)
-        >>> (int(1000 * pq[48][0]), pq[48][1:])
-        (752, (11, 41))
-        >>> (int(1000 * pq[54][0]), pq[54][1:])
-        (483, (9, 38))
-        >>> (int(1000 * pq[61][0]), pq[61][1:])
-        (575, (6, 35))
+        >>> events = {lnk: (int(1000 * t), i) for (t, i, lnk) in pq._queue}
+        >>> events[41], events[38], events[35]
+        ((752, 11), (483, 9), (575, 6))
         """
-        for i in range(len(ca.priority_queue._queue)):
-            link = ca.priority_queue._queue[i][2]
-            if self.link_offset_id[link] != link:
-                ca.priority_queue._queue[i] = (
-                    ca.priority_queue._queue[i][0],
-                    ca.priority_queue._queue[i][1],
-                    self.link_offset_id[link],
-                )
+        ca.priority_queue.relink(self.link_offset_id, ca.next_update)
 
     def shift_link_states(self, ca, current_time):
         """Shift link data up and right.
@@ -657,18 +706,28 @@ class LatticeNormalFault(HexLatticeTectonicizer):
                 4, 11,  4,  0,  2,  4,  8,  6,  8,  0,  0,  0,  8,  4,  8,  4,  0,
                 0,  0,  0,  0,  0])
         """
-        num_links = self.grid.number_of_links
-        for lnk in range(num_links - 1, self.first_link_shifted_from - 1, -1):
-            link_offset = self.link_offset_id[lnk]
-            if link_offset != lnk:
-                ca.link_state[link_offset] = ca.link_state[lnk]
-                ca.next_trn_id[link_offset] = ca.next_trn_id[lnk]
-                ca.next_update[link_offset] = ca.next_update[lnk]
+        for link_data in (ca.link_state, ca.next_trn_id, ca.next_update):
+            link_data[self._link_shifted_to] = link_data[self._link_shifted_from]
 
         self.shift_scheduled_transitions(ca, current_time)
 
-        for lnk in self.links_to_update:
-            self.assign_new_link_state_and_transition(lnk, ca, current_time)
+        reschedule_link_transitions(
+            self.links_to_update,
+            as_id_array(ca.node_state),
+            self.grid.node_at_link_tail,
+            self.grid.node_at_link_head,
+            ca.link_orientation,
+            ca.num_node_states,
+            ca.num_node_states_sq,
+            ca.link_state,
+            ca.n_trn,
+            ca.priority_queue,
+            ca.next_update,
+            ca.next_trn_id,
+            ca.trn_id,
+            ca.trn_rate,
+            current_time,
+        )
 
     def do_offset(self, ca=None, current_time=0.0, rock_state=1):
         """Apply 60-degree normal-fault offset.
@@ -730,43 +789,15 @@ class LatticeNormalFault(HexLatticeTectonicizer):
             # and possibly top that are about to shift off the grid
             propids_for_incoming_nodes = self.propid[self.outgoing_node]
 
-        # We go column-by-column, starting from the right side
-        for c in range(self.grid.number_of_node_columns - 1, self.first_fw_col - 1, -1):
-
-            # Odd-numbered rows are shifted up in the hexagonal, vertically
-            # oriented lattice
-            row_offset = 2 - (c % 2)
-
-            # Number of base nodes in the footwall in this column (1 or 2).
-            n_base_nodes = min(self.num_fw_rows[c], row_offset)
-
-            # ID of the bottom footwall node in this column
-            bottom_node = (c // 2) + ((c % 2) * self.n_even_cols)
-
-            # The bottom 1 or 2 nodes in this column are set to rock
-            self.node_state[bottom_node] = rock_state
-            if n_base_nodes == 2:
-                self.node_state[bottom_node + self.nc] = rock_state
-
-            # "indices" here contains the array indices of those nodes in this
-            # column that are to be replaced by the ones in the column to the
-            # left and down one or two nodes. We do this replacement if indices
-            # contains any data.
-            first_repl = bottom_node + n_base_nodes * self.nc
-            last_repl = (
-                first_repl + (self.num_fw_rows[c] - (n_base_nodes + 1)) * self.nc
-            )
-            indices = arange(first_repl, last_repl + 1, self.nc)
-
-            if len(indices) > 0:
-                offset = (
-                    self.nc + ((self.nc + 1) // 2) + ((c + 1) % 2) * ((self.nc + 1) % 2)
-                )
-                self.node_state[indices] = self.node_state[indices - offset]
-                if self.propid is not None:
-                    self.propid[indices] = self.propid[indices - offset]
+        # Footwall nodes get the contents of the nodes to their left and down
+        # one or two nodes, and the bottom 1 or 2 nodes of each column are set
+        # to rock. All contents are read before any are written, as when
+        # shifting column-by-column from the right side.
+        self.node_state[self.node_offset_id] = self.node_state[self.node_offset_from]
+        self.node_state[self.base_node] = rock_state
 
         if self.propid is not None:
+            self.propid[self.node_offset_id] = self.propid[self.node_offset_from]
             self.propid[self.incoming_node] = propids_for_incoming_nodes
             self.prop_data[self.propid[self.incoming_node]] = self.prop_reset_value
 
@@ -825,6 +856,11 @@ class LatticeUplifter(HexLatticeTectonicizer):
                 (self.nr - 1) * self.nc
             )
 
+        # Inner nodes of each full row, from the bottom up
+        self._inner_row_nodes = self.inner_base_row_nodes + self.nc * arange(
+            self.nr
+        ).reshape((-1, 1))
+
         self._setup_links_to_update_after_uplift()
 
         # Handle option for a layer of "blocks"
@@ -977,61 +1013,47 @@ class LatticeUplifter(HexLatticeTectonicizer):
         # (or down)
         shift = nc + 2 * (nc - 1)
 
-        # Loop from top to bottom of grid, shifting the following link data
-        # upward: state of link, ID of its next transition, and time of its
-        # next transition.
-        for lnk in range(self.grid.number_of_links - 1, first_link - 1, -1):
-            ca.link_state[lnk] = ca.link_state[lnk - shift]
-            ca.next_trn_id[lnk] = ca.next_trn_id[lnk - shift]
-            ca.next_update[lnk] = ca.next_update[lnk - shift]
+        # Shift the following link data upward: state of link, ID of its next
+        # transition, and time of its next transition.
+        last_link = self.grid.number_of_links
+        for link_data in (ca.link_state, ca.next_trn_id, ca.next_update):
+            link_data[first_link:] = link_data[first_link - shift : last_link - shift]
 
-        # Sweep through event queue, shifting links upward. Do NOT shift links
+        # Shift the events in the event queue upward. Do NOT shift links
         # with IDs greater than NL - [SHIFT + (NC - 1)], because these are so
         # close to the top of the grid that either the events would refer to
         # non-existent links (>= NL) or would involve shifting an event onto
-        # an upper-boundary link. Note that because the event data are stored
-        # in a tuple, we have to replace the entire tuple (can't simply change
-        # the one item, because tuples are immutable)
+        # an upper-boundary link. Events that no longer match the (shifted)
+        # next_update times are dropped from the queue.
         first_no_shift_id = self.grid.number_of_links - (shift + (nc - 1))
-        for i in range(len(ca.priority_queue._queue)):
-            if ca.priority_queue._queue[i][2] < first_no_shift_id:
-                ca.priority_queue._queue[i] = (
-                    ca.priority_queue._queue[i][0],
-                    ca.priority_queue._queue[i][1],
-                    (ca.priority_queue._queue[i][2] + shift),
-                )
-
-        # Update state of links along the boundaries.
-        for lk in self.links_to_update:
-
-            # Update link state
-            fns = self.node_state[self.grid.node_at_link_tail[lk]]
-            tns = self.node_state[self.grid.node_at_link_head[lk]]
-            orientation = ca.link_orientation[lk]
-            new_link_state = (
-                orientation * ca.num_node_states_sq + fns * ca.num_node_states + tns
-            )
-
-            # Schedule a new transition, if applicable
-            ca.link_state[lk] = new_link_state
-            if ca.n_trn[new_link_state] > 0:
-                (event_time, this_trn_id) = get_next_event_new(
-                    lk, new_link_state, current_time, ca.n_trn, ca.trn_id, ca.trn_rate
-                )
-                ca.priority_queue.push(lk, event_time)
-                ca.next_update[lk] = event_time
-                ca.next_trn_id[lk] = this_trn_id
-            else:
-                ca.next_update[lk] = _NEVER
-                ca.next_trn_id[lk] = -1
+        new_link_id = arange(self.grid.number_of_links)
+        new_link_id[:first_no_shift_id] += shift
+        ca.priority_queue.relink(new_link_id, ca.next_update)
+
+        # Update state of links along the boundaries, and schedule new
+        # transitions, if applicable.
+        reschedule_link_transitions(
+            self.links_to_update,
+            as_id_array(self.node_state),
+            self.grid.node_at_link_tail,
+            self.grid.node_at_link_head,
+            ca.link_orientation,
+            ca.num_node_states,
+            ca.num_node_states_sq,
+            ca.link_state,
+            ca.n_trn,
+            ca.priority_queue,
+            ca.next_update,
+            ca.next_trn_id,
+            ca.trn_id,
+            ca.trn_rate,
+            current_time,
+        )
 
     def uplift_property_ids(self):
         """Shift property IDs upward by one row."""
         top_row_propid = self.propid[self.inner_top_row_nodes]
-        for r in range(self.nr - 1, 0, -1):
-            self.propid[self.inner_base_row_nodes + self.nc * r] = self.propid[
-                self.inner_base_row_nodes + self.nc * (r - 1)
-            ]
+        self.propid[self._inner_row_nodes[1:]] = self.propid[self._inner_row_nodes[:-1]]
         self.propid[self.inner_base_row_nodes] = top_row_propid
         self.prop_data[self.propid[self.inner_base_row_nodes]] = self.prop_reset_value
 
@@ -1072,12 +1094,10 @@ class LatticeUplifter(HexLatticeTectonicizer):
         """
 
         # Shift the node states up by a full row. A "full row" includes two
-        # staggered rows.
-        for r in range(self.nr - 1, 0, -1):
-            # This row gets the contents of the nodes 1 row down
-            self.node_state[self.inner_base_row_nodes + self.nc * r] = self.node_state[
-                self.inner_base_row_nodes + self.nc * (r - 1)
-            ]
+        # staggered rows. Each row gets the contents of the nodes 1 row down.
+        self.node_state[self._inner_row_nodes[1:]] = self.node_state[
+            self._inner_row_nodes[:-1]
+        ]
 
         # Fill the bottom rows with "fresh material" (code = rock_state), or
         # if using a block layer, with the right pattern of states.
@@ -83,19 +83,15 @@ node_pair : list (x number of possible link states)
     you to look up the node states and orientation corresponding to a
     particular link-state ID.
 
-priority_queue : PriorityQueue object containing event records
+priority_queue : LinkPriorityQueue object containing event records
     Queue containing all future transition events, sorted by time of occurrence
-    (from soonest to latest).
+    (from soonest to latest). The queue holds at most one event per link:
+    when a transition changes one of a link's two nodes, the link's scheduled
+    event is replaced in place, rather than being left on the queue.
 
 next_update : 1d array (x number of links)
     Time (in the future) at which the link will undergo its next transition.
-    You might notice that the update time for every scheduled transition is
-    also stored with each event in the event queue. Why store it twice?
-    Because a scheduled event might be invalidated after the event has been
-    scheduled (because another transition has changed one of a link's two
-    nodes, for example). The way to tell whether a scheduled event is still
-    valid is to compare its time with the corresponding transition time in the
-    *next_update* array. If they are different, the event is discarded.
+    This is also the time of the link's event in the event queue.
 
 link_orientation : 1d array of int8 (x number of links)
     Orientation code for each link.
@@ -124,7 +120,8 @@ import pylab as plt
 
 import landlab
 from landlab.ca.cfuncs import (
-    PriorityQueue,
+    CTSPartition,
+    LinkPriorityQueue,
     get_next_event_new,
     push_transitions_to_event_queue,
     run_cts_new,
@@ -326,6 +323,17 @@ class CellLabCTSModel(object):
     prop_reset_value : number or object, optional
         Default or initial value for a node/cell property (e.g., 0.0).
         Must be same type as *prop_data*.
+    seed : int, optional
+        Seed for random number generation.
+    n_partitions : int, optional
+        Number of pairs of horizontal strips into which the lattice is
+        divided, so that strips can be run in parallel. With 1, events are
+        processed one at a time in order of time.
+    n_threads : int, optional
+        Number of threads with which to run strips.
+    sync_interval : float, optional
+        Length of time that strips run between exchanges of events. Defaults
+        to the inverse of the fastest transition rate.
     """
 
     def __init__(
@@ -337,6 +345,9 @@ class CellLabCTSModel(object):
         prop_data=None,
         prop_reset_value=None,
         seed=0,
+        n_partitions=1,
+        n_threads=1,
+        sync_interval=None,
     ):
         """Initialize the CA model.
 
@@ -357,7 +368,25 @@ class CellLabCTSModel(object):
             Default or initial value for a node/cell property (e.g., 0.0).
             Must be same type as *prop_data*.
         seed : int, optional
-            Seed for random number generation.
+            Seed for random number generation. The serial model draws from
+            numpy's global random state, which must not be used by other
+            threads while the model runs.
+        n_partitions : int, optional
+            Number of pairs of horizontal strips into which the lattice is
+            divided, so that strips can be run in parallel. Within each
+            window of *sync_interval*, events are processed in order of time
+            within each strip, rather than across the whole lattice, and
+            strips exchange the events they have changed at the end of the
+            window. Results are reproducible for a given seed and number of
+            partitions, whatever the number of threads, and statistically
+            equivalent to those of a serial run. Transitions with a
+            *prop_update_fn* can only be used with 1 partition (the default).
+        n_threads : int, optional
+            Number of threads with which to run strips (only used with more
+            than 1 partition). Default 1.
+        sync_interval : float, optional
+            Length of time that strips run between exchanges of events.
+            Defaults to the inverse of the fastest transition rate.
         """
 
         # Keep a copy of the model grid
@@ -436,7 +465,7 @@ class CellLabCTSModel(object):
 
         # Create priority queue for events and next_update array for links
         self.next_update = self.grid.add_zeros("link", "next_update_time")
-        self.priority_queue = PriorityQueue()
+        self.priority_queue = LinkPriorityQueue(self.grid.number_of_links)
         self.next_trn_id = -np.ones(self.grid.number_of_links, dtype=np.int)
 
         # Assign link types from node types
@@ -482,6 +511,33 @@ class CellLabCTSModel(object):
             self.prop_data = prop_data
             self.prop_reset_value = prop_reset_value
 
+        # Optionally, divide the lattice into strips that run in parallel
+        if int(n_partitions) != n_partitions or n_partitions < 1:
+            raise ValueError(
+                "n_partitions must be a positive integer ({0})".format(n_partitions)
+            )
+        if int(n_threads) != n_threads or n_threads < 1:
+            raise ValueError(
+                "n_threads must be a positive integer ({0})".format(n_threads)
+            )
+        if sync_interval is None:
+            sync_interval = 1.0 / np.max(self.trn_rate)
+        elif sync_interval <= 0.0:
+            raise ValueError(
+                "sync_interval must be positive ({0})".format(sync_interval)
+            )
+        self._n_threads = int(n_threads)
+        self._sync_interval = float(sync_interval)
+
+        if n_partitions > 1:
+            if np.any(self.trn_prop_update_fn != 0):
+                raise ValueError(
+                    "transitions with a prop_update_fn require n_partitions=1"
+                )
+            self._partition = CTSPartition(self.grid, int(n_partitions), seed=seed)
+        else:
+            self._partition = None
+
     def set_node_state_grid(self, node_states):
         """Set the grid of node-state codes to node_states.
 
@@ -703,6 +759,7 @@ class CellLabCTSModel(object):
             self.next_update[link] = event_time
             self.next_trn_id[link] = trn_id
         else:
+            self.priority_queue.discard(link)
             self.next_update[link] = _NEVER
             self.next_trn_id[link] = -1
 
@@ -787,6 +844,14 @@ class CellLabCTSModel(object):
         if node_state_grid is not None:
             self.set_node_state_grid(node_state_grid)
 
+        if self._partition is not None:
+            if plot_each_transition:
+                raise ValueError("plot_each_transition requires n_partitions=1")
+            self.current_time = self._partition.run(
+                self, run_to, self._sync_interval, n_threads=self._n_threads
+            )
+            return
+
         self.current_time = run_cts_new(
             run_to,
             self.current_time,
@@ -4,6 +4,9 @@ Created on Thu Jun 30 12:40:39 2016
 @author: gtucker
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
 import numpy as np
 cimport numpy as np
 cimport cython
@@ -11,6 +14,8 @@ from landlab.grid.nodestatus import NodeStatus
 from _heapq import heappush, heappop
 from libc.stdlib cimport rand
 from libc.math cimport log
+from cpython.pycapsule cimport PyCapsule_GetPointer
+from numpy.random cimport bitgen_t
 
 
 import sys # for debug
@@ -34,6 +39,43 @@ ctypedef np.uint8_t DTYPE_UINT8_t
 cdef char _DEBUG = 0
 
 
+cdef object _fallback_bit_generator = None
+
+
+cdef bitgen_t *_global_bit_generator() except NULL:
+    """Get the bit generator behind numpy's global random state.
+
+    Random numbers drawn from it directly are the same as those that the
+    np.random functions (which share its state) would have drawn.
+
+    Draws are made without taking the lock of numpy's global RandomState, as
+    the serial run can call a prop_update_fn that itself uses np.random, and
+    the lock is not reentrant. The global random state must therefore not be
+    used by other threads while a CellLab-CTS model is being run.
+
+    The bit generator is a private attribute of the global RandomState. If
+    it is missing, a separate bit generator, seeded from np.random the first
+    time it is needed, is used instead (so only the first model run in a
+    process is then reproducible from its seed).
+    """
+    global _fallback_bit_generator
+
+    try:
+        bit_generator = np.random.mtrand._rand._bit_generator
+    except AttributeError:
+        if _fallback_bit_generator is None:
+            _fallback_bit_generator = np.random.MT19937(
+                np.random.randint(2 ** 31)
+            )
+        bit_generator = _fallback_bit_generator
+    return <bitgen_t *> PyCapsule_GetPointer(bit_generator.capsule, "BitGenerator")
+
+
+cdef inline double _exponential(bitgen_t *rng, double scale) nogil:
+    """Draw from an exponential distribution, as np.random.exponential."""
+    return scale * -log(1.0 - rng.next_double(rng.state))
+
+
 cdef class PriorityQueue:
     """
     Implements a priority queue.
@@ -54,6 +96,288 @@ cdef class PriorityQueue:
         return heappop(self._queue)
 
 
+cdef class LinkPriorityQueue:
+    """A priority queue of transition events, keyed by link ID.
+
+    Each link has at most one scheduled event. Pushing an event for a link
+    that is already in the queue reschedules it in place (in O(log n) time),
+    so the queue never holds stale events. Ties in time are broken by the
+    order in which the events were (last) pushed, so events come off the
+    queue in the same order as they would from a :py:class:`PriorityQueue`
+    that discards stale events.
+
+    The event time, link ID and push order are stored in arrays that are
+    allocated when the queue is created, so that scheduling and popping
+    events creates no Python objects. The transition that will occur at a
+    link is not stored in the queue; it is in the *next_trn_id* array of
+    the model. The numbers of events pushed and popped so far are kept in
+    ``_index`` and ``_n_popped``.
+
+    Parameters
+    ----------
+    number_of_links : int
+        The number of links; links must be in the range
+        ``[0, number_of_links)``.
+    capacity : int, optional
+        The maximum number of events in the queue. The default is
+        *number_of_links*.
+
+    Examples
+    --------
+    >>> from landlab.ca.cfuncs import LinkPriorityQueue
+    >>> pq = LinkPriorityQueue(6)
+    >>> pq.push(2, 2.2)
+    >>> pq.push(5, 5.5)
+    >>> pq.push(0, 0.11)
+    >>> len(pq)
+    3
+    >>> pq.pop()
+    (0.11, 2, 0)
+
+    Pushing a link that is already in the queue reschedules its event.
+
+    >>> pq.push(5, 1.1)
+    >>> len(pq)
+    2
+    >>> pq.pop()
+    (1.1, 3, 5)
+    >>> pq.discard(2)
+    >>> len(pq)
+    0
+    """
+    cdef DTYPE_t[:] _time
+    cdef DTYPE_INT_t[:] _order
+    cdef DTYPE_INT_t[:] _link
+    cdef DTYPE_INT_t[:] _position
+    cdef public DTYPE_INT_t _size
+    cdef public DTYPE_INT_t _index
+    cdef public DTYPE_INT_t _n_popped
+
+    def __init__(self, number_of_links, capacity=None):
+        if capacity is None:
+            capacity = number_of_links
+        self._time = np.empty(capacity, dtype=np.double)
+        self._order = np.empty(capacity, dtype=np.int_)
+        self._link = np.empty(capacity, dtype=np.int_)
+        self._position = np.full(number_of_links, -1, dtype=np.int_)
+        self._size = 0
+        self._index = 0
+        self._n_popped = 0
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, DTYPE_INT_t link):
+        return 0 <= link < self._position.shape[0] and self._position[link] != -1
+
+    @property
+    def _queue(self):
+        """Scheduled events, as (time, order, link) tuples, in heap order."""
+        cdef DTYPE_INT_t slot
+        cdef list events = []
+
+        for slot in range(self._size):
+            events.append((self._time[slot], self._order[slot], self._link[slot]))
+        return events
+
+    def push(self, link, time):
+        """Schedule an event at a link, or reschedule the link's event."""
+        if not 0 <= link < self._position.shape[0]:
+            raise ValueError("link is out of range: {0}".format(link))
+        if link not in self and self._size == self._link.shape[0]:
+            raise IndexError("push onto a full priority queue")
+        self._push(link, time)
+
+    def pop(self):
+        """Remove and return the soonest event as (time, order, link)."""
+        if self._size == 0:
+            raise IndexError("pop from an empty priority queue")
+        event = (self._time[0], self._order[0], self._link[0])
+        self._pop()
+        return event
+
+    def discard(self, link):
+        """Remove the event scheduled at a link, if there is one."""
+        if link in self:
+            self._discard(link)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def relink(self, const DTYPE_INT_t[:] new_link_at_link,
+               const DTYPE_t[:] next_update):
+        """Move scheduled events to new links.
+
+        The event scheduled at link ``i`` moves to link
+        ``new_link_at_link[i]``. Events whose time no longer matches the
+        *next_update* time of their new link are dropped; of those that
+        remain, at most one event per link is kept.
+
+        Parameters
+        ----------
+        new_link_at_link : ndarray of int
+            New ID of each link.
+        next_update : ndarray of float
+            Time of the next transition at each link, after the move.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from landlab.ca.cfuncs import LinkPriorityQueue
+        >>> pq = LinkPriorityQueue(4)
+        >>> pq.push(0, 1.0)
+        >>> pq.push(1, 2.0)
+        >>> pq.push(3, 0.5)
+        >>> next_update = np.array([9.0, 1.0, 2.0, 9.0])
+        >>> pq.relink(np.array([1, 2, 2, 3]), next_update)
+        >>> pq.pop(), pq.pop()
+        ((1.0, 0, 1), (2.0, 1, 2))
+        >>> len(pq)
+        0
+        """
+        cdef DTYPE_INT_t size = self._size
+        cdef DTYPE_INT_t slot, new_link
+        cdef DTYPE_INT_t n_kept = 0
+
+        for slot in range(size):
+            self._position[self._link[slot]] = -1
+
+        for slot in range(size):
+            new_link = new_link_at_link[self._link[slot]]
+            if (
+                self._time[slot] == next_update[new_link]
+                and self._position[new_link] == -1
+            ):
+                self._time[n_kept] = self._time[slot]
+                self._order[n_kept] = self._order[slot]
+                self._link[n_kept] = new_link
+                self._position[new_link] = n_kept
+                n_kept += 1
+        self._size = n_kept
+
+        self._heapify()
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _push(self, DTYPE_INT_t link, DTYPE_t time) nogil:
+        cdef DTYPE_INT_t slot = self._position[link]
+
+        if slot == -1:
+            slot = self._size
+            self._size += 1
+            self._link[slot] = link
+            self._position[link] = slot
+        self._time[slot] = time
+        self._order[slot] = self._index
+        self._index += 1
+
+        self._sift_down(self._sift_up(slot))
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _clear(self) nogil:
+        cdef DTYPE_INT_t slot
+
+        for slot in range(self._size):
+            self._position[self._link[slot]] = -1
+        self._size = 0
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _append(self, DTYPE_INT_t link, DTYPE_t time,
+                      DTYPE_INT_t order) nogil:
+        """Add an event at a link that is not queued, without sifting."""
+        self._time[self._size] = time
+        self._order[self._size] = order
+        self._link[self._size] = link
+        self._position[link] = self._size
+        self._size += 1
+
+    cdef void _heapify(self) nogil:
+        cdef DTYPE_INT_t slot
+
+        for slot in range(self._size // 2 - 1, -1, -1):
+            self._sift_down(slot)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef DTYPE_INT_t _pop(self) nogil:
+        cdef DTYPE_INT_t top = self._link[0]
+
+        self._discard(top)
+        self._n_popped += 1
+        return top
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _discard(self, DTYPE_INT_t link) nogil:
+        cdef DTYPE_INT_t slot = self._position[link]
+        cdef DTYPE_INT_t last
+
+        if slot == -1:
+            return
+        self._position[link] = -1
+        self._size -= 1
+        last = self._size
+        if slot != last:
+            self._time[slot] = self._time[last]
+            self._order[slot] = self._order[last]
+            self._link[slot] = self._link[last]
+            self._position[self._link[slot]] = slot
+            self._sift_down(self._sift_up(slot))
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef bint _less(self, DTYPE_INT_t slot_a, DTYPE_INT_t slot_b) nogil:
+        return self._time[slot_a] < self._time[slot_b] or (
+            self._time[slot_a] == self._time[slot_b]
+            and self._order[slot_a] < self._order[slot_b]
+        )
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _swap(self, DTYPE_INT_t slot_a, DTYPE_INT_t slot_b) nogil:
+        cdef DTYPE_t time = self._time[slot_a]
+        cdef DTYPE_INT_t order = self._order[slot_a]
+        cdef DTYPE_INT_t link = self._link[slot_a]
+
+        self._time[slot_a] = self._time[slot_b]
+        self._order[slot_a] = self._order[slot_b]
+        self._link[slot_a] = self._link[slot_b]
+        self._time[slot_b] = time
+        self._order[slot_b] = order
+        self._link[slot_b] = link
+        self._position[self._link[slot_a]] = slot_a
+        self._position[self._link[slot_b]] = slot_b
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef DTYPE_INT_t _sift_up(self, DTYPE_INT_t slot) nogil:
+        cdef DTYPE_INT_t parent
+
+        while slot > 0:
+            parent = (slot - 1) // 2
+            if not self._less(slot, parent):
+                break
+            self._swap(slot, parent)
+            slot = parent
+        return slot
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef DTYPE_INT_t _sift_down(self, DTYPE_INT_t slot) nogil:
+        cdef DTYPE_INT_t child = 2 * slot + 1
+
+        while child < self._size:
+            if child + 1 < self._size and self._less(child + 1, child):
+                child += 1
+            if not self._less(child, slot):
+                break
+            self._swap(slot, child)
+            slot = child
+            child = 2 * slot + 1
+        return slot
+
+
 cdef class Event:
     """
     Represents a transition event at a link. The transition occurs at a given
@@ -245,7 +569,7 @@ cpdef update_link_states_and_transitions_new(
                              np.ndarray[DTYPE_INT8_t, ndim=1] bnd_lnk,
                              np.ndarray[DTYPE_INT_t, ndim=1] link_state,
                              np.ndarray[DTYPE_INT_t, ndim=1] n_trn,
-                             priority_queue,
+                             LinkPriorityQueue priority_queue,
                              np.ndarray[DTYPE_t, ndim=1] next_update,
                              np.ndarray[DTYPE_INT_t, ndim=1] next_trn_id,
                              np.ndarray[DTYPE_INT_t, ndim=2] trn_id,
@@ -268,6 +592,7 @@ cpdef update_link_states_and_transitions_new(
         """
         cdef int current_state
         cdef int i, j
+        cdef bitgen_t *rng = _global_bit_generator()
 
         for j in range(len(active_links)):
             i = active_links[j]
@@ -283,14 +608,61 @@ cpdef update_link_states_and_transitions_new(
                                   node_at_link_head, link_orientation,
                                   num_node_states, num_node_states_sq,
                                   link_state, n_trn, priority_queue, next_update,
-                                  next_trn_id, trn_id, trn_rate)
+                                  next_trn_id, trn_id, trn_rate, rng)
+
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef void reschedule_link_transitions(const DTYPE_INT_t[:] links,
+                                       const DTYPE_INT_t[:] node_state,
+                                       const DTYPE_INT_t[:] node_at_link_tail,
+                                       const DTYPE_INT_t[:] node_at_link_head,
+                                       const DTYPE_INT8_t[:] link_orientation,
+                                       DTYPE_INT_t num_node_states,
+                                       DTYPE_INT_t num_node_states_sq,
+                                       DTYPE_INT_t[:] link_state,
+                                       const DTYPE_INT_t[:] n_trn,
+                                       LinkPriorityQueue priority_queue,
+                                       DTYPE_t[:] next_update,
+                                       DTYPE_INT_t[:] next_trn_id,
+                                       const DTYPE_INT_t[:, :] trn_id,
+                                       const DTYPE_t[:] trn_rate,
+                                       DTYPE_t current_time):
+    """Set link states from node states, and schedule new transitions.
+
+    Every link in *links* gets a new transition (or none, if its state has
+    none), whether or not its state has changed. Links are handled in order,
+    drawing from numpy's global random state as update_link_state_new does.
+    """
+    cdef DTYPE_INT_t i, link, new_link_state
+    cdef double event_time
+    cdef bitgen_t *rng = _global_bit_generator()
+
+    for i in range(links.shape[0]):
+        link = links[i]
+        new_link_state = (
+            link_orientation[link] * num_node_states_sq
+            + node_state[node_at_link_tail[link]] * num_node_states
+            + node_state[node_at_link_head[link]])
+
+        link_state[link] = new_link_state
+        if n_trn[new_link_state] > 0:
+            next_trn_id[link] = _next_event(new_link_state, current_time,
+                                            n_trn, trn_id, trn_rate, rng,
+                                            &event_time)
+            next_update[link] = event_time
+            priority_queue._push(link, event_time)
+        else:
+            priority_queue._discard(link)
+            next_update[link] = _NEVER
+            next_trn_id[link] = -1
+
 @cython.boundscheck(True)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cpdef update_node_states(np.ndarray[DTYPE_INT_t, ndim=1] node_state,
-                       np.ndarray[DTYPE_UINT8_t, ndim=1] status_at_node,
+cpdef update_node_states(DTYPE_INT_t[:] node_state,
+                       const DTYPE_UINT8_t[:] status_at_node,
                        DTYPE_INT_t tail_node,
                        DTYPE_INT_t head_node,
                        DTYPE_INT_t new_link_state,
@@ -424,24 +796,48 @@ cpdef get_next_event_new(DTYPE_INT_t link, DTYPE_INT_t current_state,
     current state.
     """
     cdef int this_trn_id
+    cdef double next_time
+
+    this_trn_id = _next_event(current_state, current_time, n_trn, trn_id,
+                              trn_rate, _global_bit_generator(), &next_time)
+
+    return (next_time, this_trn_id)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int _next_event(DTYPE_INT_t current_state,
+                     DTYPE_t current_time,
+                     const DTYPE_INT_t[:] n_trn,
+                     const DTYPE_INT_t[:, :] trn_id,
+                     const DTYPE_t[:] trn_rate,
+                     bitgen_t *rng,
+                     double *event_time) nogil:
+    """Choose the next transition out of a link state.
+
+    Same as get_next_event_new, but stores the time of the transition in
+    *event_time* and returns the ID of the transition, rather than
+    returning both as a tuple. Random numbers are drawn from *rng*.
+    """
+    cdef int this_trn_id
     cdef int i
-    cdef char propswap
     cdef double next_time, this_next
 
     # Find next event time for each potential transition
     if n_trn[current_state] == 1:
         this_trn_id = trn_id[current_state, 0]
-        next_time = np.random.exponential(1.0 / trn_rate[this_trn_id])
+        next_time = _exponential(rng, 1.0 / trn_rate[this_trn_id])
     else:
         next_time = _NEVER
         this_trn_id = -1
         for i in range(n_trn[current_state]):
-            this_next = np.random.exponential(1.0 / trn_rate[trn_id[current_state][i]])
+            this_next = _exponential(rng, 1.0 / trn_rate[trn_id[current_state, i]])
             if this_next < next_time:
                 next_time = this_next
                 this_trn_id = trn_id[current_state, i]
 
-    return (next_time + current_time, this_trn_id)
+    event_time[0] = next_time + current_time
+    return this_trn_id
 
 
 cpdef push_transitions_to_event_queue(int number_of_active_links,
@@ -452,25 +848,28 @@ cpdef push_transitions_to_event_queue(int number_of_active_links,
                                       np.ndarray[DTYPE_t, ndim=1] trn_rate,
                                       np.ndarray[DTYPE_t, ndim=1] next_update,
                                       np.ndarray[DTYPE_INT_t, ndim=1] next_trn_id,
-                                      PriorityQueue priority_queue):
+                                      LinkPriorityQueue priority_queue):
     """
     Initializes the event queue by creating transition events for each
     cell pair that has one or more potential transitions and pushing these
     onto the queue. Also records scheduled transition times in the
     self.next_update array.
     """
+    cdef int i, j
+    cdef double ev_time
+    cdef bitgen_t *rng = _global_bit_generator()
+
     for j in range(number_of_active_links):
 
         i = active_links[j]
         if n_trn[link_state[i]] > 0:
-            (ev_time, this_trn_id) = get_next_event_new(i, link_state[i], 0.0,
-                                                        n_trn, trn_id,
-                                                        trn_rate)
-            priority_queue.push(i, ev_time)
+            next_trn_id[i] = _next_event(link_state[i], 0.0, n_trn, trn_id,
+                                         trn_rate, rng, &ev_time)
+            priority_queue._push(i, ev_time)
             next_update[i] = ev_time
-            next_trn_id[i] = this_trn_id
 
         else:
+            priority_queue._discard(i)
             next_update[i] = _NEVER
 
 @cython.boundscheck(True)
@@ -529,24 +928,25 @@ cdef void update_link_state(DTYPE_INT_t link, DTYPE_INT_t new_link_state,
         next_update[link] = _NEVER
 
 
-@cython.boundscheck(True)
+@cython.boundscheck(False)
 @cython.wraparound(False)
 cdef void update_link_state_new(DTYPE_INT_t link, DTYPE_INT_t new_link_state,
                       DTYPE_t current_time,
-                      np.ndarray[DTYPE_INT8_t, ndim=1] bnd_lnk,
-                      np.ndarray[DTYPE_INT_t, ndim=1] node_state,
-                      np.ndarray[DTYPE_INT_t, ndim=1] node_at_link_tail,
-                      np.ndarray[DTYPE_INT_t, ndim=1] node_at_link_head,
-                      np.ndarray[DTYPE_INT8_t, ndim=1] link_orientation,
+                      const DTYPE_INT8_t[:] bnd_lnk,
+                      DTYPE_INT_t[:] node_state,
+                      const DTYPE_INT_t[:] node_at_link_tail,
+                      const DTYPE_INT_t[:] node_at_link_head,
+                      const DTYPE_INT8_t[:] link_orientation,
                       DTYPE_INT_t num_node_states,
                       DTYPE_INT_t num_node_states_sq,
-                      np.ndarray[DTYPE_INT_t, ndim=1] link_state,
-                      np.ndarray[DTYPE_INT_t, ndim=1] n_trn,
-                      PriorityQueue priority_queue,
-                      np.ndarray[DTYPE_t, ndim=1] next_update,
-                      np.ndarray[DTYPE_INT_t, ndim=1] next_trn_id,
-                      np.ndarray[DTYPE_INT_t, ndim=2] trn_id,
-                      np.ndarray[DTYPE_t, ndim=1] trn_rate):
+                      DTYPE_INT_t[:] link_state,
+                      const DTYPE_INT_t[:] n_trn,
+                      LinkPriorityQueue priority_queue,
+                      DTYPE_t[:] next_update,
+                      DTYPE_INT_t[:] next_trn_id,
+                      const DTYPE_INT_t[:, :] trn_id,
+                      const DTYPE_t[:] trn_rate,
+                      bitgen_t *rng):
     """
     Implements a link transition by updating the current state of the link
     and (if appropriate) choosing the next transition event and pushing it
@@ -562,13 +962,46 @@ cdef void update_link_state_new(DTYPE_INT_t link, DTYPE_INT_t new_link_state,
         Current time in simulation
     (see celllab_cts.py for other parameters)
     """
-    cdef int fns, tns
-    cdef int this_trn_id
-    cdef int orientation
-
     if _DEBUG:
         print(('ULSN', link, link_state[link], new_link_state, current_time))
 
+    if _set_link_state(link, new_link_state, current_time, bnd_lnk,
+                       node_state, node_at_link_tail, node_at_link_head,
+                       link_orientation, num_node_states, num_node_states_sq,
+                       link_state, n_trn, next_update, next_trn_id, trn_id,
+                       trn_rate, rng):
+        priority_queue._push(link, next_update[link])
+    else:
+        priority_queue._discard(link)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef bint _set_link_state(DTYPE_INT_t link, DTYPE_INT_t new_link_state,
+                          DTYPE_t current_time,
+                          const DTYPE_INT8_t[:] bnd_lnk,
+                          const DTYPE_INT_t[:] node_state,
+                          const DTYPE_INT_t[:] node_at_link_tail,
+                          const DTYPE_INT_t[:] node_at_link_head,
+                          const DTYPE_INT8_t[:] link_orientation,
+                          DTYPE_INT_t num_node_states,
+                          DTYPE_INT_t num_node_states_sq,
+                          DTYPE_INT_t[:] link_state,
+                          const DTYPE_INT_t[:] n_trn,
+                          DTYPE_t[:] next_update,
+                          DTYPE_INT_t[:] next_trn_id,
+                          const DTYPE_INT_t[:, :] trn_id,
+                          const DTYPE_t[:] trn_rate,
+                          bitgen_t *rng) nogil:
+    """Set the state of a link and choose its next transition.
+
+    Same as update_link_state_new, but leaves the event queue alone.
+    Returns True if a transition was scheduled at the link.
+    """
+    cdef int fns, tns
+    cdef int orientation
+    cdef double event_time
+
     # If the link connects to a boundary, we might have a different state
     # than the one we planned
     if bnd_lnk[link]:
@@ -577,20 +1010,17 @@ cdef void update_link_state_new(DTYPE_INT_t link, DTYPE_INT_t new_link_state,
         orientation = link_orientation[link]
         new_link_state = orientation * num_node_states_sq + \
             fns * num_node_states + tns
-        if _DEBUG:
-            print((' bnd True', new_link_state))
 
     link_state[link] = new_link_state
     if n_trn[new_link_state] > 0:
-        (event_time, this_trn_id) = get_next_event_new(link, new_link_state,
-                                                       current_time,
-                                                       n_trn, trn_id, trn_rate)
-        priority_queue.push(link, event_time)
+        next_trn_id[link] = _next_event(new_link_state, current_time, n_trn,
+                                        trn_id, trn_rate, rng, &event_time)
         next_update[link] = event_time
-        next_trn_id[link] = this_trn_id
+        return True
     else:
         next_update[link] = _NEVER
         next_trn_id[link] = -1
+        return False
 
 @cython.boundscheck(True)
 @cython.wraparound(False)
@@ -766,26 +1196,26 @@ cdef void do_transition(Event event,
 #@cython.wraparound(False)
 cpdef void do_transition_new(DTYPE_INT_t event_link,
                   DTYPE_t event_time,
-                  PriorityQueue priority_queue,
-                  np.ndarray[DTYPE_t, ndim=1] next_update,
-                  np.ndarray[DTYPE_INT_t, ndim=1] node_at_link_tail,
-                  np.ndarray[DTYPE_INT_t, ndim=1] node_at_link_head,
-                  np.ndarray[DTYPE_INT_t, ndim=1] node_state,
-                  np.ndarray[DTYPE_INT_t, ndim=1] next_trn_id,
-                  np.ndarray[DTYPE_INT_t, ndim=1] trn_to,
-                  np.ndarray[DTYPE_UINT8_t, ndim=1] status_at_node,
+                  LinkPriorityQueue priority_queue,
+                  DTYPE_t[:] next_update,
+                  const DTYPE_INT_t[:] node_at_link_tail,
+                  const DTYPE_INT_t[:] node_at_link_head,
+                  DTYPE_INT_t[:] node_state,
+                  DTYPE_INT_t[:] next_trn_id,
+                  const DTYPE_INT_t[:] trn_to,
+                  const DTYPE_UINT8_t[:] status_at_node,
                   DTYPE_INT_t num_node_states,
                   DTYPE_INT_t num_node_states_sq,
-                  np.ndarray[DTYPE_INT8_t, ndim=1] bnd_lnk,
-                  np.ndarray[DTYPE_INT8_t, ndim=1] link_orientation,
-                  np.ndarray[DTYPE_INT_t, ndim=1] link_state,
-                  np.ndarray[DTYPE_INT_t, ndim=1] n_trn,
-                  np.ndarray[DTYPE_INT_t, ndim=2] trn_id,
-                  np.ndarray[DTYPE_t, ndim=1] trn_rate,
-                  np.ndarray[DTYPE_INT_t, ndim=2] links_at_node,
-                  np.ndarray[DTYPE_INT8_t, ndim=2] active_link_dirs_at_node,
-                  np.ndarray[DTYPE_INT8_t, ndim=1] trn_propswap,
-                  np.ndarray[DTYPE_INT_t, ndim=1] propid,
+                  const DTYPE_INT8_t[:] bnd_lnk,
+                  const DTYPE_INT8_t[:] link_orientation,
+                  DTYPE_INT_t[:] link_state,
+                  const DTYPE_INT_t[:] n_trn,
+                  const DTYPE_INT_t[:, :] trn_id,
+                  const DTYPE_t[:] trn_rate,
+                  const DTYPE_INT_t[:, :] links_at_node,
+                  const DTYPE_INT8_t[:, :] active_link_dirs_at_node,
+                  const DTYPE_INT8_t[:] trn_propswap,
+                  DTYPE_INT_t[:] propid,
                   object prop_data,
                   DTYPE_INT_t prop_reset_value,
                   object trn_prop_update_fn,
@@ -821,6 +1251,51 @@ cpdef void do_transition_new(DTYPE_INT_t event_link,
     3. Update the states of the other links attached to the two nodes,
        choose their next transitions, and push them on the event queue.
     """
+    _do_transition(event_link, event_time, priority_queue, next_update,
+                   node_at_link_tail, node_at_link_head, node_state,
+                   next_trn_id, trn_to, status_at_node, num_node_states,
+                   num_node_states_sq, bnd_lnk, link_orientation, link_state,
+                   n_trn, trn_id, trn_rate, links_at_node,
+                   active_link_dirs_at_node, trn_propswap, propid, prop_data,
+                   prop_reset_value, trn_prop_update_fn, this_cts_model,
+                   _global_bit_generator(), plot_each_transition, plotter)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _do_transition(DTYPE_INT_t event_link,
+                  DTYPE_t event_time,
+                  LinkPriorityQueue priority_queue,
+                  DTYPE_t[:] next_update,
+                  const DTYPE_INT_t[:] node_at_link_tail,
+                  const DTYPE_INT_t[:] node_at_link_head,
+                  DTYPE_INT_t[:] node_state,
+                  DTYPE_INT_t[:] next_trn_id,
+                  const DTYPE_INT_t[:] trn_to,
+                  const DTYPE_UINT8_t[:] status_at_node,
+                  DTYPE_INT_t num_node_states,
+                  DTYPE_INT_t num_node_states_sq,
+                  const DTYPE_INT8_t[:] bnd_lnk,
+                  const DTYPE_INT8_t[:] link_orientation,
+                  DTYPE_INT_t[:] link_state,
+                  const DTYPE_INT_t[:] n_trn,
+                  const DTYPE_INT_t[:, :] trn_id,
+                  const DTYPE_t[:] trn_rate,
+                  const DTYPE_INT_t[:, :] links_at_node,
+                  const DTYPE_INT8_t[:, :] active_link_dirs_at_node,
+                  const DTYPE_INT8_t[:] trn_propswap,
+                  DTYPE_INT_t[:] propid,
+                  object prop_data,
+                  DTYPE_INT_t prop_reset_value,
+                  object trn_prop_update_fn,
+                  object this_cts_model,
+                  bitgen_t *rng,
+                  plot_each_transition=False,
+                  plotter=None):
+    """Implement a state transition (see do_transition_new).
+
+    Random numbers are drawn from *rng*.
+    """
     cdef int index
     cdef int tail_node, head_node  # IDs of tail and head nodes at link
     cdef int old_tail_node_state
@@ -878,7 +1353,7 @@ cpdef void do_transition_new(DTYPE_INT_t event_link,
                               node_at_link_head, link_orientation,
                               num_node_states, num_node_states_sq,
                               link_state, n_trn, priority_queue, next_update,
-                              next_trn_id, trn_id, trn_rate)
+                              next_trn_id, trn_id, trn_rate, rng)
 
         # Next, when the state of one of the link's nodes changes, we have
         # to update the states of the OTHER links attached to it. This
@@ -905,7 +1380,7 @@ cpdef void do_transition_new(DTYPE_INT_t event_link,
                                           node_at_link_head, link_orientation,
                                           num_node_states, num_node_states_sq,
                                           link_state, n_trn, priority_queue, next_update,
-                                          next_trn_id, trn_id, trn_rate)
+                                          next_trn_id, trn_id, trn_rate, rng)
 
         if node_state[head_node] != old_head_node_state:
 
@@ -928,7 +1403,7 @@ cpdef void do_transition_new(DTYPE_INT_t event_link,
                                           node_at_link_head, link_orientation,
                                           num_node_states, num_node_states_sq,
                                           link_state, n_trn, priority_queue, next_update,
-                                          next_trn_id, trn_id, trn_rate)
+                                          next_trn_id, trn_id, trn_rate, rng)
 
         # If requested, display a plot of the grid
         if plot_each_transition and (plotter is not None):
@@ -952,26 +1427,26 @@ cpdef void do_transition_new(DTYPE_INT_t event_link,
                     this_cts_model, tail_node, head_node, event_time)
 
 cpdef double run_cts_new(double run_to, double current_time,
-                     PriorityQueue priority_queue,
-                     np.ndarray[DTYPE_t, ndim=1] next_update,
-                     np.ndarray[DTYPE_INT_t, ndim=1] node_at_link_tail,
-                     np.ndarray[DTYPE_INT_t, ndim=1] node_at_link_head,
-                     np.ndarray[DTYPE_INT_t, ndim=1] node_state,
-                     np.ndarray[DTYPE_INT_t, ndim=1] next_trn_id,
-                     np.ndarray[DTYPE_INT_t, ndim=1] trn_to,
-                     np.ndarray[DTYPE_UINT8_t, ndim=1] status_at_node,
+                     LinkPriorityQueue priority_queue,
+                     DTYPE_t[:] next_update,
+                     const DTYPE_INT_t[:] node_at_link_tail,
+                     const DTYPE_INT_t[:] node_at_link_head,
+                     DTYPE_INT_t[:] node_state,
+                     DTYPE_INT_t[:] next_trn_id,
+                     const DTYPE_INT_t[:] trn_to,
+                     const DTYPE_UINT8_t[:] status_at_node,
                      DTYPE_INT_t num_node_states,
                      DTYPE_INT_t num_node_states_sq,
-                     np.ndarray[DTYPE_INT8_t, ndim=1] bnd_lnk,
-                     np.ndarray[DTYPE_INT8_t, ndim=1] link_orientation,
-                     np.ndarray[DTYPE_INT_t, ndim=1] link_state,
-                     np.ndarray[DTYPE_INT_t, ndim=1] n_trn,
-                     np.ndarray[DTYPE_INT_t, ndim=2] trn_id,
-                     np.ndarray[DTYPE_t, ndim=1] trn_rate,
-                     np.ndarray[DTYPE_INT_t, ndim=2] links_at_node,
-                     np.ndarray[DTYPE_INT8_t, ndim=2] active_link_dirs_at_node,
-                     np.ndarray[DTYPE_INT8_t, ndim=1] trn_propswap,
-                     np.ndarray[DTYPE_INT_t, ndim=1] propid,
+                     const DTYPE_INT8_t[:] bnd_lnk,
+                     const DTYPE_INT8_t[:] link_orientation,
+                     DTYPE_INT_t[:] link_state,
+                     const DTYPE_INT_t[:] n_trn,
+                     const DTYPE_INT_t[:, :] trn_id,
+                     const DTYPE_t[:] trn_rate,
+                     const DTYPE_INT_t[:, :] links_at_node,
+                     const DTYPE_INT8_t[:, :] active_link_dirs_at_node,
+                     const DTYPE_INT8_t[:] trn_propswap,
+                     DTYPE_INT_t[:] propid,
                      object prop_data,
                      DTYPE_INT_t prop_reset_value,
                      trn_prop_update_fn,
@@ -992,25 +1467,25 @@ cpdef double run_cts_new(double run_to, double current_time,
         Needed if caller wants to plot after every transition
     (see celllab_cts.py for other parameters)
     """
-    import sys
     cdef double ev_time
-    cdef int ev_idx
     cdef int ev_link
+    cdef bitgen_t *rng = _global_bit_generator()
 
     # Continue until we've run out of either time or events
-    while current_time < run_to and priority_queue._queue:
+    while current_time < run_to and priority_queue._size > 0:
 
         if _DEBUG:
             print('current time = ', current_time)
 
         # Is there an event scheduled to occur within this run?
-        if priority_queue._queue[0][0] <= run_to:
+        if priority_queue._time[0] <= run_to:
 
             # If so, pick the next transition event from the event queue
-            (ev_time, ev_idx, ev_link) = priority_queue.pop()
+            ev_time = priority_queue._time[0]
+            ev_link = priority_queue._pop()
 
             # ... and execute the transition
-            do_transition_new(ev_link, ev_time, priority_queue, next_update,
+            _do_transition(ev_link, ev_time, priority_queue, next_update,
                               node_at_link_tail,
                               node_at_link_head,
                               node_state,
@@ -1032,6 +1507,7 @@ cpdef double run_cts_new(double run_to, double current_time,
                               prop_reset_value,
                               trn_prop_update_fn,
                               this_cts_model,
+                              rng,
                               plot_each_transition,
                               plotter)
 
@@ -1046,6 +1522,380 @@ cpdef double run_cts_new(double run_to, double current_time,
     return current_time
 
 
+cdef class CTSPartition:
+    """Divide a CellLab-CTS lattice into strips that can run in parallel.
+
+    The rows of nodes are split into ``2 * n_partitions`` horizontal strips,
+    and each link belongs to the strip of its lower node. Every strip has its
+    own event queue and its own random number generator. Time advances in
+    windows: in each window the even strips process their events, and then
+    the odd ones do. Strips are at least twice as thick as the number of rows
+    a link spans, so strips that run at the same time never touch the same
+    nodes or links, and can be processed concurrently. A transition that
+    changes a link of a neighboring strip reschedules that link's event once
+    its own strip has finished the window.
+
+    Within a window, events are processed in order of time within a strip
+    rather than across the whole lattice, so results are statistically
+    equivalent to, rather than identical with, those of a serial run. For a
+    given seed and number of partitions, results are reproducible and do not
+    depend on the number of threads.
+
+    Parameters
+    ----------
+    grid : ModelGrid
+        The model's grid.
+    n_partitions : int
+        Number of pairs of strips.
+    seed : int, optional
+        Seed for the random number generators of the strips.
+
+    Examples
+    --------
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.ca.cfuncs import CTSPartition
+    >>> grid = RasterModelGrid((8, 3))
+    >>> partition = CTSPartition(grid, 2)
+    >>> partition.n_strips
+    4
+    >>> partition.strip_at_link[[0, 2, 5, 12, 33]]
+    array([0, 0, 0, 1, 3])
+    >>> CTSPartition(grid, 3)
+    Traceback (most recent call last):
+    ...
+    ValueError: too few rows of nodes (8) for 3 partitions
+    """
+    cdef public DTYPE_INT_t n_strips
+    cdef DTYPE_INT_t[:] _strip_at_link
+    cdef list _queues
+    cdef list _bit_generators
+    cdef DTYPE_INT_t[:, :] _outbox
+    cdef DTYPE_INT_t[:] _outbox_size
+    cdef DTYPE_INT8_t[:] _in_outbox
+    cdef DTYPE_INT8_t[:] _reset_at_prop
+
+    # Model data, set at the start of each run
+    cdef DTYPE_t[:] _next_update
+    cdef const DTYPE_INT_t[:] _node_at_link_tail
+    cdef const DTYPE_INT_t[:] _node_at_link_head
+    cdef DTYPE_INT_t[:] _node_state
+    cdef DTYPE_INT_t[:] _next_trn_id
+    cdef const DTYPE_INT_t[:] _trn_to
+    cdef const DTYPE_UINT8_t[:] _status_at_node
+    cdef DTYPE_INT_t _num_node_states
+    cdef DTYPE_INT_t _num_node_states_sq
+    cdef const DTYPE_INT8_t[:] _bnd_lnk
+    cdef const DTYPE_INT8_t[:] _link_orientation
+    cdef DTYPE_INT_t[:] _link_state
+    cdef const DTYPE_INT_t[:] _n_trn
+    cdef const DTYPE_INT_t[:, :] _trn_id
+    cdef const DTYPE_t[:] _trn_rate
+    cdef const DTYPE_INT_t[:, :] _links_at_node
+    cdef const DTYPE_INT8_t[:, :] _active_link_dirs_at_node
+    cdef const DTYPE_INT8_t[:] _trn_propswap
+    cdef DTYPE_INT_t[:] _propid
+
+    def __init__(self, grid, n_partitions, seed=0):
+        tail = grid.node_at_link_tail
+        head = grid.node_at_link_head
+
+        row_at_node = np.unique(grid.y_of_node, return_inverse=True)[1]
+        n_rows = row_at_node.max() + 1
+        rows_per_link = np.abs(row_at_node[head] - row_at_node[tail]).max()
+
+        self.n_strips = 2 * n_partitions
+        rows_per_strip = n_rows // self.n_strips
+        if rows_per_strip < max(2 * rows_per_link, 1):
+            raise ValueError(
+                "too few rows of nodes ({0}) for {1} partitions".format(
+                    n_rows, n_partitions
+                )
+            )
+
+        strip_at_link = np.minimum(
+            np.minimum(row_at_node[tail], row_at_node[head]) // rows_per_strip,
+            self.n_strips - 1,
+        ).astype(np.int_)
+        links_per_strip = np.bincount(strip_at_link, minlength=self.n_strips)
+        links_next_to_strip = np.zeros_like(links_per_strip)
+        links_next_to_strip[1:] += links_per_strip[:-1]
+        links_next_to_strip[:-1] += links_per_strip[1:]
+
+        self._strip_at_link = strip_at_link
+        self._queues = [
+            LinkPriorityQueue(grid.number_of_links, capacity=n_links)
+            for n_links in links_per_strip
+        ]
+        self._bit_generators = [
+            np.random.PCG64(seq)
+            for seq in np.random.SeedSequence(seed).spawn(self.n_strips)
+        ]
+        self._outbox = np.empty(
+            (self.n_strips, links_next_to_strip.max()), dtype=np.int_
+        )
+        self._outbox_size = np.zeros(self.n_strips, dtype=np.int_)
+        self._in_outbox = np.zeros(grid.number_of_links, dtype=np.int8)
+        self._reset_at_prop = np.zeros(grid.number_of_nodes, dtype=np.int8)
+
+    @property
+    def strip_at_link(self):
+        """Strip to which each link belongs."""
+        return np.asarray(self._strip_at_link)
+
+    def run(self, this_cts_model, double run_to, double sync_interval,
+            n_threads=1):
+        """Run a model forward to a given time.
+
+        Parameters
+        ----------
+        this_cts_model : CellLabCTSModel
+            The model to run. Its event queue is divided among the strips
+            for the run, and gathered again at the end.
+        run_to : float
+            Time to run to.
+        sync_interval : float
+            Length of the window of time that strips run between exchanges
+            of events.
+        n_threads : int, optional
+            Number of threads with which to process strips.
+
+        Returns
+        -------
+        float
+            The model time at the end of the run, which is *run_to*.
+        """
+        cdef LinkPriorityQueue queue
+        cdef double current_time = this_cts_model.current_time
+        cdef double window_end, next_time
+        cdef DTYPE_INT_t strip
+
+        self._set_model_data(this_cts_model)
+        self._scatter(this_cts_model.priority_queue)
+
+        executor = None
+        if n_threads > 1:
+            executor = ThreadPoolExecutor(max_workers=n_threads)
+        try:
+            # Strips can hand each other events that are due before the end
+            # of the last window, so carry on until none are left.
+            while True:
+                # Skip ahead to the soonest event, if it is beyond this window
+                next_time = _NEVER
+                for queue in self._queues:
+                    if queue._size > 0 and queue._time[0] < next_time:
+                        next_time = queue._time[0]
+                if next_time > run_to:
+                    break
+                current_time = max(current_time, next_time)
+                window_end = min(current_time + sync_interval, run_to)
+
+                for phase in range(2):
+                    strips = range(phase, self.n_strips, 2)
+                    if executor is None:
+                        for strip in strips:
+                            self._run_strip(strip, window_end)
+                    else:
+                        for _ in executor.map(
+                            self._run_strip, strips, repeat(window_end)
+                        ):
+                            pass
+                    for strip in strips:
+                        self._flush_outbox(strip)
+
+                current_time = window_end
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            self._gather(this_cts_model.priority_queue)
+
+        for prop in np.flatnonzero(self._reset_at_prop):
+            this_cts_model.prop_data[prop] = this_cts_model.prop_reset_value
+        self._reset_at_prop[:] = 0
+
+        return run_to
+
+    def _set_model_data(self, this_cts_model):
+        grid = this_cts_model.grid
+
+        self._next_update = this_cts_model.next_update
+        self._node_at_link_tail = grid.node_at_link_tail
+        self._node_at_link_head = grid.node_at_link_head
+        self._node_state = this_cts_model.node_state
+        self._next_trn_id = this_cts_model.next_trn_id
+        self._trn_to = this_cts_model.trn_to
+        self._status_at_node = grid.status_at_node
+        self._num_node_states = this_cts_model.num_node_states
+        self._num_node_states_sq = this_cts_model.num_node_states_sq
+        self._bnd_lnk = this_cts_model.bnd_lnk
+        self._link_orientation = this_cts_model.link_orientation
+        self._link_state = this_cts_model.link_state
+        self._n_trn = this_cts_model.n_trn
+        self._trn_id = this_cts_model.trn_id
+        self._trn_rate = this_cts_model.trn_rate
+        self._links_at_node = grid.links_at_node
+        self._active_link_dirs_at_node = grid.active_link_dirs_at_node
+        self._trn_propswap = this_cts_model.trn_propswap
+        self._propid = this_cts_model.propid
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _scatter(self, LinkPriorityQueue priority_queue):
+        """Move the events of a queue to the queues of the strips."""
+        cdef LinkPriorityQueue queue
+        cdef DTYPE_INT_t slot, link
+
+        for slot in range(priority_queue._size):
+            link = priority_queue._link[slot]
+            queue = self._queues[self._strip_at_link[link]]
+            queue._append(link, priority_queue._time[slot],
+                          priority_queue._order[slot])
+        for queue in self._queues:
+            queue._heapify()
+            queue._index = priority_queue._index
+        priority_queue._clear()
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _gather(self, LinkPriorityQueue priority_queue):
+        """Move the events of the strips back to a single queue."""
+        cdef LinkPriorityQueue queue
+        cdef DTYPE_INT_t slot
+
+        for queue in self._queues:
+            for slot in range(queue._size):
+                priority_queue._append(queue._link[slot], queue._time[slot],
+                                       queue._order[slot])
+            priority_queue._index = max(priority_queue._index, queue._index)
+            priority_queue._n_popped += queue._n_popped
+            queue._n_popped = 0
+            queue._clear()
+        priority_queue._heapify()
+
+    def _run_strip(self, DTYPE_INT_t strip, double run_to):
+        """Process the events of a strip up to a given time."""
+        cdef LinkPriorityQueue queue = self._queues[strip]
+        cdef bitgen_t *rng = <bitgen_t *> PyCapsule_GetPointer(
+            self._bit_generators[strip].capsule, "BitGenerator"
+        )
+        cdef double ev_time
+        cdef DTYPE_INT_t ev_link
+
+        with nogil:
+            while queue._size > 0 and queue._time[0] <= run_to:
+                ev_time = queue._time[0]
+                ev_link = queue._pop()
+                self._do_transition(strip, queue, rng, ev_link, ev_time)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _flush_outbox(self, DTYPE_INT_t strip):
+        """Reschedule the links of other strips that a strip has changed."""
+        cdef LinkPriorityQueue queue
+        cdef DTYPE_INT_t i, link
+
+        for i in range(self._outbox_size[strip]):
+            link = self._outbox[strip, i]
+            self._in_outbox[link] = 0
+            queue = self._queues[self._strip_at_link[link]]
+            if self._next_trn_id[link] != -1:
+                queue._push(link, self._next_update[link])
+            else:
+                queue._discard(link)
+        self._outbox_size[strip] = 0
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.cdivision(True)
+    cdef void _do_transition(self, DTYPE_INT_t strip,
+                             LinkPriorityQueue queue, bitgen_t *rng,
+                             DTYPE_INT_t event_link,
+                             DTYPE_t event_time) nogil:
+        """Implement a state transition (see do_transition_new)."""
+        cdef DTYPE_INT_t tail_node = self._node_at_link_tail[event_link]
+        cdef DTYPE_INT_t head_node = self._node_at_link_head[event_link]
+        cdef DTYPE_INT_t old_tail_node_state = self._node_state[tail_node]
+        cdef DTYPE_INT_t old_head_node_state = self._node_state[head_node]
+        cdef DTYPE_INT_t this_trn_id = self._next_trn_id[event_link]
+        cdef DTYPE_INT_t this_trn_to = self._trn_to[this_trn_id]
+        cdef DTYPE_INT_t tmp
+
+        if self._status_at_node[tail_node] == _CORE:
+            self._node_state[tail_node] = (
+                this_trn_to // self._num_node_states) % self._num_node_states
+        if self._status_at_node[head_node] == _CORE:
+            self._node_state[head_node] = this_trn_to % self._num_node_states
+        self._update_link(strip, queue, rng, event_link, this_trn_to,
+                          event_time)
+
+        if self._node_state[tail_node] != old_tail_node_state:
+            self._update_links_at_node(strip, queue, rng, tail_node,
+                                       event_link, event_time)
+        if self._node_state[head_node] != old_head_node_state:
+            self._update_links_at_node(strip, queue, rng, head_node,
+                                       event_link, event_time)
+
+        # Property data are reset once the run is over, which gives the same
+        # result as resetting them now (there are no callbacks to see them).
+        if self._trn_propswap[this_trn_id]:
+            tmp = self._propid[tail_node]
+            self._propid[tail_node] = self._propid[head_node]
+            self._propid[head_node] = tmp
+            if self._status_at_node[tail_node] != _CORE:
+                self._reset_at_prop[self._propid[tail_node]] = 1
+            if self._status_at_node[head_node] != _CORE:
+                self._reset_at_prop[self._propid[head_node]] = 1
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _update_links_at_node(self, DTYPE_INT_t strip,
+                                    LinkPriorityQueue queue, bitgen_t *rng,
+                                    DTYPE_INT_t node, DTYPE_INT_t event_link,
+                                    DTYPE_t event_time) nogil:
+        """Update the other links at a node whose state has changed."""
+        cdef DTYPE_INT_t i, link, new_link_state
+
+        for i in range(self._links_at_node.shape[1]):
+            link = self._links_at_node[node, i]
+            if self._active_link_dirs_at_node[node, i] != 0 and link != event_link:
+                new_link_state = (
+                    self._link_orientation[link] * self._num_node_states_sq
+                    + self._node_state[self._node_at_link_tail[link]]
+                    * self._num_node_states
+                    + self._node_state[self._node_at_link_head[link]])
+                self._update_link(strip, queue, rng, link, new_link_state,
+                                  event_time)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _update_link(self, DTYPE_INT_t strip, LinkPriorityQueue queue,
+                           bitgen_t *rng, DTYPE_INT_t link,
+                           DTYPE_INT_t new_link_state,
+                           DTYPE_t current_time) nogil:
+        """Update a link's state, and schedule or hold back its event.
+
+        Links of the strip are rescheduled right away. Links of other strips
+        go to the strip's outbox.
+        """
+        cdef bint scheduled = _set_link_state(
+            link, new_link_state, current_time, self._bnd_lnk,
+            self._node_state, self._node_at_link_tail,
+            self._node_at_link_head, self._link_orientation,
+            self._num_node_states, self._num_node_states_sq, self._link_state,
+            self._n_trn, self._next_update, self._next_trn_id, self._trn_id,
+            self._trn_rate, rng)
+
+        if self._strip_at_link[link] == strip:
+            if scheduled:
+                queue._push(link, self._next_update[link])
+            else:
+                queue._discard(link)
+        elif not self._in_outbox[link]:
+            self._in_outbox[link] = 1
+            self._outbox[strip, self._outbox_size[strip]] = link
+            self._outbox_size[strip] += 1
+
+
+
 cpdef double run_cts(double run_to, double current_time,
                      char plot_each_transition,
                      object plotter,
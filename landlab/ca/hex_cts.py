@@ -60,6 +60,9 @@ class HexCTS(CellLabCTSModel):
         prop_data=None,
         prop_reset_value=None,
         seed=0,
+        n_partitions=1,
+        n_threads=1,
+        sync_interval=None,
     ):
         """HexCTS constructor: sets number of orientations to 1 and calls base-
         class constructor.
@@ -82,6 +85,13 @@ class HexCTS(CellLabCTSModel):
             Must be same type as *prop_data*.
         seed : int (default 0)
             Seed for random number generator
+        n_partitions : int, optional
+            Number of pairs of strips to run in parallel (see
+            CellLabCTSModel).
+        n_threads : int, optional
+            Number of threads with which to run strips.
+        sync_interval : float, optional
+            Length of time that strips run between exchanges of events.
         """
 
         # Make sure caller has sent the right grid type
@@ -102,4 +112,7 @@ class HexCTS(CellLabCTSModel):
             prop_data,
             prop_reset_value,
             seed,
+            n_partitions=n_partitions,
+            n_threads=n_threads,
+            sync_interval=sync_interval,
         )
@@ -0,0 +1,249 @@
+"""Record the node states of a CellLab-CTS model to a NetCDF file.
+
+Most nodes of a CellLab-CTS model keep their state from one output time to
+the next, so rather than store a copy of the whole node-state array at each
+output time, a NodeStateRecorder stores the nodes whose states have changed
+since the previous snapshot (and their new states). Every so often it also
+stores all of the node states, as a key frame, so that any snapshot can be
+rebuilt by applying the changes that follow the key frame before it.
+
+Snapshots are appended to a compressed, chunked NetCDF4 file as they are
+recorded, so they are never all held in memory.
+
+.. autosummary::
+
+    ~landlab.ca.node_state_recorder.NodeStateRecorder
+    ~landlab.ca.node_state_recorder.read_node_state_frame
+"""
+
+import numpy as np
+
+from landlab.io.netcdf._constants import _NP_TO_NC_TYPE
+
+_CHUNK_SIZE = 4096
+
+
+def _read_frame(root, frame):
+    """Rebuild the node states of a frame from an open NetCDF file."""
+    n_frames = len(root.dimensions["frame"])
+    if frame < 0:
+        frame += n_frames
+    if not 0 <= frame < n_frames:
+        raise IndexError("frame out of range ({0})".format(frame))
+
+    keyframe_interval = root.keyframe_interval
+    keyframe = frame // keyframe_interval
+
+    node_state = root["node_state_at_keyframe"][keyframe, :]
+    if frame > keyframe * keyframe_interval:
+        start = root["change_start"][keyframe * keyframe_interval + 1]
+        stop = root["change_start"][frame] + root["change_count"][frame]
+        node_state[root["changed_node"][start:stop]] = root["changed_state"][start:stop]
+    return node_state.astype(int)
+
+
+def read_node_state_frame(path, frame):
+    """Read the node states of a snapshot from a file of a NodeStateRecorder.
+
+    Parameters
+    ----------
+    path : str
+        Path to a file written by a NodeStateRecorder.
+    frame : int
+        Index of the snapshot. Negative indices count back from the last.
+
+    Returns
+    -------
+    (ndarray of int, float)
+        Node states, and the model time of the snapshot.
+    """
+    import netCDF4
+
+    with netCDF4.Dataset(path, "r") as root:
+        root.set_auto_mask(False)
+        return _read_frame(root, frame), float(root["time"][frame])
+
+
+class NodeStateRecorder(object):
+
+    """Record the node states of a CellLab-CTS model over time.
+
+    Parameters
+    ----------
+    ca : CellLabCTSModel
+        The model whose node states are recorded.
+    path : str
+        Path to the NetCDF file to write. An existing file is clobbered.
+    keyframe_interval : int, optional
+        Number of snapshots between snapshots of all node states. A larger
+        interval makes a smaller file, but makes reading a snapshot slower.
+    complevel : int, optional
+        Level of zlib compression, from 1 (fastest) to 9 (smallest).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.ca.celllab_cts import Transition
+    >>> from landlab.ca.raster_cts import RasterCTS
+    >>> from landlab.ca.node_state_recorder import (
+    ...     NodeStateRecorder, read_node_state_frame
+    ... )
+
+    Create a temporary directory to write the netcdf file into.
+
+    >>> import tempfile, os
+    >>> temp_dir = tempfile.mkdtemp()
+    >>> os.chdir(temp_dir)
+
+    >>> grid = RasterModelGrid((4, 5))
+    >>> trn_list = [Transition((0, 1, 0), (1, 1, 0), 1.0)]
+    >>> ins = np.zeros(20, dtype=int)
+    >>> ins[6] = 1
+    >>> ca = RasterCTS(grid, {0: "empty", 1: "full"}, trn_list, ins)
+
+    >>> with NodeStateRecorder(ca, "states.nc", keyframe_interval=4) as rec:
+    ...     for time in range(1, 11):
+    ...         ca.run(float(time))
+    ...         rec.record()
+    ...     rec.times
+    array([  0.,   1.,   2.,   3.,   4.,   5.,   6.,   7.,   8.,   9.,  10.])
+
+    >>> node_state, time = read_node_state_frame("states.nc", 0)
+    >>> node_state.reshape(grid.shape)
+    array([[0, 0, 0, 0, 0],
+           [0, 1, 0, 0, 0],
+           [0, 0, 0, 0, 0],
+           [0, 0, 0, 0, 0]])
+    >>> node_state, time = read_node_state_frame("states.nc", -1)
+    >>> np.all(node_state == ca.node_state), time
+    (True, 10.0)
+    """
+
+    def __init__(self, ca, path, keyframe_interval=100, complevel=4):
+        import netCDF4
+
+        if int(keyframe_interval) != keyframe_interval or keyframe_interval < 1:
+            raise ValueError(
+                "keyframe_interval must be a positive integer ({0})".format(
+                    keyframe_interval
+                )
+            )
+
+        self._ca = ca
+        self._keyframe_interval = int(keyframe_interval)
+        self._n_frames = 0
+        self._n_changes = 0
+        self._last_node_state = np.empty_like(ca.node_state)
+
+        n_nodes = len(ca.node_state)
+        state_type = _NP_TO_NC_TYPE[str(np.min_scalar_type(ca.num_node_states - 1))]
+        node_type = _NP_TO_NC_TYPE[str(np.min_scalar_type(max(n_nodes - 1, 0)))]
+
+        self._root = netCDF4.Dataset(path, "w", format="NETCDF4")
+        self._root.keyframe_interval = self._keyframe_interval
+
+        self._root.createDimension("node", n_nodes)
+        self._root.createDimension("frame", None)
+        self._root.createDimension("keyframe", None)
+        self._root.createDimension("change", None)
+
+        compression = {"zlib": True, "complevel": complevel, "shuffle": True}
+        self._root.createVariable(
+            "time", "f8", ("frame",), chunksizes=(_CHUNK_SIZE,), **compression
+        )
+        for name in ("change_start", "change_count"):
+            self._root.createVariable(
+                name, "i8", ("frame",), chunksizes=(_CHUNK_SIZE,), **compression
+            )
+        self._root.createVariable(
+            "node_state_at_keyframe",
+            state_type,
+            ("keyframe", "node"),
+            chunksizes=(1, n_nodes),
+            **compression
+        )
+        self._root.createVariable(
+            "changed_node",
+            node_type,
+            ("change",),
+            chunksizes=(_CHUNK_SIZE,),
+            **compression
+        )
+        self._root.createVariable(
+            "changed_state",
+            state_type,
+            ("change",),
+            chunksizes=(_CHUNK_SIZE,),
+            **compression
+        )
+        self._root.set_auto_mask(False)
+
+        self.record()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._n_frames
+
+    @property
+    def times(self):
+        """Model times of the snapshots."""
+        return self._root["time"][:]
+
+    def record(self):
+        """Take a snapshot of the model's node states.
+
+        The snapshot is stamped with the model's current time. Only the
+        nodes that have changed since the previous snapshot are updated in
+        the recorder's copy of the node states.
+        """
+        root = self._root
+        frame = self._n_frames
+        node_state = self._ca.node_state
+
+        if frame == 0:
+            changed = np.empty(0, dtype=int)
+            self._last_node_state[:] = node_state
+        else:
+            changed = np.flatnonzero(node_state != self._last_node_state)
+            self._last_node_state[changed] = node_state[changed]
+
+        root["time"][frame] = self._ca.current_time
+        root["change_start"][frame] = self._n_changes
+        root["change_count"][frame] = len(changed)
+        if len(changed) > 0:
+            stop = self._n_changes + len(changed)
+            root["changed_node"][self._n_changes : stop] = changed
+            root["changed_state"][self._n_changes : stop] = node_state[changed]
+            self._n_changes = stop
+        if frame % self._keyframe_interval == 0:
+            root["node_state_at_keyframe"][
+                frame // self._keyframe_interval, :
+            ] = node_state
+
+        self._n_frames += 1
+
+    def frame(self, frame):
+        """Node states of a snapshot.
+
+        Parameters
+        ----------
+        frame : int
+            Index of the snapshot. Negative indices count back from the last.
+
+        Returns
+        -------
+        ndarray of int
+            Node states.
+        """
+        return _read_frame(self._root, frame)
+
+    def close(self):
+        """Close the file."""
+        if self._root.isopen():
+            self._root.close()
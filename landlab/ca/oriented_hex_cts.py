@@ -65,6 +65,9 @@ class OrientedHexCTS(CellLabCTSModel):
         prop_data=None,
         prop_reset_value=None,
         seed=0,
+        n_partitions=1,
+        n_threads=1,
+        sync_interval=None,
     ):
         """Initialize a OrientedHexCTS.
 
@@ -87,6 +90,13 @@ class OrientedHexCTS(CellLabCTSModel):
         prop_reset_value : number or object, optional
             Default or initial value for a node/cell property (e.g., 0.0).
             Must be same type as *prop_data*.
+        n_partitions : int, optional
+            Number of pairs of strips to run in parallel (see
+            CellLabCTSModel).
+        n_threads : int, optional
+            Number of threads with which to run strips.
+        sync_interval : float, optional
+            Length of time that strips run between exchanges of events.
         """
 
         # Make sure caller has sent the right grid type
@@ -107,6 +117,9 @@ class OrientedHexCTS(CellLabCTSModel):
             prop_data,
             prop_reset_value,
             seed,
+            n_partitions=n_partitions,
+            n_threads=n_threads,
+            sync_interval=sync_interval,
         )
 
     def setup_array_of_orientation_codes(self):
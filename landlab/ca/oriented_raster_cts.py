@@ -68,6 +68,9 @@ class OrientedRasterCTS(CellLabCTSModel):
         prop_data=None,
         prop_reset_value=None,
         seed=0,
+        n_partitions=1,
+        n_threads=1,
+        sync_interval=None,
     ):
         """RasterCTS constructor: sets number of orientations to 2 and calls
         base-class constructor.
@@ -88,6 +91,13 @@ class OrientedRasterCTS(CellLabCTSModel):
         prop_reset_value : number or object, optional
             Default or initial value for a node/cell property (e.g., 0.0).
             Must be same type as *prop_data*.
+        n_partitions : int, optional
+            Number of pairs of strips to run in parallel (see
+            CellLabCTSModel).
+        n_threads : int, optional
+            Number of threads with which to run strips.
+        sync_interval : float, optional
+            Length of time that strips run between exchanges of events.
         """
 
         # Make sure caller has sent the right grid type
@@ -108,6 +118,9 @@ class OrientedRasterCTS(CellLabCTSModel):
             prop_data,
             prop_reset_value,
             seed,
+            n_partitions=n_partitions,
+            n_threads=n_threads,
+            sync_interval=sync_interval,
         )
 
     def setup_array_of_orientation_codes(self):
@@ -1,5 +1,5 @@
 from .chi_index import ChiFinder
-from .depression_finder import DepressionFinderAndRouter
+from .depression_finder import DepressionFinderAndRouter, PriorityFloodDepressionFinder
 from .depth_dependent_diffusion import DepthDependentDiffuser
 from .depth_dependent_taylor_soil_creep import DepthDependentTaylorDiffuser
 from .detachment_ltd_erosion import DepthSlopeProductErosion, DetachmentLtdErosion
@@ -100,6 +100,7 @@ COMPONENTS = [
     PotentialEvapotranspiration,
     PotentialityFlowRouter,
     PrecipitationDistribution,
+    PriorityFloodDepressionFinder,
     Profiler,
     Radiation,
     SedDepEroder,
@@ -1,3 +1,4 @@
 from .lake_mapper import DepressionFinderAndRouter
+from .priority_flood import PriorityFloodDepressionFinder
 
-__all__ = ["DepressionFinderAndRouter"]
+__all__ = ["DepressionFinderAndRouter", "PriorityFloodDepressionFinder"]
@@ -0,0 +1,80 @@
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import (
+    DepressionFinderAndRouter,
+    FlowAccumulator,
+    PriorityFloodDepressionFinder,
+)
+from landlab.values import plane, random
+
+
+def _noisy_grid(shape, seed=0):
+    np.random.seed(seed)
+    grid = RasterModelGrid(shape)
+    plane(grid, "topographic__elevation", normal=(0.001, 0.001, 1.0))
+    random(grid, "topographic__elevation", where="CORE_NODE", high=1.0, low=0.0)
+    FlowAccumulator(grid, flow_director="D8").run_one_step()
+    return grid
+
+
+def _map_depressions(DepressionFinder, shape):
+    grid = _noisy_grid(shape)
+    receivers = grid.at_node["flow__receiver_node"].copy()
+    sinks = grid.at_node["flow__sink_flag"].copy()
+    df = DepressionFinder(grid)
+
+    def map_depressions():
+        grid.at_node["flow__receiver_node"][:] = receivers
+        grid.at_node["flow__sink_flag"][:] = sinks
+        df.map_depressions()
+
+    return map_depressions
+
+
+def bench_depression_finder_and_router_1e4():
+    _map_depressions(DepressionFinderAndRouter, (100, 100))()
+
+
+def bench_priority_flood_1e4():
+    _map_depressions(PriorityFloodDepressionFinder, (100, 100))()
+
+
+def bench_priority_flood_1e6():
+    _map_depressions(PriorityFloodDepressionFinder, (1000, 1000))()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for shape in [(100, 100), (200, 200), (400, 400)]:
+        times = [
+            min(
+                timeit.repeat(
+                    _map_depressions(DepressionFinder, shape), number=1, repeat=3
+                )
+            )
+            for DepressionFinder in (
+                DepressionFinderAndRouter,
+                PriorityFloodDepressionFinder,
+            )
+        ]
+        print(
+            "{0} nodes: DepressionFinderAndRouter {1:.3f} s, "
+            "PriorityFloodDepressionFinder {2:.3f} s ({3:.0f}x)".format(
+                shape[0] * shape[1], times[0], times[1], times[0] / times[1]
+            )
+        )
+    for shape in [(1000, 1000)]:
+        time = min(
+            timeit.repeat(
+                _map_depressions(PriorityFloodDepressionFinder, shape),
+                number=1,
+                repeat=3,
+            )
+        )
+        print(
+            "{0} nodes: PriorityFloodDepressionFinder {1:.3f} s".format(
+                shape[0] * shape[1], time
+            )
+        )
@@ -136,3 +136,288 @@ cpdef find_lowest_node_on_lake_perimeter_c(
             which will remove isolated open nodes."""
         )
     return lowest_node, pit_count
+
+
+cdef inline bint _heap_less(DTYPE_FLOAT_t level_a, DTYPE_INT_t order_a,
+                            DTYPE_FLOAT_t level_b, DTYPE_INT_t order_b):
+    return level_a < level_b or (level_a == level_b and order_a < order_b)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _heap_push(DTYPE_FLOAT_t [:] heap_level, DTYPE_INT_t [:] heap_order,
+                     DTYPE_INT_t [:] heap_node, DTYPE_INT_t * size,
+                     DTYPE_FLOAT_t level, DTYPE_INT_t order, DTYPE_INT_t node):
+    cdef DTYPE_INT_t child = size[0]
+    cdef DTYPE_INT_t parent
+
+    size[0] += 1
+    while child > 0:
+        parent = (child - 1) // 2
+        if not _heap_less(level, order, heap_level[parent], heap_order[parent]):
+            break
+        heap_level[child] = heap_level[parent]
+        heap_order[child] = heap_order[parent]
+        heap_node[child] = heap_node[parent]
+        child = parent
+    heap_level[child] = level
+    heap_order[child] = order
+    heap_node[child] = node
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef DTYPE_INT_t _heap_pop(DTYPE_FLOAT_t [:] heap_level, DTYPE_INT_t [:] heap_order,
+                           DTYPE_INT_t [:] heap_node, DTYPE_INT_t * size):
+    cdef DTYPE_INT_t top = heap_node[0]
+    cdef DTYPE_INT_t last, parent, child
+    cdef DTYPE_FLOAT_t level
+    cdef DTYPE_INT_t order
+
+    size[0] -= 1
+    last = size[0]
+    level = heap_level[last]
+    order = heap_order[last]
+
+    parent = 0
+    child = 1
+    while child < last:
+        if child + 1 < last and _heap_less(
+            heap_level[child + 1], heap_order[child + 1],
+            heap_level[child], heap_order[child]
+        ):
+            child += 1
+        if not _heap_less(heap_level[child], heap_order[child], level, order):
+            break
+        heap_level[parent] = heap_level[child]
+        heap_order[parent] = heap_order[child]
+        heap_node[parent] = heap_node[child]
+        parent = child
+        child = 2 * parent + 1
+    heap_level[parent] = level
+    heap_order[parent] = order
+    heap_node[parent] = heap_node[last]
+
+    return top
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def priority_flood(const DTYPE_INT_t [:, :] node_nbrs,
+                   const DTYPE_FLOAT_t [:] elev,
+                   const DTYPE_INT_t [:] outlet_nodes,
+                   DTYPE_FLOAT_t epsilon,
+                   DTYPE_FLOAT_t [:] water_level,
+                   DTYPE_INT_t [:] flooded_from,
+                   DTYPE_INT_t [:] depression_outlet):
+    """Flood a surface inward from its outlets with a Priority-Flood.
+
+    Nodes are visited in order of increasing spill elevation, starting from
+    *outlet_nodes*. A node lower than the spill elevation of the node from
+    which it is reached lies in a depression and is flooded to that level;
+    the nodes of a depression are visited breadth-first from its outlet.
+
+    Parameters
+    ----------
+    node_nbrs : (n_nodes, n_nbrs) array of int
+        Neighbors of each node, through which water can flow; -1 where
+        there is none.
+    elev : n_nodes array of float
+        Elevation of each node.
+    outlet_nodes : array of int
+        Nodes from which to start flooding (typically open boundary nodes).
+    epsilon : float
+        If greater than zero, each flooded node is raised this much above
+        the water level of the node it was reached from, so that flooded
+        areas, and flats, slope toward their outlets.
+    water_level : n_nodes array of float
+        Out: elevation of the water (or land) surface at each node.
+    flooded_from : n_nodes array of int
+        Out: the node from which each node was reached; -1 for outlet nodes
+        and for nodes that cannot be reached.
+    depression_outlet : n_nodes array of int
+        Out: for flooded nodes, the unflooded node at the rim of their
+        depression through which they drain; -1 otherwise.
+
+    Returns
+    -------
+    int
+        The number of flooded nodes.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.depression_finder.cfuncs import priority_flood
+    >>> elev = np.array([0., 3., 1., 2., 4.])
+    >>> nbrs = np.array([[-1, 1], [0, 2], [1, 3], [2, 4], [3, -1]])
+    >>> water_level = np.empty(5)
+    >>> flooded_from = np.empty(5, dtype=int)
+    >>> outlet = np.empty(5, dtype=int)
+    >>> priority_flood(
+    ...     nbrs, elev, np.array([0]), 0., water_level, flooded_from, outlet
+    ... )
+    2
+    >>> water_level
+    array([ 0.,  3.,  3.,  3.,  4.])
+    >>> flooded_from
+    array([-1,  0,  1,  2,  3])
+    >>> outlet
+    array([-1, -1,  1,  1, -1])
+    """
+    cdef DTYPE_INT_t n_nodes = elev.shape[0]
+    cdef DTYPE_INT_t n_nbrs = node_nbrs.shape[1]
+    cdef DTYPE_INT_t heap_size = 0
+    cdef DTYPE_INT_t order = 0
+    cdef DTYPE_INT_t pit_head = 0
+    cdef DTYPE_INT_t pit_tail = 0
+    cdef DTYPE_INT_t n_flooded = 0
+    cdef DTYPE_INT_t node, nbr, i, j
+    cdef DTYPE_FLOAT_t level
+
+    cdef DTYPE_FLOAT_t [:] heap_level = np.empty(n_nodes, dtype=float)
+    cdef DTYPE_INT_t [:] heap_order = np.empty(n_nodes, dtype=int)
+    cdef DTYPE_INT_t [:] heap_node = np.empty(n_nodes, dtype=int)
+    cdef DTYPE_INT_t [:] pit_queue = np.empty(n_nodes, dtype=int)
+    cdef np.uint8_t [:] visited = np.zeros(n_nodes, dtype=np.uint8)
+
+    for i in range(n_nodes):
+        water_level[i] = elev[i]
+        flooded_from[i] = -1
+        depression_outlet[i] = -1
+
+    for i in range(outlet_nodes.shape[0]):
+        node = outlet_nodes[i]
+        if not visited[node]:
+            visited[node] = True
+            _heap_push(heap_level, heap_order, heap_node, &heap_size,
+                       elev[node], order, node)
+            order += 1
+
+    while heap_size > 0 or pit_head < pit_tail:
+        if pit_head < pit_tail:
+            node = pit_queue[pit_head]
+            pit_head += 1
+        else:
+            node = _heap_pop(heap_level, heap_order, heap_node, &heap_size)
+
+        level = water_level[node]
+        for j in range(n_nbrs):
+            nbr = node_nbrs[node, j]
+            if nbr == -1 or visited[nbr]:
+                continue
+            visited[nbr] = True
+            flooded_from[nbr] = node
+
+            if elev[nbr] < level or (epsilon > 0. and elev[nbr] < level + epsilon):
+                water_level[nbr] = level + epsilon
+                if depression_outlet[node] == -1:
+                    depression_outlet[nbr] = node
+                else:
+                    depression_outlet[nbr] = depression_outlet[node]
+                pit_queue[pit_tail] = nbr
+                pit_tail += 1
+                n_flooded += 1
+            else:
+                _heap_push(heap_level, heap_order, heap_node, &heap_size,
+                           elev[nbr], order, nbr)
+                order += 1
+
+    return n_flooded
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def route_flow_across_lakes(const DTYPE_INT_t [:] outlets,
+                            const DTYPE_INT_t [:] depression_outlet,
+                            const DTYPE_INT_t [:, :] nbrs,
+                            const DTYPE_INT_t [:, :] nbr_links,
+                            DTYPE_INT_t n_first_pass,
+                            DTYPE_INT_t [:] receivers,
+                            DTYPE_INT_t [:] links):
+    """Route flow across lakes, breadth-first from their outlets.
+
+    Lakes are processed in layers, starting from their outlets. Each node
+    of a layer becomes the receiver of those of its neighbors in the same
+    lake that do not yet have one, which then form the next layer. As in
+    :py:meth:`DepressionFinderAndRouter._route_flow_for_one_lake`, the first
+    *n_first_pass* columns of *nbrs* (the orthogonal neighbors of a raster)
+    are searched for all nodes of a layer before the remaining columns (the
+    diagonal neighbors).
+
+    Parameters
+    ----------
+    outlets : array of int
+        The outlet node of each lake.
+    depression_outlet : n_nodes array of int
+        The outlet of the lake that each node is in; -1 if none.
+    nbrs : (n_nodes, n_nbrs) array of int
+        Neighbors of each node; -1 where there is none.
+    nbr_links : (n_nodes, n_nbrs) array of int
+        Links to the neighbors in *nbrs*.
+    n_first_pass : int
+        Number of columns of *nbrs* to search in the first pass over a layer.
+    receivers : n_nodes array of int
+        In/out: receiver of each node.
+    links : n_nodes array of int
+        In/out: link to the receiver of each node.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.depression_finder.cfuncs import (
+    ...     route_flow_across_lakes
+    ... )
+    >>> nbrs = np.array([[-1, 1], [0, 2], [1, 3], [2, 4], [3, -1]])
+    >>> nbr_links = np.array([[-1, 0], [0, 1], [1, 2], [2, 3], [3, -1]])
+    >>> outlet = np.array([-1, -1, 1, 1, 1])
+    >>> receivers = np.array([0, 0, 3, 3, 3])
+    >>> links = np.array([-1, 0, 2, -1, 3])
+    >>> route_flow_across_lakes(
+    ...     np.array([1]), outlet, nbrs, nbr_links, 2, receivers, links
+    ... )
+    >>> receivers
+    array([0, 0, 1, 2, 3])
+    >>> links
+    array([-1,  0,  1,  2,  3])
+    """
+    cdef DTYPE_INT_t n_nodes = depression_outlet.shape[0]
+    cdef DTYPE_INT_t n_nbrs = nbrs.shape[1]
+    cdef DTYPE_INT_t layer_start = 0
+    cdef DTYPE_INT_t layer_end
+    cdef DTYPE_INT_t tail = 0
+    cdef DTYPE_INT_t first, last
+    cdef DTYPE_INT_t i, j, node, nbr, outlet
+    cdef np.uint8_t [:] resolved = np.zeros(n_nodes, dtype=np.uint8)
+    cdef DTYPE_INT_t [:] queue = np.empty(n_nodes, dtype=int)
+    cdef DTYPE_INT_t [:] queue_outlet = np.empty(n_nodes, dtype=int)
+
+    for i in range(n_nodes):
+        if depression_outlet[i] == -1:
+            resolved[i] = True
+
+    for i in range(outlets.shape[0]):
+        queue[tail] = outlets[i]
+        queue_outlet[tail] = outlets[i]
+        tail += 1
+
+    while layer_start < tail:
+        layer_end = tail
+        for first, last in ((0, n_first_pass), (n_first_pass, n_nbrs)):
+            for i in range(layer_start, layer_end):
+                node = queue[i]
+                outlet = queue_outlet[i]
+                for j in range(first, last):
+                    nbr = nbrs[node, j]
+                    if (
+                        nbr == -1
+                        or resolved[nbr]
+                        or depression_outlet[nbr] != outlet
+                    ):
+                        continue
+                    resolved[nbr] = True
+                    receivers[nbr] = node
+                    links[nbr] = nbr_links[node, j]
+                    queue[tail] = nbr
+                    queue_outlet[tail] = outlet
+                    tail += 1
+        layer_start = layer_end
@@ -842,6 +842,37 @@ class DepressionFinderAndRouter(Component):
         """Alias for map_depressions."""
         self.map_depressions()
 
+    def _locate_pits(self):
+        """Set the pit node IDs, number of pits and is_pit from the pits
+        supplied at instantiation (or find them, if none were supplied)."""
+        if isinstance(self._user_supplied_pits, str):
+            try:
+                pits = self._grid.at_node[self._user_supplied_pits]
+                supplied_pits = np.where(pits)[0]
+                self._pit_node_ids = as_id_array(
+                    np.setdiff1d(supplied_pits, self._grid.boundary_nodes)
+                )
+                self._number_of_pits = self._pit_node_ids.size
+                self._is_pit.fill(False)
+                self._is_pit[self._pit_node_ids] = True
+            except FieldError:
+                self._find_pits()
+        elif self._user_supplied_pits is None:
+            self._find_pits()
+        else:  # hopefully an array or other sensible iterable
+            if len(self._user_supplied_pits) == self._grid.number_of_nodes:
+                supplied_pits = np.where(self._user_supplied_pits)[0]
+            else:  # it's an array of node ids
+                supplied_pits = self._user_supplied_pits
+            # remove any boundary nodes from the supplied pit list
+            self._pit_node_ids = as_id_array(
+                np.setdiff1d(supplied_pits, self._grid.boundary_nodes)
+            )
+
+            self._number_of_pits = self._pit_node_ids.size
+            self._is_pit.fill(False)
+            self._is_pit[self._pit_node_ids] = True
+
     def map_depressions(self):
         """Map depressions/lakes in a topographic surface.
 
@@ -887,33 +918,7 @@ class DepressionFinderAndRouter(Component):
         self._depression_depth.fill(0.0)
         self._depression_outlets = []  # reset these
         # Locate nodes with pits
-        if isinstance(self._user_supplied_pits, str):
-            try:
-                pits = self._grid.at_node[self._user_supplied_pits]
-                supplied_pits = np.where(pits)[0]
-                self._pit_node_ids = as_id_array(
-                    np.setdiff1d(supplied_pits, self._grid.boundary_nodes)
-                )
-                self._number_of_pits = self._pit_node_ids.size
-                self._is_pit.fill(False)
-                self._is_pit[self._pit_node_ids] = True
-            except FieldError:
-                self._find_pits()
-        elif self._user_supplied_pits is None:
-            self._find_pits()
-        else:  # hopefully an array or other sensible iterable
-            if len(self._user_supplied_pits) == self._grid.number_of_nodes:
-                supplied_pits = np.where(self._user_supplied_pits)[0]
-            else:  # it's an array of node ids
-                supplied_pits = self._user_supplied_pits
-            # remove any boundary nodes from the supplied pit list
-            self._pit_node_ids = as_id_array(
-                np.setdiff1d(supplied_pits, self._grid.boundary_nodes)
-            )
-
-            self._number_of_pits = self._pit_node_ids.size
-            self._is_pit.fill(False)
-            self._is_pit[self._pit_node_ids] = True
+        self._locate_pits()
         # Set up "lake code" array
         self._flood_status.fill(_UNFLOODED)
         self._flood_status[self._pit_node_ids] = _PIT
@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+"""Find depressions on a topographic surface with a Priority-Flood."""
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+from landlab.core.utils import as_id_array
+
+from .cfuncs import priority_flood, route_flow_across_lakes
+from .lake_mapper import _FLOODED, _PIT, _UNFLOODED, DepressionFinderAndRouter
+
+
+class PriorityFloodDepressionFinder(DepressionFinderAndRouter):
+    """Find depressions, and route flow across them, with a Priority-Flood.
+
+    This component is a drop-in replacement for
+    :py:class:`~landlab.components.DepressionFinderAndRouter` that maps all
+    of the depressions of a surface in a single compiled pass, following
+    the Priority-Flood algorithm of Barnes et al. (2014), rather than
+    flooding each pit in turn. Its cost therefore grows as n log n with the
+    number of nodes, regardless of how many pits there are.
+
+    The surface is flooded inward from the open boundary nodes in order of
+    increasing spill elevation. Nodes lower than the spill elevation of the
+    node from which they are reached form a depression, whose outlet is the
+    unflooded node on its rim through which it was reached. Flow is then
+    routed across each depression, breadth-first from its outlet, in the
+    same way as by DepressionFinderAndRouter.
+
+    The component creates the same fields, and has the same lake properties,
+    as DepressionFinderAndRouter. Each lake is identified by its deepest
+    node. Depressions that contain none of the pits given with *pits* are
+    ignored, as are the flow paths of nodes outside of depressions. A pit
+    that lies on a flat, level with its outlet, forms a lake of depth zero.
+
+    The component can be used within a
+    :py:class:`~landlab.components.FlowAccumulator` with
+    ``depression_finder="PriorityFloodDepressionFinder"``.
+
+    Examples
+    --------
+    Route flow across a depression in a sloped surface.
+
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.components import (
+    ...     FlowAccumulator, PriorityFloodDepressionFinder
+    ... )
+    >>> mg = RasterModelGrid((7, 7), xy_spacing=0.5)
+    >>> z = mg.add_field("topographic__elevation", mg.node_x.copy(), at="node")
+    >>> z += 0.01 * mg.node_y
+    >>> mg.at_node['topographic__elevation'].reshape(mg.shape)[2:5, 2:5] *= 0.1
+    >>> fr = FlowAccumulator(mg, flow_director='D8')
+    >>> fr.run_one_step()  # the flow "gets stuck" in the hole
+    >>> df = PriorityFloodDepressionFinder(mg)
+    >>> df.map_depressions()
+    >>> df.lake_at_node.reshape(mg.shape)  # doctest: +NORMALIZE_WHITESPACE
+    array([[False, False, False, False, False, False, False],
+           [False, False, False, False, False, False, False],
+           [False, False,  True,  True,  True, False, False],
+           [False, False,  True,  True,  True, False, False],
+           [False, False,  True,  True,  True, False, False],
+           [False, False, False, False, False, False, False],
+           [False, False, False, False, False, False, False]], dtype=bool)
+    >>> df.lake_codes
+    array([16])
+    >>> df.lake_outlets
+    array([8])
+    >>> df.lake_areas
+    array([ 2.25])
+    >>> mg.at_node['flow__receiver_node'].reshape(mg.shape)
+    array([[ 0,  1,  2,  3,  4,  5,  6],
+           [ 7,  7, 16, 17, 18, 18, 13],
+           [14, 14,  8, 16, 17, 18, 20],
+           [21, 21, 16, 16, 24, 25, 27],
+           [28, 28, 23, 24, 24, 32, 34],
+           [35, 35, 30, 31, 32, 32, 41],
+           [42, 43, 44, 45, 46, 47, 48]])
+    >>> mg.at_node['drainage_area'].reshape(mg.shape)
+    array([[ 0.  ,  0.  ,  0.  ,  0.  ,  0.  ,  0.  ,  0.  ],
+           [ 5.25,  5.25,  0.25,  0.25,  0.25,  0.25,  0.  ],
+           [ 0.25,  0.25,  5.  ,  1.5 ,  1.  ,  0.25,  0.  ],
+           [ 0.25,  0.25,  0.75,  2.25,  0.5 ,  0.25,  0.  ],
+           [ 0.25,  0.25,  0.5 ,  0.5 ,  1.  ,  0.25,  0.  ],
+           [ 0.25,  0.25,  0.25,  0.25,  0.25,  0.25,  0.  ],
+           [ 0.  ,  0.  ,  0.  ,  0.  ,  0.  ,  0.  ,  0.  ]])
+
+    References
+    ----------
+    **Required Software Citation(s) Specific to this Component**
+
+    None Listed
+
+    **Additional References**
+
+    Barnes, R., Lehman, C., Mulla, D. (2014). Priority-flood: An optimal
+    depression-filling and watershed-labeling algorithm for digital elevation
+    models. Computers & Geosciences 62, 117-127.
+    https://dx.doi.org/10.1016/j.cageo.2013.04.024
+
+    """
+
+    _name = "PriorityFloodDepressionFinder"
+
+    _unit_agnostic = True
+
+    _info = {
+        "depression__depth": {
+            "dtype": float,
+            "intent": "out",
+            "optional": False,
+            "units": "m",
+            "mapping": "node",
+            "doc": "Depth of depression below its spillway point",
+        },
+        "depression__outlet_node": {
+            "dtype": int,
+            "intent": "out",
+            "optional": False,
+            "units": "-",
+            "mapping": "node",
+            "doc": "If a depression, the id of the outlet node for that depression, otherwise grid.BAD_INDEX",
+        },
+        "flood_status_code": {
+            "dtype": int,
+            "intent": "out",
+            "optional": False,
+            "units": "-",
+            "mapping": "node",
+            "doc": "Map of flood status (_PIT, _CURRENT_LAKE, _UNFLOODED, or _FLOODED).",
+        },
+        "is_pit": {
+            "dtype": bool,
+            "intent": "out",
+            "optional": False,
+            "units": "-",
+            "mapping": "node",
+            "doc": "Boolean flag indicating whether a node is a pit.",
+        },
+        "topographic__elevation": {
+            "dtype": float,
+            "intent": "in",
+            "optional": False,
+            "units": "m",
+            "mapping": "node",
+            "doc": "Land surface topographic elevation",
+        },
+    }
+
+    def __init__(
+        self,
+        grid,
+        routing="D8",
+        pits="flow__sink_flag",
+        reroute_flow=True,
+        epsilon=0.0,
+    ):
+        """Create a PriorityFloodDepressionFinder.
+
+        Parameters
+        ----------
+        grid : ModelGrid
+            A landlab grid.
+        routing : str
+            If grid is a raster type, controls whether lake connectivity can
+            occur on diagonals ('D8', default), or only orthogonally ('D4').
+            Has no effect if grid is not a raster.
+        pits : array or str or None, optional
+            If a field name, the boolean field containing True where pits.
+            If an array, either a boolean array of nodes of the pits, or an
+            array of pit node IDs. Only depressions containing a pit are
+            mapped. Default is 'flow__sink_flag', the pit field output from
+            the :py:mod:`FlowDirectors <landlab.components.flow_director>`.
+        reroute_flow : bool, optional
+            If True (default), and the component detects the output fields in
+            the grid produced by the FlowAccumulator component, this component
+            will modify the existing flow fields to route the flow across the
+            lake surface(s).
+        epsilon : float, optional
+            If greater than zero, each node in a depression is taken to lie
+            *epsilon* above the node that it drains to, so that lakes, and
+            flats level with their outlets, slope gently toward the outlet
+            (Barnes et al., 2014). Depression depths then include this
+            gradient. Default is zero, for level lakes.
+        """
+        if epsilon < 0.0:
+            raise ValueError("epsilon must not be negative")
+        self._epsilon = float(epsilon)
+
+        super().__init__(grid, routing=routing, pits=pits, reroute_flow=reroute_flow)
+
+        n_nodes = self._grid.number_of_nodes
+        self._water_level = np.empty(n_nodes, dtype=float)
+        self._flooded_from = np.empty(n_nodes, dtype=int)
+        self._outlet_at_node = np.empty(n_nodes, dtype=int)
+        self._lake_codes = np.empty(0, dtype=int)
+        self._lake_outlets = np.empty(0, dtype=int)
+
+    def updated_boundary_conditions(self):
+        """Call this if boundary conditions on the grid are updated after the
+        component is instantiated."""
+        super().updated_boundary_conditions()
+        self._node_nbrs = as_id_array(self._node_nbrs)
+        if self._D8:
+            self._lake_nbrs = np.hstack(
+                (
+                    self._grid.adjacent_nodes_at_node,
+                    self._grid.diagonal_adjacent_nodes_at_node,
+                )
+            )
+            self._lake_nbr_links = self._grid.d8s_at_node
+            self._length_of_lake_links = self._grid.length_of_d8
+            self._n_orthogonal_nbrs = 4
+        else:
+            self._lake_nbrs = self._grid.adjacent_nodes_at_node
+            self._lake_nbr_links = self._grid.links_at_node
+            self._length_of_lake_links = self._grid.length_of_link
+            self._n_orthogonal_nbrs = self._lake_nbrs.shape[1]
+        self._lake_nbrs = as_id_array(self._lake_nbrs)
+        self._lake_nbr_links = as_id_array(self._lake_nbr_links)
+
+    @property
+    def epsilon(self):
+        """Rise, along flow paths, of nodes within depressions."""
+        return self._epsilon
+
+    @property
+    def water_level(self):
+        """At node array of the elevation of the lake surface, or of the land
+        surface for nodes that are not in a lake."""
+        return self._water_level
+
+    @property
+    def lake_outlets(self):
+        """Returns the *unique* outlets for each lake, in same order as the
+        return from lake_codes."""
+        return self._lake_outlets
+
+    @property
+    def lake_codes(self):
+        """Returns the *unique* code assigned to each unique lake.
+
+        These are the values used to map the lakes in the property
+        "lake_map". Each code is the ID of the deepest node of its lake.
+        """
+        return self._lake_codes
+
+    @property
+    def number_of_lakes(self):
+        """Return the number of individual lakes."""
+        return len(self._lake_codes)
+
+    def map_depressions(self):
+        """Map depressions/lakes in a topographic surface.
+
+        Examples
+        --------
+        Map a single depression, without rerouting flow.
+
+        >>> import numpy as np
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.components import (
+        ...     FlowDirectorSteepest, PriorityFloodDepressionFinder
+        ... )
+        >>> mg = RasterModelGrid((3, 5))
+        >>> mg.status_at_node[mg.nodes_at_left_edge] = mg.BC_NODE_IS_FIXED_VALUE
+        >>> mg.set_closed_boundaries_at_grid_edges(True, True, False, True)
+        >>> z = mg.add_zeros("topographic__elevation", at="node")
+        >>> z[6:9] = [1.0, 0.5, 1.0]
+        >>> FlowDirectorSteepest(mg).run_one_step()
+        >>> df = PriorityFloodDepressionFinder(mg, routing="D4", reroute_flow=False)
+        >>> df.map_depressions()
+        >>> df.lake_codes, df.lake_outlets
+        (array([7]), array([6]))
+        >>> df.depression_depth[6:9]
+        array([ 0. ,  0.5,  0. ])
+        """
+        if self._bc_set_code != self._grid.bc_set_code:
+            self.updated_boundary_conditions()
+            self._bc_set_code = self._grid.bc_set_code
+
+        status = self._grid.status_at_node
+        is_open_boundary = (status != self._grid.BC_NODE_IS_CORE) & (
+            status != self._grid.BC_NODE_IS_CLOSED
+        )
+        if not np.any(is_open_boundary):
+            msg = "PriorityFloodDepressionFinder requires that there is at least one open boundary node."
+            raise ValueError(msg)
+
+        self._lake_map.fill(self._grid.BAD_INDEX)
+        self._depression_outlet_map.fill(self._grid.BAD_INDEX)
+        self._depression_depth.fill(0.0)
+
+        self._locate_pits()
+
+        self._flood_status.fill(_UNFLOODED)
+        self._flood_status[self._pit_node_ids] = _PIT
+
+        priority_flood(
+            self._node_nbrs,
+            np.asarray(self._elev, dtype=float),
+            as_id_array(np.flatnonzero(is_open_boundary)),
+            self._epsilon,
+            self._water_level,
+            self._flooded_from,
+            self._outlet_at_node,
+        )
+
+        lake_nodes = self._find_lake_nodes()
+        outlets = self._outlet_at_node[lake_nodes]
+
+        self._flood_status[lake_nodes] = _FLOODED
+        self._depression_depth[lake_nodes] = (
+            self._water_level[lake_nodes] - self._elev[lake_nodes]
+        )
+        self._depression_outlet_map[lake_nodes] = outlets
+
+        lake = self._label_lakes(lake_nodes)
+
+        # the code of each lake is its deepest node (the lowest ID, if tied)
+        order = np.lexsort((lake_nodes, self._elev[lake_nodes], lake))
+        first_of_lake = np.ones(len(order), dtype=bool)
+        first_of_lake[1:] = np.diff(lake[order]) != 0
+        codes = lake_nodes[order][first_of_lake]
+
+        self._lake_map[lake_nodes] = codes[lake]
+
+        by_code = np.argsort(codes)
+        self._lake_codes = as_id_array(codes[by_code])
+        self._lake_outlets = as_id_array(self._depression_outlet_map[self._lake_codes])
+
+        if self._reroute_flow and ("flow__receiver_node" in self._grid.at_node):
+            self._receivers = self._grid.at_node["flow__receiver_node"]
+            self._sinks = self._grid.at_node["flow__sink_flag"]
+            self._grads = self._grid.at_node["topographic__steepest_slope"]
+            self._links = self._grid.at_node["flow__link_to_receiver_node"]
+            self._route_flow(lake_nodes)
+            self._reaccumulate_flow()
+
+    def _find_lake_nodes(self):
+        """Find the nodes of the depressions that contain a pit.
+
+        Pits that were not flooded (because they lie on a flat that is level
+        with their outlet) are lakes by themselves, draining to the node
+        from which they were reached.
+        """
+        pits = self._pit_node_ids
+        flooded_pits = pits[self._outlet_at_node[pits] != -1]
+        dry_pits = pits[
+            (self._outlet_at_node[pits] == -1) & (self._flooded_from[pits] != -1)
+        ]
+        self._outlet_at_node[dry_pits] = self._flooded_from[dry_pits]
+
+        is_lake = np.isin(
+            self._outlet_at_node, np.unique(self._outlet_at_node[flooded_pits])
+        )
+        is_lake[self._outlet_at_node == -1] = False
+        is_lake[dry_pits] = True
+
+        return as_id_array(np.flatnonzero(is_lake))
+
+    def _label_lakes(self, lake_nodes):
+        """Label each of *lake_nodes* with the lake that it is in.
+
+        Lakes are the connected groups of nodes that drain through the same
+        outlet, so that separate depressions that share an outlet are
+        separate lakes, as with DepressionFinderAndRouter. Returns the
+        label, from zero, of each node.
+        """
+        outlet = self._depression_outlet_map
+        nbrs = self._node_nbrs[lake_nodes]
+        nodes = np.broadcast_to(lake_nodes.reshape((-1, 1)), nbrs.shape)
+        is_joined = (nbrs != -1) & (outlet[nbrs] == outlet[nodes])
+
+        index_of = np.full(self._grid.number_of_nodes, -1, dtype=int)
+        index_of[lake_nodes] = np.arange(len(lake_nodes))
+        adjacency = csr_matrix(
+            (
+                np.ones(np.count_nonzero(is_joined), dtype=np.int8),
+                (index_of[nodes[is_joined]], index_of[nbrs[is_joined]]),
+            ),
+            shape=(len(lake_nodes), len(lake_nodes)),
+        )
+        return connected_components(adjacency, directed=False)[1]
+
+    def _route_flow(self, lake_nodes):
+        """Route flow across lakes, and out through their outlets.
+
+        As with DepressionFinderAndRouter, an outlet on the boundary drains
+        to itself, and any other outlet drains along the steepest descent to
+        a neighbor outside of its lake whose (water) surface is lower than
+        the outlet. Flow is then routed breadth-first across each lake from
+        its outlet.
+        """
+        outlets = self._lake_outlets
+        on_boundary = self._grid.status_at_node[outlets] != self._grid.BC_NODE_IS_CORE
+        self._receivers[outlets[on_boundary]] = outlets[on_boundary]
+
+        outlets = outlets[~on_boundary]
+        nbrs = self._lake_nbrs[outlets]
+        links = self._lake_nbr_links[outlets]
+        surface = self._elev + self._depression_depth
+
+        # sweep the neighbors in the same order as assign_outlet_receiver,
+        # keeping the steepest that is lower than the receiver found so far
+        receivers = self._flooded_from[outlets]
+        receiver_links = np.full_like(receivers, self._grid.BAD_INDEX)
+        receiver_elev = self._elev[outlets]
+        max_grad = np.zeros(len(outlets))
+        for nbr, link in zip(nbrs.T, links.T):
+            grad = (self._elev[outlets] - self._elev[nbr]) / self._length_of_lake_links[
+                link
+            ]
+            is_steepest = (
+                (nbr != -1)
+                & (self._depression_outlet_map[nbr] != outlets)
+                & (self._grid.status_at_node[nbr] != self._grid.BC_NODE_IS_CLOSED)
+                & (surface[nbr] < receiver_elev)
+                & (grad > max_grad)
+            )
+            receivers[is_steepest] = nbr[is_steepest]
+            receiver_links[is_steepest] = link[is_steepest]
+            receiver_elev[is_steepest] = self._elev[nbr[is_steepest]]
+            max_grad[is_steepest] = grad[is_steepest]
+
+            # if there is no such neighbor (the outlet is level with the node
+            # it was reached from) drain to the node it was reached from
+            is_flooded_from = (max_grad == 0.0) & (nbr == receivers)
+            receiver_links[is_flooded_from] = link[is_flooded_from]
+
+        self._receivers[outlets] = receivers
+        self._links[outlets] = receiver_links
+
+        route_flow_across_lakes(
+            np.unique(self._lake_outlets),
+            self._depression_outlet_map,
+            self._lake_nbrs,
+            self._lake_nbr_links,
+            self._n_orthogonal_nbrs,
+            self._receivers,
+            self._links,
+        )
+        receivers = self._receivers[lake_nodes]
+        self._grads[lake_nodes] = np.maximum(
+            (self._elev[lake_nodes] - self._elev[receivers])
+            / self._length_of_lake_links[self._links[lake_nodes]],
+            0.0,
+        )
+
+        self._sinks[self._pit_node_ids] = False
@@ -10,6 +10,10 @@ import numpy as np
 
 from landlab import Component, LinkStatus
 
+from ..taylor_nonlinear_hillslope_flux.taylor_nonlinear_hillslope_flux import (
+    _solve_taylor_flux_implicit,
+)
+
 
 class DepthDependentTaylorDiffuser(Component):
 
@@ -199,6 +203,26 @@ class DepthDependentTaylorDiffuser(Component):
     >>> np.greater(soil_decay_depth_1[1], soil_decay_depth_point1[1])
     False
 
+    Finally, the implicit solver takes a large step on steep topography in
+    a single pass, without substepping. Soil depth at links is taken from
+    the start of the step.
+
+    >>> mg = RasterModelGrid((3, 5))
+    >>> soilTh = mg.add_zeros('node', 'soil__depth')
+    >>> z = mg.add_zeros('node', 'topographic__elevation')
+    >>> BRz = mg.add_zeros('node', 'bedrock__elevation')
+    >>> z += mg.node_x.copy()**2
+    >>> BRz[:] = z - 1.0
+    >>> soilTh[:] = z - BRz
+    >>> expweath = ExponentialWeatherer(mg)
+    >>> DDdiff = DepthDependentTaylorDiffuser(mg, solver="implicit")
+    >>> expweath.calc_soil_prod_rate()
+    >>> DDdiff.run_one_step(10)
+    >>> np.any(np.isnan(z))
+    False
+    >>> np.allclose(mg.at_node['soil__depth'], z - BRz)
+    True
+
     References
     ----------
     **Required Software Citation(s) Specific to this Component**
@@ -299,6 +323,7 @@ class DepthDependentTaylorDiffuser(Component):
         dynamic_dt=False,
         if_unstable="pass",
         courant_factor=0.2,
+        solver="explicit",
     ):
         """Initialize the DepthDependentTaylorDiffuser.
 
@@ -326,8 +351,21 @@ class DepthDependentTaylorDiffuser(Component):
             "raise", "warn")
         courant_factor : float
             Courant factor for timestep calculation.
+        solver : str
+            Time integration scheme, "explicit" (default) or "implicit".
+            The implicit solver uses a backward-time update, with Newton
+            iterations on the slope dependence of the flux and soil depth
+            held at its value from the start of the step. It is stable for
+            any time step, and ignores *dynamic_dt*, *if_unstable* and
+            *courant_factor*.
         """
         super().__init__(grid)
+
+        if solver not in ("explicit", "implicit"):
+            raise ValueError(
+                "Parameter 'solver' must be one of: " + "'explicit', 'implicit'"
+            )
+        self._solver = solver
         # Store grid and parameters
 
         self._K = linear_diffusivity
@@ -358,6 +396,10 @@ class DepthDependentTaylorDiffuser(Component):
         dt: float (time)
             The imposed timestep.
         """
+        if self._solver == "implicit":
+            self._soilflux_implicit(dt)
+            return
+
         # establish time left as all of dt
         time_left = dt
 
@@ -431,6 +473,53 @@ class DepthDependentTaylorDiffuser(Component):
             # current self._sub_dt
             self._update_flux_topography_soil_and_bedrock()
 
+    def _soilflux_implicit(self, dt):
+        """Calculate soil flux for a time period 'dt' with the implicit solver.
+
+        Parameters
+        ----------
+        dt: float (time)
+            The imposed timestep.
+        """
+        core_nodes = self._grid.core_nodes
+
+        # calculate soil__depth
+        self._depth[:] = self._elev - self._bedrock
+
+        # Calculate soil depth at links.
+        self._H_link = self._grid.map_value_at_max_node_to_link(
+            "topographic__elevation", "soil__depth"
+        )
+
+        # Update topography from the flux divergence
+        z_old = self._elev[core_nodes].copy()
+        self._slope, self._flux[:] = _solve_taylor_flux_implicit(
+            self._grid,
+            self._elev,
+            dt,
+            (
+                self._K
+                * self._soil_transport_decay_depth
+                * (1.0 - np.exp(-self._H_link / self._soil_transport_decay_depth))
+            ),
+            self._slope_crit,
+            self._nterms,
+        )
+
+        # Calculate soil depth at nodes
+        self._depth[core_nodes] += (
+            self._soil_prod_rate[core_nodes] * dt + self._elev[core_nodes] - z_old
+        )
+
+        # prevent negative soil thickness
+        self._depth[self._depth < 0.0] = 0.0
+
+        # Calculate bedrock elevation
+        self._bedrock[core_nodes] -= self._soil_prod_rate[core_nodes] * dt
+
+        # Update topography
+        self._elev[core_nodes] = self._depth[core_nodes] + self._bedrock[core_nodes]
+
     def _update_flux_topography_soil_and_bedrock(self):
         """Calculate soil flux and update topography."""
         # Calculate flux
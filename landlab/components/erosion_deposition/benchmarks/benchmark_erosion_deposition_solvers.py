@@ -0,0 +1,45 @@
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import ErosionDeposition, FlowAccumulator
+
+
+def _setup(shape, solver):
+    grid = RasterModelGrid(shape, xy_spacing=10.0)
+    grid.set_closed_boundaries_at_grid_edges(True, True, True, False)
+    z = grid.add_zeros("topographic__elevation", at="node")
+    z += (
+        np.random.default_rng(1945).random(z.size)
+        + 0.01 * grid.x_of_node
+        + 0.001 * grid.y_of_node
+    )
+
+    FlowAccumulator(grid, flow_director="D8").run_one_step()
+    return ErosionDeposition(
+        grid, K=0.01, v_s=0.5, m_sp=0.5, n_sp=1.0, F_f=0.3, solver=solver
+    )
+
+
+def bench_basic():
+    _setup((300, 300), "basic").run_one_step(10.0)
+
+
+def bench_fused():
+    _setup((300, 300), "fused").run_one_step(10.0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for shape in [(100, 100), (300, 300)]:
+        timings = []
+        for solver in ["basic", "adaptive", "fused"]:
+            erodep = _setup(shape, solver)
+            timings.append(
+                min(timeit.repeat(lambda: erodep.run_one_step(1.0), number=1, repeat=1))
+            )
+        print(
+            "{0} nodes: basic {1:.4f} s, adaptive {2:.4f} s, fused {3:.4f} s".format(
+                shape[0] * shape[1], *timings
+            )
+        )
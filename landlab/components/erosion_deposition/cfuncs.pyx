@@ -4,6 +4,7 @@ cimport cython
 
 cdef extern from "math.h":
     double exp(double x) nogil
+    double pow(double x, double y) nogil
 
 DTYPE_FLOAT = np.double
 ctypedef np.double_t DTYPE_FLOAT_t
@@ -57,3 +58,113 @@ def calculate_qs_in(np.ndarray[DTYPE_INT_t, ndim=1] stack_flip_ud,
         else:
             # if q at the current node is zero, set qs at that node is zero.
             qs[node_id] = 0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def sequential_ero_depo(
+    const DTYPE_INT_t[:] stack,
+    const DTYPE_INT_t[:] flow_receivers,
+    const np.uint8_t[:] status_at_node,
+    const np.uint8_t[:] is_flooded_core_node,
+    const DTYPE_FLOAT_t[:] cell_area_at_node,
+    const DTYPE_FLOAT_t[:] q,
+    const DTYPE_FLOAT_t[:] slope,
+    const DTYPE_FLOAT_t[:] K,
+    const DTYPE_FLOAT_t[:] sp_crit,
+    DTYPE_FLOAT_t[:] qs,
+    DTYPE_FLOAT_t[:] qs_in,
+    DTYPE_FLOAT_t[:] erosion_term,
+    DTYPE_FLOAT_t[:] depo_rate,
+    DTYPE_FLOAT_t[:] z,
+    double m_sp,
+    double n_sp,
+    double v_s,
+    double F_f,
+    double dt,
+    bint drop_sediment_in_pits,
+):
+    """Erode, deposit and update elevations in a single pass down the stack.
+
+    For each node, from upstream to downstream, calculate the erosion rate,
+    the sediment flux out of the node and its deposition rate, and update
+    the elevation of core nodes. This is the same update as
+    ``ErosionDeposition.run_one_step_basic`` but without any temporary
+    arrays.
+
+    Parameters
+    ----------
+    stack : ndarray of int
+        Nodes ordered from downstream to upstream.
+    flow_receivers : ndarray of int
+        Receiver of each node.
+    status_at_node : ndarray of uint8
+        Node status. Only the elevations of core nodes are updated.
+    is_flooded_core_node : ndarray of uint8
+        Nonzero for core nodes that are flooded or self-draining.
+    cell_area_at_node : ndarray of float
+        Cell area at nodes.
+    q : ndarray of float
+        Water discharge.
+    slope : ndarray of float
+        Slope to the receiver node.
+    K : ndarray of float
+        Erodibility.
+    sp_crit : ndarray of float
+        Critical stream power.
+    qs, qs_in, erosion_term, depo_rate : ndarray of float
+        Sediment flux out of and into each node, erosion and deposition
+        rates. Filled in place; *qs_in* must be zero on entry.
+    z : ndarray of float
+        Elevation, updated in place.
+    m_sp, n_sp : float
+        Discharge and slope exponents.
+    v_s : float
+        Effective settling velocity.
+    F_f : float
+        Fraction of fines.
+    dt : float
+        Time step.
+    drop_sediment_in_pits : bool
+        If True, all incoming sediment is deposited at flooded core nodes.
+    """
+    cdef long n_nodes = stack.shape[0]
+    cdef long i, node, receiver
+    cdef double omega, omega_over_sp_crit
+
+    with nogil:
+        for i in range(n_nodes - 1, -1, -1):
+            node = stack[i]
+            receiver = flow_receivers[node]
+
+            if is_flooded_core_node[node]:
+                erosion_term[node] = 0.0
+            else:
+                omega = K[node] * pow(q[node], m_sp) * pow(slope[node], n_sp)
+                if sp_crit[node] != 0.0:
+                    omega_over_sp_crit = omega / sp_crit[node]
+                else:
+                    omega_over_sp_crit = 0.0
+                erosion_term[node] = omega - sp_crit[node] * (
+                    1.0 - exp(-omega_over_sp_crit)
+                )
+
+            if q[node] > 0 and receiver != node:
+                qs[node] = (
+                    qs_in[node]
+                    + ((1.0 - F_f) * erosion_term[node]) * cell_area_at_node[node]
+                ) / (1.0 + (v_s * cell_area_at_node[node] / (q[node])))
+                qs_in[receiver] += qs[node]
+            else:
+                qs[node] = 0.0
+
+            if drop_sediment_in_pits and is_flooded_core_node[node]:
+                depo_rate[node] = qs_in[node] / cell_area_at_node[node]
+            elif q[node] > 0:
+                depo_rate[node] = qs[node] * (v_s / q[node])
+            else:
+                depo_rate[node] = 0.0
+
+            if status_at_node[node] == 0:
+                z[node] += (depo_rate[node] - erosion_term[node]) * dt
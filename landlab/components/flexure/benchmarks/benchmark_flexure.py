@@ -0,0 +1,36 @@
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import Flexure
+
+
+def _setup(shape, **kwds):
+    grid = RasterModelGrid(shape, xy_spacing=1e3)
+    load = grid.add_zeros("lithosphere__overlying_pressure_increment", at="node")
+    load[:] = np.random.default_rng(1945).random(load.size) * 1e6
+    return Flexure(grid, method="flexure", **kwds)
+
+
+def bench_direct():
+    _setup((50, 50)).update()
+
+
+def bench_fft():
+    _setup((1000, 1000), backend="fft").update()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for shape in [(50, 50), (100, 100), (1000, 1000), (2000, 2000)]:
+        for backend in ["direct", "fft"]:
+            if backend == "direct" and shape[0] > 100:
+                continue
+            flex = _setup(shape, backend=backend)
+            print(
+                "{0} nodes, {1}: {2:.4f} s".format(
+                    shape[0] * shape[1],
+                    backend,
+                    min(timeit.repeat(flex.update, number=1, repeat=3)),
+                )
+            )
@@ -59,6 +59,7 @@ array([ 0., 0., 0., 0.,
 """
 
 import numpy as np
+import scipy.fft
 
 from landlab import Component
 
@@ -178,6 +179,7 @@ class Flexure(Component):
         rho_mantle=3300.0,
         gravity=9.80665,
         n_procs=1,
+        backend="direct",
     ):
         """Initialize the flexure component.
 
@@ -197,9 +199,19 @@ class Flexure(Component):
             Acceleration due to gravity (m / s^2).
         n_procs : int, optional
             Number of processors to use for calculations.
+        backend : {'direct', 'fft'}, optional
+            How to sum the deflections due to all of the loads. 'direct' adds
+            the contribution of each load to every node. 'fft' calculates the
+            same sum as a convolution with fast Fourier transforms, which is
+            much faster for large grids, and uses *n_procs* threads rather
+            than processes.
         """
         if method not in ("airy", "flexure"):
             raise ValueError("{method}: method not understood".format(method=method))
+        if backend not in ("direct", "fft"):
+            raise ValueError(
+                "{backend}: backend not understood".format(backend=backend)
+            )
 
         super().__init__(grid)
 
@@ -207,6 +219,7 @@ class Flexure(Component):
         self._method = method
         self._rho_mantle = rho_mantle
         self._gravity = gravity
+        self._backend = backend
         self.eet = eet
         self._n_procs = n_procs
 
@@ -229,6 +242,7 @@ class Flexure(Component):
         self._r = self._create_kei_func_grid(
             self._grid.shape, (self._grid.dy, self._grid.dx), self.alpha
         )
+        self._kernel_spectrum = None
 
     @property
     def youngs(self):
@@ -255,6 +269,11 @@ class Flexure(Component):
         """Name of method used to calculate deflections."""
         return self._method
 
+    @property
+    def backend(self):
+        """Name of backend used to sum deflections."""
+        return self._backend
+
     @property
     def alpha(self):
         """Flexure parameter (m)."""
@@ -272,6 +291,35 @@ class Flexure(Component):
 
         return kei(np.sqrt(dx ** 2 + dy ** 2) / alpha)
 
+    @staticmethod
+    def _create_kernel_spectrum(r, fft_shape, workers=1):
+        """Fourier transform of the deflection kernel for all node offsets.
+
+        *r* holds the kernel for offsets of zero and up along each axis. It
+        is mirrored to negative offsets, which wrap around to the end of an
+        array of *fft_shape*. As long as *fft_shape* is at least
+        ``2 * r.shape - 1``, a circular convolution with this kernel is then
+        the same as the direct sum.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from landlab.components.flexure import Flexure
+        >>> r = np.array([[4.0, 2.0], [3.0, 1.0]])
+        >>> spectrum = Flexure._create_kernel_spectrum(r, (3, 4))
+        >>> np.fft.irfft2(spectrum, s=(3, 4)).round(6)
+        array([[ 4.,  2.,  0.,  2.],
+               [ 3.,  1.,  0.,  1.],
+               [ 3.,  1.,  0.,  1.]])
+        """
+        n_rows, n_cols = r.shape
+        kernel = np.zeros(fft_shape)
+        kernel[:n_rows, :n_cols] = r
+        kernel[:n_rows, -1:-n_cols:-1] = r[:, 1:]
+        kernel[-1:-n_rows:-1, :] = kernel[1:n_rows, :]
+
+        return scipy.fft.rfft2(kernel, workers=workers)
+
     def update(self):
         """Update fields with current loading conditions."""
         load = self._grid.at_node["lithosphere__overlying_pressure_increment"]
@@ -306,15 +354,42 @@ class Flexure(Component):
         dz = out.reshape(self._grid.shape)
         load = loads.reshape(self._grid.shape)
 
-        from .cfuncs import subside_grid_in_parallel
+        if self._backend == "fft":
+            self._subside_loads_fft(load * self._grid.dx * self._grid.dy, out=dz)
+        else:
+            from .cfuncs import subside_grid_in_parallel
 
-        subside_grid_in_parallel(
-            dz,
-            load * self._grid.dx * self._grid.dy,
-            self._r,
-            self.alpha,
-            self.gamma_mantle,
-            self._n_procs,
-        )
+            subside_grid_in_parallel(
+                dz,
+                load * self._grid.dx * self._grid.dy,
+                self._r,
+                self.alpha,
+                self.gamma_mantle,
+                self._n_procs,
+            )
 
         return out
+
+    def _subside_loads_fft(self, load, out):
+        """Add deflections due to point loads, summed by FFT convolution.
+
+        As with the direct sum, loads with a magnitude of 1e-6 or less are
+        ignored. The spectrum of the kernel is calculated on the first call
+        and reused until the flexure parameter changes.
+        """
+        fft_shape = tuple(
+            scipy.fft.next_fast_len(2 * n - 1, real=True) for n in self._grid.shape
+        )
+        if self._kernel_spectrum is None:
+            c = -1.0 / (2.0 * np.pi * self.gamma_mantle * self.alpha ** 2.0)
+            self._kernel_spectrum = self._create_kernel_spectrum(
+                self._r * c, fft_shape, workers=self._n_procs
+            )
+
+        load_spectrum = scipy.fft.rfft2(
+            np.where(np.abs(load) > 1e-6, load, 0.0), s=fft_shape, workers=self._n_procs
+        )
+        load_spectrum *= self._kernel_spectrum
+        out += scipy.fft.irfft2(load_spectrum, s=fft_shape, workers=self._n_procs)[
+            : self._grid.shape[0], : self._grid.shape[1]
+        ]
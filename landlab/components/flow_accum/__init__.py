@@ -1,8 +1,16 @@
 from .flow_accum_bw import (
     find_drainage_area_and_discharge,
+    find_ensemble_discharge,
     flow_accumulation,
     make_ordered_node_array,
 )
+from .flow_accum_to_n import (
+    find_drainage_area_and_discharge_csr_to_n,
+    find_ensemble_discharge_csr_to_n,
+    make_donor_csr_to_n,
+    make_ordered_node_array_to_n,
+)
+from .flow_accum_tiled import find_drainage_area_tiled, find_flow_directions_tiled
 from .flow_accumulator import FlowAccumulator
 from .lossy_flow_accumulator import LossyFlowAccumulator
 
@@ -12,4 +20,11 @@ __all__ = [
     "make_ordered_node_array",
     "find_drainage_area_and_discharge",
     "flow_accumulation",
+    "find_ensemble_discharge",
+    "make_donor_csr_to_n",
+    "make_ordered_node_array_to_n",
+    "find_drainage_area_and_discharge_csr_to_n",
+    "find_ensemble_discharge_csr_to_n",
+    "find_drainage_area_tiled",
+    "find_flow_directions_tiled",
 ]
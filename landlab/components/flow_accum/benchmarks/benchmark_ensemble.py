@@ -0,0 +1,65 @@
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import FlowAccumulator
+
+
+def _accumulator(shape, flow_director="D8"):
+    grid = RasterModelGrid(shape)
+    grid.add_field(
+        "topographic__elevation",
+        grid.x_of_node + grid.y_of_node + np.random.rand(grid.number_of_nodes),
+        at="node",
+    )
+    fa = FlowAccumulator(grid, flow_director=flow_director)
+    fa.run_one_step()
+    return fa
+
+
+def _one_at_a_time(fa, runoff):
+    runoff_at_node = fa._grid.at_node["water__unit_flux_in"]
+    discharge = np.empty_like(runoff)
+    for scenario in range(runoff.shape[0]):
+        runoff_at_node[:] = runoff[scenario]
+        discharge[scenario] = fa.accumulate_flow(
+            update_flow_director=False, update_depression_finder=False
+        )[1]
+    return discharge
+
+
+def bench_one_at_a_time_1e5():
+    fa = _accumulator((316, 316))
+    _one_at_a_time(fa, np.random.rand(100, fa._grid.number_of_nodes))
+
+
+def bench_ensemble_1e5():
+    fa = _accumulator((316, 316))
+    fa.accumulate_runoff_ensemble(np.random.rand(100, fa._grid.number_of_nodes))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for flow_director in ("D8", "MFD"):
+        for shape, n_scenarios in [((316, 316), 100), ((1000, 1000), 100)]:
+            fa = _accumulator(shape, flow_director=flow_director)
+            runoff = np.random.rand(n_scenarios, fa._grid.number_of_nodes)
+            loop = min(
+                timeit.repeat(lambda: _one_at_a_time(fa, runoff), number=1, repeat=3)
+            )
+            ensemble = min(
+                timeit.repeat(
+                    lambda: fa.accumulate_runoff_ensemble(runoff), number=1, repeat=3
+                )
+            )
+            print(
+                "{0}, {1} nodes x {2} scenarios: one at a time {3:.3f} s, "
+                "ensemble {4:.3f} s ({5:.1f}x)".format(
+                    flow_director,
+                    fa._grid.number_of_nodes,
+                    n_scenarios,
+                    loop,
+                    ensemble,
+                    loop / ensemble,
+                )
+            )
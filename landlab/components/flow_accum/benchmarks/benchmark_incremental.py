@@ -0,0 +1,57 @@
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import FlowAccumulator
+
+
+def _accumulator(shape, incremental):
+    grid = RasterModelGrid(shape)
+    x, y = grid.x_of_node, grid.y_of_node
+    z = grid.add_zeros("topographic__elevation", at="node")
+    z += np.minimum(np.minimum(x, x.max() - x), np.minimum(y, y.max() - y))
+    z += 0.1 * np.random.rand(grid.number_of_nodes)
+    fa = FlowAccumulator(grid, flow_director="D8", incremental=incremental)
+    fa.run_one_step()
+    return fa
+
+
+def _perturb(fa, fraction):
+    grid = fa.grid
+    nodes = np.random.choice(
+        grid.core_nodes, size=int(fraction * grid.number_of_core_nodes)
+    )
+    grid.at_node["topographic__elevation"][nodes] += 0.5
+
+
+def bench_full_reroute_1e6():
+    fa = _accumulator((1000, 1000), False)
+    _perturb(fa, 1e-4)
+    fa.run_one_step()
+
+
+def bench_incremental_reroute_1e6():
+    fa = _accumulator((1000, 1000), True)
+    _perturb(fa, 1e-4)
+    fa.run_one_step()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for fraction in (1e-4, 1e-3, 1e-2):
+        for incremental in (False, True):
+            fa = _accumulator((1000, 1000), incremental)
+            elapsed = min(
+                timeit.repeat(
+                    lambda: fa.accumulate_flow(update_flow_director=False),
+                    setup=lambda: _perturb(fa, fraction)
+                    or fa.flow_director.run_one_step(),
+                    number=1,
+                    repeat=5,
+                )
+            )
+            print(
+                "{0:g} of nodes perturbed, incremental={1}: {2:.3f} s".format(
+                    fraction, incremental, elapsed
+                )
+            )
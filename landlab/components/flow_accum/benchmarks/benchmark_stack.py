@@ -0,0 +1,62 @@
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import FlowDirectorSteepest
+from landlab.components.flow_accum.flow_accum_bw import (
+    _DrainageStack,
+    _make_array_of_donors,
+    _make_delta_array,
+    _make_number_of_donors_array,
+    _StackBuilder,
+)
+
+
+def _receivers(shape):
+    grid = RasterModelGrid(shape)
+    grid.add_field(
+        "topographic__elevation",
+        grid.x_of_node + grid.y_of_node + np.random.rand(grid.number_of_nodes),
+        at="node",
+    )
+    FlowDirectorSteepest(grid).run_one_step()
+    return grid.at_node["flow__receiver_node"]
+
+
+def _recursive_stack(r):
+    nd = _make_number_of_donors_array(r)
+    delta = _make_delta_array(nd)
+    D = _make_array_of_donors(r, delta)
+    dstack = _DrainageStack(delta, D)
+    for k in np.where(r == np.arange(len(r)))[0]:
+        dstack.add_to_stack(k)
+    return dstack.s, delta, D
+
+
+def bench_recursive_stack_1e6():
+    r = _receivers((1000, 1000))
+    _recursive_stack(r)
+
+
+def bench_stack_builder_1e6():
+    r = _receivers((1000, 1000))
+    _StackBuilder(r.size).update(r)
+
+
+def bench_stack_builder_1e7():
+    r = _receivers((3163, 3163))
+    _StackBuilder(r.size).update(r)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for shape in [(1000, 1000), (3163, 3163)]:
+        r = _receivers(shape)
+        builder = _StackBuilder(r.size)
+        recursive = min(timeit.repeat(lambda: _recursive_stack(r), number=1, repeat=3))
+        compiled = min(timeit.repeat(lambda: builder.update(r), number=1, repeat=3))
+        print(
+            "{0} nodes: recursive {1:.3f} s, builder {2:.3f} s ({3:.1f}x)".format(
+                r.size, recursive, compiled, recursive / compiled
+            )
+        )
@@ -0,0 +1,44 @@
+import tempfile
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import FlowAccumulator
+from landlab.components.flow_accum import find_drainage_area_tiled
+
+
+def _elevations_on_disk(shape):
+    z = np.memmap(tempfile.TemporaryFile(), dtype=float, mode="w+", shape=shape)
+    for row in range(shape[0]):
+        z[row] = row + np.arange(shape[1]) + np.random.rand(shape[1])
+    return z
+
+
+def _flow_accumulator(z):
+    grid = RasterModelGrid(z.shape)
+    grid.add_field("topographic__elevation", np.array(z).reshape(-1), at="node")
+    FlowAccumulator(grid, flow_director="D8").run_one_step()
+    return grid.at_node["drainage_area"]
+
+
+def _tiled(z, tile_shape):
+    area = np.memmap(tempfile.TemporaryFile(), dtype=float, mode="w+", shape=z.shape)
+    return find_drainage_area_tiled(z, out=area, tile_shape=tile_shape)
+
+
+def bench_flow_accumulator_1e6():
+    _flow_accumulator(_elevations_on_disk((1000, 1000)))
+
+
+def bench_tiled_1e6():
+    _tiled(_elevations_on_disk((1000, 1000)), (250, 250))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    z = _elevations_on_disk((1000, 1000))
+    in_memory = min(timeit.repeat(lambda: _flow_accumulator(z), number=1, repeat=3))
+    print("{0} nodes: FlowAccumulator {1:.3f} s".format(z.size, in_memory))
+    for tile_shape in [(100, 100), (250, 250), (1000, 1000)]:
+        tiled = min(timeit.repeat(lambda: _tiled(z, tile_shape), number=1, repeat=3))
+        print("{0} nodes: tiles of {1} {2:.3f} s".format(z.size, tile_shape, tiled))
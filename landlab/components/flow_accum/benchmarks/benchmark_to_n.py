@@ -0,0 +1,72 @@
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import FlowDirectorMFD
+from landlab.components.flow_accum.flow_accum_to_n import (
+    _DrainageStack_to_n,
+    _make_array_of_donors_to_n,
+    _make_delta_array_to_n,
+    _make_number_of_donors_array_to_n,
+    _StackBuilderToN,
+    find_drainage_area_and_discharge_csr_to_n,
+    find_drainage_area_and_discharge_to_n,
+)
+
+
+def _receivers(shape):
+    grid = RasterModelGrid(shape)
+    grid.add_field(
+        "topographic__elevation",
+        grid.x_of_node + grid.y_of_node + np.random.rand(grid.number_of_nodes),
+        at="node",
+    )
+    FlowDirectorMFD(grid, diagonals=True).run_one_step()
+    return (
+        grid.at_node["flow__receiver_node"],
+        grid.at_node["flow__receiver_proportions"],
+    )
+
+
+def _set_based_accumulation(r, p):
+    nd = _make_number_of_donors_array_to_n(r, p)
+    delta = _make_delta_array_to_n(nd)
+    D = _make_array_of_donors_to_n(r, p, delta)
+    dstack = _DrainageStack_to_n(delta, D, np.sum(r >= 0, axis=1))
+    dstack.construct__stack(np.where(np.arange(r.shape[0]) == r[:, 0])[0])
+    return find_drainage_area_and_discharge_to_n(dstack.s, r, p)
+
+
+def _csr_accumulation(builder, r, p):
+    s, _, _ = builder.update(r, p)
+    return find_drainage_area_and_discharge_csr_to_n(
+        s, builder.indptr, builder.indices, builder.weights
+    )
+
+
+def bench_set_based_1e5():
+    r, p = _receivers((316, 316))
+    _set_based_accumulation(r, p)
+
+
+def bench_csr_1e6():
+    r, p = _receivers((1000, 1000))
+    _csr_accumulation(_StackBuilderToN(r.shape[0]), r, p)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for shape in [(316, 316), (1000, 1000)]:
+        r, p = _receivers(shape)
+        builder = _StackBuilderToN(r.shape[0])
+        set_based = min(
+            timeit.repeat(lambda: _set_based_accumulation(r, p), number=1, repeat=3)
+        )
+        csr = min(
+            timeit.repeat(lambda: _csr_accumulation(builder, r, p), number=1, repeat=3)
+        )
+        print(
+            "{0} nodes: set based {1:.3f} s, csr {2:.3f} s ({3:.1f}x)".format(
+                r.shape[0], set_based, csr, set_based / csr
+            )
+        )
@@ -120,3 +120,443 @@ cpdef _make_donors_to_n(DTYPE_INT_t np,
                 ind = delta[ri] + w[ri]
                 D[ind] = i
                 w[ri] += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef _make_donor_structure(DTYPE_INT_t np,
+                            np.ndarray[DTYPE_INT_t, ndim=1] r,
+                            np.ndarray[DTYPE_INT_t, ndim=1] nd,
+                            np.ndarray[DTYPE_INT_t, ndim=1] delta,
+                            np.ndarray[DTYPE_INT_t, ndim=1] D):
+    """Fill the number-of-donors, delta and donor arrays in place.
+
+    *nd* and *D* must have *np* elements, *delta* must have *np* + 1.
+    """
+    cdef int i, ri
+
+    for i in range(np):
+        nd[i] = 0
+    for i in range(np):
+        nd[r[i]] += 1
+
+    delta[0] = 0
+    for i in range(np):
+        delta[i + 1] = delta[i] + nd[i]
+
+    # nd is reused as the running count of donors already placed in D, so
+    # that it once again holds the number of donors when we are done.
+    for i in range(np):
+        nd[i] = 0
+    for i in range(np):
+        ri = r[i]
+        D[delta[ri] + nd[ri]] = i
+        nd[ri] += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef DTYPE_INT_t _make_stack(DTYPE_INT_t np,
+                              np.ndarray[DTYPE_INT_t, ndim=1] r,
+                              np.ndarray[DTYPE_INT_t, ndim=1] delta,
+                              np.ndarray[DTYPE_INT_t, ndim=1] D,
+                              np.ndarray[DTYPE_INT_t, ndim=1] s,
+                              np.ndarray[DTYPE_INT_t, ndim=1] work):
+    """Build the downstream-to-upstream stack, *s*, in place.
+
+    This is a non-recursive version of _add_to_stack that visits the
+    donors of each base-level node depth-first, and in the same order, so
+    that the resulting stack is identical. *work* is scratch space of *np*
+    elements. Returns the number of nodes added to the stack.
+    """
+    cdef int j = 0
+    cdef int top, k, l, m, n
+
+    for k in range(np):
+        if r[k] != k:
+            continue
+
+        work[0] = k
+        top = 1
+        while top > 0:
+            top -= 1
+            l = work[top]
+            s[j] = l
+            j += 1
+
+            # push donors in reverse so that they are popped in order
+            for n in range(delta[l + 1] - 1, delta[l] - 1, -1):
+                m = D[n]
+                if m != l:
+                    work[top] = m
+                    top += 1
+
+    return j
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef DTYPE_INT_t _mark_downstream_of_changed(
+    np.ndarray[DTYPE_INT_t, ndim=1] changed,
+    np.ndarray[DTYPE_INT_t, ndim=1] r_old,
+    np.ndarray[DTYPE_INT_t, ndim=1] r_new,
+    np.ndarray[np.uint8_t, ndim=1] affected,
+):
+    """Mark nodes downstream of nodes whose receiver has changed.
+
+    Nodes along both the old and the new flow paths from each changed node
+    are marked: bit 1 of *affected* for the old path and bit 2 for the new
+    one. A walk stops as soon as it reaches a node already marked for the
+    same path. Returns the number of newly marked nodes.
+    """
+    cdef int n_changed = changed.shape[0]
+    cdef int count = 0
+    cdef int i, node
+
+    for i in range(n_changed):
+        node = changed[i]
+        while affected[node] & 1 == 0:
+            if affected[node] == 0:
+                count += 1
+            affected[node] |= 1
+            if r_old[node] == node:
+                break
+            node = r_old[node]
+
+        node = changed[i]
+        while affected[node] & 2 == 0:
+            if affected[node] == 0:
+                count += 1
+            affected[node] |= 2
+            if r_new[node] == node:
+                break
+            node = r_new[node]
+
+    return count
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef _find_blocks(DTYPE_INT_t np,
+                   np.ndarray[DTYPE_INT_t, ndim=1] r,
+                   np.ndarray[DTYPE_INT_t, ndim=1] s,
+                   np.ndarray[DTYPE_INT_t, ndim=1] block_start,
+                   np.ndarray[DTYPE_INT_t, ndim=1] block_size):
+    """Find where the block of each base-level node lies within the stack.
+
+    Only the elements of *block_start* and *block_size* at base-level
+    nodes are set.
+    """
+    cdef int i, l
+    cdef int k = -1
+
+    for i in range(np):
+        l = s[i]
+        if r[l] == l:
+            if k >= 0:
+                block_size[k] = i - block_start[k]
+            block_start[l] = i
+            k = l
+    if k >= 0:
+        block_size[k] = np - block_start[k]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef DTYPE_INT_t _update_stack_and_accumulate(
+    DTYPE_INT_t np,
+    np.ndarray[DTYPE_INT_t, ndim=1] r,
+    np.ndarray[DTYPE_INT_t, ndim=1] delta,
+    np.ndarray[DTYPE_INT_t, ndim=1] D,
+    np.ndarray[np.uint8_t, ndim=1] affected,
+    np.ndarray[DTYPE_INT_t, ndim=1] s_old,
+    np.ndarray[DTYPE_INT_t, ndim=1] s,
+    np.ndarray[DTYPE_INT_t, ndim=1] block_start,
+    np.ndarray[DTYPE_INT_t, ndim=1] block_size,
+    np.ndarray[DTYPE_INT_t, ndim=1] work,
+    np.ndarray[DTYPE_FLOAT_t, ndim=1] node_cell_area,
+    np.ndarray[DTYPE_FLOAT_t, ndim=1] runoff,
+    np.ndarray[DTYPE_FLOAT_t, ndim=1] drainage_area,
+    np.ndarray[DTYPE_FLOAT_t, ndim=1] discharge,
+):
+    """Rebuild the stack and accumulate flow only for affected basins.
+
+    The stack is made of one block per base-level node. Blocks whose
+    base-level node is not marked in *affected* are copied from the old
+    stack, *s_old*, using *block_start* and *block_size*; the others are
+    rebuilt, as in _make_stack, from the (new) delta and donor arrays.
+    *block_start* and *block_size* are updated in place for the new stack.
+    Drainage area and discharge are then recalculated at the affected nodes
+    of each rebuilt block. Returns the number of nodes in rebuilt blocks.
+    """
+    cdef int n_rebuilt = 0
+    cdef int i, j, k, l, m, n, top, start, donor, recvr
+    cdef float accum
+
+    j = 0
+    for k in range(np):
+        if r[k] != k:
+            continue
+
+        start = j
+        if not affected[k]:
+            i = block_start[k]
+            for n in range(block_size[k]):
+                s[j] = s_old[i + n]
+                j += 1
+            block_start[k] = start
+            continue
+
+        work[0] = k
+        top = 1
+        while top > 0:
+            top -= 1
+            l = work[top]
+            s[j] = l
+            j += 1
+
+            for n in range(delta[l + 1] - 1, delta[l] - 1, -1):
+                m = D[n]
+                if m != l:
+                    work[top] = m
+                    top += 1
+
+        block_start[k] = start
+        block_size[k] = j - start
+
+        for i in range(start, j):
+            l = s[i]
+            if affected[l]:
+                drainage_area[l] = node_cell_area[l]
+                discharge[l] = node_cell_area[l] * runoff[l]
+
+        for i in range(j - 1, start - 1, -1):
+            donor = s[i]
+            recvr = r[donor]
+            if donor != recvr and affected[recvr]:
+                drainage_area[recvr] += drainage_area[donor]
+                accum = discharge[recvr] + discharge[donor]
+                if accum < 0.:
+                    accum = 0.
+                discharge[recvr] = accum
+
+        n_rebuilt += j - start
+
+    return n_rebuilt
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef DTYPE_INT_t _make_donor_csr_to_n(DTYPE_INT_t np,
+                                       DTYPE_INT_t q,
+                                       np.ndarray[DTYPE_INT_t, ndim=2] r,
+                                       np.ndarray[DTYPE_FLOAT_t, ndim=2] p,
+                                       np.ndarray[DTYPE_INT_t, ndim=1] indptr,
+                                       np.ndarray[DTYPE_INT_t, ndim=1] indices,
+                                       np.ndarray[DTYPE_FLOAT_t, ndim=1] weights,
+                                       np.ndarray[DTYPE_INT_t, ndim=1] work):
+    """Fill the CSR donor arrays of a route-to-n graph in place.
+
+    The donors of node i are ``indices[indptr[i]:indptr[i + 1]]`` and the
+    proportion of the flow of each donor that goes to node i is in the same
+    elements of *weights*. Only receivers with a positive proportion are
+    included. Donors are in the same order as with _make_donors_to_n, so
+    that *indptr* and *indices* are the same as its delta and D arrays.
+
+    *indptr* must have *np* + 1 elements, *work* must have *np*, and
+    *indices* and *weights* must be large enough to hold every donor. Returns
+    the number of donors.
+    """
+    cdef int i, v, ri, k
+
+    for i in range(np + 1):
+        indptr[i] = 0
+    for v in range(q):
+        for i in range(np):
+            if p[i, v] > 0.:
+                indptr[r[i, v] + 1] += 1
+    for i in range(np):
+        indptr[i + 1] += indptr[i]
+
+    for i in range(np):
+        work[i] = indptr[i]
+    for v in range(q):
+        for i in range(np):
+            if p[i, v] > 0.:
+                ri = r[i, v]
+                k = work[ri]
+                indices[k] = i
+                weights[k] = p[i, v]
+                work[ri] += 1
+
+    return indptr[np]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef DTYPE_INT_t _make_stack_to_n(DTYPE_INT_t np,
+                                   DTYPE_INT_t q,
+                                   np.ndarray[DTYPE_INT_t, ndim=2] r,
+                                   np.ndarray[DTYPE_FLOAT_t, ndim=2] p,
+                                   np.ndarray[DTYPE_INT_t, ndim=1] indptr,
+                                   np.ndarray[DTYPE_INT_t, ndim=1] indices,
+                                   np.ndarray[DTYPE_INT_t, ndim=1] s,
+                                   np.ndarray[DTYPE_INT_t, ndim=1] work):
+    """Build the downstream-to-upstream stack of a route-to-n graph in place.
+
+    This is a topological sort of the graph: a node is added to the stack,
+    *s*, once all of its receivers are in it, starting from the nodes that
+    have no receivers other than themselves. *work* is scratch space of *np*
+    elements that counts the receivers of each node still to be added.
+
+    Nodes that can not be reached this way (because they drain into a
+    cycle) are put at the end of the stack in order of their IDs. Returns
+    the number of nodes that were sorted.
+    """
+    cdef int i, v, k, l, m, n_sorted
+    cdef int j = 0
+    cdef int head = 0
+
+    for i in range(np):
+        work[i] = 0
+        for v in range(q):
+            if p[i, v] > 0. and r[i, v] != i:
+                work[i] += 1
+
+    for i in range(np):
+        if work[i] == 0:
+            s[j] = i
+            j += 1
+
+    while head < j:
+        l = s[head]
+        head += 1
+        for k in range(indptr[l], indptr[l + 1]):
+            m = indices[k]
+            if m != l:
+                work[m] -= 1
+                if work[m] == 0:
+                    s[j] = m
+                    j += 1
+
+    n_sorted = j
+    if n_sorted < np:
+        for i in range(np):
+            if work[i] > 0:
+                s[j] = i
+                j += 1
+
+    return n_sorted
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef _accumulate_csr_to_n(DTYPE_INT_t np,
+                           np.ndarray[DTYPE_INT_t, ndim=1] s,
+                           np.ndarray[DTYPE_INT_t, ndim=1] indptr,
+                           np.ndarray[DTYPE_INT_t, ndim=1] indices,
+                           np.ndarray[DTYPE_FLOAT_t, ndim=1] weights,
+                           np.ndarray[DTYPE_FLOAT_t, ndim=1] drainage_area,
+                           np.ndarray[DTYPE_FLOAT_t, ndim=1] discharge):
+    """Accumulate drainage area and discharge over CSR donor arrays.
+
+    Works from upstream to downstream, gathering the flow of the donors of
+    each node, and permits transmission losses.
+    """
+    cdef int i, k, l, m
+    cdef double accum, weight
+
+    for i in range(np - 1, -1, -1):
+        l = s[i]
+        for k in range(indptr[l], indptr[l + 1]):
+            m = indices[k]
+            if m != l:
+                weight = weights[k]
+                drainage_area[l] += weight * drainage_area[m]
+                accum = discharge[l] + weight * discharge[m]
+                if accum < 0.:
+                    accum = 0.
+                discharge[l] = accum
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef _accumulate_bw_ensemble(DTYPE_INT_t np,
+                              np.ndarray[DTYPE_INT_t, ndim=1] s,
+                              np.ndarray[DTYPE_INT_t, ndim=1] r,
+                              np.ndarray[DTYPE_FLOAT_t, ndim=2] discharge):
+    """Accumulate discharge for many runoff scenarios in one pass.
+
+    *discharge* has one row per node and one column per scenario, so that
+    the scenarios of a node are next to each other in memory. Permits
+    transmission losses.
+    """
+    cdef int n_scenarios = discharge.shape[1]
+    cdef int donor, recvr, i, k
+    cdef double accum
+
+    for i in range(np - 1, -1, -1):
+        donor = s[i]
+        recvr = r[donor]
+        if donor != recvr:
+            for k in range(n_scenarios):
+                accum = discharge[recvr, k] + discharge[donor, k]
+                if accum < 0.:
+                    accum = 0.
+                discharge[recvr, k] = accum
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef _accumulate_csr_to_n_ensemble(DTYPE_INT_t np,
+                                    np.ndarray[DTYPE_INT_t, ndim=1] s,
+                                    np.ndarray[DTYPE_INT_t, ndim=1] indptr,
+                                    np.ndarray[DTYPE_INT_t, ndim=1] indices,
+                                    np.ndarray[DTYPE_FLOAT_t, ndim=1] weights,
+                                    np.ndarray[DTYPE_FLOAT_t, ndim=2] discharge):
+    """Accumulate discharge over CSR donor arrays for many runoff scenarios.
+
+    *discharge* has one row per node and one column per scenario. Permits
+    transmission losses.
+    """
+    cdef int n_scenarios = discharge.shape[1]
+    cdef int i, j, k, l, m
+    cdef double accum, weight
+
+    for i in range(np - 1, -1, -1):
+        l = s[i]
+        for j in range(indptr[l], indptr[l + 1]):
+            m = indices[j]
+            if m != l:
+                weight = weights[j]
+                for k in range(n_scenarios):
+                    accum = discharge[l, k] + weight * discharge[m, k]
+                    if accum < 0.:
+                        accum = 0.
+                    discharge[l, k] = accum
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef _find_next_marked_downstream(DTYPE_INT_t np,
+                                   np.ndarray[DTYPE_INT_t, ndim=1] s,
+                                   np.ndarray[DTYPE_INT_t, ndim=1] r,
+                                   np.ndarray[DTYPE_INT_t, ndim=1] marked,
+                                   np.ndarray[DTYPE_INT_t, ndim=1] out):
+    """Find the first marked node downstream of each node.
+
+    Works from downstream to upstream so that the receiver of a node is
+    always visited before the node itself. Nodes whose flow path ends
+    without passing through a marked node are given -1.
+    """
+    cdef int i, node, recvr
+
+    for i in range(np):
+        node = s[i]
+        recvr = r[node]
+        if recvr == node:
+            out[node] = -1
+        elif marked[recvr]:
+            out[node] = recvr
+        else:
+            out[node] = out[recvr]
@@ -22,13 +22,28 @@ If you simply want the ordered list by itself, use::
 
     s = make_ordered_node_array(r)
 
+To find the discharge for many runoff fields at once, with the same
+receivers and stack, use::
+
+    q = find_ensemble_discharge(s, r, runoff)
+
 Created: GT Nov 2013
 """
 import numpy
 
 from landlab.core.utils import as_id_array
 
-from .cfuncs import _accumulate_bw, _add_to_stack, _make_donors
+from .cfuncs import (
+    _accumulate_bw,
+    _accumulate_bw_ensemble,
+    _add_to_stack,
+    _find_blocks,
+    _make_donor_structure,
+    _make_donors,
+    _make_stack,
+    _mark_downstream_of_changed,
+    _update_stack_and_accumulate,
+)
 
 
 class _DrainageStack:
@@ -72,6 +87,259 @@ class _DrainageStack:
         self.j = _add_to_stack(node, self.j, self.s, self.delta, self.D)
 
 
+def _assert_all_stacked(n_stacked, number_of_nodes):
+    """Raise ValueError unless every node was added to the stack."""
+    if n_stacked != number_of_nodes:
+        raise ValueError(
+            "{0} of {1} nodes do not drain to a base-level node "
+            "(do their receivers form a cycle?)".format(
+                number_of_nodes - n_stacked, number_of_nodes
+            )
+        )
+
+
+class _StackBuilder:
+
+    """Build the Braun & Willett data structures into persistent buffers.
+
+    The number-of-donors, delta, donor and stack arrays are allocated once,
+    when the builder is created, and are then overwritten by each call to
+    update(). The whole construction is done in compiled code, without
+    recursion, so this is the preferred way to rebuild the stack repeatedly
+    for a grid whose number of nodes does not change.
+
+    Note that the arrays returned by update() are the builder's buffers and
+    so will be changed by the next call to update(); copy them if they need
+    to persist.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.flow_accum.flow_accum_bw import _StackBuilder
+    >>> r = np.array([2, 5, 2, 7, 5, 5, 6, 5, 7, 8]) - 1
+    >>> builder = _StackBuilder(10)
+    >>> s, delta, D = builder.update(r)
+    >>> s
+    array([4, 1, 0, 2, 5, 6, 3, 8, 7, 9])
+    >>> delta
+    array([ 0,  0,  2,  2,  2,  6,  7,  9, 10, 10, 10])
+    >>> D
+    array([0, 2, 1, 4, 5, 7, 6, 3, 8, 9])
+    >>> builder.nd
+    array([0, 2, 0, 0, 4, 1, 2, 1, 0, 0])
+
+    The buffers are reused by subsequent updates.
+
+    >>> r[9] = 9
+    >>> s_new, _, _ = builder.update(r)
+    >>> s_new is s
+    True
+    >>> s
+    array([4, 1, 0, 2, 5, 6, 3, 8, 7, 9])
+    """
+
+    def __init__(self, number_of_nodes):
+        """Allocate the buffers for a graph of *number_of_nodes* nodes."""
+        self._n = number_of_nodes
+        self._nd = numpy.zeros(number_of_nodes, dtype=int)
+        self._delta = numpy.zeros(number_of_nodes + 1, dtype=int)
+        self._D = numpy.zeros(number_of_nodes, dtype=int)
+        self._s = numpy.zeros(number_of_nodes, dtype=int)
+        self._work = numpy.empty(number_of_nodes, dtype=int)
+
+    @property
+    def nd(self):
+        """Number of donors for each node."""
+        return self._nd
+
+    @property
+    def delta(self):
+        """Index into *D* at which each node's donor list begins."""
+        return self._delta
+
+    @property
+    def D(self):
+        """IDs of the donors of each node."""
+        return self._D
+
+    @property
+    def s(self):
+        """Node IDs ordered from downstream to upstream."""
+        return self._s
+
+    def update(self, receiver_nodes):
+        """Rebuild the data structures for a new set of receivers.
+
+        Parameters
+        ----------
+        receiver_nodes : ndarray of int
+            ID of receiver for each node.
+
+        Returns
+        -------
+        tuple of ndarray of int
+            The stack, delta and donor arrays, (s, delta, D).
+
+        Raises
+        ------
+        ValueError
+            If some nodes do not drain to a base-level node (for example,
+            because their receivers form a cycle).
+        """
+        _make_donor_structure(self._n, receiver_nodes, self._nd, self._delta, self._D)
+        n_stacked = _make_stack(
+            self._n, receiver_nodes, self._delta, self._D, self._s, self._work
+        )
+        _assert_all_stacked(n_stacked, self._n)
+        return self._s, self._delta, self._D
+
+
+class _IncrementalStackBuilder(_StackBuilder):
+
+    """Build the Braun & Willett data structures, reusing unchanged basins.
+
+    In addition to rebuilding everything with update(), the builder can
+    update its stack, along with drainage area and discharge, for only those
+    basins (the nodes draining to a single base-level node) that contain a
+    node whose receiver has changed since the previous update. The rest of
+    the stack is copied from the previous one. Both the stack and the
+    accumulated values are identical to those found by rebuilding from
+    scratch.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.flow_accum import flow_accumulation
+    >>> from landlab.components.flow_accum.flow_accum_bw import (
+    ...     _IncrementalStackBuilder)
+    >>> r = np.array([2, 5, 2, 7, 5, 5, 6, 5, 7, 8, 11]) - 1
+    >>> a, q, s = flow_accumulation(r)
+    >>> builder = _IncrementalStackBuilder(11)
+    >>> _ = builder.update(r)
+
+    Node 9 now drains to node 5 rather than to node 7.
+
+    >>> r[9] = 5
+    >>> builder.update_and_accumulate(r, a, q, np.ones(11), np.ones(11))
+    10
+    >>> builder.s
+    array([ 4,  1,  0,  2,  5,  6,  3,  8,  9,  7, 10])
+    >>> a
+    array([  1.,   3.,   1.,   1.,  10.,   5.,   3.,   1.,   1.,   1.,   1.])
+    >>> np.all(a == flow_accumulation(r)[0])
+    True
+
+    Nothing needs to be done if no receivers have changed.
+
+    >>> builder.update_and_accumulate(r, a, q, np.ones(11), np.ones(11))
+    0
+    """
+
+    def __init__(self, number_of_nodes):
+        """Allocate the buffers for a graph of *number_of_nodes* nodes."""
+        super().__init__(number_of_nodes)
+        self._s_old = numpy.zeros(number_of_nodes, dtype=int)
+        self._r_old = numpy.zeros(number_of_nodes, dtype=int)
+        self._affected = numpy.zeros(number_of_nodes, dtype=numpy.uint8)
+        self._block_start = numpy.zeros(number_of_nodes, dtype=int)
+        self._block_size = numpy.zeros(number_of_nodes, dtype=int)
+        self._has_stack = False
+
+    def update(self, receiver_nodes):
+        """Rebuild the data structures for a new set of receivers.
+
+        Parameters
+        ----------
+        receiver_nodes : ndarray of int
+            ID of receiver for each node.
+
+        Returns
+        -------
+        tuple of ndarray of int
+            The stack, delta and donor arrays, (s, delta, D).
+        """
+        self._has_stack = False
+        super().update(receiver_nodes)
+        _find_blocks(
+            self._n, receiver_nodes, self._s, self._block_start, self._block_size
+        )
+        self._r_old[:] = receiver_nodes
+        self._has_stack = True
+        return self._s, self._delta, self._D
+
+    def update_and_accumulate(
+        self, receiver_nodes, drainage_area, discharge, node_cell_area, runoff
+    ):
+        """Update the stack, drainage area and discharge for new receivers.
+
+        Parameters
+        ----------
+        receiver_nodes : ndarray of int
+            ID of receiver for each node.
+        drainage_area : ndarray of float
+            Drainage area at each node for the receivers of the previous
+            update, updated in place.
+        discharge : ndarray of float
+            Discharge at each node for the receivers of the previous update,
+            updated in place.
+        node_cell_area : ndarray of float
+            Cell surface area for each node.
+        runoff : ndarray of float
+            Local runoff rate at each node. Must be the same as that used to
+            calculate *discharge* and must not be negative.
+
+        Returns
+        -------
+        int
+            The number of nodes in the basins that were rebuilt.
+
+        Raises
+        ------
+        ValueError
+            If some nodes do not drain to a base-level node. update must
+            then be called again before update_and_accumulate.
+        """
+        if not self._has_stack:
+            raise RuntimeError("update must be called before update_and_accumulate")
+
+        changed = numpy.flatnonzero(receiver_nodes != self._r_old)
+        if len(changed) == 0:
+            return 0
+
+        self._affected.fill(0)
+        _mark_downstream_of_changed(
+            changed, self._r_old, receiver_nodes, self._affected
+        )
+        _make_donor_structure(self._n, receiver_nodes, self._nd, self._delta, self._D)
+
+        self._s, self._s_old = self._s_old, self._s
+        n_rebuilt = _update_stack_and_accumulate(
+            self._n,
+            receiver_nodes,
+            self._delta,
+            self._D,
+            self._affected,
+            self._s_old,
+            self._s,
+            self._block_start,
+            self._block_size,
+            self._work,
+            numpy.asarray(node_cell_area, dtype=float),
+            numpy.asarray(runoff, dtype=float),
+            drainage_area,
+            discharge,
+        )
+        self._r_old[:] = receiver_nodes
+
+        baselevel_nodes = numpy.flatnonzero(receiver_nodes == numpy.arange(self._n))
+        n_stacked = self._block_size[baselevel_nodes].sum()
+        if n_stacked != self._n:
+            self._has_stack = False
+        _assert_all_stacked(n_stacked, self._n)
+
+        return n_rebuilt
+
+
 def _make_number_of_donors_array(r):
 
     """Number of donors for each node.
@@ -196,20 +464,21 @@ def make_ordered_node_array(receiver_nodes, nd=None, delta=None, D=None):
     >>> s
     array([4, 1, 0, 2, 5, 6, 3, 8, 7, 9])
     """
-    node_id = numpy.arange(receiver_nodes.size)
-    baselevel_nodes = numpy.where(node_id == receiver_nodes)[0]
-    if nd is None:
-        nd = _make_number_of_donors_array(receiver_nodes)
-    if delta is None:
-        delta = _make_delta_array(nd)
-    if D is None:
-        D = _make_array_of_donors(receiver_nodes, delta)
-    dstack = _DrainageStack(delta, D)
-    add_it = dstack.add_to_stack
-    for k in baselevel_nodes:
-        add_it(k)  # don't think this is a bottleneck, so no C++
-
-    return dstack.s
+    receiver_nodes = as_id_array(receiver_nodes)
+    if delta is None or D is None:
+        return _StackBuilder(receiver_nodes.size).update(receiver_nodes)[0]
+
+    s = numpy.zeros(receiver_nodes.size, dtype=int)
+    _make_stack(
+        receiver_nodes.size,
+        receiver_nodes,
+        as_id_array(delta),
+        as_id_array(D),
+        s,
+        numpy.empty(receiver_nodes.size, dtype=int),
+    )
+
+    return s
 
 
 def find_drainage_area_and_discharge(
@@ -288,6 +557,70 @@ def find_drainage_area_and_discharge(
     return drainage_area, discharge
 
 
+def find_ensemble_discharge(s, r, runoff, node_cell_area=1.0, boundary_nodes=None):
+
+    """Calculate the water discharge at each node for many runoff fields.
+
+    Each row of *runoff* is one scenario. All of the scenarios are
+    accumulated together in a single pass through the stack, which is
+    much faster than calling find_drainage_area_and_discharge once for
+    each scenario.
+
+    Parameters
+    ----------
+    s : ndarray of int
+        Ordered (downstream to upstream) array of node IDs
+    r : ndarray of int
+        Receiver IDs for each node
+    runoff : ndarray of float, shape (n_scenarios, n_nodes)
+        Local runoff rate at each cell (in water depth per time) for each
+        scenario. Runoff is permitted to be negative, in which case it
+        performs as a transmission loss.
+    node_cell_area : float or ndarray
+        Cell surface areas for each node. If it's an array, must have same
+        length as s (that is, the number of nodes).
+    boundary_nodes: list, optional
+        Array of boundary nodes to have discharge set to zero.
+        Default value is None.
+
+    Returns
+    -------
+    ndarray of float, shape (n_scenarios, n_nodes)
+        Discharge for each scenario.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.flow_accum import find_ensemble_discharge
+    >>> r = np.array([2, 5, 2, 7, 5, 5, 6, 5, 7, 8])-1
+    >>> s = np.array([4, 1, 0, 2, 5, 6, 3, 8, 7, 9])
+    >>> runoff = np.array([np.ones(10), np.arange(10.)])
+    >>> find_ensemble_discharge(s, r, runoff)
+    array([[  1.,   3.,   1.,   1.,  10.,   4.,   3.,   2.,   1.,   1.],
+           [  0.,   3.,   2.,   3.,  45.,  22.,  17.,  16.,   8.,   9.]])
+    """
+    # Number of points
+    np = len(s)
+
+    runoff = numpy.atleast_2d(runoff)
+
+    # Discharge starts out as the cell's local runoff rate times the cell's
+    # surface area. It is stored with the scenarios of each node next to one
+    # another, so that they are all accumulated at once.
+    discharge = numpy.empty((np, runoff.shape[0]))
+    discharge[:] = (node_cell_area * runoff).T
+
+    # Optionally zero out discharge at boundary nodes
+    if boundary_nodes is not None:
+        discharge[boundary_nodes] = 0
+
+    _accumulate_bw_ensemble(np, as_id_array(s), as_id_array(r), discharge)
+    # nodes at channel heads can still be negative with this method, so...
+    discharge.clip(0.0, out=discharge)
+
+    return discharge.T
+
+
 def find_drainage_area_and_discharge_lossy(
     s,
     r,
@@ -0,0 +1,499 @@
+#!/usr/env/python
+
+"""
+flow_accum_tiled.py: Tiled, out-of-core flow routing for very large rasters.
+
+Finds drainage area for rasters that are too large to be held in memory as
+a RasterModelGrid. Elevations are read, and drainage area is written, one
+tile at a time. Anything that supports two-dimensional slicing can therefore
+be used for input and output: a numpy array, a numpy.memmap, or a variable of
+an open netCDF4 dataset (see landlab.io.netcdf.create_raster_netcdf).
+
+The main public function is::
+
+    a = find_drainage_area_tiled(z, out=a, tile_shape=(1024, 1024))
+
+Routing is done with three passes over the tiles:
+
+1.  Steepest-descent flow directions (D8, as with FlowDirectorD8, or D4, as
+    with FlowDirectorSteepest) are found for each tile using a one-node halo
+    of elevations around the tile. They are stored as small integer codes.
+2.  Drainage area is accumulated within each tile, with the
+    flow_accum_bw stack algorithm, as though the tile were the entire
+    domain. The flow paths that leave each tile are then reduced to a graph
+    that connects only the nodes along the edges of the tiles. This graph
+    is small enough to hold in memory and is accumulated to find the area
+    that enters each tile from its neighbors.
+3.  Drainage area is accumulated within each tile once more, this time with
+    the inflow from neighboring tiles added at the edges of the tile, and is
+    written to the output.
+
+Boundary conditions are those of a RasterModelGrid with its default
+boundaries: nodes along the edges of the raster are fixed-value base-level
+nodes. As with FlowDirectorD8, depressions are not filled. Nodes whose
+elevation is *nodata* (or NaN) are closed.
+"""
+import tempfile
+
+import numpy
+
+from .cfuncs import _find_next_marked_downstream
+from .flow_accum_bw import find_drainage_area_and_discharge, make_ordered_node_array
+
+# Row and column offsets to the receiver of a node for each flow-direction
+# code. Code 0 is a node that is its own receiver. Neighbors are ordered as
+# the links of a raster are: east, north, west, south, then northeast,
+# northwest, southwest and southeast.
+_ROW_OFFSET = numpy.array([0, 0, 1, 0, -1, 1, 1, -1, -1])
+_COL_OFFSET = numpy.array([0, 1, 0, -1, 0, 1, -1, -1, 1])
+
+# Flow-direction code of a closed node.
+_CLOSED = -1
+
+
+def _iter_tiles(shape, tile_shape):
+    """Iterate over the row and column slices of the tiles of a raster.
+
+    Examples
+    --------
+    >>> from landlab.components.flow_accum.flow_accum_tiled import _iter_tiles
+    >>> for rows, cols in _iter_tiles((5, 4), (3, 3)):
+    ...     print(rows, cols)
+    slice(0, 3, None) slice(0, 3, None)
+    slice(0, 3, None) slice(3, 4, None)
+    slice(3, 5, None) slice(0, 3, None)
+    slice(3, 5, None) slice(3, 4, None)
+    """
+    n_rows, n_cols = shape
+    for row in range(0, n_rows, tile_shape[0]):
+        for col in range(0, n_cols, tile_shape[1]):
+            yield (
+                slice(row, min(row + tile_shape[0], n_rows)),
+                slice(col, min(col + tile_shape[1], n_cols)),
+            )
+
+
+def _read_with_halo(elevation, rows, cols, nodata=None):
+    """Read the elevations of a tile along with a one-node halo.
+
+    Halo nodes that lie outside of the raster, along with nodes that are
+    *nodata*, NaN, or masked, are given an elevation of infinity so that
+    flow is never directed to them.
+    """
+    n_rows, n_cols = elevation.shape
+    start_row, stop_row = max(rows.start - 1, 0), min(rows.stop + 1, n_rows)
+    start_col, stop_col = max(cols.start - 1, 0), min(cols.stop + 1, n_cols)
+
+    z = numpy.full((rows.stop - rows.start + 2, cols.stop - cols.start + 2), numpy.inf)
+    z[
+        start_row - rows.start + 1 : stop_row - rows.start + 1,
+        start_col - cols.start + 1 : stop_col - cols.start + 1,
+    ] = numpy.ma.filled(elevation[start_row:stop_row, start_col:stop_col], numpy.nan)
+
+    z[numpy.isnan(z)] = numpy.inf
+    if nodata is not None:
+        z[z == nodata] = numpy.inf
+
+    return z
+
+
+def _is_at_raster_edge(rows, cols, shape):
+    """Flag the nodes of a tile that lie along the edge of the raster."""
+    row = numpy.arange(rows.start, rows.stop).reshape((-1, 1))
+    col = numpy.arange(cols.start, cols.stop).reshape((1, -1))
+    return (row == 0) | (row == shape[0] - 1) | (col == 0) | (col == shape[1] - 1)
+
+
+def _calc_tile_flow_directions(z, distance, at_edge):
+    """Find the steepest-descent flow directions of the nodes of a tile.
+
+    *z* are the elevations of the tile with a one-node halo, *distance* the
+    distance to each neighbor to consider, and *at_edge* flags the nodes
+    that lie along the edge of the raster.
+    """
+    n_rows, n_cols = z.shape[0] - 2, z.shape[1] - 2
+    center = z[1:-1, 1:-1]
+
+    slope = numpy.empty((len(distance), n_rows, n_cols))
+    with numpy.errstate(invalid="ignore"):
+        for k in range(len(distance)):
+            row, col = 1 + _ROW_OFFSET[k + 1], 1 + _COL_OFFSET[k + 1]
+            numpy.divide(
+                center - z[row : row + n_rows, col : col + n_cols],
+                distance[k],
+                out=slope[k],
+            )
+        has_downslope = slope.max(axis=0) > 0.0
+
+    codes = numpy.argmax(slope, axis=0) + 1
+    codes[~has_downslope | at_edge] = 0
+    codes[numpy.isinf(center)] = _CLOSED
+
+    return codes
+
+
+def _calc_tile_receivers(codes):
+    """Find receivers within a tile, using the tile's own node numbering.
+
+    Nodes that flow out of the tile are made their own receivers.
+
+    Returns
+    -------
+    tuple of ndarray
+        The receiver of each node, the row and column of each node's true
+        receiver (relative to the tile, so they can lie outside of it), and
+        whether each node flows out of the tile.
+    """
+    n_rows, n_cols = codes.shape
+    code = codes.clip(0)
+    row = numpy.arange(n_rows).reshape((-1, 1)) + _ROW_OFFSET[code]
+    col = numpy.arange(n_cols).reshape((1, -1)) + _COL_OFFSET[code]
+    inside = (row >= 0) & (row < n_rows) & (col >= 0) & (col < n_cols)
+
+    receivers = numpy.where(
+        inside, row * n_cols + col, numpy.arange(codes.size).reshape(codes.shape)
+    )
+
+    return (
+        receivers.reshape(-1),
+        row.reshape(-1),
+        col.reshape(-1),
+        ~inside.reshape(-1),
+    )
+
+
+def _calc_tile_cell_area(codes, rows, cols, shape, cell_area):
+    """Cell area at the nodes of a tile; zero for edge and closed nodes."""
+    area = numpy.full(codes.shape, cell_area)
+    area[_is_at_raster_edge(rows, cols, shape) | (codes == _CLOSED)] = 0.0
+    return area.reshape(-1)
+
+
+def _nodes_at_tile_edge(tile_shape):
+    """Flag the nodes that lie along the edge of a tile."""
+    at_tile_edge = numpy.zeros(tile_shape, dtype=int)
+    at_tile_edge[(0, -1), :] = 1
+    at_tile_edge[:, (0, -1)] = 1
+    return at_tile_edge.reshape(-1)
+
+
+def _global_id(row, col, rows, cols, shape):
+    """Convert the row and column of a node within a tile to its global id."""
+    return (rows.start + row) * shape[1] + cols.start + col
+
+
+def _reduce_tile(codes, rows, cols, shape, cell_area):
+    """Reduce the flow paths of a tile to paths between its edge nodes.
+
+    Returns
+    -------
+    tuple of ndarray
+        For each node along the edge of the tile: its global id, the global
+        id of the next tile-edge node downstream (or -1, if there is none),
+        the drainage area that it passes to a neighboring tile, and whether
+        it flows out of the tile.
+    """
+    n_cols = codes.shape[1]
+    receivers, row, col, exits = _calc_tile_receivers(codes)
+    node_cell_area = _calc_tile_cell_area(codes, rows, cols, shape, cell_area)
+
+    s = make_ordered_node_array(receivers)
+    area, _ = find_drainage_area_and_discharge(
+        s, receivers, node_cell_area=node_cell_area
+    )
+
+    at_tile_edge = _nodes_at_tile_edge(codes.shape)
+    next_at_tile_edge = numpy.empty(codes.size, dtype=int)
+    _find_next_marked_downstream(
+        codes.size, s, receivers, at_tile_edge, next_at_tile_edge
+    )
+
+    nodes = numpy.flatnonzero(at_tile_edge)
+    exits = exits[nodes]
+    downstream = numpy.where(
+        exits, _global_id(row[nodes], col[nodes], rows, cols, shape), -1
+    )
+
+    next_node = next_at_tile_edge[nodes]
+    is_in_tile = ~exits & (next_node >= 0)
+    next_node = next_node[is_in_tile]
+    downstream[is_in_tile] = _global_id(
+        next_node // n_cols, next_node % n_cols, rows, cols, shape
+    )
+
+    return (
+        _global_id(nodes // n_cols, nodes % n_cols, rows, cols, shape),
+        downstream,
+        numpy.where(exits, area[nodes], 0.0),
+        exits,
+    )
+
+
+def _find_inflow_at_tile_edges(node_ids, downstream, outflow, exits):
+    """Accumulate the reduced graph of tile-edge nodes.
+
+    The graph is accumulated with *outflow* as the local contribution of
+    each node, which gives the total drainage area that each node passes
+    along to the next node downstream. Summing this over the nodes that
+    flow out of their tile gives the inflow from neighboring tiles.
+
+    Returns
+    -------
+    tuple of ndarray
+        Sorted global ids of the tile-edge nodes and the drainage area that
+        flows into each of them from neighboring tiles.
+    """
+    sorted_nodes = numpy.argsort(node_ids)
+    node_ids = node_ids[sorted_nodes]
+    downstream = downstream[sorted_nodes]
+    outflow = outflow[sorted_nodes]
+    exits = exits[sorted_nodes]
+
+    receivers = numpy.arange(len(node_ids))
+    has_downstream = downstream >= 0
+    receivers[has_downstream] = numpy.searchsorted(node_ids, downstream[has_downstream])
+
+    s = make_ordered_node_array(receivers)
+    total, _ = find_drainage_area_and_discharge(s, receivers, node_cell_area=outflow)
+
+    inflow = numpy.bincount(
+        receivers[exits], weights=total[exits], minlength=len(node_ids)
+    )
+
+    return node_ids, inflow
+
+
+def find_flow_directions_tiled(
+    elevation,
+    out=None,
+    tile_shape=(1024, 1024),
+    xy_spacing=(1.0, 1.0),
+    nodata=None,
+    method="D8",
+):
+    """Find steepest-descent flow directions one tile at a time.
+
+    Parameters
+    ----------
+    elevation : array_like of float, shape (n_rows, n_cols)
+        Elevations at the nodes of a raster. Only one tile (plus a halo) is
+        read at a time, so this can be a numpy.memmap or a netCDF4 variable.
+    out : array_like of int, shape (n_rows, n_cols), optional
+        Where to write the flow-direction codes. If not provided, a new
+        array is created.
+    tile_shape : tuple of int, optional
+        Number of rows and columns of nodes in a tile.
+    xy_spacing : tuple of float, optional
+        Spacing between columns and between rows of nodes.
+    nodata : float, optional
+        Elevation that marks a node as closed. Nodes with NaN (or masked)
+        elevations are always closed.
+    method : {'D8', 'D4'}, optional
+        Route flow to one of the eight neighbors of a node, as with
+        FlowDirectorD8, or to one of its four orthogonal neighbors, as with
+        FlowDirectorSteepest.
+
+    Returns
+    -------
+    array_like of int
+        Flow-direction code of each node: -1 for a closed node, 0 for a
+        node that is its own receiver and 1 through 8 for flow to the east,
+        north, west, south, northeast, northwest, southwest and southeast
+        neighbor.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.flow_accum import find_flow_directions_tiled
+    >>> z = np.array([
+    ...     [9., 0., 9., 9., 9., 9.],
+    ...     [9., 1., 2., 3., 4., 9.],
+    ...     [9., 2.5, 3.5, 4.5, 5.5, 9.],
+    ...     [9., 4., 5., 6., 7., 9.],
+    ...     [9., 9., 9., 9., 9., 9.],
+    ... ])
+    >>> find_flow_directions_tiled(z, tile_shape=(2, 2))
+    array([[0, 0, 0, 0, 0, 0],
+           [0, 4, 7, 3, 3, 0],
+           [0, 4, 7, 7, 7, 0],
+           [0, 4, 7, 7, 7, 0],
+           [0, 0, 0, 0, 0, 0]], dtype=int8)
+    >>> find_flow_directions_tiled(z, tile_shape=(2, 2), method="D4")
+    array([[0, 0, 0, 0, 0, 0],
+           [0, 4, 3, 3, 3, 0],
+           [0, 4, 4, 4, 4, 0],
+           [0, 4, 4, 4, 4, 0],
+           [0, 0, 0, 0, 0, 0]], dtype=int8)
+    """
+    if method not in ("D8", "D4"):
+        raise ValueError("method not understood ({0})".format(method))
+    if min(tile_shape) < 1:
+        raise ValueError("tile_shape must be at least one node on a side")
+
+    dx, dy = xy_spacing
+    distance = numpy.array([dx, dy, dx, dy] + [numpy.hypot(dx, dy)] * 4)
+    if method == "D4":
+        distance = distance[:4]
+
+    shape = elevation.shape
+    if out is None:
+        out = numpy.empty(shape, dtype=numpy.int8)
+
+    for rows, cols in _iter_tiles(shape, tile_shape):
+        out[rows, cols] = _calc_tile_flow_directions(
+            _read_with_halo(elevation, rows, cols, nodata=nodata),
+            distance,
+            _is_at_raster_edge(rows, cols, shape),
+        )
+
+    return out
+
+
+def find_drainage_area_tiled(
+    elevation,
+    out=None,
+    tile_shape=(1024, 1024),
+    xy_spacing=(1.0, 1.0),
+    nodata=None,
+    method="D8",
+    flow_directions=None,
+):
+    """Find drainage area of a raster one tile at a time.
+
+    The result is the same as that of a FlowAccumulator, with a D8 (or
+    steepest) flow director, run on a RasterModelGrid of the same
+    elevations, but only a tile's worth of the raster is held in memory at
+    once, along with a small graph of the nodes along the edges of the
+    tiles.
+
+    Parameters
+    ----------
+    elevation : array_like of float, shape (n_rows, n_cols)
+        Elevations at the nodes of a raster. Only one tile (plus a halo) is
+        read at a time, so this can be a numpy.memmap or a netCDF4 variable.
+    out : array_like of float, shape (n_rows, n_cols), optional
+        Where to write drainage area, one tile at a time. This can be a
+        numpy.memmap or a netCDF4 variable. If not provided, a new array is
+        created.
+    tile_shape : tuple of int, optional
+        Number of rows and columns of nodes in a tile.
+    xy_spacing : tuple of float, optional
+        Spacing between columns and between rows of nodes.
+    nodata : float, optional
+        Elevation that marks a node as closed. Nodes with NaN (or masked)
+        elevations are always closed.
+    method : {'D8', 'D4'}, optional
+        Route flow as FlowDirectorD8 does or, with 'D4', as
+        FlowDirectorSteepest does.
+    flow_directions : array_like of int, shape (n_rows, n_cols), optional
+        Where to keep flow directions while routing. If not provided, a
+        temporary numpy.memmap is used. On return, holds the flow-direction
+        codes of find_flow_directions_tiled.
+
+    Returns
+    -------
+    array_like of float
+        Drainage area at each node.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.components import FlowAccumulator
+    >>> from landlab.components.flow_accum import find_drainage_area_tiled
+
+    >>> z = np.array([
+    ...     [9., 0., 9., 9., 9., 9.],
+    ...     [9., 1., 2., 3., 4., 9.],
+    ...     [9., 2.5, 3.5, 4.5, 5.5, 9.],
+    ...     [9., 4., 5., 6., 7., 9.],
+    ...     [9., 9., 9., 9., 9., 9.],
+    ... ])
+    >>> find_drainage_area_tiled(z, tile_shape=(2, 2))
+    array([[  0.,  12.,   0.,   0.,   0.,   0.],
+           [  0.,   6.,   6.,   3.,   1.,   0.],
+           [  0.,   3.,   2.,   2.,   1.,   0.],
+           [  0.,   1.,   1.,   1.,   1.,   0.],
+           [  0.,   0.,   0.,   0.,   0.,   0.]])
+
+    The same as a FlowAccumulator on a RasterModelGrid.
+
+    >>> grid = RasterModelGrid((5, 6))
+    >>> _ = grid.add_field("topographic__elevation", z, at="node")
+    >>> fa = FlowAccumulator(grid, flow_director="D8")
+    >>> fa.run_one_step()
+    >>> grid.at_node["drainage_area"].reshape(grid.shape)
+    array([[  0.,  12.,   0.,   0.,   0.,   0.],
+           [  0.,   6.,   6.,   3.,   1.,   0.],
+           [  0.,   3.,   2.,   2.,   1.,   0.],
+           [  0.,   1.,   1.,   1.,   1.,   0.],
+           [  0.,   0.,   0.,   0.,   0.,   0.]])
+
+    For a raster that does not fit into memory, read elevations from, and
+    write drainage area to, memory-mapped arrays (or to a NetCDF file
+    created with landlab.io.netcdf.create_raster_netcdf).
+
+    >>> import tempfile
+    >>> z_on_disk = np.memmap(
+    ...     tempfile.TemporaryFile(), dtype=float, mode="w+", shape=(5, 6)
+    ... )
+    >>> z_on_disk[:] = z
+    >>> area_on_disk = np.memmap(
+    ...     tempfile.TemporaryFile(), dtype=float, mode="w+", shape=(5, 6)
+    ... )
+    >>> _ = find_drainage_area_tiled(z_on_disk, out=area_on_disk, tile_shape=(2, 2))
+    >>> np.all(area_on_disk == grid.at_node["drainage_area"].reshape(grid.shape))
+    True
+    """
+    shape = elevation.shape
+    if out is None:
+        out = numpy.empty(shape, dtype=float)
+    if flow_directions is None:
+        flow_directions = numpy.memmap(
+            tempfile.TemporaryFile(), dtype=numpy.int8, mode="w+", shape=shape
+        )
+
+    find_flow_directions_tiled(
+        elevation,
+        out=flow_directions,
+        tile_shape=tile_shape,
+        xy_spacing=xy_spacing,
+        nodata=nodata,
+        method=method,
+    )
+
+    cell_area = xy_spacing[0] * xy_spacing[1]
+
+    reduced = [
+        _reduce_tile(
+            numpy.asarray(flow_directions[rows, cols], dtype=int),
+            rows,
+            cols,
+            shape,
+            cell_area,
+        )
+        for rows, cols in _iter_tiles(shape, tile_shape)
+    ]
+    node_ids, inflow = _find_inflow_at_tile_edges(
+        *[numpy.concatenate(arrays) for arrays in zip(*reduced)]
+    )
+    del reduced
+
+    for rows, cols in _iter_tiles(shape, tile_shape):
+        codes = numpy.asarray(flow_directions[rows, cols], dtype=int)
+        receivers = _calc_tile_receivers(codes)[0]
+        node_cell_area = _calc_tile_cell_area(codes, rows, cols, shape, cell_area)
+
+        nodes = numpy.flatnonzero(_nodes_at_tile_edge(codes.shape))
+        global_ids = _global_id(
+            nodes // codes.shape[1], nodes % codes.shape[1], rows, cols, shape
+        )
+        node_cell_area[nodes] += inflow[numpy.searchsorted(node_ids, global_ids)]
+
+        s = make_ordered_node_array(receivers)
+        area, _ = find_drainage_area_and_discharge(
+            s, receivers, node_cell_area=node_cell_area
+        )
+        out[rows, cols] = area.reshape(codes.shape)
+
+    return out
@@ -43,13 +43,33 @@ If you simply want the ordered list by itself, use::
 
     s = make_ordered_node_array_to_n(r, p, b)
 
+The donors of each node can also be stored as a compressed sparse row (CSR)
+structure, with the proportion of flow from each donor as the weights::
+
+    indptr, indices, weights = make_donor_csr_to_n(r, p)
+
+from which drainage area and discharge are accumulated with::
+
+    a, q = find_drainage_area_and_discharge_csr_to_n(s, indptr, indices, weights)
+
+To find the discharge for many runoff fields at once, use::
+
+    q = find_ensemble_discharge_csr_to_n(s, indptr, indices, weights, runoff)
+
 Created: KRB Oct 2016 (modified from flow_accumu_bw)
 """
 import numpy
 
 from landlab.core.utils import as_id_array
 
-from .cfuncs import _accumulate_to_n, _make_donors_to_n
+from .cfuncs import (
+    _accumulate_csr_to_n,
+    _accumulate_csr_to_n_ensemble,
+    _accumulate_to_n,
+    _make_donor_csr_to_n,
+    _make_donors_to_n,
+    _make_stack_to_n,
+)
 
 
 class _DrainageStack_to_n:
@@ -206,6 +226,137 @@ class _DrainageStack_to_n:
         self.s = numpy.argsort(visit_time)
 
 
+class _StackBuilderToN:
+
+    """Build the route-to-n donor structure and stack into persistent buffers.
+
+    The route-to-n counterpart of flow_accum_bw._StackBuilder. The CSR donor
+    arrays and the stack are allocated when first needed and are then
+    overwritten by each call to update(), so rebuilding them for a grid
+    whose number of nodes does not change allocates no new arrays. The donor
+    arrays are grown if a later graph has more donors than fit.
+
+    Note that the arrays returned by update() are the builder's buffers and
+    so will be changed by the next call to update(); copy them if they need
+    to persist.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.flow_accum.flow_accum_to_n import (
+    ...     _StackBuilderToN)
+    >>> r = np.array([[ 1,  2],
+    ...               [ 4,  5],
+    ...               [ 1,  5],
+    ...               [ 6,  2],
+    ...               [ 4, -1],
+    ...               [ 4, -1],
+    ...               [ 5,  7],
+    ...               [ 4,  5],
+    ...               [ 6,  7],
+    ...               [ 7,  8]])
+    >>> p = np.array([[ 0.6,   0.4 ],
+    ...               [ 0.85,  0.15],
+    ...               [ 0.65,  0.35],
+    ...               [ 0.9,   0.1 ],
+    ...               [ 1.,    0.  ],
+    ...               [ 1.,    0.  ],
+    ...               [ 0.75,  0.25],
+    ...               [ 0.55,  0.45],
+    ...               [ 0.8,   0.2 ],
+    ...               [ 0.95,  0.05]])
+    >>> builder = _StackBuilderToN(10)
+    >>> s, delta, D = builder.update(r, p)
+    >>> s
+    array([4, 5, 1, 7, 2, 6, 0, 3, 8, 9])
+    >>> delta
+    array([ 0,  0,  2,  4,  4,  8, 12, 14, 17, 18, 18])
+    >>> D
+    array([0, 2, 0, 3, 1, 4, 5, 7, 6, 1, 2, 7, 3, 8, 9, 6, 8, 9])
+    >>> builder.weights
+    array([ 0.6 ,  0.65,  0.4 ,  0.1 ,  0.85,  1.  ,  1.  ,  0.55,  0.75,
+            0.15,  0.35,  0.45,  0.9 ,  0.8 ,  0.95,  0.25,  0.2 ,  0.05])
+
+    The buffers are reused by subsequent updates.
+
+    >>> s_new, _, _ = builder.update(r, p)
+    >>> s_new is s
+    True
+    """
+
+    def __init__(self, number_of_nodes):
+        """Allocate the buffers for a graph of *number_of_nodes* nodes."""
+        self._n = number_of_nodes
+        self._indptr = numpy.zeros(number_of_nodes + 1, dtype=int)
+        self._indices = numpy.zeros(0, dtype=int)
+        self._weights = numpy.zeros(0, dtype=float)
+        self._nnz = 0
+        self._s = numpy.zeros(number_of_nodes, dtype=int)
+        self._work = numpy.empty(number_of_nodes, dtype=int)
+
+    @property
+    def indptr(self):
+        """Index into *indices* at which each node's donor list begins."""
+        return self._indptr
+
+    @property
+    def indices(self):
+        """IDs of the donors of each node."""
+        return self._indices[: self._nnz]
+
+    @property
+    def weights(self):
+        """Proportion of the flow of each donor that goes to the node."""
+        return self._weights[: self._nnz]
+
+    @property
+    def s(self):
+        """Node IDs ordered from downstream to upstream."""
+        return self._s
+
+    def update(self, receiver_nodes, receiver_proportions):
+        """Rebuild the data structures for a new set of receivers.
+
+        Parameters
+        ----------
+        receiver_nodes : ndarray of int, shape (n_nodes, q)
+            IDs of the receivers of each node.
+        receiver_proportions : ndarray of float, shape (n_nodes, q)
+            Proportion of flow going to each receiver.
+
+        Returns
+        -------
+        tuple of ndarray of int
+            The stack, delta and donor arrays, (s, delta, D).
+        """
+        q = receiver_nodes.shape[1]
+        if self._indices.size < self._n * q:
+            self._indices = numpy.zeros(self._n * q, dtype=int)
+            self._weights = numpy.zeros(self._n * q, dtype=float)
+
+        self._nnz = _make_donor_csr_to_n(
+            self._n,
+            q,
+            receiver_nodes,
+            receiver_proportions,
+            self._indptr,
+            self._indices,
+            self._weights,
+            self._work,
+        )
+        _make_stack_to_n(
+            self._n,
+            q,
+            receiver_nodes,
+            receiver_proportions,
+            self._indptr,
+            self._indices,
+            self._s,
+            self._work,
+        )
+        return self._s, self._indptr, self.indices
+
+
 def _make_number_of_donors_array_to_n(r, p):
 
     """Number of donors for each node.
@@ -360,6 +511,83 @@ def _make_array_of_donors_to_n(r, p, delta):
     return D
 
 
+def make_donor_csr_to_n(receiver_nodes, receiver_proportions):
+    """Make the donor arrays of a route-to-n graph in CSR format.
+
+    The donors of node i are ``indices[indptr[i]:indptr[i + 1]]``, and the
+    proportion of the flow of each of those donors that goes to node i is
+    in the same elements of *weights*. That is, these are the arrays of a
+    compressed sparse row matrix whose rows are receivers and whose columns
+    are donors. Receivers with a proportion of zero are not included.
+
+    *indptr* and *indices* are the same as the delta and D arrays of the
+    Braun & Willett (2013) algorithm.
+
+    The lack of a leading underscore is meant to signal that this operation
+    could be useful outside of this module!
+
+    Parameters
+    ----------
+    receiver_nodes : ndarray of int, shape (n_nodes, q)
+        IDs of the receivers of each node.
+    receiver_proportions : ndarray of float, shape (n_nodes, q)
+        Proportion of flow going to each receiver.
+
+    Returns
+    -------
+    tuple of ndarray
+        The *indptr*, *indices* and *weights* arrays.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.flow_accum.flow_accum_to_n import(
+    ... make_donor_csr_to_n)
+    >>> r = np.array([[ 1,  2],
+    ...               [ 3, -1],
+    ...               [ 3,  1],
+    ...               [ 3, -1]])
+    >>> p = np.array([[ 0.5,  0.5],
+    ...               [ 1. ,  0. ],
+    ...               [ 0.2,  0.8],
+    ...               [ 1. ,  0. ]])
+    >>> indptr, indices, weights = make_donor_csr_to_n(r, p)
+    >>> indptr
+    array([0, 0, 2, 3, 6])
+    >>> indices
+    array([0, 2, 0, 1, 2, 3])
+    >>> weights
+    array([ 0.5,  0.8,  0.5,  1. ,  0.2,  1. ])
+
+    The same graph as a scipy sparse matrix:
+
+    >>> from scipy.sparse import csr_matrix
+    >>> csr_matrix((weights, indices, indptr), shape=(4, 4)).toarray()
+    array([[ 0. ,  0. ,  0. ,  0. ],
+           [ 0.5,  0. ,  0.8,  0. ],
+           [ 0.5,  0. ,  0. ,  0. ],
+           [ 0. ,  1. ,  0.2,  1. ]])
+    """
+    receiver_nodes = as_id_array(receiver_nodes)
+    receiver_proportions = numpy.asarray(receiver_proportions, dtype=float)
+    n_nodes, q = receiver_nodes.shape
+
+    indptr = numpy.empty(n_nodes + 1, dtype=int)
+    indices = numpy.empty(n_nodes * q, dtype=int)
+    weights = numpy.empty(n_nodes * q, dtype=float)
+    nnz = _make_donor_csr_to_n(
+        n_nodes,
+        q,
+        receiver_nodes,
+        receiver_proportions,
+        indptr,
+        indices,
+        weights,
+        numpy.empty(n_nodes, dtype=int),
+    )
+    return indptr, indices[:nnz], weights[:nnz]
+
+
 def make_ordered_node_array_to_n(
     receiver_nodes, receiver_proportion, nd=None, delta=None, D=None
 ):
@@ -372,6 +600,11 @@ def make_ordered_node_array_to_n(
     The lack of a leading underscore is meant to signal that this operation
     could be useful outside of this module!
 
+    The stack is built in compiled code by a topological sort of the
+    donor graph: a node is added once all of its receivers have been added,
+    starting from the nodes that drain only to themselves. *nd* is no longer
+    used, and is accepted only for backward compatibility.
+
     Examples
     --------
     >>> import numpy as np
@@ -411,22 +644,24 @@ def make_ordered_node_array_to_n(
     >>> len(set([0, 3, 8])-set(s[6:9]))
     0
     """
-    node_id = numpy.arange(receiver_nodes.shape[0])
-    baselevel_nodes = numpy.where(node_id == receiver_nodes[:, 0])[0]
-    if nd is None:
-        nd = _make_number_of_donors_array_to_n(receiver_nodes, receiver_proportion)
-    if delta is None:
-        delta = _make_delta_array_to_n(nd)
-    if D is None:
-        D = _make_array_of_donors_to_n(receiver_nodes, receiver_proportion, delta)
-
-    num_receivers = numpy.sum(receiver_nodes >= 0, axis=1)
-
-    dstack = _DrainageStack_to_n(delta, D, num_receivers)
-    construct_it = dstack.construct__stack
-
-    construct_it(baselevel_nodes)  # don't think this is a bottleneck, so no C++
-    return dstack.s
+    receiver_nodes = as_id_array(receiver_nodes)
+    receiver_proportion = numpy.asarray(receiver_proportion, dtype=float)
+    if delta is None or D is None:
+        delta, D, _ = make_donor_csr_to_n(receiver_nodes, receiver_proportion)
+
+    n_nodes, q = receiver_nodes.shape
+    s = numpy.empty(n_nodes, dtype=int)
+    _make_stack_to_n(
+        n_nodes,
+        q,
+        receiver_nodes,
+        receiver_proportion,
+        as_id_array(delta),
+        as_id_array(D),
+        s,
+        numpy.empty(n_nodes, dtype=int),
+    )
+    return s
 
 
 def find_drainage_area_and_discharge_to_n(
@@ -532,6 +767,198 @@ def find_drainage_area_and_discharge_to_n(
     return drainage_area, discharge
 
 
+def find_drainage_area_and_discharge_csr_to_n(
+    s, indptr, indices, weights, node_cell_area=1.0, runoff=1.0, boundary_nodes=None
+):
+
+    """Calculate the drainage area and water discharge over CSR donor arrays.
+
+    This is the same as find_drainage_area_and_discharge_to_n, but gathers
+    flow from the donors of each node, as given by make_donor_csr_to_n,
+    rather than spreading it over the receivers of each node.
+
+    Parameters
+    ----------
+    s : ndarray of int
+        Ordered (downstream to upstream) array of node IDs
+    indptr : ndarray of int
+        Index into *indices* at which each node's donor list begins.
+    indices : ndarray of int
+        IDs of the donors of each node.
+    weights : ndarray of float
+        Proportion of the flow of each donor that goes to the node.
+    node_cell_area : float or ndarray
+        Cell surface areas for each node. If it's an array, must have same
+        length as s (that is, the number of nodes).
+    runoff : float or ndarray
+        Local runoff rate at each cell (in water depth per time). If it's an
+        array, must have same length as s (that is, the number of nodes).
+        runoff *is* permitted to be negative, in which case it performs as a
+        transmission loss.
+    boundary_nodes: list, optional
+        Array of boundary nodes to have discharge and drainage area set to
+        zero. Default value is None.
+
+    Returns
+    -------
+    tuple of ndarray
+        drainage area and discharge
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.flow_accum.flow_accum_to_n import(
+    ... find_drainage_area_and_discharge_csr_to_n, make_donor_csr_to_n,
+    ... make_ordered_node_array_to_n)
+    >>> r = np.array([[ 1,  2],
+    ...               [ 4,  5],
+    ...               [ 1,  5],
+    ...               [ 6,  2],
+    ...               [ 4, -1],
+    ...               [ 4, -1],
+    ...               [ 5,  7],
+    ...               [ 4,  5],
+    ...               [ 6,  7],
+    ...               [ 7,  8]])
+    >>> p = np.array([[ 0.6,   0.4 ],
+    ...               [ 0.85,  0.15],
+    ...               [ 0.65,  0.35],
+    ...               [ 0.9,   0.1 ],
+    ...               [ 1.,    0.  ],
+    ...               [ 1.,    0.  ],
+    ...               [ 0.75,  0.25],
+    ...               [ 0.55,  0.45],
+    ...               [ 0.8,   0.2 ],
+    ...               [ 0.95,  0.05]])
+    >>> indptr, indices, weights = make_donor_csr_to_n(r, p)
+    >>> s = make_ordered_node_array_to_n(r, p, delta=indptr, D=indices)
+    >>> a, q = find_drainage_area_and_discharge_csr_to_n(
+    ...     s, indptr, indices, weights)
+    >>> a.round(4)
+    array([  1.    ,   2.575 ,   1.5   ,   1.    ,  10.    ,   5.2465,
+             2.74  ,   2.845 ,   1.05  ,   1.    ])
+    >>> q.round(4)
+    array([  1.    ,   2.575 ,   1.5   ,   1.    ,  10.    ,   5.2465,
+             2.74  ,   2.845 ,   1.05  ,   1.    ])
+    """
+    # Number of points
+    np = len(s)
+
+    # Initialize the drainage_area and discharge arrays. Drainage area starts
+    # out as the area of the cell in question, then (unless the cell has no
+    # donors) grows from there. Discharge starts out as the cell's local runoff
+    # rate times the cell's surface area.
+    drainage_area = numpy.zeros(np) + node_cell_area
+    discharge = numpy.zeros(np) + node_cell_area * runoff
+
+    # Optionally zero out drainage area and discharge at boundary nodes
+    if boundary_nodes is not None:
+        drainage_area[boundary_nodes] = 0
+        discharge[boundary_nodes] = 0
+
+    # Call the cfunc to work accumulate from upstream to downstream, permitting
+    # transmission losses
+    _accumulate_csr_to_n(
+        np,
+        as_id_array(s),
+        as_id_array(indptr),
+        as_id_array(indices),
+        numpy.asarray(weights, dtype=float),
+        drainage_area,
+        discharge,
+    )
+    # nodes at channel heads can still be negative with this method, so...
+    discharge = discharge.clip(0.0)
+
+    return drainage_area, discharge
+
+
+def find_ensemble_discharge_csr_to_n(
+    s, indptr, indices, weights, runoff, node_cell_area=1.0, boundary_nodes=None
+):
+
+    """Calculate the water discharge at each node for many runoff fields.
+
+    The route-to-n version of flow_accum_bw.find_ensemble_discharge, which
+    gathers flow over CSR donor arrays, as given by make_donor_csr_to_n.
+    Each row of *runoff* is one scenario, and all of the scenarios are
+    accumulated together in a single pass through the stack.
+
+    Parameters
+    ----------
+    s : ndarray of int
+        Ordered (downstream to upstream) array of node IDs
+    indptr : ndarray of int
+        Index into *indices* at which each node's donor list begins.
+    indices : ndarray of int
+        IDs of the donors of each node.
+    weights : ndarray of float
+        Proportion of the flow of each donor that goes to the node.
+    runoff : ndarray of float, shape (n_scenarios, n_nodes)
+        Local runoff rate at each cell (in water depth per time) for each
+        scenario. Runoff is permitted to be negative, in which case it
+        performs as a transmission loss.
+    node_cell_area : float or ndarray
+        Cell surface areas for each node. If it's an array, must have same
+        length as s (that is, the number of nodes).
+    boundary_nodes: list, optional
+        Array of boundary nodes to have discharge set to zero.
+        Default value is None.
+
+    Returns
+    -------
+    ndarray of float, shape (n_scenarios, n_nodes)
+        Discharge for each scenario.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.flow_accum.flow_accum_to_n import(
+    ... find_ensemble_discharge_csr_to_n, make_donor_csr_to_n)
+    >>> r = np.array([[ 1,  2],
+    ...               [ 3, -1],
+    ...               [ 3,  1],
+    ...               [ 3, -1]])
+    >>> p = np.array([[ 0.5,  0.5],
+    ...               [ 1. ,  0. ],
+    ...               [ 0.2,  0.8],
+    ...               [ 1. ,  0. ]])
+    >>> s = np.array([ 3, 1, 2, 0])
+    >>> indptr, indices, weights = make_donor_csr_to_n(r, p)
+    >>> runoff = np.array([[1., 1., 1., 1.], [2., 0., 1., 0.]])
+    >>> find_ensemble_discharge_csr_to_n(s, indptr, indices, weights, runoff)
+    array([[ 1. ,  2.7,  1.5,  4. ],
+           [ 2. ,  2.6,  2. ,  3. ]])
+    """
+    # Number of points
+    np = len(s)
+
+    runoff = numpy.atleast_2d(runoff)
+
+    # Discharge starts out as the cell's local runoff rate times the cell's
+    # surface area. It is stored with the scenarios of each node next to one
+    # another, so that they are all accumulated at once.
+    discharge = numpy.empty((np, runoff.shape[0]))
+    discharge[:] = (node_cell_area * runoff).T
+
+    # Optionally zero out discharge at boundary nodes
+    if boundary_nodes is not None:
+        discharge[boundary_nodes] = 0
+
+    _accumulate_csr_to_n_ensemble(
+        np,
+        as_id_array(s),
+        as_id_array(indptr),
+        as_id_array(indices),
+        numpy.asarray(weights, dtype=float),
+        discharge,
+    )
+    # nodes at channel heads can still be negative with this method, so...
+    discharge.clip(0.0, out=discharge)
+
+    return discharge.T
+
+
 def find_drainage_area_and_discharge_to_n_lossy(
     s,
     r,
@@ -110,6 +110,16 @@ class FlowAccumulator(Component):
          uninstantiated DepressionFinder class, or an instance of a
          DepressionFinder class.
          This sets the method for depression finding.
+    incremental : bool, optional
+         If True, and flow is routed to one receiver, only rebuild the stack
+         for the basins that contain a node whose receiver has changed since
+         the previous call, and only recalculate drainage area and
+         discharge downstream of those nodes. This pays off when the
+         receivers of only a small fraction of nodes change from one call
+         to the next. The drainage area and discharge fields must not be
+         modified between calls. Runoff that has changed since the last
+         call, or that is negative, triggers a full recalculation. Default
+         is False.
     **kwargs : any additional parameters to pass to a FlowDirector or
          DepressionFinderAndRouter instance (e.g., partion_method for
          FlowDirectorMFD). This will have no effect if an instantiated component
@@ -682,6 +692,7 @@ class FlowAccumulator(Component):
         flow_director="FlowDirectorSteepest",
         runoff_rate=None,
         depression_finder=None,
+        incremental=False,
         **kwargs
     ):
         """Initialize the FlowAccumulator component.
@@ -748,6 +759,20 @@ class FlowAccumulator(Component):
         self._D_structure = self._grid.BAD_INDEX * grid.ones(at="link", dtype=int)
         self._nodes_not_in_stack = True
 
+        # buffers for the route-to-one stack, reused by every call to
+        # accumulate_flow
+        self._incremental = bool(incremental)
+        if self._incremental:
+            self._stack_builder = flow_accum_bw._IncrementalStackBuilder(
+                grid.number_of_nodes
+            )
+        else:
+            self._stack_builder = flow_accum_bw._StackBuilder(grid.number_of_nodes)
+        self._runoff_at_last_update = None
+        # and for the route-to-many donor structure and stack, created when
+        # first needed
+        self._stack_builder_to_n = None
+
         # STEP 3:
         # identify Flow Director method, save name, import and initialize the
         # correct flow director component if necessary; same with
@@ -824,7 +849,7 @@ class FlowAccumulator(Component):
         ...      flow_director='MFD')
         >>> fa.run_one_step()
         >>> fa.link_order_upstream()
-        array([ 5, 14, 10,  6, 11,  7, 23, 19, 15, 20, 16, 28, 24, 29, 25])
+        array([ 5, 10,  6, 14, 11,  7, 19, 15, 23, 20, 16, 28, 24, 29, 25])
         """
         downstream_links = self._grid["node"]["flow__link_to_receiver_node"][
             self._upstream_ordered_nodes
@@ -960,7 +985,11 @@ class FlowAccumulator(Component):
 
     def _add_depression_finder(self, depression_finder):
         """Test and add the depression finder component."""
-        PERMITTED_DEPRESSION_FINDERS = ["DepressionFinderAndRouter", "LakeMapperBarnes"]
+        PERMITTED_DEPRESSION_FINDERS = [
+            "DepressionFinderAndRouter",
+            "LakeMapperBarnes",
+            "PriorityFloodDepressionFinder",
+        ]
 
         # now do a similar thing for the depression finder.
         self._depression_finder_provided = depression_finder
@@ -980,6 +1009,7 @@ class FlowAccumulator(Component):
                 "reaccumulate_flow",
                 "ignore_overfill",
                 "track_lakes",
+                "epsilon",
             ]
             kw = {}
             for p_k in potential_kwargs:
@@ -1024,11 +1054,13 @@ class FlowAccumulator(Component):
                 from landlab.components import (
                     DepressionFinderAndRouter,
                     LakeMapperBarnes,
+                    PriorityFloodDepressionFinder,
                 )
 
                 DEPRESSION_METHODS = {
                     "DepressionFinderAndRouter": DepressionFinderAndRouter,
                     "LakeMapperBarnes": LakeMapperBarnes,
+                    "PriorityFloodDepressionFinder": PriorityFloodDepressionFinder,
                 }
 
                 try:
@@ -1151,32 +1183,42 @@ class FlowAccumulator(Component):
                     if self._flow_director._name == "FlowDirectorSteepest":
                         self._flow_director._determine_link_directions()
 
-            # step 3. Stack, D, delta construction
-            nd = as_id_array(flow_accum_bw._make_number_of_donors_array(r))
-            delta = as_id_array(flow_accum_bw._make_delta_array(nd))
-            D = as_id_array(flow_accum_bw._make_array_of_donors(r, delta))
-            s = as_id_array(flow_accum_bw.make_ordered_node_array(r, nd, delta, D))
+            # steps 3 and 4 together, if only the basins with changed
+            # receivers need to be updated.
+            if self._can_update_incrementally():
+                n_rebuilt = self._stack_builder.update_and_accumulate(
+                    r,
+                    a,
+                    q,
+                    self._node_cell_area,
+                    self._grid.at_node["water__unit_flux_in"],
+                )
+                if n_rebuilt > 0:
+                    self._store_stack()
+                return (a, q)
 
-            # put these in grid so that depression finder can use it.
-            # store the generated data in the grid
-            self._grid.at_node["flow__data_structure_delta"][:] = as_id_array(delta[1:])
-            self._D_structure = as_id_array(D)
-            self._grid.at_node["flow__upstream_node_order"][:] = as_id_array(s)
+            # step 3. Stack, D, delta construction
+            s, delta, D = self._stack_builder.update(r)
+            self._store_stack()
 
             # step 4. Accumulate (to one or to N depending on direction method)
             a[:], q[:] = self._accumulate_A_Q_to_one(s, r)
 
+            if self._incremental:
+                self._runoff_at_last_update = self._grid.at_node[
+                    "water__unit_flux_in"
+                ].copy()
+
         else:
             # Get p
             p = self._grid["node"]["flow__receiver_proportions"]
 
             # step 3. Stack, D, delta construction
-            nd = as_id_array(flow_accum_to_n._make_number_of_donors_array_to_n(r, p))
-            delta = as_id_array(flow_accum_to_n._make_delta_array_to_n(nd))
-            D = as_id_array(flow_accum_to_n._make_array_of_donors_to_n(r, p, delta))
-            s = as_id_array(
-                flow_accum_to_n.make_ordered_node_array_to_n(r, p, nd, delta, D)
-            )
+            if self._stack_builder_to_n is None:
+                self._stack_builder_to_n = flow_accum_to_n._StackBuilderToN(
+                    self._grid.number_of_nodes
+                )
+            s, delta, D = self._stack_builder_to_n.update(r, p)
 
             # put theese in grid so that depression finder can use it.
             # store the generated data in the grid
@@ -1191,6 +1233,113 @@ class FlowAccumulator(Component):
 
         return (a, q)
 
+    def accumulate_runoff_ensemble(self, runoff):
+        """Calculate discharge for many runoff fields over the current routing.
+
+        The receivers and the stack (*flow__upstream_node_order*) found by
+        the last call to accumulate_flow() or run_one_step() are reused (for
+        route-to-many methods, as the donor arrays of that call), and
+        all of the runoff fields are accumulated in a single compiled pass.
+        This is much faster than setting *water__unit_flux_in* and
+        calling accumulate_flow() once for each field, as, for instance,
+        for an ensemble of storms over the same topography. No fields of the
+        grid are changed.
+
+        Parameters
+        ----------
+        runoff : array_like of float, shape (n_scenarios, n_nodes)
+            Local runoff rate at each node for each scenario. Runoff is
+            permitted to be negative, in which case it mimics transmission
+            losses.
+
+        Returns
+        -------
+        ndarray of float, shape (n_scenarios, n_nodes)
+            Surface water discharge at each node for each scenario.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.components import FlowAccumulator
+        >>> mg = RasterModelGrid((5, 3))
+        >>> mg.set_closed_boundaries_at_grid_edges(True, True, True, False)
+        >>> _ = mg.add_field(
+        ...     "topographic__elevation",
+        ...     mg.node_x + mg.node_y,
+        ...     at="node",
+        ... )
+        >>> fa = FlowAccumulator(mg, 'topographic__elevation')
+        >>> fa.run_one_step()
+        >>> runoff = np.array([np.ones(15), 2. * np.ones(15), mg.y_of_node])
+        >>> q = fa.accumulate_runoff_ensemble(runoff)
+        >>> q[:, mg.core_nodes]
+        array([[ 3.,  2.,  1.],
+               [ 6.,  4.,  2.],
+               [ 6.,  5.,  3.]])
+
+        The discharge of each scenario is the same as with accumulate_flow.
+
+        >>> mg.at_node["water__unit_flux_in"][:] = mg.y_of_node
+        >>> _, q_x = fa.accumulate_flow()
+        >>> np.allclose(q[2], q_x)
+        True
+        """
+        s = self._grid.at_node["flow__upstream_node_order"]
+        if np.any(s == self._grid.BAD_INDEX):
+            raise RuntimeError(
+                "flow must be accumulated before accumulate_runoff_ensemble"
+            )
+        runoff = np.asarray(runoff, dtype=float)
+        if runoff.ndim != 2 or runoff.shape[1] != self._grid.number_of_nodes:
+            raise ValueError(
+                "runoff must have shape (n_scenarios, {0})".format(
+                    self._grid.number_of_nodes
+                )
+            )
+
+        if self._flow_director._to_n_receivers == "one":
+            return flow_accum_bw.find_ensemble_discharge(
+                s,
+                as_id_array(self._grid.at_node["flow__receiver_node"]),
+                runoff,
+                node_cell_area=self._node_cell_area,
+            )
+        else:
+            builder = self._stack_builder_to_n
+            return flow_accum_to_n.find_ensemble_discharge_csr_to_n(
+                s,
+                builder.indptr,
+                builder.indices,
+                builder.weights,
+                runoff,
+                node_cell_area=self._node_cell_area,
+            )
+
+    def _can_update_incrementally(self):
+        """Check if drainage area and discharge can be updated in place.
+
+        This is the case when running incrementally, a previous accumulation
+        exists, and the runoff has neither changed since nor is negative.
+        """
+        if self._runoff_at_last_update is None:
+            return False
+        runoff = self._grid.at_node["water__unit_flux_in"]
+        return np.array_equal(runoff, self._runoff_at_last_update) and np.all(
+            runoff >= 0.0
+        )
+
+    def _store_stack(self):
+        """Put the route-to-one stack and delta array in the grid.
+
+        These are stored so that the depression finder can use them.
+        """
+        self._grid.at_node["flow__data_structure_delta"][:] = self._stack_builder.delta[
+            1:
+        ]
+        self._D_structure = self._stack_builder.D
+        self._grid.at_node["flow__upstream_node_order"][:] = self._stack_builder.s
+
     def _accumulate_A_Q_to_one(self, s, r):
         """Accumulate area and discharge for a route-to-one scheme.
 
@@ -1206,8 +1355,14 @@ class FlowAccumulator(Component):
 
         Note this can be overridden in inherited components.
         """
-        a, q = flow_accum_to_n.find_drainage_area_and_discharge_to_n(
-            s, r, p, self._node_cell_area, self._grid.at_node["water__unit_flux_in"]
+        builder = self._stack_builder_to_n
+        a, q = flow_accum_to_n.find_drainage_area_and_discharge_csr_to_n(
+            s,
+            builder.indptr,
+            builder.indices,
+            builder.weights,
+            self._node_cell_area,
+            self._grid.at_node["water__unit_flux_in"],
         )
         return (a, q)
 
@@ -374,6 +374,12 @@ class LossyFlowAccumulator(FlowAccumulator):
             **kwargs
         )
 
+        if self._incremental:
+            raise ValueError(
+                "LossyFlowAccumulator does not support incremental updates, "
+                "since losses may vary independently of the flow routing."
+            )
+
         if loss_function is not None:
             if sys.version_info[0] >= 3:
                 sig = signature(loss_function)
@@ -447,6 +453,17 @@ class LossyFlowAccumulator(FlowAccumulator):
 
             self._lossfunc = lossfunc
 
+    def accumulate_runoff_ensemble(self, runoff):
+        """Not available for LossyFlowAccumulator.
+
+        Losses are a function of discharge, so the scenarios can not be
+        accumulated together.
+        """
+        raise ValueError(
+            "LossyFlowAccumulator does not support accumulate_runoff_ensemble, "
+            "since losses are applied one scenario at a time."
+        )
+
     def _accumulate_A_Q_to_one(self, s, r):
         """Accumulate area and discharge for a route-to-one scheme."""
         link = self._grid.at_node["flow__link_to_receiver_node"]
@@ -0,0 +1,65 @@
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from landlab import LinkStatus, RasterModelGrid
+from landlab.components import FlowDirectorD8
+from landlab.components.flow_director import flow_directions
+
+
+def _grid(shape):
+    grid = RasterModelGrid(shape)
+    grid.add_field(
+        "topographic__elevation",
+        grid.x_of_node + grid.y_of_node + np.random.rand(grid.number_of_nodes),
+        at="node",
+    )
+    return grid
+
+
+def _link_based(grid):
+    z = grid.at_node["topographic__elevation"]
+    link_slope = -grid.calc_grad_at_d8(z)
+    link_slope[grid.status_at_d8 != LinkStatus.ACTIVE] = 0
+    return flow_directions(
+        z,
+        np.arange(grid.number_of_d8),
+        grid.nodes_at_d8[:, 0],
+        grid.nodes_at_d8[:, 1],
+        link_slope,
+        baselevel_nodes=grid.fixed_value_boundary_nodes,
+    )
+
+
+def _peak_memory(func):
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def bench_d8_1e6():
+    FlowDirectorD8(_grid((1000, 1000))).run_one_step()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for shape in [(316, 316), (1000, 1000), (2000, 2000)]:
+        grid = _grid(shape)
+        fd = FlowDirectorD8(grid)
+        _link_based(grid)
+        fd.run_one_step()
+
+        link_based = min(timeit.repeat(lambda: _link_based(grid), number=1, repeat=3))
+        fused = min(timeit.repeat(fd.run_one_step, number=1, repeat=3))
+        print(
+            "{0} nodes: link based {1:.3f} s ({2:.0f} MB), "
+            "fused {3:.3f} s ({4:.0f} MB)".format(
+                grid.number_of_nodes,
+                link_based,
+                _peak_memory(lambda: _link_based(grid)) / 2 ** 20,
+                fused,
+                _peak_memory(fd.run_one_step) / 2 ** 20,
+            )
+        )
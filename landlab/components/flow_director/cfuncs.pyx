@@ -55,3 +55,102 @@ def adjust_flow_receivers(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
             receiver[dst_id] = src_id
             steepest_slope[dst_id] = - link_slope[i]
             receiver_link[dst_id] = active_links[i]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def direct_flow_d8_on_raster(shape,
+                             DTYPE_FLOAT_t dx,
+                             DTYPE_FLOAT_t dy,
+                             np.ndarray[DTYPE_FLOAT_t, ndim=1] z,
+                             np.ndarray[np.uint8_t, ndim=1] status_at_node,
+                             np.ndarray[DTYPE_INT_t, ndim=1] receiver,
+                             np.ndarray[DTYPE_FLOAT_t, ndim=1] steepest_slope,
+                             np.ndarray[DTYPE_INT_t, ndim=1] receiver_link,
+                             np.ndarray[np.uint8_t, ndim=1, cast=True] sink_flag):
+    """Find D8 steepest-descent flow directions on a raster in one pass.
+
+    Only core nodes are given receivers, and only along active links and
+    diagonals (those to another core node or to a fixed-value node). The
+    neighbors of a node are visited in order of the ids of the links that
+    join them so that, as with *adjust_flow_receivers*, the first of equally
+    steep links is chosen.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Number of rows and columns of nodes.
+    dx, dy : float
+        Spacing between columns and rows of nodes.
+    z : array_like
+        Node elevations.
+    status_at_node : array_like
+        Boundary status of each node.
+    receiver : array_like
+        Output. Flow receiver of each node.
+    steepest_slope : array_like
+        Output. Slope (positive downhill) to each node's receiver.
+    receiver_link : array_like
+        Output. Link (or diagonal) from each node to its receiver, or -1.
+    sink_flag : array_like
+        Output. True for nodes that are their own receivers.
+    """
+    cdef long n_rows = shape[0]
+    cdef long n_cols = shape[1]
+    cdef long links_per_row = 2 * n_cols - 1
+    cdef long first_diagonal = n_rows * (n_cols - 1) + (n_rows - 1) * n_cols
+    cdef long diagonals_per_row = 2 * (n_cols - 1)
+    cdef double dd = (dx * dx + dy * dy) ** 0.5
+    cdef long row, col, node, neighbor, link, k
+    cdef long best_node, best_link
+    cdef double slope, best_slope, z_node
+    cdef long d_row[8]
+    cdef long d_col[8]
+    cdef long link_id[8]
+    cdef double length[8]
+
+    # Neighbors in order of the ids of the links that join them: south,
+    # west, east, north, southwest, southeast, northwest, northeast.
+    d_row[:] = [-1, 0, 0, 1, -1, -1, 1, 1]
+    d_col[:] = [0, -1, 1, 0, -1, 1, -1, 1]
+    length[:] = [dy, dx, dx, dy, dd, dd, dd, dd]
+
+    for row in range(n_rows):
+        for col in range(n_cols):
+            node = row * n_cols + col
+            best_node = node
+            best_link = -1
+            best_slope = 0.0
+
+            if status_at_node[node] == 0:
+                link_id[0] = (row - 1) * links_per_row + n_cols - 1 + col
+                link_id[1] = row * links_per_row + col - 1
+                link_id[2] = row * links_per_row + col
+                link_id[3] = row * links_per_row + n_cols - 1 + col
+                link = first_diagonal + (row - 1) * diagonals_per_row + 2 * col
+                link_id[4] = link - 2
+                link_id[5] = link + 1
+                link = first_diagonal + row * diagonals_per_row + 2 * col
+                link_id[6] = link - 1
+                link_id[7] = link
+
+                z_node = z[node]
+                for k in range(8):
+                    if (
+                        row + d_row[k] < 0 or row + d_row[k] >= n_rows
+                        or col + d_col[k] < 0 or col + d_col[k] >= n_cols
+                    ):
+                        continue
+                    neighbor = node + d_row[k] * n_cols + d_col[k]
+                    if status_at_node[neighbor] > 1:
+                        continue
+                    slope = (z_node - z[neighbor]) / length[k]
+                    if z_node > z[neighbor] and slope > best_slope:
+                        best_node = neighbor
+                        best_link = link_id[k]
+                        best_slope = slope
+
+            receiver[node] = best_node
+            receiver_link[node] = best_link
+            steepest_slope[node] = best_slope
+            sink_flag[node] = best_node == node
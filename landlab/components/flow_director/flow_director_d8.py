@@ -12,8 +12,8 @@ FlowDirectorSteepest instead.
 
 import numpy
 
-from landlab import LinkStatus
-from landlab.components.flow_director import flow_direction_DN
+from landlab import RasterModelGrid
+from landlab.components.flow_director.cfuncs import direct_flow_d8_on_raster
 from landlab.components.flow_director.flow_director_to_one import _FlowDirectorToOne
 
 
@@ -170,12 +170,7 @@ class FlowDirectorD8(_FlowDirectorToOne):
         """
         self._method = "D8"
         super().__init__(grid, surface)
-        try:
-            self._grid.nodes_at_d8
-        except AttributeError:
-            self._is_Voroni = True
-        else:
-            self._is_Voroni = False
+        self._is_Voroni = not isinstance(self._grid, RasterModelGrid)
         if self._is_Voroni:
             raise NotImplementedError(
                 "FlowDirectorD8 not implemented for"
@@ -190,11 +185,11 @@ class FlowDirectorD8(_FlowDirectorToOne):
 
         Call this if boundary conditions on the grid are updated after
         the component is instantiated.
+
+        Flow directions are found directly from the grid's *status_at_node*
+        each time they are calculated, so there is nothing to update.
         """
-        self._active_links = numpy.arange(self._grid.number_of_d8)
-        nodes_at_d8 = self._grid.nodes_at_d8[self._active_links]
-        self._activelink_tail = nodes_at_d8[:, 0]
-        self._activelink_head = nodes_at_d8[:, 1]
+        pass
 
     def run_one_step(self):
         """Find flow directions and save to the model grid.
@@ -227,36 +222,24 @@ class FlowDirectorD8(_FlowDirectorToOne):
         # update the surface, if it was provided as a model grid field.
         self._changed_surface()
 
-        # step 1. Calculate link slopes.
-        link_slope = -self._grid.calc_grad_at_d8(self._surface_values)
-        link_slope[self._grid.status_at_d8 != LinkStatus.ACTIVE] = 0
-
-        # Step 2. Find and save base level nodes.
-        (baselevel_nodes,) = numpy.where(
-            numpy.logical_or(
-                self._grid.status_at_node == self._grid.BC_NODE_IS_FIXED_VALUE,
-                self._grid.status_at_node == self._grid.BC_NODE_IS_FIXED_GRADIENT,
-            )
-        )
-
-        # Calculate flow directions by D8 method
-        receiver, steepest_slope, sink, recvr_link = flow_direction_DN.flow_directions(
-            self._surface_values,
-            self._active_links,
-            self._activelink_tail,
-            self._activelink_head,
-            link_slope,
-            grid=self._grid,
-            baselevel_nodes=baselevel_nodes,
-        )
-        # Save the four ouputs of this component.
-        self._grid["node"]["flow__receiver_node"][:] = receiver
-        self._grid["node"]["topographic__steepest_slope"][:] = steepest_slope
-        self._grid["node"]["flow__link_to_receiver_node"][:] = recvr_link
-        self._grid["node"]["flow__sink_flag"][:] = numpy.zeros_like(
-            receiver, dtype=bool
+        # Find receivers, steepest slopes, links to receivers and sinks all
+        # in one pass through the nodes, writing straight to the fields.
+        receiver = self._grid["node"]["flow__receiver_node"]
+        steepest_slope = self._grid["node"]["topographic__steepest_slope"]
+        recvr_link = self._grid["node"]["flow__link_to_receiver_node"]
+        sink_flag = self._grid["node"]["flow__sink_flag"]
+
+        direct_flow_d8_on_raster(
+            self._grid.shape,
+            self._grid.dx,
+            self._grid.dy,
+            numpy.asarray(self._surface_values, dtype=float),
+            self._grid.status_at_node,
+            receiver,
+            steepest_slope,
+            recvr_link,
+            sink_flag,
         )
-        self._grid["node"]["flow__sink_flag"][sink] = True
 
         return receiver
 
@@ -329,6 +329,12 @@ class FlowDirectorSteepest(_FlowDirectorToOne):
         # get 'flow__link_direction' field
         self._flow_link_direction = grid.at_link["flow__link_direction"]
 
+        # arrays derived from the link directions are cached, along with the
+        # version of the link directions they were calculated from. The
+        # version is incremented whenever the link directions are determined.
+        self._link_direction_version = 0
+        self._link_direction_cache = {}
+
         self.updated_boundary_conditions()
 
     def updated_boundary_conditions(self):
@@ -443,6 +449,30 @@ class FlowDirectorSteepest(_FlowDirectorToOne):
             ]
         ] = 1
 
+        # invalidate the arrays derived from the old link directions
+        self._link_direction_version += 1
+
+    def _cached_at_link_directions(self, name, calc):
+        """Return an array derived from the link directions.
+
+        The array is calculated by *calc* only if it has not already been
+        calculated for the current link directions. Cached arrays are shared
+        by every caller, so they are made read-only.
+
+        The cache is invalidated only when ``_determine_link_directions``
+        runs, so changes made to ``flow__link_direction`` by anything other
+        than this flow director are not seen until its next run_one_step.
+        """
+        try:
+            version, value = self._link_direction_cache[name]
+        except KeyError:
+            version = None
+        if version != self._link_direction_version:
+            value = calc()
+            value.flags.writeable = False
+            self._link_direction_cache[name] = (self._link_direction_version, value)
+        return value
+
     def flow_link_direction_at_node(self):
         """Return array of flow link direction at node.
 
@@ -464,6 +494,9 @@ class FlowDirectorSteepest(_FlowDirectorToOne):
         a value of 1 indicates that water flow goes from tail node to head
         node.
 
+        The array is calculated only once each time the link directions
+        change (that is, once per run_one_step), and is read-only.
+
         Examples
         --------
         >>> from landlab import RasterModelGrid
@@ -586,6 +619,11 @@ class FlowDirectorSteepest(_FlowDirectorToOne):
                [ 0,  0,  0,  0],
                [ 0,  0,  0,  0]], dtype=int8)
         """
+        return self._cached_at_link_directions(
+            "flow_link_direction_at_node", self._calc_flow_link_direction_at_node
+        )
+
+    def _calc_flow_link_direction_at_node(self):
         flow_link_direction_at_node = self._flow_link_direction[
             self._grid.links_at_node
         ]
@@ -603,6 +641,9 @@ class FlowDirectorSteepest(_FlowDirectorToOne):
         Incoming flow is indicated as 1 and outgoing as -1. 0 indicates
         that no flow moves along the link or that the link does not exist.
 
+        The array is calculated only once each time the link directions
+        change (that is, once per run_one_step), and is read-only.
+
         Examples
         --------
         >>> from landlab import RasterModelGrid
@@ -627,7 +668,11 @@ class FlowDirectorSteepest(_FlowDirectorToOne):
                [ 0,  0,  0,  0],
                [ 0,  0,  0,  0]], dtype=int8)
         """
+        return self._cached_at_link_directions(
+            "flow_link_incoming_at_node", self._calc_flow_link_incoming_at_node
+        )
 
+    def _calc_flow_link_incoming_at_node(self):
         incoming_at_node = (
             self.flow_link_direction_at_node() * self._grid.link_dirs_at_node
         )
@@ -678,6 +723,9 @@ class FlowDirectorSteepest(_FlowDirectorToOne):
 
         BAD_INDEX_VALUE is given if no upstream node is defined.
 
+        The array is calculated only once each time the link directions
+        change (that is, once per run_one_step), and is read-only.
+
         Examples
         --------
         >>> from landlab import RasterModelGrid
@@ -694,6 +742,11 @@ class FlowDirectorSteepest(_FlowDirectorToOne):
         >>> fd.upstream_node_at_link()
         array([-1, -1, -1,  4, -1, -1, -1, -1, -1, -1, -1, -1])
         """
+        return self._cached_at_link_directions(
+            "upstream_node_at_link", self._calc_upstream_node_at_link
+        )
+
+    def _calc_upstream_node_at_link(self):
         out = -1 * self._grid.ones(at="link", dtype=int)
         out[self._flow_link_direction == 1] = self._grid.node_at_link_tail[
             self._flow_link_direction == 1
@@ -708,6 +761,9 @@ class FlowDirectorSteepest(_FlowDirectorToOne):
 
         BAD_INDEX_VALUE is given if no downstream node is defined.
 
+        The array is calculated only once each time the link directions
+        change (that is, once per run_one_step), and is read-only.
+
         Examples
         --------
         >>> from landlab import RasterModelGrid
@@ -724,6 +780,11 @@ class FlowDirectorSteepest(_FlowDirectorToOne):
         >>> fd.downstream_node_at_link()
         array([-1, -1, -1,  1, -1, -1, -1, -1, -1, -1, -1, -1])
         """
+        return self._cached_at_link_directions(
+            "downstream_node_at_link", self._calc_downstream_node_at_link
+        )
+
+    def _calc_downstream_node_at_link(self):
         out = -1 * self._grid.ones(at="link", dtype=int)
         out[self._flow_link_direction == 1] = self._grid.node_at_link_head[
             self._flow_link_direction == 1
@@ -0,0 +1,58 @@
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import FlowAccumulator, LakeMapperBarnes
+from landlab.values import plane, random
+
+
+def _noisy_grid(shape, seed=0):
+    np.random.seed(seed)
+    grid = RasterModelGrid(shape)
+    plane(grid, "topographic__elevation", normal=(0.001, 0.001, 1.0))
+    random(grid, "topographic__elevation", where="CORE_NODE", high=1.0, low=0.0)
+    FlowAccumulator(grid, flow_director="D8")
+    return grid
+
+
+def _fill(shape, fill_flat=True, track_lakes=True):
+    grid = _noisy_grid(shape)
+    lmb = LakeMapperBarnes(
+        grid,
+        method="D8",
+        fill_flat=fill_flat,
+        track_lakes=track_lakes,
+        ignore_overfill=True,
+    )
+    return lmb.run_one_step
+
+
+def bench_fill_flat_1e4():
+    _fill((100, 100), fill_flat=True)()
+
+
+def bench_fill_to_slant_1e4():
+    _fill((100, 100), fill_flat=False)()
+
+
+def bench_fill_flat_1e6():
+    _fill((1000, 1000), fill_flat=True)()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for fill_flat in (True, False):
+        for shape in [(100, 100), (200, 200), (400, 400), (1000, 1000)]:
+            times = [
+                min(timeit.repeat(fill, number=1, repeat=3))
+                for fill in (
+                    _fill(shape, fill_flat=fill_flat, track_lakes=False),
+                    _fill(shape, fill_flat=fill_flat, track_lakes=True),
+                )
+            ]
+            print(
+                "{0} nodes, fill_flat={1}: compiled {2:.3f} s, "
+                "compiled with tracking {3:.3f} s".format(
+                    shape[0] * shape[1], fill_flat, times[0], times[1]
+                )
+            )
@@ -0,0 +1,245 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+from libc.math cimport fabs, nextafter
+
+from landlab.utils.ext.priority_queue cimport NodePriorityQueue
+
+DTYPE_INT = int
+ctypedef np.int_t DTYPE_INT_t
+DTYPE_FLOAT = np.double
+ctypedef np.double_t DTYPE_FLOAT_t
+
+cdef DTYPE_FLOAT_t LARGE_ELEV = 9999999999.0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def fill_to_flat(DTYPE_FLOAT_t [:] fill_surface,
+                 const DTYPE_INT_t [:, :] all_neighbors,
+                 NodePriorityQueue openq,
+                 np.uint8_t [:] closedq,
+                 DTYPE_INT_t [:] lake_nodes,
+                 DTYPE_INT_t [:] lake_outlets,
+                 bint track_lakes):
+    """Fill a surface to flat with the Barnes et al. (2014) algorithm.
+
+    Assumes that *openq* and *closedq* have already been set up per Barnes
+    algos 2&3, lns 1-7. Nodes that are found to be in lakes are visited in
+    order of their IDs, as with a heap queue of node IDs.
+
+    Parameters
+    ----------
+    fill_surface : 1-D array of length nnodes
+        The surface to fill in LL node order. Modified in place.
+    all_neighbors : (nnodes, max_nneighbours) array
+        Adjacent nodes at each node; -1 where there is none.
+    openq : NodePriorityQueue
+        Ordered queue of nodes remaining to be checked out by the algorithm
+        that are known not to be in a lake.
+    closedq : 1-D array of uint8 of length nnodes
+        Nodes already or not to be explored by the algorithm.
+    lake_nodes : 1-D array of int of length nnodes
+        Out: if *track_lakes*, the nodes that are inundated, in the order in
+        which they were filled.
+    lake_outlets : 1-D array of int of length nnodes
+        Out: if *track_lakes*, the outlet of the lake of each of
+        *lake_nodes*.
+    track_lakes : bool
+        If True, record which nodes have been filled.
+
+    Returns
+    -------
+    int
+        The number of nodes recorded in *lake_nodes* (zero if not
+        *track_lakes*).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.components.lake_fill.cfuncs import fill_to_flat
+    >>> from landlab.utils import NodePriorityQueue
+    >>> mg = RasterModelGrid((3, 5))
+    >>> mg.set_closed_boundaries_at_grid_edges(True, True, False, True)
+    >>> z = np.array([0., 0., 0., 0., 0.,
+    ...               0., 1., 0.5, 2., 0.,
+    ...               0., 0., 0., 0., 0.])
+    >>> closedq = np.zeros(mg.number_of_nodes, dtype=np.uint8)
+    >>> closedq[mg.status_at_node == mg.BC_NODE_IS_CLOSED] = True
+    >>> openq = NodePriorityQueue(mg.number_of_nodes)
+    >>> openq.add_task(5, priority=z[5])
+    >>> closedq[5] = True
+    >>> lake_nodes = np.empty(15, dtype=int)
+    >>> lake_outlets = np.empty(15, dtype=int)
+    >>> fill_to_flat(z, mg.adjacent_nodes_at_node, openq, closedq,
+    ...              lake_nodes, lake_outlets, True)
+    1
+    >>> z[5:10]
+    array([ 0.,  1.,  1.,  2.,  0.])
+    >>> lake_nodes[:1], lake_outlets[:1]
+    (array([7]), array([6]))
+    """
+    cdef DTYPE_INT_t n_nbrs = all_neighbors.shape[1]
+    cdef DTYPE_INT_t n_lake_nodes = 0
+    cdef DTYPE_INT_t outlet = -1
+    cdef DTYPE_INT_t c, n, i
+    cdef NodePriorityQueue pitq = NodePriorityQueue(fill_surface.shape[0])
+
+    while True:
+        if pitq._size > 0:
+            c = pitq.pop()
+            if track_lakes:
+                lake_nodes[n_lake_nodes] = c
+                lake_outlets[n_lake_nodes] = outlet
+                n_lake_nodes += 1
+        elif openq._size > 0:
+            c = openq.pop()
+            outlet = c
+        else:
+            break
+
+        for i in range(n_nbrs):
+            n = all_neighbors[c, i]
+            if n == -1 or closedq[n]:
+                continue
+            closedq[n] = True
+            if fill_surface[n] <= fill_surface[c]:
+                fill_surface[n] = fill_surface[c]
+                pitq.push(n, n)
+            else:
+                openq.push(n, fill_surface[n])
+
+    return n_lake_nodes
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def fill_to_slant(DTYPE_FLOAT_t [:] fill_surface,
+                  const DTYPE_INT_t [:, :] all_neighbors,
+                  NodePriorityQueue openq,
+                  np.uint8_t [:] closedq,
+                  DTYPE_INT_t [:] lake_nodes,
+                  DTYPE_INT_t [:] lake_outlets,
+                  bint track_lakes,
+                  bint ignore_overfill):
+    """Fill a surface so that it drains, with the Barnes et al. (2014)
+    algorithm.
+
+    Filled nodes are raised by the smallest representable increment above
+    the node from which they were reached, so that flow can be routed
+    across the filled surface. Assumes that *openq* and *closedq* have
+    already been set up per Barnes algos 2&3, lns 1-7.
+
+    Parameters
+    ----------
+    fill_surface : 1-D array of length nnodes
+        The surface to fill in LL node order. Modified in place.
+    all_neighbors : (nnodes, max_nneighbours) array
+        Adjacent nodes at each node; -1 where there is none.
+    openq : NodePriorityQueue
+        Ordered queue of nodes remaining to be checked out by the algorithm
+        that are known not to be in a lake.
+    closedq : 1-D array of uint8 of length nnodes
+        Nodes already or not to be explored by the algorithm.
+    lake_nodes : 1-D array of int of length nnodes
+        Out: if *track_lakes*, the nodes that are inundated, in the order in
+        which they were filled.
+    lake_outlets : 1-D array of int of length nnodes
+        Out: if *track_lakes*, the outlet of the lake of each of
+        *lake_nodes*.
+    track_lakes : bool
+        If True, record which nodes have been filled.
+    ignore_overfill : bool
+        If False, raise a ValueError if adding an increment to the elevation
+        of a node would fundamentally alter the resulting drainage pattern
+        (e.g., it would create a new outlet somewhere).
+
+    Returns
+    -------
+    n_lake_nodes : int
+        The number of nodes recorded in *lake_nodes* (zero if not
+        *track_lakes*).
+    overfilled : bool
+        True if any lake was overfilled.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.components.lake_fill.cfuncs import fill_to_slant
+    >>> from landlab.utils import NodePriorityQueue
+    >>> mg = RasterModelGrid((3, 5))
+    >>> mg.set_closed_boundaries_at_grid_edges(True, True, False, True)
+    >>> z = np.array([0., 0., 0., 0., 0.,
+    ...               0., 1., 0.5, 2., 0.,
+    ...               0., 0., 0., 0., 0.])
+    >>> closedq = np.zeros(mg.number_of_nodes, dtype=np.uint8)
+    >>> closedq[mg.status_at_node == mg.BC_NODE_IS_CLOSED] = True
+    >>> openq = NodePriorityQueue(mg.number_of_nodes)
+    >>> openq.add_task(5, priority=z[5])
+    >>> closedq[5] = True
+    >>> lake_nodes = np.empty(15, dtype=int)
+    >>> lake_outlets = np.empty(15, dtype=int)
+    >>> fill_to_slant(z, mg.adjacent_nodes_at_node, openq, closedq,
+    ...               lake_nodes, lake_outlets, True, False)
+    (1, False)
+    >>> z[7] > z[6]
+    True
+    >>> np.isclose(z[7], z[6])
+    True
+    """
+    cdef DTYPE_INT_t n_nbrs = all_neighbors.shape[1]
+    cdef DTYPE_INT_t n_lake_nodes = 0
+    cdef DTYPE_INT_t outlet = -1
+    cdef DTYPE_INT_t c, n, i
+    cdef DTYPE_FLOAT_t pit_top = LARGE_ELEV
+    cdef DTYPE_FLOAT_t nextval
+    cdef bint overfilled = False
+    cdef NodePriorityQueue pitq = NodePriorityQueue(fill_surface.shape[0])
+
+    while True:
+        if pitq._size > 0 and openq._size > 0 and openq.peek() == pitq.peek():
+            c = openq.pop()
+            outlet = c
+            pit_top = LARGE_ELEV
+        elif pitq._size > 0:
+            c = pitq.pop()
+            # as np.isclose(pit_top, LARGE_ELEV)
+            if fabs(pit_top - LARGE_ELEV) <= 1.0e-8 + 1.0e-5 * LARGE_ELEV:
+                pit_top = fill_surface[c]
+            if track_lakes:
+                lake_nodes[n_lake_nodes] = c
+                lake_outlets[n_lake_nodes] = outlet
+                n_lake_nodes += 1
+        elif openq._size > 0:
+            c = openq.pop()
+            outlet = c
+            pit_top = LARGE_ELEV
+        else:
+            break
+
+        for i in range(n_nbrs):
+            n = all_neighbors[c, i]
+            if n == -1 or closedq[n]:
+                continue
+            closedq[n] = True
+            nextval = nextafter(fill_surface[c], LARGE_ELEV)
+            if fill_surface[n] <= nextval:
+                if pit_top < fill_surface[n] and nextval >= fill_surface[n]:
+                    if ignore_overfill:
+                        overfilled = True
+                    else:
+                        raise ValueError(
+                            "Pit is overfilled due to creation of two "
+                            + "outlets as the minimum gradient gets "
+                            + "applied. Suppress this Error with the "
+                            + "ignore_overfill flag at component "
+                            + "instantiation."
+                        )
+                fill_surface[n] = nextval
+                pitq.push(n, n)
+            else:
+                openq.push(n, fill_surface[n])
+
+    return n_lake_nodes, overfilled
@@ -7,7 +7,6 @@ Fill sinks in a landscape to the brim, following the Barnes et al.
 """
 
 
-import heapq
 import itertools
 
 # ^ this simply in case Katy updates to add more fields, that we would also
@@ -18,90 +17,55 @@ import numpy as np
 
 from landlab import Component, NodeStatus, RasterModelGrid
 from landlab.components import FlowAccumulator
-from landlab.utils import StablePriorityQueue
+from landlab.utils import NodePriorityQueue
 from landlab.utils.return_array import return_array_at_node
 
+from .cfuncs import fill_to_flat, fill_to_slant
+
 LARGE_ELEV = 9999999999.0
 
 # TODO: Needs to have rerouting functionality...
 
 
-def _fill_one_node_to_flat(fill_surface, all_neighbors, pitq, openq, closedq, dummy):
-    """Implements the Barnes et al. algorithm for a simple fill. Assumes the
-    _open and _closed lists have already been updated per Barnes algos 2&3, lns
-    1-7.
+def _lake_dict(lake_nodes, lake_outlets):
+    """Group lake nodes by the outlets of their lakes.
 
     Parameters
     ----------
-    fill_surface : 1-D array of length nnodes
-        The surface to fill in LL node order. Modified in place.
-    all_neighbors : (nnodes, max_nneighbours) array
-        Adjacent nodes at each node.
-    pitq : heap queue (i.e., a structured list)
-        Current nodes known to be in a lake, if already identified.
-    openq : StablePriorityQueue object
-        Ordered queue of nodes remaining to be checked out by the algorithm
-        that are known not to be in a lake.
-    closedq : 1-D boolean array of length nnodes
-        Nodes already or not to be explored by the algorithm.
-    dummy : any Python object
-        Necessary for direct comparison with _fill_one_node_to_slant.
+    lake_nodes : 1-D array of int
+        Nodes inundated by lakes, in the order in which they were filled.
+    lake_outlets : 1-D array of int
+        The outlet of the lake of each of *lake_nodes*.
+
+    Returns
+    -------
+    dict
+        {outlet_ID : deque of nodes draining to outlet}, with outlets in the
+        order in which their lakes were first filled.
 
     Examples
     --------
     >>> import numpy as np
-    >>> from landlab import RasterModelGrid
-    >>> mg = RasterModelGrid((5, 6))
-    >>> for edge in ('left', 'top', 'bottom'):
-    ...     mg.status_at_node[mg.nodes_at_edge(edge)] = mg.BC_NODE_IS_CLOSED
-    >>> z = mg.zeros('node', dtype=float)
-    >>> z.reshape(mg.shape)[2, 1:-1] = [2., 1., 0.5, 1.5]
-    >>> z.reshape(mg.shape)[1, 1:-1] = [2.1, 1.1, 0.6, 1.6]
-    >>> z.reshape(mg.shape)[3, 1:-1] = [2.2, 1.2, 0.7, 1.7]
-    >>> zw = z.copy()
-    >>> openq = StablePriorityQueue()
-    >>> pitq = []
-    >>> closedq = mg.zeros('node', dtype=bool)
-    >>> closedq[mg.status_at_node == mg.BC_NODE_IS_CLOSED] = True
-    >>> edges = np.array([11, 17, 23])
-    >>> for edgenode in edges:
-    ...     openq.add_task(edgenode, priority=z[edgenode])
-    >>> closedq[edges] = True
-    >>> while True:
-    ...     try:
-    ...         _fill_one_node_to_flat(zw, mg.adjacent_nodes_at_node,
-    ...                                pitq, openq, closedq, None)
-    ...     except KeyError:
-    ...         break
-
-    Now check the values make sense.
-
-    >>> lake = np.array([False, False, False, False, False, False,
-    ...                  False, False,  True,  True, False, False,
-    ...                  False, False,  True,  True, False, False,
-    ...                  False, False,  True,  True, False, False,
-    ...                  False, False, False, False, False, False])
-    >>> np.allclose(zw[lake], z[16])
-    True
-    >>> np.all(np.greater(zw[lake], z[lake]))
-    True
-    >>> np.allclose(zw[np.logical_not(lake)], z[np.logical_not(lake)])
-    True
+    >>> _lake_dict(np.array([7, 15, 9, 14, 22]), np.array([8, 16, 16, 16, 16]))
+    {8: deque([7]), 16: deque([15, 9, 14, 22])}
+    >>> _lake_dict(np.array([], dtype=int), np.array([], dtype=int))
+    {}
     """
-    try:
-        c = heapq.heappop(pitq)
-    except IndexError:
-        c = openq.pop_task()
-        # this will raise a KeyError once it's exhausted both queues
-    cneighbors = all_neighbors[c]
-    openneighbors = cneighbors[np.logical_not(closedq[cneighbors])]  # for efficiency
-    closedq[openneighbors] = True
-    for n in openneighbors:
-        if fill_surface[n] <= fill_surface[c]:
-            fill_surface[n] = fill_surface[c]
-            heapq.heappush(pitq, n)
-        else:
-            openq.add_task(n, priority=fill_surface[n])
+    outlets, first, inverse = np.unique(
+        lake_outlets, return_index=True, return_inverse=True
+    )
+    by_first_fill = np.argsort(first)
+    rank = np.empty_like(by_first_fill)
+    rank[by_first_fill] = np.arange(len(by_first_fill))
+    lake_of_node = rank[inverse]
+    lakes = np.split(
+        lake_nodes[np.argsort(lake_of_node, kind="stable")],
+        np.cumsum(np.bincount(lake_of_node, minlength=len(outlets)))[:-1],
+    )
+    return {
+        int(outlet): deque(nodes.tolist())
+        for outlet, nodes in zip(outlets[by_first_fill], lakes)
+    }
 
 
 class LakeMapperBarnes(Component):
@@ -316,7 +280,6 @@ class LakeMapperBarnes(Component):
                 )
                 raise NotImplementedError(msg)
 
-        self._pit = []
         self._closed = self._grid.zeros("node", dtype=bool)
         self._gridclosednodes = (
             self._grid.status_at_node == self._grid.BC_NODE_IS_CLOSED
@@ -330,7 +293,6 @@ class LakeMapperBarnes(Component):
         self._runcounter = itertools.count()
         self._runcount = -1  # not yet run
         self._lastcountforlakemap = -1  # lake_map has not yet been called
-        self._PitTop = LARGE_ELEV  # variable to not overfill slanted surfaces
         self._ignore_overfill = ignore_overfill
         self._overfill_flag = False
         self._track_lakes = track_lakes
@@ -440,196 +402,19 @@ class LakeMapperBarnes(Component):
             self._reaccumulate = False
 
         self._fill_flat = fill_flat
-        if fill_flat:
-            self._fill_one_node = _fill_one_node_to_flat
-        else:
-            self._fill_one_node = self._fill_one_node_to_slant
-
-    def _fill_one_node_to_slant(
-        self, fill_surface, all_neighbors, pitq, openq, closedq, ignore_overfill
-    ):
-        """Implements the Barnes et al. algorithm to obtain a naturally
-        draining surface, updating a single node. Assumes the _open and _closed
-        lists have already been updated per Barnes algos 2&3, lns 1-7.
-
-        Parameters
-        ----------
-        fill_surface : 1-D array of length nnodes
-            The surface to fill in LL node order. Modified in place.
-        all_neighbors : (nnodes, max_nneighbours) array
-            Adjacent nodes at each node.
-        pitq : heap queue (i.e., a structured list)
-            Current nodes known to be in a lake, if already identified.
-        openq : StablePriorityQueue object
-            Ordered queue of nodes remaining to be checked out by the algorithm
-            that are known not to be in a lake.
-        closedq : 1-D boolean array of length nnodes
-            Nodes already or not to be explored by the algorithm.
-        ignore_overfill : bool
-            If False, method will raise a ValueError if adding an increment
-            to the node's elevation would fundamentally alter the resulting
-            drainage pattern (e.g., it would create a new outlet somewhere).
-            If True, the elevation of the node will be changed regardless.
-
-        Examples
-        --------
-        >>> import numpy as np
-        >>> from landlab import RasterModelGrid
-        >>> from landlab.components import LakeMapperBarnes, FlowAccumulator
-        >>> from landlab.utils import StablePriorityQueue
-        >>> mg = RasterModelGrid((5, 6))
-        >>> for edge in ('left', 'top', 'bottom'):
-        ...     mg.status_at_node[mg.nodes_at_edge(edge)] = mg.BC_NODE_IS_CLOSED
-        >>> z = mg.add_zeros("topographic__elevation", at="node", dtype=float)
-        >>> z.reshape(mg.shape)[2, 1:-1] = [2., 1., 0.5, 1.5]
-        >>> z.reshape(mg.shape)[1, 1:-1] = [2.1, 1.1, 0.6, 1.6]
-        >>> z.reshape(mg.shape)[3, 1:-1] = [2.2, 1.2, 0.7, 1.7]
-        >>> z_init = z.copy()
-        >>> fa = FlowAccumulator(mg)
-        >>> lmb = LakeMapperBarnes(mg, method='Steepest')
-        >>> lmb._closed = mg.zeros('node', dtype=bool)
-        >>> lmb._closed[mg.status_at_node == mg.BC_NODE_IS_CLOSED] = True
-        >>> edges = np.array([11, 17, 23])
-        >>> open = StablePriorityQueue()
-        >>> for edgenode in edges:
-        ...     open.add_task(edgenode, priority=z[edgenode])
-        >>> lmb._closed[edges] = True
-        >>> first_nodes_checked = []
-
-        >>> for i in range(3):  # run a couple of steps
-        ...     lmb._fill_one_node_to_slant(
-        ...         z, mg.adjacent_nodes_at_node, lmb._pit, open,
-        ...         lmb._closed, False)
-        ...     print(open.peek_at_task())
-        ...     assert lmb._pit == []  # these steps don't find pits
-        17
-        23
-        16
-
-        >>> lmb._fill_one_node_to_slant(
-        ...     z, mg.adjacent_nodes_at_node, lmb._pit, open,
-        ...     lmb._closed, False)
-        >>> lmb._pit == [15, ]  # Popping 16 off "open" puts 15 in "pit"
-        True
-        >>> np.isclose(z[15], z[16])  # 15 has also been filled in this step
-        True
-        >>> z[15] > z[16]  # ...but 15 is incrementally greater than 16
-        True
-
-        >>> lmb._fill_one_node_to_slant(
-        ...     z, mg.adjacent_nodes_at_node, lmb._pit, open,
-        ...     lmb._closed, False)
-        >>> lmb._pit == [9, 21, 14]  # 15 pops of pit, these neighbors go in
-        True
-        >>> np.allclose(z[15], [z[9], z[21], z[14]])  # now filled
-        True
-        >>> np.all([z[9] == z[21], z[21] == z[14]])  # these perfectly level
-        True
-        >>> z[9] > z[15]  # ...but incrementally above 15
-        True
-
-        >>> lmb._fill_one_node_to_slant(
-        ...     z, mg.adjacent_nodes_at_node, lmb._pit, open,
-        ...     lmb._closed, False)
-        >>> lmb._pit == [8, 21, 14]  # 9 popped off pit, 8 went in. And so on.
-        True
-
-        Test a failing example. This behaviour exists to prevent the
-        application of the gradient from fundamentally altering the drainage
-        pattern that "should" result.
-
-        >>> mg = RasterModelGrid((3, 7))
-        >>> for edge in ('top', 'right', 'bottom'):
-        ...     mg.status_at_node[mg.nodes_at_edge(edge)] = mg.BC_NODE_IS_CLOSED
-        >>> z = mg.add_zeros("topographic__elevation", at="node", dtype=float)
-        >>> z.reshape(mg.shape)[1, 1:-1] = [1., 0.2, 0.1,
-        ...                                 1.0000000000000004, 1.5]
-        >>> z_init = z.copy()
-        >>> fa = FlowAccumulator(mg)
-        >>> lmb = LakeMapperBarnes(mg, method='Steepest')
-        >>> lmb._closed = mg.zeros('node', dtype=bool)
-        >>> lmb._closed[mg.status_at_node == mg.BC_NODE_IS_CLOSED] = True
-        >>> open = StablePriorityQueue()
-        >>> edges = np.array([7, ])
-        >>> for edgenode in edges:
-        ...     open.add_task(edgenode, priority=z[edgenode])
-        >>> lmb._closed[edges] = True
-        >>> while True:
-        ...     try:
-        ...         lmb._fill_one_node_to_slant(
-        ...             z, mg.adjacent_nodes_at_node, lmb._pit, open,
-        ...             lmb._closed, False)
-        ...     except KeyError:
-        ...         break
-        ...     except ValueError:
-        ...         print('ValueError was raised: here we overfilled')
-        ValueError was raised: here we overfilled
-        """
-        try:
-            topopen = openq.peek_at_task()
-        except KeyError:
-            noopen = True
-        else:
-            noopen = False
-        try:
-            toppit = pitq[0]
-        except IndexError:
-            nopit = True
-        else:
-            nopit = False
-        if not (nopit or noopen):
-            # not clear how this occurs, but present in Barnes ->
-            # DEJH suspects this should be an elevation comparison given the
-            # text description. Regardless, this is only to ensure
-            # repeatability, so it's not vital even if these cases don't
-            # trigger
-            if topopen == toppit:  # intentionally tight comparison
-                # print('yessssss')
-                c = openq.pop_task()
-                self._PitTop = LARGE_ELEV
-        if not nopit:
-            c = heapq.heappop(pitq)
-            if np.isclose(self._PitTop, LARGE_ELEV):
-                self._PitTop = fill_surface[c]
-        else:
-            c = openq.pop_task()  # again, returns KeyError if empty
-            self._PitTop = LARGE_ELEV
 
-        for n in all_neighbors[c]:
-            if closedq[n]:
-                continue
-            else:
-                closedq[n] = True
-            nextval = np.nextafter(fill_surface[c], LARGE_ELEV)
-            # DEJH believes that in the LL use cases this is impossible,
-            # but retained as comments since present in Barnes algorithm
-            # if self._gridclosednodes[n]:
-            #     heapq.heappush(pitq, n)
-            if fill_surface[n] <= nextval:  # former elif
-                if self._PitTop < fill_surface[n] and nextval >= fill_surface[n]:
-                    if ignore_overfill:
-                        self._overfill_flag = True
-                    else:
-                        raise ValueError(
-                            "Pit is overfilled due to creation of two "
-                            + "outlets as the minimum gradient gets applied. "
-                            + "Suppress this Error with the ignore_overfill "
-                            + "flag at component instantiation."
-                        )
-                fill_surface[n] = nextval
-                heapq.heappush(pitq, n)
-            else:
-                openq.add_task(n, priority=fill_surface[n])
+        # work space for the compiled fill, which records the lake nodes, and
+        # the outlet of the lake of each, in the order they were filled:
+        self._lake_nodes = np.empty(self._grid.number_of_nodes, dtype=int)
+        self._lake_outlets = np.empty(self._grid.number_of_nodes, dtype=int)
 
-    def _fill_to_flat_with_tracking(
-        self, fill_surface, all_neighbors, pitq, openq, closedq
-    ):
+    def _fill_to_flat_with_tracking(self, fill_surface, all_neighbors, openq, closedq):
         """Implements the Barnes et al. algorithm for a simple fill over the
         grid. Assumes the _open and _closed lists have already been updated per
         Barnes algos 2&3, lns 1-7.
 
-        This version runs a little more slowly to enable tracking of which
-        nodes are linked to which outlets.
+        This version tracks which nodes are linked to which outlets. The
+        filling itself is done in compiled code.
 
         Parameters
         ----------
@@ -637,9 +422,7 @@ class LakeMapperBarnes(Component):
             The surface to fill in LL node order. Modified in place.
         all_neighbors : (nnodes, max_nneighbours) array
             Adjacent nodes at each node.
-        pitq : heap queue (i.e., a structured list)
-            Current nodes known to be in a lake, if already identified.
-        openq : StablePriorityQueue object
+        openq : NodePriorityQueue object
             Ordered queue of nodes remaining to be checked out by the algorithm
             that are known not to be in a lake.
         closedq : 1-D boolean array of length nnodes
@@ -657,7 +440,7 @@ class LakeMapperBarnes(Component):
         >>> import numpy as np
         >>> from landlab import RasterModelGrid
         >>> from landlab.components import LakeMapperBarnes, FlowAccumulator
-        >>> from landlab.utils import StablePriorityQueue
+        >>> from landlab.utils import NodePriorityQueue
         >>> mg = RasterModelGrid((5, 6))
         >>> for edge in ('left', 'top', 'bottom'):
         ...     mg.status_at_node[mg.nodes_at_edge(edge)] = mg.BC_NODE_IS_CLOSED
@@ -674,52 +457,33 @@ class LakeMapperBarnes(Component):
         >>> lmb = LakeMapperBarnes(mg, method='Steepest')
         >>> lmb._closed = mg.zeros('node', dtype=bool)
         >>> lmb._closed[mg.status_at_node == mg.BC_NODE_IS_CLOSED] = True
-        >>> open = StablePriorityQueue()
+        >>> open = NodePriorityQueue(mg.number_of_nodes)
         >>> edges = np.array([11, 17, 23])
         >>> for edgenode in edges:
         ...     open.add_task(edgenode, priority=z[edgenode])
         >>> lmb._closed[edges] = True
         >>> out = lmb._fill_to_flat_with_tracking(
-        ...     z, mg.adjacent_nodes_at_node, lmb._pit, open, lmb._closed)
+        ...     z, mg.adjacent_nodes_at_node, open, lmb._closed)
         >>> out == {8: deque([7]), 16: deque([15, 9, 14, 22])}
         True
         """
-        lakemappings = dict()
-        outlet_ID = self._grid.BAD_INDEX
-        while True:
-            try:
-                c = heapq.heappop(pitq)
-            except IndexError:
-                try:
-                    c = openq.pop_task()
-                    outlet_ID = c
-                except KeyError:
-                    break
-            else:
-                try:
-                    lakemappings[outlet_ID].append(c)  # add this node to lake
-                except KeyError:  # this is the first node of a new lake
-                    lakemappings[outlet_ID] = deque([c])
-
-            cneighbors = all_neighbors[c]
-            openneighbors = cneighbors[
-                np.logical_not(closedq[cneighbors])
-            ]  # for efficiency
-            closedq[openneighbors] = True
-            for n in openneighbors:
-                if fill_surface[n] <= fill_surface[c]:
-                    fill_surface[n] = fill_surface[c]
-                    heapq.heappush(pitq, n)
-                else:
-                    openq.add_task(n, priority=fill_surface[n])
-            # print(np.sort(openq.tasks_currently_in_queue()), pitq)
-        return lakemappings
+        n_lake_nodes = fill_to_flat(
+            fill_surface,
+            all_neighbors,
+            openq,
+            closedq.view(np.uint8),
+            self._lake_nodes,
+            self._lake_outlets,
+            True,
+        )
+        return _lake_dict(
+            self._lake_nodes[:n_lake_nodes], self._lake_outlets[:n_lake_nodes]
+        )
 
     def _fill_to_slant_with_optional_tracking(
         self,
         fill_surface,
         all_neighbors,
-        pitq,
         openq,
         closedq,
         ignore_overfill,
@@ -729,8 +493,8 @@ class LakeMapperBarnes(Component):
         draining surface over the grid. Assumes the _open and _closed lists
         have already been updated per Barnes algos 2&3, lns 1-7.
 
-        This version runs a little more slowly to enable tracking of which
-        nodes are linked to which outlets.
+        This version can also track which nodes are linked to which outlets.
+        The filling itself is done in compiled code.
 
         Parameters
         ----------
@@ -738,9 +502,7 @@ class LakeMapperBarnes(Component):
             The surface to fill in LL node order. Modified in place.
         all_neighbors : (nnodes, max_nneighbours) array
             Adjacent nodes at each node.
-        pitq : heap queue (i.e., a structured list)
-            Current nodes known to be in a lake, if already identified.
-        openq : StablePriorityQueue object
+        openq : NodePriorityQueue object
             Ordered queue of nodes remaining to be checked out by the algorithm
             that are known not to be in a lake.
         closedq : 1-D boolean array of length nnodes
@@ -769,7 +531,7 @@ class LakeMapperBarnes(Component):
         >>> import numpy as np
         >>> from landlab import RasterModelGrid
         >>> from landlab.components import LakeMapperBarnes, FlowAccumulator
-        >>> from landlab.utils import StablePriorityQueue
+        >>> from landlab.utils import NodePriorityQueue
         >>> mg = RasterModelGrid((5, 6))
         >>> for edge in ('left', 'top', 'bottom'):
         ...     mg.status_at_node[mg.nodes_at_edge(edge)] = mg.BC_NODE_IS_CLOSED
@@ -782,13 +544,13 @@ class LakeMapperBarnes(Component):
         >>> lmb = LakeMapperBarnes(mg, method='Steepest')
         >>> lmb._closed = mg.zeros('node', dtype=bool)
         >>> lmb._closed[mg.status_at_node == mg.BC_NODE_IS_CLOSED] = True
-        >>> open = StablePriorityQueue()
+        >>> open = NodePriorityQueue(mg.number_of_nodes)
         >>> edges = np.array([11, 17, 23])
         >>> for edgenode in edges:
         ...     open.add_task(edgenode, priority=z[edgenode])
         >>> lmb._closed[edges] = True
         >>> out = lmb._fill_to_slant_with_optional_tracking(
-        ...     z, mg.adjacent_nodes_at_node, lmb._pit, open,
+        ...     z, mg.adjacent_nodes_at_node, open,
         ...     lmb._closed, False, True)
         >>> out == {16: deque([15, 9, 8, 14, 20, 21])}
         True
@@ -807,13 +569,13 @@ class LakeMapperBarnes(Component):
         >>> lmb = LakeMapperBarnes(mg, method='Steepest')
         >>> lmb._closed = mg.zeros('node', dtype=bool)
         >>> lmb._closed[mg.status_at_node == mg.BC_NODE_IS_CLOSED] = True
-        >>> open = StablePriorityQueue()
+        >>> open = NodePriorityQueue(mg.number_of_nodes)
         >>> edges = np.array([11, 17, 23])
         >>> for edgenode in edges:
         ...     open.add_task(edgenode, priority=z[edgenode])
         >>> lmb._closed[edges] = True
         >>> out = lmb._fill_to_slant_with_optional_tracking(
-        ...     z, mg.adjacent_nodes_at_node, lmb._pit, open,
+        ...     z, mg.adjacent_nodes_at_node, open,
         ...     lmb._closed, False, True)
         >>> out == {8: deque([7]), 16: deque([15, 9, 14, 22])}
         True
@@ -844,13 +606,13 @@ class LakeMapperBarnes(Component):
         >>> lmb = LakeMapperBarnes(mg, method='Steepest')
         >>> lmb._closed = mg.zeros('node', dtype=bool)
         >>> lmb._closed[mg.status_at_node == mg.BC_NODE_IS_CLOSED] = True
-        >>> open = StablePriorityQueue()
+        >>> open = NodePriorityQueue(mg.number_of_nodes)
         >>> edges = np.array([11, 17, 23])
         >>> for edgenode in edges:
         ...     open.add_task(edgenode, priority=z[edgenode])
         >>> lmb._closed[edges] = True
         >>> lmb._fill_to_slant_with_optional_tracking(
-        ...     z, mg.adjacent_nodes_at_node, lmb._pit, open,
+        ...     z, mg.adjacent_nodes_at_node, open,
         ...     lmb._closed, False, False)  # empty dict now
         {}
 
@@ -871,14 +633,14 @@ class LakeMapperBarnes(Component):
         >>> lmb = LakeMapperBarnes(mg, method='Steepest')
         >>> lmb._closed = mg.zeros('node', dtype=bool)
         >>> lmb._closed[mg.status_at_node == mg.BC_NODE_IS_CLOSED] = True
-        >>> open = StablePriorityQueue()
+        >>> open = NodePriorityQueue(mg.number_of_nodes)
         >>> edges = np.array([7, ])
         >>> for edgenode in edges:
         ...     open.add_task(edgenode, priority=z[edgenode])
         >>> lmb._closed[edges] = True
         >>> try:
         ...     lmb._fill_to_slant_with_optional_tracking(
-        ...         z, mg.adjacent_nodes_at_node, lmb._pit, open,
+        ...         z, mg.adjacent_nodes_at_node, open,
         ...         lmb._closed, False, True)
         ... except ValueError:
         ...     print('ValueError was raised: Pit is overfilled due to ' +
@@ -887,76 +649,21 @@ class LakeMapperBarnes(Component):
         ...           'ignore_overfill flag at component instantiation.')
         ValueError was raised: Pit is overfilled due to creation of two outlets as the minimum gradient gets applied. Suppress this Error with the ignore_overfill flag at component instantiation.
         """
-        lakemappings = dict()
-        outlet_ID = self._grid.BAD_INDEX
-        while True:
-            try:
-                topopen = openq.peek_at_task()
-            except KeyError:
-                noopen = True
-                topopen = None
-            else:
-                noopen = False
-            try:
-                toppit = pitq[0]
-            except IndexError:
-                nopit = True
-                toppit = None
-            else:
-                nopit = False
-            # as above, DEJH is unclear how this clause triggers, so
-            # retained but untested ->
-            if (not (nopit or noopen)) and (topopen == toppit):
-                # intentionally tight comparison
-                c = openq.pop_task()
-                outlet_ID = c
-                self._PitTop = LARGE_ELEV
-            elif not nopit:
-                c = heapq.heappop(pitq)
-                if np.isclose(self._PitTop, LARGE_ELEV):
-                    self._PitTop = fill_surface[c]
-                if track_lakes:
-                    try:
-                        lakemappings[outlet_ID].append(c)
-                        # ^add this node to lake
-                    except KeyError:
-                        # ^this is the first node of a new lake
-                        lakemappings[outlet_ID] = deque([c])
-            else:
-                try:
-                    c = openq.pop_task()
-                    # ^again, returns KeyError if empty
-                except KeyError:
-                    break
-                outlet_ID = c
-                self._PitTop = LARGE_ELEV
-
-            for n in all_neighbors[c]:
-                if closedq[n]:
-                    continue
-                else:
-                    closedq[n] = True
-                nextval = np.nextafter(fill_surface[c], LARGE_ELEV)
-                # as in non-tracker, DEJH believes this is redundant in LL
-                # if self._gridclosednodes[n]:
-                #     heapq.heappush(pitq, n)
-                if fill_surface[n] <= nextval:  # formerly elif
-                    if self._PitTop < fill_surface[n] and nextval >= fill_surface[n]:
-                        if ignore_overfill:
-                            self._overfill_flag = True
-                        else:
-                            raise ValueError(
-                                "Pit is overfilled due to creation of two "
-                                + "outlets as the minimum gradient gets "
-                                + "applied. Suppress this Error with the "
-                                + "ignore_overfill flag at component "
-                                + "instantiation."
-                            )
-                    fill_surface[n] = nextval
-                    heapq.heappush(pitq, n)
-                else:
-                    openq.add_task(n, priority=fill_surface[n])
-        return lakemappings
+        n_lake_nodes, overfilled = fill_to_slant(
+            fill_surface,
+            all_neighbors,
+            openq,
+            closedq.view(np.uint8),
+            self._lake_nodes,
+            self._lake_outlets,
+            track_lakes,
+            ignore_overfill,
+        )
+        if overfilled:
+            self._overfill_flag = True
+        return _lake_dict(
+            self._lake_nodes[:n_lake_nodes], self._lake_outlets[:n_lake_nodes]
+        )
 
     def _track_original_surface(self):
         """This helper method ensures that if flow is to be redircted, the
@@ -1663,8 +1370,8 @@ class LakeMapperBarnes(Component):
                 )
                 raise NotImplementedError(msg)
         # do the prep:
-        # create the StasblePriorityQueue locaslly to permit garbage collection
-        _open = StablePriorityQueue()
+        # create the NodePriorityQueue locally to permit garbage collection
+        _open = NodePriorityQueue(self._grid.number_of_nodes)
         # increment the run counter
         self._runcount = next(self._runcounter)
         # First get _fill_surface in order.
@@ -1683,13 +1390,12 @@ class LakeMapperBarnes(Component):
             closedq[self._edges] = True
             if self._fill_flat:
                 self._lakemappings = self._fill_to_flat_with_tracking(
-                    self._fill_surface, self._allneighbors, self._pit, _open, closedq,
+                    self._fill_surface, self._allneighbors, _open, closedq
                 )
             else:
                 self._lakemappings = self._fill_to_slant_with_optional_tracking(
                     self._fill_surface,
                     self._allneighbors,
-                    self._pit,
                     _open,
                     closedq,
                     ignore_overfill=self._ignore_overfill,
@@ -1706,18 +1412,25 @@ class LakeMapperBarnes(Component):
             for edgenode in self._edges:
                 _open.add_task(edgenode, priority=self._surface[edgenode])
             closedq[self._edges] = True
-            while True:
-                try:
-                    self._fill_one_node(
-                        self._fill_surface,
-                        self._allneighbors,
-                        self._pit,
-                        _open,
-                        closedq,
-                        self._ignore_overfill,
-                    )
-                except KeyError:  # run out of nodes to fill...
-                    break
+            if self._fill_flat:
+                fill_to_flat(
+                    self._fill_surface,
+                    self._allneighbors,
+                    _open,
+                    closedq.view(np.uint8),
+                    self._lake_nodes,
+                    self._lake_outlets,
+                    False,
+                )
+            else:
+                self._fill_to_slant_with_optional_tracking(
+                    self._fill_surface,
+                    self._allneighbors,
+                    _open,
+                    closedq,
+                    ignore_overfill=self._ignore_overfill,
+                    track_lakes=False,
+                )
 
     @property
     def lake_dict(self):
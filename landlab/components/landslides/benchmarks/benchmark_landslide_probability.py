@@ -0,0 +1,58 @@
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import LandslideProbability
+
+
+def _setup(shape, number_of_iterations, **kwds):
+    grid = RasterModelGrid(shape, xy_spacing=10.0)
+    rng = np.random.default_rng(1945)
+    n_nodes = grid.number_of_nodes
+    grid.at_node["topographic__slope"] = rng.uniform(0.3, 1.0, n_nodes)
+    grid.at_node["topographic__specific_contributing_area"] = rng.uniform(
+        30.0, 900.0, n_nodes
+    )
+    grid.at_node["soil__transmissivity"] = rng.uniform(5.0, 20.0, n_nodes)
+    grid.add_zeros("soil__saturated_hydraulic_conductivity", at="node")
+    cohesion = rng.uniform(1000.0, 10000.0, n_nodes)
+    grid.at_node["soil__mode_total_cohesion"] = cohesion
+    grid.at_node["soil__minimum_total_cohesion"] = cohesion - 500.0
+    grid.at_node["soil__maximum_total_cohesion"] = cohesion + 500.0
+    grid.at_node["soil__internal_friction_angle"] = rng.uniform(26.0, 40.0, n_nodes)
+    grid.at_node["soil__thickness"] = rng.uniform(1.0, 3.0, n_nodes)
+    grid.at_node["soil__density"] = np.full(n_nodes, 2000.0)
+
+    return LandslideProbability(grid, number_of_iterations=number_of_iterations, **kwds)
+
+
+def bench_node_by_node():
+    _setup((100, 100), 250).calculate_landslide_probability()
+
+
+def bench_chunks():
+    _setup((100, 100), 250, chunk_size=1000).calculate_landslide_probability()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    # Chunks of about 250000 samples (chunk_size * number_of_iterations) keep
+    # the work arrays in cache.
+    for shape, number_of_iterations, chunk_size in [
+        ((200, 200), 250, 1000),
+        ((100, 100), 10000, 25),
+    ]:
+        for kwds in [{}, {"chunk_size": chunk_size}]:
+            ls_prob = _setup(shape, number_of_iterations, **kwds)
+            print(
+                "{0} nodes x {1} iterations, {2}: {3:.3f} s".format(
+                    shape[0] * shape[1],
+                    number_of_iterations,
+                    kwds or "node by node",
+                    min(
+                        timeit.repeat(
+                            ls_prob.calculate_landslide_probability, number=1, repeat=1
+                        )
+                    ),
+                )
+            )
@@ -27,6 +27,7 @@ Last edit June 7, 2017
 """
 
 import copy
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import scipy.constants
@@ -36,6 +37,55 @@ from statsmodels.distributions.empirical_distribution import ECDF
 from landlab import Component
 
 
+def _triangular(rng, left, mode, right, size):
+    """Draw samples from triangular distributions with array parameters.
+
+    Samples are drawn by inverting the cumulative distribution of uniform
+    samples, as *Generator.triangular* does, but without branching on which
+    side of the mode each sample falls. Below the mode the left quantile
+    function is less than the mode and the right one greater, and the other
+    way around above it, so clipping both to the mode and adding them picks
+    the right one. This is much faster than *Generator.triangular* when the
+    parameters are arrays.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.landslides.landslide_probability import (
+    ...     _triangular,
+    ... )
+    >>> samples = _triangular(
+    ...     np.random.default_rng(1),
+    ...     np.array([[0.0], [10.0]]),
+    ...     np.array([[1.0], [15.0]]),
+    ...     np.array([[2.0], [30.0]]),
+    ...     (2, 100000),
+    ... )
+    >>> np.all(samples[0] >= 0.0) and np.all(samples[0] <= 2.0)
+    True
+    >>> np.round(samples.mean(axis=1), 1)
+    array([  1. ,  18.3])
+    """
+    left, mode, right = (np.asarray(x, dtype=float) for x in (left, mode, right))
+    base = right - left
+
+    u = rng.random(size)
+    lower = u * ((mode - left) * base)
+    np.sqrt(lower, out=lower)
+    lower += left
+    np.minimum(lower, mode, out=lower)
+
+    upper = np.subtract(1.0, u, out=u)
+    upper *= (right - mode) * base
+    np.sqrt(upper, out=upper)
+    np.subtract(right, upper, out=upper)
+    np.maximum(upper, mode, out=upper)
+
+    upper -= mode
+    upper += lower
+    return upper
+
+
 class LandslideProbability(Component):
     """Landslide probability component using the infinite slope stability
     model.
@@ -353,6 +403,8 @@ class LandslideProbability(Component):
         groundwater__recharge_standard_deviation=None,
         groundwater__recharge_HSD_inputs=[],
         seed=0,
+        chunk_size=None,
+        n_threads=1,
     ):
         """
         Parameters
@@ -390,7 +442,30 @@ class LandslideProbability(Component):
             other than the default value of zero, it will create different
             sequence. To create a certain sequence repititively, use the same
             value as input for seed.
+        chunk_size: int, optional
+            if given, run the Monte Carlo simulation for this many core nodes
+            at a time, vectorized over nodes and iterations, rather than node
+            by node. Memory use grows with chunk_size * number_of_iterations.
+            Each chunk draws from its own random number generator, seeded
+            from seed and the chunk's position, so results are reproducible
+            for a given seed and chunk_size. (default=None)
+        n_threads: int, optional
+            number of threads over which to spread chunks of nodes. Only
+            used with chunk_size. Results do not depend on the number of
+            threads. (default=1)
         """
+        if chunk_size is not None and (int(chunk_size) != chunk_size or chunk_size < 1):
+            raise ValueError(
+                "chunk_size must be a positive integer ({0})".format(chunk_size)
+            )
+        if int(n_threads) != n_threads or n_threads < 1:
+            raise ValueError(
+                "n_threads must be a positive integer ({0})".format(n_threads)
+            )
+        self._chunk_size = None if chunk_size is None else int(chunk_size)
+        self._n_threads = int(n_threads)
+        self._seed = seed
+
         # Initialize seeded random number generation
         self._seed_generator(seed)
 
@@ -552,10 +627,8 @@ class LandslideProbability(Component):
             self._a / np.sin(np.arctan(self._theta))
         )  # relative wetness
         # calculate probability of saturation
-        countr = 0
-        for val in self._rel_wetness:  # find how many RW values >= 1
-            if val >= 1.0:
-                countr = countr + 1  # number with RW values (>=1)
+        # find how many RW values >= 1
+        countr = np.count_nonzero(self._rel_wetness >= 1.0)
         # probability: No. high RW values/total No. of values (n)
         self._soil__probability_of_saturation = np.float32(countr) / self._n
         # Maximum Rel_wetness = 1.0
@@ -567,10 +640,8 @@ class LandslideProbability(Component):
         self._FS = (self._C_dim / np.sin(np.arctan(self._theta))) + (
             np.cos(np.arctan(self._theta)) * (Y / np.sin(np.arctan(self._theta)))
         )
-        count = 0
-        for val in self._FS:  # find how many FS values <= 1
-            if val <= 1.0:
-                count = count + 1  # number with unstable FS values (<=1)
+        # find how many FS values <= 1 (unstable)
+        count = np.count_nonzero(self._FS <= 1.0)
         # probability: No. unstable values/total No. of values (n)
         self._landslide__probability_of_failure = np.float32(count) / self._n
 
@@ -587,14 +658,17 @@ class LandslideProbability(Component):
         self._mean_Relative_Wetness = np.full(self._grid.number_of_nodes, -9999.0)
         self._prob_fail = np.full(self._grid.number_of_nodes, -9999.0)
         self._prob_sat = np.full(self._grid.number_of_nodes, -9999.0)
-        # Run factor of safety Monte Carlo for all core nodes in domain
-        # i refers to each core node id
-        for i in self._grid.core_nodes:
-            self.calculate_factor_of_safety(i)
-            # Populate storage arrays with calculated values
-            self._mean_Relative_Wetness[i] = self._soil__mean_relative_wetness
-            self._prob_fail[i] = self._landslide__probability_of_failure
-            self._prob_sat[i] = self._soil__probability_of_saturation
+        if self._chunk_size is None:
+            # Run factor of safety Monte Carlo for all core nodes in domain
+            # i refers to each core node id
+            for i in self._grid.core_nodes:
+                self.calculate_factor_of_safety(i)
+                # Populate storage arrays with calculated values
+                self._mean_Relative_Wetness[i] = self._soil__mean_relative_wetness
+                self._prob_fail[i] = self._landslide__probability_of_failure
+                self._prob_sat[i] = self._soil__probability_of_saturation
+        else:
+            self._calculate_landslide_probability_by_chunk()
         # Values can't be negative
         self._mean_Relative_Wetness[self._mean_Relative_Wetness < 0.0] = 0.0
         self._prob_fail[self._prob_fail < 0.0] = 0.0
@@ -603,6 +677,121 @@ class LandslideProbability(Component):
         self._grid.at_node["landslide__probability_of_failure"] = self._prob_fail
         self._grid.at_node["soil__probability_of_saturation"] = self._prob_sat
 
+    def _calculate_landslide_probability_by_chunk(self):
+        """Run the Monte Carlo simulation on chunks of core nodes.
+
+        Chunk k draws from a random number generator seeded with the k-th
+        child of a SeedSequence of the component's seed.
+        """
+        core_nodes = self._grid.core_nodes
+        chunks = [
+            core_nodes[start : start + self._chunk_size]
+            for start in range(0, len(core_nodes), self._chunk_size)
+        ]
+        rngs = [
+            np.random.default_rng(seed)
+            for seed in np.random.SeedSequence(self._seed).spawn(len(chunks))
+        ]
+
+        if self._n_threads == 1:
+            results = map(self._calculate_factor_of_safety_at_nodes, chunks, rngs)
+        else:
+            with ThreadPoolExecutor(max_workers=self._n_threads) as executor:
+                results = list(
+                    executor.map(
+                        self._calculate_factor_of_safety_at_nodes, chunks, rngs
+                    )
+                )
+
+        for nodes, (rel_wetness, prob_fail, prob_sat) in zip(chunks, results):
+            self._mean_Relative_Wetness[nodes] = rel_wetness
+            self._prob_fail[nodes] = prob_fail
+            self._prob_sat[nodes] = prob_sat
+
+    def _calculate_factor_of_safety_at_nodes(self, nodes, rng):
+        """Calculate factor of safety at many nodes at once.
+
+        This is the same Monte Carlo simulation as
+        *calculate_factor_of_safety*, but for an array of nodes, with
+        samples drawn from *rng* into arrays of shape
+        (number of nodes, number of iterations).
+
+        Parameters
+        ----------
+        nodes: ndarray of int
+            IDs of core nodes.
+        rng: numpy.random.Generator
+            random number generator.
+
+        Returns
+        -------
+        tuple of ndarray
+            mean relative wetness, probability of failure, and probability
+            of saturation at each node.
+        """
+        size = (len(nodes), self._n)
+
+        def value_at_nodes(name):
+            return np.float32(self._grid.at_node[name][nodes])[:, np.newaxis]
+
+        a = value_at_nodes("topographic__specific_contributing_area")
+        theta = value_at_nodes("topographic__slope")
+        Tmode = value_at_nodes("soil__transmissivity")
+        Ksatmode = value_at_nodes("soil__saturated_hydraulic_conductivity")
+        Cmode = value_at_nodes("soil__mode_total_cohesion")
+        Cmin = value_at_nodes("soil__minimum_total_cohesion")
+        Cmax = value_at_nodes("soil__maximum_total_cohesion")
+        phi_mode = value_at_nodes("soil__internal_friction_angle")
+        rho = value_at_nodes("soil__density")
+        hs_mode = value_at_nodes("soil__thickness")
+
+        # recharge distribution based on distribution type
+        if self._groundwater__recharge_distribution == "data_driven_spatial":
+            Re = np.vstack([self._HSD_recharge_at_node(i) for i in nodes])
+            Re /= 1000.0  # mm->m
+        elif self._groundwater__recharge_distribution == "lognormal_spatial":
+            mean = self._recharge_mean[nodes, np.newaxis]
+            stdev = self._recharge_stdev[nodes, np.newaxis]
+            mu_lognormal = np.log((mean ** 2) / np.sqrt(stdev ** 2 + mean ** 2))
+            sigma_lognormal = np.sqrt(np.log((stdev ** 2) / (mean ** 2) + 1))
+            Re = rng.lognormal(mu_lognormal, sigma_lognormal, size)
+            Re /= 1000.0  # Convert mm to m
+        else:
+            Re = self._Re
+
+        C = _triangular(rng, Cmin, Cmode, Cmax, size)
+        phi = _triangular(
+            rng, phi_mode - 0.18 * phi_mode, phi_mode, phi_mode + 0.32 * phi_mode, size
+        )
+        hs = _triangular(
+            rng, hs_mode - 0.3 * hs_mode, hs_mode, hs_mode + 0.1 * hs_mode, size
+        )
+        hs[hs <= 0.0] = 0.005
+        if self._Ksat_provided:
+            Ksat = _triangular(
+                rng,
+                Ksatmode - (0.3 * Ksatmode),
+                Ksatmode,
+                Ksatmode + (0.1 * Ksatmode),
+                size,
+            )
+            T = Ksat * hs
+        else:
+            T = _triangular(
+                rng, Tmode - (0.3 * Tmode), Tmode, Tmode + (0.1 * Tmode), size
+            )
+
+        sin_theta = np.sin(np.arctan(theta))
+        C_dim = C / (hs * rho * self._g)
+        rel_wetness = (Re / T) * (a / sin_theta)
+        prob_sat = np.count_nonzero(rel_wetness >= 1.0, axis=1) / self._n
+        np.minimum(rel_wetness, 1.0, out=rel_wetness)
+        Y = np.tan(np.radians(phi)) * (1 - (rel_wetness * 0.5))
+        FS = (C_dim / sin_theta) + (np.cos(np.arctan(theta)) * (Y / sin_theta))
+        prob_fail = np.count_nonzero(FS <= 1.0, axis=1) / self._n
+
+        return rel_wetness.mean(axis=1), prob_fail, prob_sat
+
     def _seed_generator(self, seed=0):
         """Method to initiate random seed.
 
@@ -649,6 +838,10 @@ class LandslideProbability(Component):
         areal fractions of upstream contributing HSD ids. Output is a
         numpy array of recharge at node i.
         """
+        self._Re = self._HSD_recharge_at_node(i)
+
+    def _HSD_recharge_at_node(self, i):
+        """Recharge at node i from the recharge of its contributing HSDs."""
         store_Re = np.zeros(self._n)
         HSD_id_list = self._HSD_id_dict[i]
         fract_list = self._fract_dict[i]
@@ -657,4 +850,4 @@ class LandslideProbability(Component):
             fract_temp = fract_list[j]
             Re_adj = Re_temp * fract_temp
             store_Re = np.vstack((store_Re, np.array(Re_adj)))
-        self._Re = np.sum(store_Re, 0)
+        return np.sum(store_Re, 0)
@@ -1,3 +1,5 @@
+import inspect
+
 import numpy as np
 import scipy.sparse as sparse
 import scipy.sparse.linalg as linalg
@@ -8,6 +10,63 @@ from landlab import Component
 # 2. Implicit handling of scenarios where kappa*dt exceeds critical step -
 #    subdivide dt automatically.
 
+# Relative tolerance of the iterative solver, and the number of iterations
+# after which it gives up on an old preconditioner.
+_ITERATIVE_RTOL = 1e-10
+_ITERATIVE_MAX_ITERATIONS = 10
+
+# scipy 1.12 renamed the relative tolerance of its iterative solvers from
+# tol to rtol, and later versions no longer accept tol.
+if "rtol" in inspect.signature(linalg.bicgstab).parameters:
+    _RTOL_KEYWORD = "rtol"
+else:
+    _RTOL_KEYWORD = "tol"
+
+
+def _csr_pattern(rows, cols, shape):
+    """Set up a CSR matrix with nonzero entries at the given coordinates.
+
+    Parameters
+    ----------
+    rows, cols : ndarray of int
+        Row and column of each entry. Coordinates may be repeated.
+    shape : tuple of int
+        Shape of the matrix.
+
+    Returns
+    -------
+    (csr_matrix, ndarray of int)
+        The matrix, with all its entries set to zero, and the position in
+        the matrix's data array of each of the coordinates.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> matrix, slots = _csr_pattern(
+    ...     np.array([1, 0, 1, 1]), np.array([0, 2, 1, 0]), (2, 3)
+    ... )
+    >>> slots
+    array([1, 0, 2, 1])
+
+    Values at repeated coordinates are summed into the same entry.
+
+    >>> matrix.data[:] = np.bincount(slots, weights=[1.0, 2.0, 3.0, 4.0])
+    >>> matrix.toarray()
+    array([[ 0.,  0.,  2.],
+           [ 5.,  3.,  0.]])
+    """
+    n_rows, n_cols = shape
+    keys, slots = np.unique(rows * n_cols + cols, return_inverse=True)
+    matrix = sparse.csr_matrix(
+        (
+            np.zeros(len(keys)),
+            keys % n_cols,
+            np.searchsorted(keys // n_cols, np.arange(n_rows + 1)),
+        ),
+        shape=shape,
+    )
+    return matrix, slots
+
 
 class PerronNLDiffuse(Component):
 
@@ -87,6 +146,7 @@ class PerronNLDiffuse(Component):
         S_crit=33.0 * np.pi / 180.0,
         rock_density=2700.0,
         sed_density=2700.0,
+        solver="direct",
     ):
         """
         Parameters
@@ -101,9 +161,23 @@ class PerronNLDiffuse(Component):
             The density of intact rock
         sed_density : float (kg*m**-3)
             The density of the mobile (sediment) layer
+        solver : string (optional, default is "direct")
+            Method used to solve the linear system at each step. Options are:
+                (1) 'direct': sparse LU decomposition of each new matrix.
+                (2) 'iterative': BiCGSTAB, started from the current
+                    elevations and preconditioned with the LU decomposition
+                    of an earlier matrix. The decomposition is only redone
+                    when convergence slows, which is much faster on large
+                    grids.
         """
         super().__init__(grid)
 
+        if solver not in ("direct", "iterative"):
+            raise ValueError(
+                "Parameter 'solver' must be one of: " + "'direct', 'iterative'"
+            )
+        self._solver = solver
+
         self._bc_set_code = self._grid.bc_set_code
         self._values_to_diffuse = "topographic__elevation"
         self._kappa = nonlinear_diffusivity
@@ -159,23 +233,14 @@ class PerronNLDiffuse(Component):
         # onto the operating matrix:
         # This array is ninteriornodes long, but the IDs it contains are
         # REAL IDs
-        operating_matrix_ID_map = np.empty((ninteriornodes, 9))
+        self._modulator_mask = np.array(
+            [-ncols - 1, -ncols, -ncols + 1, -1, 0, 1, ncols - 1, ncols, ncols + 1]
+        )
         self._interior_IDs_as_real = self._interiorIDtoreal(np.arange(ninteriornodes))
-        for j in range(ninteriornodes):
-            i = self._interior_IDs_as_real[j]
-            operating_matrix_ID_map[j, :] = np.array(
-                [
-                    (i - ncols - 1),
-                    (i - ncols),
-                    (i - ncols + 1),
-                    (i - 1),
-                    i,
-                    (i + 1),
-                    (i + ncols - 1),
-                    (i + ncols),
-                    (i + ncols + 1),
-                ]
-            )
+        operating_matrix_ID_map = (
+            self._interior_IDs_as_real.reshape((ninteriornodes, 1))
+            + self._modulator_mask
+        )
         self._operating_matrix_ID_map = operating_matrix_ID_map
         self._operating_matrix_core_int_IDs = self._realIDtointerior(
             operating_matrix_ID_map[self._corenodesbyintIDs, :]
@@ -224,10 +289,6 @@ class PerronNLDiffuse(Component):
         # ^this is the position w/i the corner antimasks that the true corner
         # actually occupies
 
-        self._modulator_mask = np.array(
-            [-ncols - 1, -ncols, -ncols + 1, -1, 0, 1, ncols - 1, ncols, ncols + 1]
-        )
-
         self.updated_boundary_conditions()
 
     def updated_boundary_conditions(self):
@@ -364,6 +425,11 @@ class PerronNLDiffuse(Component):
             ]
         )
 
+        # The sparsity pattern of the operating matrix, and so also any
+        # factorization of it, depends on the boundary conditions.
+        self._operating_matrix_slots = None
+        self._factorization = None
+
     def _gear_timestep(self, timestep_in, new_grid):
         """This method allows the gearing between the model run step and the
         component (shorter) step.
@@ -1321,59 +1387,93 @@ class PerronNLDiffuse(Component):
                             conditions...!"""
             )
 
-        # new approach using COO sparse matrix requires we build the matrix
-        # only now...
-        self._operating_matrix = sparse.coo_matrix(
-            (
-                np.concatenate(
-                    (
-                        core_op_mat_data,
-                        corners_op_mat_data,
-                        bottom_op_mat_data,
-                        top_op_mat_data,
-                        left_op_mat_data,
-                        right_op_mat_data,
-                        bottom_op_mat_data_add,
-                        top_op_mat_data_add,
-                        left_op_mat_data_add,
-                        right_op_mat_data_add,
-                    )
-                ),
+        # The nonzero entries of the operating matrix only depend on the
+        # boundary conditions, so find where each of the entries goes once,
+        # and afterwards just sum the new values into place.
+        if self._operating_matrix_slots is None:
+            rows = np.concatenate(
                 (
-                    np.concatenate(
-                        (
-                            core_op_mat_row,
-                            corners_op_mat_row,
-                            bottom_op_mat_row,
-                            top_op_mat_row,
-                            left_op_mat_row,
-                            right_op_mat_row,
-                            bottom_op_mat_row_add,
-                            top_op_mat_row_add,
-                            left_op_mat_row_add,
-                            right_op_mat_row_add,
-                        )
-                    ),
-                    np.concatenate(
-                        (
-                            core_op_mat_col,
-                            corners_op_mat_col,
-                            bottom_op_mat_col,
-                            top_op_mat_col,
-                            left_op_mat_col,
-                            right_op_mat_col,
-                            bottom_op_mat_col_add,
-                            top_op_mat_col_add,
-                            left_op_mat_col_add,
-                            right_op_mat_col_add,
-                        )
-                    ),
-                ),
+                    core_op_mat_row,
+                    corners_op_mat_row,
+                    bottom_op_mat_row,
+                    top_op_mat_row,
+                    left_op_mat_row,
+                    right_op_mat_row,
+                    bottom_op_mat_row_add,
+                    top_op_mat_row_add,
+                    left_op_mat_row_add,
+                    right_op_mat_row_add,
+                )
+            ).astype(int)
+            cols = np.concatenate(
+                (
+                    core_op_mat_col,
+                    corners_op_mat_col,
+                    bottom_op_mat_col,
+                    top_op_mat_col,
+                    left_op_mat_col,
+                    right_op_mat_col,
+                    bottom_op_mat_col_add,
+                    top_op_mat_col_add,
+                    left_op_mat_col_add,
+                    right_op_mat_col_add,
+                )
+            ).astype(int)
+            self._operating_matrix, self._operating_matrix_slots = _csr_pattern(
+                rows, cols, (n_interior_nodes, n_interior_nodes)
+            )
+
+        self._operating_matrix.data[:] = np.bincount(
+            self._operating_matrix_slots,
+            weights=np.concatenate(
+                (
+                    core_op_mat_data,
+                    corners_op_mat_data,
+                    bottom_op_mat_data,
+                    top_op_mat_data,
+                    left_op_mat_data,
+                    right_op_mat_data,
+                    bottom_op_mat_data_add,
+                    top_op_mat_data_add,
+                    left_op_mat_data_add,
+                    right_op_mat_data_add,
+                )
             ),
-            shape=(n_interior_nodes, n_interior_nodes),
-        ).tocsr()
+            minlength=self._operating_matrix.nnz,
+        )
         self._mat_RHS = _mat_RHS
 
+    def _solve_iterative(self):
+        """Solve for the interior elevations with preconditioned BiCGSTAB.
+
+        The solver starts from the current elevations. It is preconditioned
+        with the LU decomposition of the operating matrix from an earlier
+        step, so that the decomposition is only redone when the matrix has
+        changed enough that the solver no longer converges quickly. The new
+        decomposition then solves the system directly.
+        """
+        if self._factorization is not None:
+            _interior_elevs, info = linalg.bicgstab(
+                self._operating_matrix,
+                self._mat_RHS,
+                x0=self._grid.at_node[self._values_to_diffuse][
+                    self._interior_IDs_as_real
+                ],
+                maxiter=_ITERATIVE_MAX_ITERATIONS,
+                M=linalg.LinearOperator(
+                    self._operating_matrix.shape, self._factorization.solve
+                ),
+                atol=0.0,
+                **{_RTOL_KEYWORD: _ITERATIVE_RTOL}
+            )
+            if info == 0:
+                return _interior_elevs
+
+        self._factorization = linalg.splu(
+            self._operating_matrix.tocsc(), permc_spec="MMD_AT_PLUS_A"
+        )
+        return self._factorization.solve(self._mat_RHS)
+
     # These methods translate ID numbers between arrays of differing sizes
     def _realIDtointerior(self, ID):
         ncols = self._ncols
@@ -1445,7 +1545,12 @@ class PerronNLDiffuse(Component):
                 # Initialize the variables for the step:
                 self._set_variables(self._grid)
                 # Solve interior of grid:
-                _interior_elevs = linalg.spsolve(self._operating_matrix, self._mat_RHS)
+                if self._solver == "iterative":
+                    _interior_elevs = self._solve_iterative()
+                else:
+                    _interior_elevs = linalg.spsolve(
+                        self._operating_matrix, self._mat_RHS
+                    )
                 # this fn solves Ax=B for x
 
                 # Handle the BC cells; test common cases first for speed
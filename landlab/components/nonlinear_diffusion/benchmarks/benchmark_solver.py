@@ -0,0 +1,42 @@
+import time
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import PerronNLDiffuse
+
+
+def _setup(shape, **kwds):
+    grid = RasterModelGrid(shape, xy_spacing=10.0)
+    z = grid.add_zeros("topographic__elevation", at="node")
+    z[grid.core_nodes] = np.random.default_rng(1945).random(grid.number_of_core_nodes)
+    return PerronNLDiffuse(grid, nonlinear_diffusivity=0.5, **kwds)
+
+
+def _run(diffuser, n_steps, dt=200.0):
+    z = diffuser.grid.at_node["topographic__elevation"]
+    for _ in range(n_steps):
+        z[diffuser.grid.core_nodes] += 0.1
+        diffuser.run_one_step(dt)
+
+
+def bench_iterative():
+    _run(_setup((300, 300), solver="iterative"), 10)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for shape, n_steps in [((100, 100), 20), ((300, 300), 20), ((500, 500), 10)]:
+        timings = {}
+        for solver in ["direct", "iterative"]:
+            diffuser = _setup(shape, solver=solver)
+            start = time.perf_counter()
+            _run(diffuser, n_steps)
+            timings[solver] = time.perf_counter() - start
+        print(
+            "{0} nodes, {1} steps: direct {2:.3f} s, iterative {3:.3f} s".format(
+                diffuser.grid.number_of_nodes,
+                n_steps,
+                timings["direct"],
+                timings["iterative"],
+            )
+        )
@@ -0,0 +1,165 @@
+import numpy as np
+
+cimport cython
+cimport numpy as np
+from libc.math cimport fabs, isfinite, pow
+
+
+ctypedef np.int_t DTYPE_INT_t
+ctypedef np.double_t DTYPE_FLOAT_t
+ctypedef np.uint8_t DTYPE_UINT8_t
+
+# Tolerance and iteration limit of scipy.optimize.newton.
+DEF NEWTON_TOL = 1.48e-8
+DEF NEWTON_MAXITER = 50
+
+
+cdef inline double _water_fn(
+    double x, double a, double b, double c, double d, double e
+) nogil:
+    return x - c + a * pow(b * x + (b - 1.0) * c, d) - e
+
+
+@cython.cdivision(True)
+cdef int _secant(
+    double x0, double a, double b, double c, double d, double e, double* root
+) nogil:
+    """Find a root of the water-depth equation with the secant method.
+
+    This follows ``scipy.optimize.newton`` (called without a derivative)
+    step by step, so that the root is identical to the one that function
+    returns. Returns 0 on success and -1 on failure.
+    """
+    cdef double p0, p1, q0, q1, p, tmp
+    cdef int itr
+
+    p0 = x0
+    p1 = x0 * (1 + 1e-4)
+    if p1 >= 0:
+        p1 += 1e-4
+    else:
+        p1 -= 1e-4
+    q0 = _water_fn(p0, a, b, c, d, e)
+    q1 = _water_fn(p1, a, b, c, d, e)
+    if fabs(q1) < fabs(q0):
+        tmp = p0; p0 = p1; p1 = tmp
+        tmp = q0; q0 = q1; q1 = tmp
+
+    for itr in range(NEWTON_MAXITER):
+        if q1 == q0:
+            if p1 != p0:
+                return -1
+            root[0] = (p1 + p0) / 2.0
+            return 0
+        elif fabs(q1) > fabs(q0):
+            p = (-q0 / q1 * p1 + p0) / (1 - q0 / q1)
+        else:
+            p = (-q1 / q0 * p0 + p1) / (1 - q1 / q0)
+
+        if isfinite(p) and isfinite(p1):
+            if fabs(p - p1) <= NEWTON_TOL:
+                root[0] = p
+                return 0
+        elif p == p1:
+            root[0] = p
+            return 0
+
+        p0 = p1
+        q0 = q1
+        p1 = p
+        q1 = _water_fn(p1, a, b, c, d, e)
+
+    return -1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def sweep_kinwave_implicit(
+    const DTYPE_INT_t[:] nodes_ordered,
+    const DTYPE_UINT8_t[:] status_at_node,
+    const DTYPE_INT_t[:, :] adjacent_nodes_at_node,
+    const DTYPE_FLOAT_t[:, :] proportions,
+    const DTYPE_FLOAT_t[:] alpha,
+    const DTYPE_FLOAT_t[:] grad_width_sum,
+    const DTYPE_FLOAT_t[:] area_at_node,
+    DTYPE_FLOAT_t[:] depth,
+    DTYPE_FLOAT_t[:] disch_in,
+    double dt,
+    double runoff_rate,
+    double vel_coef,
+    double weight,
+    double depth_exp,
+):
+    """Solve for water depth at core nodes, from upstream to downstream.
+
+    For each core node, in upstream-to-downstream order, solve the implicit
+    water-depth equation and send the resulting outflow to the node's
+    neighbors, partitioned by *proportions*.
+
+    Parameters
+    ----------
+    nodes_ordered : ndarray of int
+        Nodes ordered from downstream to upstream.
+    status_at_node : ndarray of uint8
+        Node status. Only core nodes are solved.
+    adjacent_nodes_at_node : ndarray of int, shape (n_nodes, n_neighbors)
+        Neighbors of each node (-1 for none).
+    proportions : ndarray of float, shape (n_nodes, n_neighbors)
+        Proportion of outflow sent to each neighbor.
+    alpha : ndarray of float
+        Prefactor of the water-depth equation at nodes.
+    grad_width_sum : ndarray of float
+        Sum of square-root slope times face width at nodes.
+    area_at_node : ndarray of float
+        Area of the cell at each core node.
+    depth : ndarray of float
+        Water depth at nodes, updated in place.
+    disch_in : ndarray of float
+        Inflow discharge at nodes. Must be zero on entry; filled in place.
+    dt : float
+        Time step.
+    runoff_rate : float
+        Local runoff rate.
+    vel_coef : float
+        Velocity coefficient (inverse roughness).
+    weight : float
+        Weight on depth at the new time step.
+    depth_exp : float
+        Exponent on depth in the discharge equation.
+
+    Returns
+    -------
+    int
+        -1 on success, otherwise the node at which the solution for depth
+        failed to converge.
+    """
+    cdef long n_nodes = nodes_ordered.shape[0]
+    cdef long n_neighbors = adjacent_nodes_at_node.shape[1]
+    cdef long i, k, node, neighbor
+    cdef long failed_node = -1
+    cdef double cc, ee, h_eff, outflow
+
+    with nogil:
+        for i in range(n_nodes - 1, -1, -1):
+            node = nodes_ordered[i]
+            if status_at_node[node] != 0:
+                continue
+
+            cc = depth[node]
+            ee = (dt * runoff_rate) + (dt * disch_in[node] / area_at_node[node])
+            if _secant(
+                cc, alpha[node], weight, cc, depth_exp, ee, &depth[node]
+            ) != 0:
+                failed_node = node
+                break
+
+            h_eff = weight * depth[node] + (1.0 - weight) * cc
+            outflow = vel_coef * pow(h_eff, depth_exp) * grad_width_sum[node]
+
+            for k in range(n_neighbors):
+                neighbor = adjacent_nodes_at_node[node, k]
+                if neighbor != -1:
+                    disch_in[neighbor] += outflow * proportions[node, k]
+
+    return failed_node
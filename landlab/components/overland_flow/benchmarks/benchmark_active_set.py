@@ -0,0 +1,57 @@
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import OverlandFlow
+
+
+def _setup(shape, **kwds):
+    grid = RasterModelGrid(shape, xy_spacing=5.0)
+    grid.set_closed_boundaries_at_grid_edges(True, True, True, False)
+    grid.add_field(
+        "topographic__elevation",
+        0.002 * grid.y_of_node
+        + 0.05 * np.random.default_rng(1945).random(grid.number_of_nodes),
+        at="node",
+    )
+    grid.add_zeros("surface_water__depth", at="node")
+
+    # Rain over a storm cell in the middle of the grid
+    distance_to_center = np.hypot(
+        grid.x_of_node - grid.x_of_node.mean(), grid.y_of_node - grid.y_of_node.mean()
+    )
+    rain = np.where(distance_to_center < 0.1 * grid.x_of_node.max(), 2.0e-5, 0.0)
+
+    return OverlandFlow(grid, steep_slopes=True, rainfall_intensity=rain, **kwds)
+
+
+def _run(overland_flow):
+    for _ in range(6):
+        overland_flow.run_one_step(300.0)
+
+
+def bench_all_links():
+    _run(_setup((200, 200)))
+
+
+def bench_active_set():
+    _run(_setup((200, 200), active_set=True))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for shape in [(100, 100), (200, 200), (500, 500)]:
+        for active_set in [False, True]:
+            print(
+                "{0} nodes, active_set={1}: {2:.3f} s".format(
+                    shape[0] * shape[1],
+                    active_set,
+                    min(
+                        timeit.repeat(
+                            lambda: _run(_setup(shape, active_set=active_set)),
+                            number=1,
+                            repeat=1,
+                        )
+                    ),
+                )
+            )
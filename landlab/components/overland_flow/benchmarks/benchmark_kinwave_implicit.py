@@ -0,0 +1,39 @@
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import KinwaveImplicitOverlandFlow
+
+
+def _setup(shape):
+    grid = RasterModelGrid(shape, xy_spacing=5.0)
+    grid.add_field(
+        "topographic__elevation",
+        0.01 * grid.x_of_node
+        + 0.02 * grid.y_of_node
+        + 0.3 * np.random.default_rng(1973).random(grid.number_of_nodes),
+        at="node",
+    )
+    kinwave = KinwaveImplicitOverlandFlow(grid, runoff_rate=50.0)
+    kinwave.run_one_step(10.0)
+    return kinwave
+
+
+def bench_kinwave_implicit_1e6():
+    _setup((1000, 1000)).run_one_step(10.0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for shape in [(100, 100), (316, 316), (1000, 1000)]:
+        kinwave = _setup(shape)
+        print(
+            "{0} nodes: {1:.3f} s per step".format(
+                kinwave.grid.number_of_nodes,
+                min(
+                    timeit.repeat(
+                        lambda: kinwave.run_one_step(10.0), number=1, repeat=3
+                    )
+                ),
+            )
+        )
@@ -0,0 +1,48 @@
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import OverlandFlow
+
+
+def _setup(shape, **kwds):
+    grid = RasterModelGrid(shape, xy_spacing=10.0)
+    grid.set_closed_boundaries_at_grid_edges(True, True, True, False)
+    grid.add_field(
+        "topographic__elevation",
+        0.005 * grid.y_of_node
+        + 0.02 * np.random.default_rng(1945).random(grid.number_of_nodes),
+        at="node",
+    )
+    h = grid.add_zeros("surface_water__depth", at="node")
+    h[np.hypot(grid.x_of_node - 400.0, grid.y_of_node - 300.0) < 40.0] = 3.0
+    return OverlandFlow(grid, steep_slopes=True, **kwds)
+
+
+def bench_global_time_stepping():
+    _setup((200, 200)).run_one_step(600.0)
+
+
+def bench_local_time_stepping():
+    _setup((200, 200), local_time_stepping=True).run_one_step(600.0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for shape in [(60, 80), (200, 200), (500, 500)]:
+        for local_time_stepping in [False, True]:
+            print(
+                "{0} nodes, local_time_stepping={1}: {2:.3f} s".format(
+                    shape[0] * shape[1],
+                    local_time_stepping,
+                    min(
+                        timeit.repeat(
+                            lambda: _setup(
+                                shape, local_time_stepping=local_time_stepping
+                            ).run_one_step(600.0),
+                            number=1,
+                            repeat=1,
+                        )
+                    ),
+                )
+            )
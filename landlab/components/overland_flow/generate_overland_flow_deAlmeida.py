@@ -253,6 +253,10 @@ class OverlandFlow(Component):
         theta=0.8,
         rainfall_intensity=0.0,
         steep_slopes=False,
+        local_time_stepping=False,
+        max_time_step_level=4,
+        active_set=False,
+        wet_depth=0.001,
     ):
         """Create an overland flow component.
 
@@ -272,11 +276,31 @@ class OverlandFlow(Component):
             Acceleration due to gravity (m/s^2).
         theta : float, optional
             Weighting factor from de Almeida et al., 2012.
-        rainfall_intensity : float, optional
-            Rainfall intensity. Default is zero.
+        rainfall_intensity : float or array of float, optional
+            Rainfall intensity, either uniform or at each node. Default is
+            zero.
         steep_slopes : bool, optional
             Modify the algorithm to handle steeper slopes at the expense of
             speed. If model runs become unstable, consider setting to True.
+        local_time_stepping : bool, optional
+            Advance each link at its own stable time step rather than at the
+            global one, which is limited by the deepest water on the grid.
+            Links are grouped into classes whose time steps are the global
+            step times 1, 2, 4, ... and fluxes are held between updates, so
+            water is conserved. This pays off when deep water covers only a
+            small part of the grid.
+        max_time_step_level : int, optional
+            With *local_time_stepping*, the number of time step classes above
+            the global one; the longest time step is ``2 **
+            max_time_step_level`` times the global step.
+        active_set : bool, optional
+            Only update links with a wet node at either end, and the nodes
+            at their ends. The set is updated as water spreads and recedes,
+            and discharge is zero outside of it. This pays off when most of
+            the grid is dry. Cannot be combined with *local_time_stepping*.
+        wet_depth : float, optional
+            With *active_set*, the water depth above which a node is wet
+            (m). Nodes with rainfall are always wet.
         """
         super().__init__(grid)
 
@@ -294,6 +318,19 @@ class OverlandFlow(Component):
         self._theta = theta
         self.rainfall_intensity = rainfall_intensity
         self._steep_slopes = steep_slopes
+        self._local_time_stepping = local_time_stepping
+        if int(max_time_step_level) != max_time_step_level or max_time_step_level < 0:
+            raise ValueError(
+                "max_time_step_level must be a non-negative integer "
+                "({0})".format(max_time_step_level)
+            )
+        self._max_time_step_level = int(max_time_step_level)
+        if active_set and local_time_stepping:
+            raise ValueError(
+                "active_set cannot be combined with local_time_stepping"
+            )
+        self._active_set = active_set
+        self._wet_depth = wet_depth
 
         # Now setting up fields at the links...
         # For water discharge
@@ -381,7 +418,7 @@ class OverlandFlow(Component):
 
     @rainfall_intensity.setter
     def rainfall_intensity(self, rainfall_intensity):
-        if rainfall_intensity >= 0:
+        if np.all(np.asarray(rainfall_intensity) >= 0):
             self._rainfall_intensity = rainfall_intensity
         else:
             raise ValueError("Rainfall intensity must be positive")
@@ -515,6 +552,21 @@ class OverlandFlow(Component):
         )
         self._q_vertical = np.zeros(links.number_of_vertical_links(self._grid.shape))
 
+        # For local time stepping, store the two (horizontal or vertical)
+        # neighbors of every link by link ID.
+        self._neighbors_at_link = np.full((self._grid.number_of_links, 2), -1)
+        self._neighbors_at_link[self._horizontal_ids, 0] = self._west_neighbors
+        self._neighbors_at_link[self._horizontal_ids, 1] = self._east_neighbors
+        self._neighbors_at_link[self._vertical_ids, 0] = self._north_neighbors
+        self._neighbors_at_link[self._vertical_ids, 1] = self._south_neighbors
+
+        # Width of the face crossed by each link, and area of the cell at each
+        # node, for updating water depth at a subset of nodes.
+        self._width_at_link = np.empty(self._grid.number_of_links)
+        self._width_at_link[self._horizontal_ids] = self._grid.dy
+        self._width_at_link[self._vertical_ids] = self._grid.dx
+        self._cell_area = self._grid.dx * self._grid.dy
+
         # Once the neighbor arrays are set up, we change the flag to True!
         self._neighbor_flag = True
 
@@ -530,6 +582,13 @@ class OverlandFlow(Component):
         Outputs water depth, discharge and shear stress values through time at
         every point in the input grid.
         """
+        if self._local_time_stepping:
+            self._overland_flow_local(dt=dt)
+            return
+        if self._active_set:
+            self._overland_flow_active_set(dt=dt)
+            return
+
         # DH adds a loop to enable an imposed tstep while maintaining stability
         local_elapsed_time = 0.0
         if dt is None:
@@ -807,6 +866,333 @@ class OverlandFlow(Component):
                 break
             local_elapsed_time += self._dt
 
+    def calc_time_step_level_at_link(self, dt_min):
+        """Calculate the time step class of each link for local time stepping.
+
+        A link of level *m* is stable with a time step of ``dt_min * 2 ** m``,
+        based on the deepest water within *max_time_step_level* nodes of
+        either of its ends. Levels are limited to *max_time_step_level* and
+        smoothed so that the levels of neighboring nodes differ by at most
+        one.
+
+        Parameters
+        ----------
+        dt_min : float
+            The global (shortest) stable time step.
+
+        Returns
+        -------
+        ndarray of int
+            Time step level at each link.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.components import OverlandFlow
+        >>> grid = RasterModelGrid((3, 9))
+        >>> _ = grid.add_zeros("topographic__elevation", at="node")
+        >>> h = grid.add_zeros("surface_water__depth", at="node")
+        >>> h[10] = 16.0
+        >>> of = OverlandFlow(grid, h_init=0.0, max_time_step_level=2)
+        >>> level_at_link = of.calc_time_step_level_at_link(of.calc_time_step())
+        >>> level_at_link[grid.horizontal_links].reshape((3, 8))
+        array([[0, 0, 0, 1, 2, 2, 2, 2],
+               [0, 0, 0, 0, 1, 2, 2, 2],
+               [0, 0, 0, 1, 2, 2, 2, 2]])
+        """
+        h = self._grid.at_node["surface_water__depth"]
+        max_level = self._max_time_step_level
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dt_at_node = self._alpha * self._grid.dx / np.sqrt(self._g * h)
+            level_at_node = np.floor(np.log2(dt_at_node / dt_min))
+        level_at_node[np.isnan(level_at_node)] = 0
+        level_at_node = np.clip(level_at_node, 0, max_level).astype(int)
+
+        # Nodes within max_level nodes of deeper water take its level, so
+        # that a wetting front does not run into nodes with long time steps.
+        # Levels then grow by at most one from node to node.
+        neighbors = self._grid.adjacent_nodes_at_node
+        for increment in [0] * max_level + [1] * max_level:
+            level_at_neighbors = np.where(
+                neighbors == -1, max_level, level_at_node[neighbors]
+            )
+            np.minimum(
+                level_at_node,
+                level_at_neighbors.min(axis=1) + increment,
+                out=level_at_node,
+            )
+
+        return np.minimum(
+            level_at_node[self._grid.node_at_link_tail],
+            level_at_node[self._grid.node_at_link_head],
+        )
+
+    def _overland_flow_local(self, dt=None):
+        """Generate overland flow with local time stepping.
+
+        Each pass through the loop below is a cycle of ``2 ** n_levels``
+        steps of the global time step. Within a cycle, links of level *m*
+        are updated every ``2 ** m`` steps, and their discharge is held
+        constant in between. Water depth at a node is brought up to date,
+        with the held discharges, only when a link of the node is updated.
+        """
+        if self._neighbor_flag is False:
+            self.set_up_neighbor_arrays()
+
+        local_elapsed_time = 0.0
+        if dt is None:
+            dt = np.inf  # to allow the loop to begin
+        while local_elapsed_time < dt:
+            dt_min = self.calc_time_step()
+            if not dt_min < np.inf:
+                break
+
+            level_at_link = self.calc_time_step_level_at_link(dt_min)
+            if self._default_fixed_links is True:
+                level_at_link[self._grid.fixed_links] = 0
+            n_levels = level_at_link.max()
+            while n_levels > 0 and local_elapsed_time + dt_min * 2 ** n_levels > dt:
+                n_levels -= 1
+            if local_elapsed_time + dt_min > dt:
+                dt_min = dt - local_elapsed_time
+            np.minimum(level_at_link, n_levels, out=level_at_link)
+            self._dt = dt_min
+
+            self._run_local_time_step_cycle(dt_min, level_at_link, n_levels)
+
+            if dt is np.inf:
+                break
+            local_elapsed_time += dt_min * 2 ** n_levels
+
+    def _run_local_time_step_cycle(self, dt_min, level_at_link, n_levels):
+        """Advance flow through one cycle of ``2 ** n_levels`` global steps."""
+        grid = self._grid
+        self._h = grid.at_node["surface_water__depth"]
+        self._z = grid.at_node["topographic__elevation"]
+        self._q = grid.at_link["surface_water__discharge"]
+        self._h_links = grid.at_link["surface_water__depth"]
+
+        # Links, and the nodes they touch, that are updated on a step for
+        # which the links of levels 0 through m are due.
+        links_at_level = [
+            np.flatnonzero(level_at_link == m) for m in range(n_levels + 1)
+        ]
+        links_due = [
+            np.concatenate(links_at_level[: m + 1]) for m in range(n_levels + 1)
+        ]
+        nodes_due = [
+            np.union1d(grid.node_at_link_tail[links], grid.node_at_link_head[links])
+            for links in links_due
+        ]
+
+        self._dhdt = self._rainfall_intensity - grid.calc_flux_div_at_node(self._q)
+        self._dhdt[grid.status_at_node != grid.BC_NODE_IS_CORE] = 0.0
+        step_at_node = np.zeros(grid.number_of_nodes, dtype=int)
+
+        n_steps = 2 ** n_levels
+        for step in range(n_steps):
+            if step == 0:
+                level = n_levels
+            else:
+                level = (step & -step).bit_length() - 1
+            links, nodes = links_due[level], nodes_due[level]
+
+            self._advance_depth_to_step(nodes, step, step_at_node, dt_min)
+            self._update_discharge_at_links(
+                links, dt_min * 2 ** level_at_link[links]
+            )
+            self._update_dhdt_at_nodes(nodes)
+
+        self._advance_depth_to_step(
+            np.arange(grid.number_of_nodes), n_steps, step_at_node, dt_min
+        )
+
+    def _advance_depth_to_step(self, nodes, step, step_at_node, dt_min):
+        """Bring water depth at *nodes* up to date with the held discharges."""
+        self._h[nodes] += self._dhdt[nodes] * ((step - step_at_node[nodes]) * dt_min)
+        step_at_node[nodes] = step
+
+        if self._steep_slopes is True:
+            h = self._h[nodes]
+            self._h[nodes[h < self._h_init]] = self._h_init * 10.0 ** -3
+
+    def _update_dhdt_at_nodes(self, nodes):
+        """Recalculate the rate of change of water depth at core *nodes*."""
+        grid = self._grid
+        nodes = nodes[grid.status_at_node[nodes] == grid.BC_NODE_IS_CORE]
+        links = grid.links_at_node[nodes]
+        self._dhdt[nodes] = self._rainfall_at_nodes(nodes) + (
+            self._q[links] * grid.link_dirs_at_node[nodes] * self._width_at_link[links]
+        ).sum(axis=1) / self._cell_area
+
+    def _is_wet(self, nodes):
+        """Find if *nodes* are wet, for the active set."""
+        return (self._h[nodes] > self._wet_depth) | (
+            self._rainfall_at_nodes(nodes) > 0.0
+        )
+
+    def _rainfall_at_nodes(self, nodes):
+        """Rainfall intensity at *nodes*."""
+        return np.broadcast_to(
+            self._rainfall_intensity, (self._grid.number_of_nodes,)
+        )[nodes]
+
+    def _update_discharge_at_links(self, links, dt_at_link):
+        """Update discharge at *links*, each with its own time step."""
+        grid = self._grid
+
+        # Water depth and water surface gradient at active links
+        active_links = links[grid.status_at_link[links] == grid.BC_LINK_IS_ACTIVE]
+        tail = grid.node_at_link_tail[active_links]
+        head = grid.node_at_link_head[active_links]
+        w_at_tail = self._h[tail] + self._z[tail]
+        w_at_head = self._h[head] + self._z[head]
+        self._h_links[active_links] = np.maximum(w_at_tail, w_at_head) - np.maximum(
+            self._z[tail], self._z[head]
+        )
+        self._water_surface_slope[active_links] = (
+            w_at_head - w_at_tail
+        ) / grid.length_of_link[active_links]
+
+        if self._default_fixed_links is True:
+            self._q[grid.fixed_links] = self._q[self._active_neighbors]
+
+        neighbors = self._neighbors_at_link[links]
+        q_at_neighbors = self._q[neighbors]
+        q_at_neighbors[neighbors == -1] = 0.0
+
+        q = self._q[links]
+        h_links = self._h_links[links]
+        mannings_n = np.broadcast_to(self._mannings_n, (grid.number_of_links,))[links]
+        q = (
+            self._theta * q
+            + (1.0 - self._theta) / 2.0 * q_at_neighbors.sum(axis=1)
+            - self._g * h_links * dt_at_link * self._water_surface_slope[links]
+        ) / (
+            1
+            + self._g
+            * dt_at_link
+            * mannings_n ** 2.0
+            * abs(q)
+            / h_links ** _SEVEN_OVER_THREE
+        )
+
+        if self._steep_slopes is True:
+            # Limit discharge by the Froude and Courant numbers, as in
+            # overland_flow.
+            Fr = 1.0
+            calculated_q = (q / h_links) / np.sqrt(self._g * h_links)
+            q_courant = q * dt_at_link / grid.dx
+            water_div_4 = h_links / 4.0
+            is_positive, is_negative = q > 0, q < 0
+
+            froude_q = h_links * np.sqrt(self._g * h_links) * Fr
+            courant_q = (h_links * grid.dx / 5.0) / dt_at_link
+            q = np.where(is_positive & (calculated_q > Fr), froude_q, q)
+            q = np.where(is_negative & (abs(calculated_q) > Fr), -froude_q, q)
+            q = np.where(is_positive & (q_courant > water_div_4), courant_q, q)
+            q = np.where(is_negative & (abs(q_courant) > water_div_4), -courant_q, q)
+
+        self._q[links] = q
+
+        if self._default_fixed_links is True:
+            self._q[grid.fixed_links] = self._q[self._active_neighbors]
+
+    def _overland_flow_active_set(self, dt=None):
+        """Generate overland flow on the wet part of the grid only.
+
+        This is the same algorithm as :meth:`overland_flow` but each time
+        step only updates the links and nodes of the active set (see
+        :meth:`_update_active_set`).
+        """
+        if self._neighbor_flag is False:
+            self.set_up_neighbor_arrays()
+
+        grid = self._grid
+        self._h = grid.at_node["surface_water__depth"]
+        self._z = grid.at_node["topographic__elevation"]
+        self._q = grid.at_link["surface_water__discharge"]
+        self._h_links = grid.at_link["surface_water__depth"]
+
+        # Water depth may have been changed since the last call, so start
+        # from scratch.
+        self._update_active_set()
+
+        local_elapsed_time = 0.0
+        if dt is None:
+            dt = np.inf  # to allow the loop to begin
+        while local_elapsed_time < dt:
+            nodes, core_nodes = self._nodes_in_set, self._core_nodes_in_set
+            if len(nodes) == 0:
+                break
+            dt_local = (
+                self._alpha * grid.dx / np.sqrt(self._g * np.amax(self._h[nodes]))
+            )
+            if not dt_local < np.inf:
+                break
+            if local_elapsed_time + dt_local > dt:
+                dt_local = dt - local_elapsed_time
+            self._dt = dt_local
+
+            self._update_discharge_at_links(self._links_in_set, dt_local)
+            self._update_dhdt_at_nodes(core_nodes)
+            self._h[core_nodes] += self._dhdt[core_nodes] * dt_local
+
+            if self._steep_slopes is True:
+                h = self._h[nodes]
+                self._h[nodes[h < self._h_init]] = self._h_init * 10.0 ** -3
+
+            self._update_active_set(nodes)
+
+            if dt is np.inf:
+                break
+            local_elapsed_time += dt_local
+
+    def _update_active_set(self, nodes=None):
+        """Update the set of links and nodes where water can move.
+
+        A node is wet if its water is deeper than *wet_depth* or if it gets
+        rain. The set holds the links with a wet node at either end,
+        and the nodes at the ends of these links (that is, wet nodes and
+        their neighbors). Only *nodes* may have changed since the last
+        update; if not given, the set is found from scratch. Discharge at
+        links that leave the set is zeroed.
+        """
+        grid = self._grid
+
+        if nodes is None:
+            self._wet_at_node = self._is_wet(slice(None))
+            links = slice(None)
+        else:
+            changed = nodes[self._is_wet(nodes) != self._wet_at_node[nodes]]
+            if len(changed) == 0:
+                return
+            self._wet_at_node[changed] = ~self._wet_at_node[changed]
+            links = np.unique(grid.links_at_node[changed])
+            links = links[links != -1]
+
+        is_wet = self._wet_at_node
+        in_set = (
+            is_wet[grid.node_at_link_tail[links]]
+            | is_wet[grid.node_at_link_head[links]]
+        )
+        if nodes is None:
+            self._link_in_set = in_set
+            self._q[~in_set] = 0.0
+        else:
+            self._q[links[self._link_in_set[links] & ~in_set]] = 0.0
+            self._link_in_set[links] = in_set
+
+        self._links_in_set = np.flatnonzero(self._link_in_set)
+        self._nodes_in_set = np.union1d(
+            grid.node_at_link_tail[self._links_in_set],
+            grid.node_at_link_head[self._links_in_set],
+        )
+        self._core_nodes_in_set = self._nodes_in_set[
+            grid.status_at_node[self._nodes_in_set] == grid.BC_NODE_IS_CORE
+        ]
+
     def run_one_step(self, dt=None):
         """Generate overland flow across a grid.
 
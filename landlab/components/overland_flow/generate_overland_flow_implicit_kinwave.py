@@ -9,17 +9,18 @@ Created on Fri May 27 14:26:13 2016
 
 
 import numpy as np
-from scipy.optimize import newton
 
 from landlab import Component
 from landlab.components import FlowAccumulator
 
+from ._kinwave_implicit import sweep_kinwave_implicit
+
 
 def water_fn(x, a, b, c, d, e):
     r"""Evaluates the solution to the water-depth equation.
 
-    Called by scipy.newton() to find solution for :math:`x`
-    using Newton's method.
+    The component solves this equation for :math:`x` in compiled code,
+    with the secant form of Newton's method used by ``scipy.optimize.newton``.
 
     Parameters
     ----------
@@ -253,6 +254,9 @@ class KinwaveImplicitOverlandFlow(Component):
         # will find a solution for.
         self._alpha = grid.zeros("node")
 
+        # Area of the cell around each core node
+        self._area_at_node = grid.zeros("node")
+
         # Instantiate flow router
         self._flow_accum = FlowAccumulator(
             grid,
@@ -330,58 +334,49 @@ class KinwaveImplicitOverlandFlow(Component):
             #
             #   $\alpha = \frac{\Sigma W S^{1/2} \Delta t}{A C_r}$
             cores = self._grid.core_nodes
+            self._area_at_node[cores] = self._grid.area_of_cell[
+                self._grid.cell_at_node[cores]
+            ]
             self._alpha[cores] = (
                 self._vel_coef
                 * self._grad_width_sum[cores]
                 * dt
-                / (self._grid.area_of_cell[self._grid.cell_at_node[cores]])
+                / (self._area_at_node[cores])
             )
 
         # Zero out inflow discharge
         self._disch_in[:] = 0.0
 
-        # Upstream-to-downstream loop
-        for i in range(len(self._nodes_ordered) - 1, -1, -1):
-            n = self._nodes_ordered[i]
-            if self._grid.status_at_node[n] == 0:
-
-                # Solve for new water depth
-                aa = self._alpha[n]
-                cc = self._depth[n]
-                ee = (dt * self._runoff_rate) + (
-                    dt
-                    * self._disch_in[n]
-                    / self._grid.area_of_cell[self._grid.cell_at_node[n]]
-                )
-                self._depth[n] = newton(
-                    water_fn,
-                    self._depth[n],
-                    args=(aa, self._weight, cc, self._depth_exp, ee),
-                )
-
-                # Calc outflow
-                Heff = self._weight * self._depth[n] + (1.0 - self._weight) * cc
-                outflow = (
-                    self._vel_coef * (Heff ** self._depth_exp) * self._grad_width_sum[n]
-                )  # this is manning/chezy/darcy
-
-                # Send flow downstream. Here we take total inflow discharge
-                # and partition it among the node's neighbors. For this, we use
-                # the flow director's "proportions" array, which contains, for
-                # each node, the proportion of flow that heads out toward each
-                # of its N neighbors. The proportion is zero if the neighbor is
-                # uphill; otherwise, it is S^1/2 / sum(S^1/2). If for example
-                # we have a raster grid, there will be four neighbors and four
-                # proportions, some of which may be zero and some between 0 and
-                # 1.
-                self._disch_in[self._grid.adjacent_nodes_at_node[n]] += (
-                    outflow * self._flow_accum.flow_director._proportions[n]
-                )
+        # Upstream-to-downstream sweep. At each core node we solve for the new
+        # water depth, calculate outflow, and send it downstream, partitioned
+        # among the node's neighbors using the flow director's "proportions"
+        # array. The proportion is zero if the neighbor is uphill; otherwise,
+        # it is S^1/2 / sum(S^1/2).
+        failed_node = sweep_kinwave_implicit(
+            self._nodes_ordered,
+            self._grid.status_at_node,
+            self._grid.adjacent_nodes_at_node,
+            self._flow_accum.flow_director._proportions,
+            self._alpha,
+            self._grad_width_sum,
+            self._area_at_node,
+            self._depth,
+            self._disch_in,
+            dt,
+            self._runoff_rate,
+            self._vel_coef,
+            self._weight,
+            self._depth_exp,
+        )
+        if failed_node >= 0:
+            raise RuntimeError(
+                "Failed to converge on a water depth at node {0}".format(failed_node)
+            )
 
-                # TODO: the above is enough to implement the solution for flow
-                # depth, but it does not provide any information about flow
-                # velocity or discharge on links. This could be added as an
-                # optional method, perhaps done just before output.
+        # TODO: the above is enough to implement the solution for flow
+        # depth, but it does not provide any information about flow
+        # velocity or discharge on links. This could be added as an
+        # optional method, perhaps done just before output.
 
 
 if __name__ == "__main__":
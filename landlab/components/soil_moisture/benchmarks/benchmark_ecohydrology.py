@@ -0,0 +1,52 @@
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import SoilMoisture, Vegetation
+
+
+def _setup(shape):
+    grid = RasterModelGrid(shape)
+    n_cells = grid.number_of_cells
+    rng = np.random.default_rng(1945)
+    grid.at_cell["vegetation__plant_functional_type"] = rng.integers(0, 6, n_cells)
+    for name in [
+        "surface__potential_evapotranspiration_rate",
+        "surface__potential_evapotranspiration_30day_mean",
+        "vegetation__cover_fraction",
+        "vegetation__live_leaf_area_index",
+        "rainfall__daily_depth",
+    ]:
+        grid.add_zeros(name, at="cell")
+    grid.at_cell["soil_moisture__initial_saturation_fraction"] = np.full(n_cells, 0.5)
+
+    return grid, SoilMoisture(grid), Vegetation(grid), rng
+
+
+def _run(grid, soil_moisture, vegetation, rng, n_days):
+    for day in range(n_days):
+        pet = 3.0 + 2.0 * np.sin(2.0 * np.pi * day / 365.0)
+        grid.at_cell["surface__potential_evapotranspiration_rate"][:] = pet
+        grid.at_cell["surface__potential_evapotranspiration_30day_mean"][:] = pet
+        grid.at_cell["rainfall__daily_depth"][:] = 10.0 if rng.random() < 0.2 else 0.0
+        soil_moisture.Tb, soil_moisture.Tr = 24.0, 0.0
+        vegetation.Tb, vegetation.Tr = 24.0, 0.0
+        soil_moisture.update()
+        vegetation.update()
+
+
+def bench_one_year():
+    _run(*_setup((100, 100)), 365)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for shape, n_days in [((100, 100), 365), ((200, 200), 365 * 10)]:
+        model = _setup(shape)
+        print(
+            "{0} cells x {1} days: {2:.3f} s".format(
+                model[0].number_of_cells,
+                n_days,
+                min(timeit.repeat(lambda: _run(*model, n_days), number=1, repeat=1)),
+            )
+        )
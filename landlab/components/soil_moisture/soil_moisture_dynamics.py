@@ -598,63 +598,99 @@ class SoilMoisture(Component):
         self._Sini = np.zeros(self._SO.shape)
         self._ETmax = np.zeros(self._SO.shape)
 
-        for cell in range(0, self._grid.number_of_cells):
-            P = P_[cell]
-            # print cell
-            s = self._SO[cell]
-            fbare = self._fbare
-            ZR = self._zr[cell]
-            pc = self._soil_pc[cell]
-            fc = self._soil_fc[cell]
-            scc = self._soil_sc[cell]
-            wp = self._soil_wp[cell]
-            hgw = self._soil_hgw[cell]
-            beta = self._soil_beta[cell]
-            if self._vegtype[cell] == 0:  # 0 - GRASS
-                sc = scc * self._fr[cell] + (1 - self._fr[cell]) * fc
-            else:
-                sc = scc
-
-            Inf_cap = (
-                self._soil_Ib[cell] * (1 - self._vegcover[cell])
-                + self._soil_Iv[cell] * self._vegcover[cell]
-            )
-            # Infiltration capacity
-            Int_cap = min(self._vegcover[cell] * self._interception_cap[cell], P)
-            # Interception capacity
-            Peff = max(P - Int_cap, 0.0)  # Effective precipitation depth
-            mu = (Inf_cap / 1000.0) / (pc * ZR * (np.exp(beta * (1.0 - fc)) - 1.0))
-            Ep = max(
-                (
-                    self._PET[cell] * self._fr[cell]
-                    + fbare * self._PET[cell] * (1.0 - self._fr[cell])
-                )
-                - Int_cap,
-                0.0001,
-            )  # mm/d
-            self._ETmax[cell] = Ep
-            nu = ((Ep / 24.0) / 1000.0) / (pc * ZR)  # Loss function parameter
-            nuw = ((self._soil_Ew / 24.0) / 1000.0) / (pc * ZR)
-            # Loss function parameter
-            sini = self._SO[cell] + ((Peff + self._runon) / (pc * ZR * 1000.0))
-
-            if sini > 1.0:
-                self._runoff[cell] = (sini - 1.0) * pc * ZR * 1000.0
-                # print 'Runoff =', self._runoff
-                sini = 1.0
-            else:
-                self._runoff[cell] = 0.0
-
-            if sini >= fc:
-                tfc = (1.0 / (beta * (mu - nu))) * (
+        P = P_
+        fbare = self._fbare
+        ZR = self._zr
+        pc = self._soil_pc
+        fc = self._soil_fc
+        wp = self._soil_wp
+        hgw = self._soil_hgw
+        beta = self._soil_beta
+        sc = np.where(
+            self._vegtype == 0,  # 0 - GRASS
+            self._soil_sc * self._fr + (1 - self._fr) * fc,
+            self._soil_sc,
+        )
+
+        Inf_cap = self._soil_Ib * (1 - self._vegcover) + self._soil_Iv * self._vegcover
+        # Infiltration capacity
+        Int_cap = np.minimum(self._vegcover * self._interception_cap, P)
+        # Interception capacity
+        Peff = np.maximum(P - Int_cap, 0.0)  # Effective precipitation depth
+        mu = (Inf_cap / 1000.0) / (pc * ZR * (np.exp(beta * (1.0 - fc)) - 1.0))
+        Ep = np.maximum(
+            (self._PET * self._fr + fbare * self._PET * (1.0 - self._fr)) - Int_cap,
+            0.0001,
+        )  # mm/d
+        self._ETmax[:] = Ep
+        nu = ((Ep / 24.0) / 1000.0) / (pc * ZR)  # Loss function parameter
+        nuw = ((self._soil_Ew / 24.0) / 1000.0) / (pc * ZR)
+        # Loss function parameter
+        sini = self._SO + ((Peff + self._runon) / (pc * ZR * 1000.0))
+
+        is_saturated = sini > 1.0
+        self._runoff[:] = np.where(is_saturated, (sini - 1.0) * pc * ZR * 1000.0, 0.0)
+        sini[is_saturated] = 1.0
+
+        # Each cell follows one of the branches of the soil water loss
+        # function, depending on its initial soil moisture and on how it
+        # compares to the times at which soil moisture would drop to field
+        # capacity (tfc), stomatal closure (tsc), and wilting point (twp).
+        # Expressions are evaluated at all cells and picked per cell, so
+        # ignore floating point errors at cells where they are not used.
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            above_fc = sini >= fc
+            above_sc = ~above_fc & (sini >= sc)
+            above_wp = ~above_fc & ~above_sc & (sini >= wp)
+
+            tfc = np.where(
+                above_fc,
+                (1.0 / (beta * (mu - nu)))
+                * (
                     beta * (fc - sini)
                     + np.log((nu - mu + mu * np.exp(beta * (sini - fc))) / nu)
-                )
-                tsc = ((fc - sc) / nu) + tfc
-                twp = ((sc - wp) / (nu - nuw)) * np.log(nu / nuw) + tsc
+                ),
+                0.0,
+            )
+            tsc = np.select(
+                [above_fc, above_sc], [((fc - sc) / nu) + tfc, (sini - sc) / nu], 0.0
+            )
+            twp = np.select(
+                [above_fc | above_sc, above_wp],
+                [
+                    ((sc - wp) / (nu - nuw)) * np.log(nu / nuw) + tsc,
+                    ((sc - wp) / (nu - nuw))
+                    * np.log(1 + (nu - nuw) * (sini - wp) / (nuw * (sc - wp))),
+                ],
+                0.0,
+            )
 
-                if Tb < tfc:
-                    s = abs(
+            branches = [
+                above_fc & (Tb < tfc),
+                above_fc & (Tb >= tfc) & (Tb < tsc),
+                above_fc & (Tb >= tsc) & (Tb < twp),
+                above_fc,
+                above_sc & (Tb < tsc),
+                above_sc & (Tb >= tsc) & (Tb < twp),
+                above_sc,
+                above_wp & (Tb < twp),
+                above_wp,
+            ]
+
+            # Soil moisture after drying from stomatal closure toward the
+            # wilting point, and from the wilting point toward the
+            # hygroscopic point.
+            s_below_sc = wp + (sc - wp) * (
+                (nu / (nu - nuw)) * np.exp((-1) * ((nu - nuw) / (sc - wp)) * (Tb - tsc))
+                - (nuw / (nu - nuw))
+            )
+            s_below_wp = hgw + (wp - hgw) * np.exp(
+                (-1) * (nuw / (wp - hgw)) * np.maximum(Tb - twp, 0.0)
+            )
+            s = np.select(
+                branches,
+                [
+                    np.abs(
                         sini
                         - (1.0 / beta)
                         * np.log(
@@ -665,104 +701,53 @@ class SoilMoisture(Component):
                             )
                             / (nu - mu)
                         )
-                    )
-
-                    self._D[cell] = ((pc * ZR * 1000.0) * (sini - s)) - (
-                        Tb * (Ep / 24.0)
-                    )
-                    self._ETA[cell] = Tb * (Ep / 24.0)
-
-                elif Tb >= tfc and Tb < tsc:
-                    s = fc - (nu * (Tb - tfc))
-                    self._D[cell] = ((pc * ZR * 1000.0) * (sini - fc)) - (
-                        (tfc) * (Ep / 24.0)
-                    )
-                    self._ETA[cell] = Tb * (Ep / 24.0)
-
-                elif Tb >= tsc and Tb < twp:
-                    s = wp + (sc - wp) * (
-                        (nu / (nu - nuw))
-                        * np.exp((-1) * ((nu - nuw) / (sc - wp)) * (Tb - tsc))
-                        - (nuw / (nu - nuw))
-                    )
-                    self._D[cell] = ((pc * ZR * 1000.0) * (sini - fc)) - (
-                        tfc * Ep / 24.0
-                    )
-                    self._ETA[cell] = (1000.0 * ZR * pc * (sini - s)) - self._D[cell]
-
-                else:
-                    s = hgw + (wp - hgw) * np.exp(
-                        (-1) * (nuw / (wp - hgw)) * max(Tb - twp, 0.0)
-                    )
-                    self._D[cell] = ((pc * ZR * 1000.0) * (sini - fc)) - (
-                        tfc * Ep / 24.0
-                    )
-                    self._ETA[cell] = (1000.0 * ZR * pc * (sini - s)) - self._D[cell]
-
-            elif sini < fc and sini >= sc:
-                tfc = 0.0
-                tsc = (sini - sc) / nu
-                twp = ((sc - wp) / (nu - nuw)) * np.log(nu / nuw) + tsc
-
-                if Tb < tsc:
-                    s = sini - nu * Tb
-                    self._D[cell] = 0.0
-                    self._ETA[cell] = 1000.0 * ZR * pc * (sini - s)
-
-                elif Tb >= tsc and Tb < twp:
-                    s = wp + (sc - wp) * (
-                        (nu / (nu - nuw))
-                        * np.exp((-1) * ((nu - nuw) / (sc - wp)) * (Tb - tsc))
-                        - (nuw / (nu - nuw))
-                    )
-                    self._D[cell] = 0
-                    self._ETA[cell] = 1000.0 * ZR * pc * (sini - s)
-
-                else:
-                    s = hgw + (wp - hgw) * np.exp(
-                        (-1) * (nuw / (wp - hgw)) * (Tb - twp)
-                    )
-                    self._D[cell] = 0.0
-                    self._ETA[cell] = 1000.0 * ZR * pc * (sini - s)
-
-            elif sini < sc and sini >= wp:
-                tfc = 0
-                tsc = 0
-                twp = ((sc - wp) / (nu - nuw)) * np.log(
-                    1 + (nu - nuw) * (sini - wp) / (nuw * (sc - wp))
-                )
-
-                if Tb < twp:
-                    s = wp + ((sc - wp) / (nu - nuw)) * (
+                    ),
+                    fc - (nu * (Tb - tfc)),
+                    s_below_sc,
+                    s_below_wp,
+                    sini - nu * Tb,
+                    s_below_sc,
+                    s_below_wp,
+                    wp
+                    + ((sc - wp) / (nu - nuw))
+                    * (
                         (np.exp((-1) * ((nu - nuw) / (sc - wp)) * Tb))
                         * (nuw + ((nu - nuw) / (sc - wp)) * (sini - wp))
                         - nuw
-                    )
-                    self._D[cell] = 0.0
-                    self._ETA[cell] = 1000.0 * ZR * pc * (sini - s)
-
-                else:
-                    s = hgw + (wp - hgw) * np.exp(
-                        (-1) * (nuw / (wp - hgw)) * (Tb - twp)
-                    )
-                    self._D[cell] = 0.0
-                    self._ETA[cell] = 1000.0 * ZR * pc * (sini - s)
-
-            else:
-                tfc = 0.0
-                tsc = 0.0
-                twp = 0.0
-
-                s = hgw + (sini - hgw) * np.exp((-1) * (nuw / (wp - hgw)) * Tb)
-                self._D[cell] = 0.0
-                self._ETA[cell] = 1000.0 * ZR * pc * (sini - s)
-
-            self._water_stress[cell] = min(
-                ((max(((sc - (s + sini) / 2.0) / (sc - wp)), 0.0)) ** 4.0), 1.0
+                    ),
+                    s_below_wp,
+                ],
+                hgw + (sini - hgw) * np.exp((-1) * (nuw / (wp - hgw)) * Tb),
+            )
+
+            leakage_below_fc = ((pc * ZR * 1000.0) * (sini - fc)) - (tfc * Ep / 24.0)
+            self._D[:] = np.select(
+                branches[:4],
+                [
+                    ((pc * ZR * 1000.0) * (sini - s)) - (Tb * (Ep / 24.0)),
+                    ((pc * ZR * 1000.0) * (sini - fc)) - ((tfc) * (Ep / 24.0)),
+                    leakage_below_fc,
+                    leakage_below_fc,
+                ],
+                0.0,
             )
-            self._S[cell] = s
-            self._SO[cell] = s
-            self._Sini[cell] = sini
+            self._ETA[:] = np.select(
+                branches[:4],
+                [
+                    Tb * (Ep / 24.0),
+                    Tb * (Ep / 24.0),
+                    (1000.0 * ZR * pc * (sini - s)) - self._D,
+                    (1000.0 * ZR * pc * (sini - s)) - self._D,
+                ],
+                1000.0 * ZR * pc * (sini - s),
+            )
+
+        self._water_stress[:] = np.minimum(
+            ((np.maximum(((sc - (s + sini) / 2.0) / (sc - wp)), 0.0)) ** 4.0), 1.0
+        )
+        self._S[:] = s
+        self._SO[:] = s
+        self._Sini[:] = sini
 
         self.current_time += (Tb + Tr) / (24.0 * 365.25)
         return current_time
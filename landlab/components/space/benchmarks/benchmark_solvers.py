@@ -0,0 +1,57 @@
+import time
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import FlowAccumulator, Space
+
+
+def _setup(shape, solver):
+    grid = RasterModelGrid(shape, xy_spacing=10.0)
+    grid.set_closed_boundaries_at_grid_edges(True, True, True, False)
+    z = grid.add_zeros("topographic__elevation", at="node")
+    rng = np.random.default_rng(1945)
+    z += rng.random(z.size) + 0.01 * grid.x_of_node + 0.001 * grid.y_of_node
+    h = grid.add_zeros("soil__depth", at="node")
+    h += 0.5 * rng.random(h.size)
+    grid.add_field("bedrock__elevation", z - h, at="node")
+
+    FlowAccumulator(grid, flow_director="D8").run_one_step()
+    return Space(
+        grid,
+        K_sed=0.01,
+        K_br=0.001,
+        F_f=0.5,
+        phi=0.1,
+        H_star=1.0,
+        v_s=5.0,
+        m_sp=0.5,
+        n_sp=1.0,
+        solver=solver,
+    )
+
+
+def bench_basic():
+    _setup((100, 100), "basic").run_one_step(10.0)
+
+
+def bench_fused():
+    _setup((100, 100), "fused").run_one_step(10.0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for shape in [(100, 100), (300, 300), (1000, 1000)]:
+        timings = []
+        for solver in ["basic", "adaptive", "fused"]:
+            if solver != "fused" and shape[0] > 300:
+                timings.append(np.nan)
+                continue
+            space = _setup(shape, solver)
+            start = time.perf_counter()
+            space.run_one_step(10.0)
+            timings.append(time.perf_counter() - start)
+        print(
+            "{0} nodes: basic {1:.4f} s, adaptive {2:.4f} s, fused {3:.4f} s".format(
+                shape[0] * shape[1], *timings
+            )
+        )
@@ -0,0 +1,45 @@
+import os
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import FastscapeEroder, FlowAccumulator
+
+
+def _setup(shape, n_threads, n_sp=2.0):
+    grid = RasterModelGrid(shape, xy_spacing=10.0)
+    grid.add_field(
+        "topographic__elevation",
+        np.random.default_rng(1973).random(grid.number_of_nodes),
+        at="node",
+    )
+    FlowAccumulator(grid, flow_director="D8").run_one_step()
+    return FastscapeEroder(
+        grid, K_sp=1.0e-4, n_sp=n_sp, threshold_sp=1.0e-5, n_threads=n_threads
+    )
+
+
+def bench_fastscape_serial_1e6():
+    _setup((1000, 1000), 1).run_one_step(100.0)
+
+
+def bench_fastscape_threaded_1e6():
+    _setup((1000, 1000), os.cpu_count()).run_one_step(100.0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for n_threads in sorted({1, 2, 4, os.cpu_count()}):
+        sp = _setup((1000, 1000), n_threads)
+        z = sp.grid.at_node["topographic__elevation"]
+        z0 = z.copy()
+
+        def run():
+            z[:] = z0
+            sp.run_one_step(100.0)
+
+        print(
+            "{0} threads: {1:.3f} s".format(
+                n_threads, min(timeit.repeat(run, number=1, repeat=3))
+            )
+        )
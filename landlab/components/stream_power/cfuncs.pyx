@@ -2,11 +2,6 @@ import numpy as np
 cimport numpy as np
 cimport cython
 from scipy.optimize import newton
-#from libc.math cimport fabs
-
-# suspect that the function _brentq is in c and thus this is the most effective
-# method for using the brentq method in cython.
-from scipy.optimize._zeros import _brentq as brentq
 
 DTYPE_FLOAT = np.double
 ctypedef np.double_t DTYPE_FLOAT_t
@@ -20,49 +15,116 @@ cdef extern from "math.h":
     double pow(double x, double y) nogil
 
 
-def brent_method_erode_variable_threshold(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
-                                          np.ndarray[DTYPE_INT_t, ndim=1] dst_nodes,
-                                          np.ndarray[DTYPE_FLOAT_t, ndim=1] threshsxdt,
-                                          np.ndarray[DTYPE_FLOAT_t, ndim=1] alpha,
-                                          DTYPE_FLOAT_t n,
-                                          np.ndarray[DTYPE_FLOAT_t, ndim=1] z):
-    """Erode node elevations using Brent's method for stability.
+cdef double _erode_fn(double x, double alpha, double beta, double n) nogil:
+    """Evaluate erode_fn without the GIL."""
+    return x - 1.0 + (alpha * pow(x, n)) - beta
 
-    The alpha value is given as
 
-    alpha = delta_t*K * (A)**m/(delta_x**n)
+cdef double _brentq_erode(
+    double alpha, double beta, double n, int max_iter, int * converged
+) nogil:
+    """Find the root of erode_fn between 0 and 1 using Brent's method.
 
-    It will be multiplied by the value:
-        (z_node(t) - z_downstream(t+delta_t))**(n-1)
-
-    to become the alpha value defined below in the function used in erode_fun
-    used in the root-finding operation.
-
-    Parameters
-    ----------
-    src_nodes : array_like
-        Ordered upstream node ids.
-    dst_nodes : array_like
-        Node ids of nodes receiving flow.
-    threshsxdt : array_like
-        Incision thresholds at nodes multiplied by the timestep.
-    alpha : array_like
-        Erosion factor.
-    n : float
-        Exponent.
-    z : array_like
-        Node elevations.
+    This is scipy's brentq, with its default tolerances, specialized to
+    erode_fn so that it can be called without the GIL. The root must be
+    bracketed, which it is whenever erode_fn(1) > 0.
     """
-    # define internally used variables.
-    cdef unsigned int n_nodes = src_nodes.shape[0]
-    cdef unsigned int src_id
-    cdef unsigned int dst_id
-    cdef unsigned int i
+    cdef double xtol = 1e-12
+    cdef double rtol = 4.4408920985006262e-16
+    cdef double xpre = 0.0, xcur = 1.0
+    cdef double xblk = 0.0, fblk = 0.0, spre = 0.0, scur = 0.0
+    cdef double fpre, fcur, sbis, delta, stry, dpre, dblk
+    cdef int i
+
+    converged[0] = 1
+    fpre = _erode_fn(xpre, alpha, beta, n)
+    fcur = _erode_fn(xcur, alpha, beta, n)
+    if fpre == 0:
+        return xpre
+    if fcur == 0:
+        return xcur
+
+    for i in range(max_iter):
+        if fpre != 0 and fcur != 0 and ((fpre < 0) != (fcur < 0)):
+            xblk = xpre
+            fblk = fpre
+            spre = scur = xcur - xpre
+        if fabs(fblk) < fabs(fcur):
+            xpre = xcur
+            xcur = xblk
+            xblk = xpre
+
+            fpre = fcur
+            fcur = fblk
+            fblk = fpre
+
+        delta = (xtol + rtol * fabs(xcur)) / 2
+        sbis = (xblk - xcur) / 2
+        if fcur == 0 or fabs(sbis) < delta:
+            return xcur
+
+        if fabs(spre) > delta and fabs(fcur) < fabs(fpre):
+            if xpre == xblk:
+                # interpolate
+                stry = -fcur * (xcur - xpre) / (fcur - fpre)
+            else:
+                # extrapolate
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                stry = (
+                    -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+                )
+            if 2 * fabs(stry) < min(fabs(spre), 3 * fabs(sbis) - delta):
+                # good short step
+                spre = scur
+                scur = stry
+            else:
+                # bisect
+                spre = sbis
+                scur = sbis
+        else:
+            # bisect
+            spre = sbis
+            scur = sbis
+
+        xpre = xcur
+        fpre = fcur
+        if fabs(scur) > delta:
+            xcur += scur
+        else:
+            xcur += delta if sbis > 0 else -delta
+
+        fcur = _erode_fn(xcur, alpha, beta, n)
+
+    converged[0] = 0
+    return xcur
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef long _erode_stack(const DTYPE_INT_t [:] src_nodes,
+                       const DTYPE_INT_t [:] dst_nodes,
+                       const DTYPE_FLOAT_t [:] threshsxdt,
+                       bint variable_threshold,
+                       const DTYPE_FLOAT_t [:] alpha,
+                       double n,
+                       int max_iter,
+                       DTYPE_FLOAT_t [:] z) nogil:
+    """Erode node elevations along a stack, without the GIL.
+
+    Returns -1 on success. Otherwise, returns the node for which Brent's
+    method did not converge; that node, and the nodes upstream of it in the
+    stack, are left uneroded.
+    """
+    cdef long n_nodes = src_nodes.shape[0]
+    cdef long src_id
+    cdef long dst_id
+    cdef long i
+    cdef int converged
     cdef double z_old
     cdef double z_downstream
     cdef double thresholddt
     cdef double z_diff_old
-    cdef double z_diff
     cdef double alpha_param
     cdef double beta_param
     cdef double check_function
@@ -85,8 +147,12 @@ def brent_method_erode_variable_threshold(np.ndarray[DTYPE_INT_t, ndim=1] src_no
             z_old = z[src_id]
             z_downstream = z[dst_id]
 
-            # Get the threshold value. In this function, it is spatially variable
-            thresholddt = threshsxdt[src_id]
+            # Get the threshold value, which is either spatially variable or
+            # the same everywhere.
+            if variable_threshold:
+                thresholddt = threshsxdt[src_id]
+            else:
+                thresholddt = threshsxdt[0]
 
             # calculate the difference between z_old and z_downstream
             z_diff_old = z_old - z_downstream
@@ -104,7 +170,7 @@ def brent_method_erode_variable_threshold(np.ndarray[DTYPE_INT_t, ndim=1] src_no
             # x = 1 to the erode_fn. If this returns a value of less than
             # zero, this means that the the maximum possible slope value  does
             # not produce stream power needed to exceed the erosion threshold
-            check_function = erode_fn(1, alpha_param, beta_param, n)
+            check_function = _erode_fn(1, alpha_param, beta_param, n)
 
             # if the threshold was not exceeded do not change the elevation,
             # otherwise calculate the erosion rate
@@ -112,23 +178,14 @@ def brent_method_erode_variable_threshold(np.ndarray[DTYPE_INT_t, ndim=1] src_no
                 # if the threshold was exceeded, then there will be a zero
                 # between x = 0 and x= 1
 
-                # solve using brentq, which requires a zero to exist
-                # in between the two end values
-
                 # if n is 1, finding x has an analytical solution. Otherwise,
                 # use the the numerical solution given by root finding
                 if n != 1.0:
-
-                    # The threshold values passed here are the defaults if one
-                    # were to import brentq from scipy.optimize
-                    x = brentq(erode_fn,
-                                       0.0, 1.0,
-                                       1e-12,4.4408920985006262e-16,
-                                       100,
-                                       (alpha_param, beta_param, n),
-                                       False,
-                                       True)
-
+                    x = _brentq_erode(
+                        alpha_param, beta_param, n, max_iter, &converged
+                    )
+                    if not converged:
+                        return src_id
                 else:
                     # Analytical solution
                     x = (1.0 + beta_param)/(1.0 + alpha_param)
@@ -143,17 +200,17 @@ def brent_method_erode_variable_threshold(np.ndarray[DTYPE_INT_t, ndim=1] src_no
                 else:
                     z[src_id] = z_downstream + 1.0e-15
 
-                # Nothing is returned from this function as it serves to update
-                # the array z.
+    return -1
 
 
-def brent_method_erode_fixed_threshold(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
-                                       np.ndarray[DTYPE_INT_t, ndim=1] dst_nodes,
-                                       DTYPE_FLOAT_t threshsxdt,
-                                       np.ndarray[DTYPE_FLOAT_t, ndim=1] alpha,
-                                       DTYPE_FLOAT_t n,
-                                       np.ndarray[DTYPE_FLOAT_t, ndim=1] z):
-    """Erode node elevations.
+def brent_method_erode_variable_threshold(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
+                                          np.ndarray[DTYPE_INT_t, ndim=1] dst_nodes,
+                                          np.ndarray[DTYPE_FLOAT_t, ndim=1] threshsxdt,
+                                          np.ndarray[DTYPE_FLOAT_t, ndim=1] alpha,
+                                          DTYPE_FLOAT_t n,
+                                          np.ndarray[DTYPE_FLOAT_t, ndim=1] z,
+                                          int max_iter=100):
+    """Erode node elevations using Brent's method for stability.
 
     The alpha value is given as
 
@@ -165,13 +222,17 @@ def brent_method_erode_fixed_threshold(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes
     to become the alpha value defined below in the function used in erode_fun
     used in the root-finding operation.
 
+    The GIL is released while eroding, so that independent parts of a stack
+    (separate drainage basins, for instance) can be eroded concurrently from
+    separate threads.
+
     Parameters
     ----------
     src_nodes : array_like
         Ordered upstream node ids.
     dst_nodes : array_like
         Node ids of nodes receiving flow.
-    threshsxdt : float
+    threshsxdt : array_like
         Incision thresholds at nodes multiplied by the timestep.
     alpha : array_like
         Erosion factor.
@@ -179,98 +240,132 @@ def brent_method_erode_fixed_threshold(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes
         Exponent.
     z : array_like
         Node elevations.
+    max_iter : int, optional
+        Maximum number of iterations of Brent's method.
+
+    Raises
+    ------
+    RuntimeError
+        If Brent's method does not converge at a node. Nodes downstream of
+        it have been eroded; it and the nodes upstream of it have not.
     """
-    # define internally used variables.
-    cdef unsigned int n_nodes = src_nodes.shape[0]
-    cdef unsigned int src_id
-    cdef unsigned int dst_id
-    cdef unsigned int i
-    cdef double z_old
-    cdef double z_downstream
-    cdef double z_diff_old
-    cdef double z_diff
-    cdef double alpha_param
-    cdef double beta_param
-    cdef double check_function
-    cdef double x
+    cdef const DTYPE_INT_t [:] src = src_nodes
+    cdef const DTYPE_INT_t [:] dst = dst_nodes
+    cdef const DTYPE_FLOAT_t [:] thresh = threshsxdt
+    cdef const DTYPE_FLOAT_t [:] alpha_at_node = alpha
+    cdef DTYPE_FLOAT_t [:] z_at_node = z
+    cdef long failed_node
 
-    # Loop through nodes.
-    for i in range(n_nodes):
+    with nogil:
+        failed_node = _erode_stack(
+            src, dst, thresh, True, alpha_at_node, n, max_iter, z_at_node
+        )
 
-        # get IDs for source and reciever nodes
-        src_id = src_nodes[i]
-        dst_id = dst_nodes[src_id]
+    if failed_node >= 0:
+        raise RuntimeError(
+            "Failed to converge after {0} iterations (node {1})".format(
+                max_iter, failed_node
+            )
+        )
 
-        # if a node does not flow to itself, and the source node is above the
-        # destination node
-        if src_id != dst_id and z[src_id] > z[dst_id]:
+    # Nothing is returned from this function as it serves to update the
+    # array z.
 
-            # Get values for z at present node and present time,
-            # and z downstream at t + delta t (which should have been
-            # previously solved for)
-            z_old = z[src_id]
-            z_downstream = z[dst_id]
-
-            # Get the threshold value. In this function, it is constant, so we
-            # already have it.
-            # threshsxdt = threshsxdt
-
-            # calculate the difference between z_old and z_downstream
-            z_diff_old = z_old - z_downstream
-
-            # using z_diff_old, calculate the alpha paramter of Braun and
-            # Willet by calculating alpha times z
 
-            alpha_param = alpha[src_id] * pow(z_diff_old, n-1.0)
+def brent_method_erode_fixed_threshold(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
+                                       np.ndarray[DTYPE_INT_t, ndim=1] dst_nodes,
+                                       DTYPE_FLOAT_t threshsxdt,
+                                       np.ndarray[DTYPE_FLOAT_t, ndim=1] alpha,
+                                       DTYPE_FLOAT_t n,
+                                       np.ndarray[DTYPE_FLOAT_t, ndim=1] z,
+                                       int max_iter=100):
+    """Erode node elevations.
 
-            # Calculate the beta parameter that accounts for the possible
-            # presence of a threshold.
-            beta_param = threshsxdt / z_diff_old
-            # check if the threshold has been exceeded by passing a value of
-            # x = 1 to the erode_fn. If this returns a value of less than
-            # zero, this means that the the maximum possible slope value  does
-            # not produce stream power needed to exceed the erosion threshold
-            check_function = erode_fn(1, alpha_param, beta_param, n)
+    The alpha value is given as
 
-            # if the threshold was not exceeded do not change the elevation,
-            # otherwise calculate the erosion rate
-            if check_function > 0:
-                # if the threshold was exceeded, then there will be a zero
-                # between x = 0 and x= 1
+    alpha = delta_t*K * (A)**m/(delta_x**n)
 
-                # solve using brentq, which requires a zero to exist
-                # in between the two end values
+    It will be multiplied by the value:
+        (z_node(t) - z_downstream(t+delta_t))**(n-1)
 
-                # if n is 1, finding x has an analytical solution. Otherwise,
-                # use the the numerical solution given by root finding
-                if n != 1.0:
+    to become the alpha value defined below in the function used in erode_fun
+    used in the root-finding operation.
 
-                    # The threshold values passed here are the defaults if one
-                    # were to import brentq from scipy.optimize
-                    x = brentq(erode_fn,
-                                       0.0, 1.0,
-                                       1e-12,4.4408920985006262e-16,
-                                       100,
-                                       (alpha_param, beta_param, n),
-                                       False,
-                                       True)
+    The GIL is released while eroding, so that independent parts of a stack
+    (separate drainage basins, for instance) can be eroded concurrently from
+    separate threads.
 
-                else:
-                    # Analytical solution
-                    x = (1.0 + beta_param)/(1.0 + alpha_param)
+    Parameters
+    ----------
+    src_nodes : array_like
+        Ordered upstream node ids.
+    dst_nodes : array_like
+        Node ids of nodes receiving flow.
+    threshsxdt : float
+        Incision thresholds at nodes multiplied by the timestep.
+    alpha : array_like
+        Erosion factor.
+    n : float
+        Exponent.
+    z : array_like
+        Node elevations.
+    max_iter : int, optional
+        Maximum number of iterations of Brent's method.
+
+    Raises
+    ------
+    RuntimeError
+        If Brent's method does not converge at a node. Nodes downstream of
+        it have been eroded; it and the nodes upstream of it have not.
+    """
+    cdef const DTYPE_INT_t [:] src = src_nodes
+    cdef const DTYPE_INT_t [:] dst = dst_nodes
+    cdef const DTYPE_FLOAT_t [:] thresh = np.full(1, threshsxdt)
+    cdef const DTYPE_FLOAT_t [:] alpha_at_node = alpha
+    cdef DTYPE_FLOAT_t [:] z_at_node = z
+    cdef long failed_node
+
+    with nogil:
+        failed_node = _erode_stack(
+            src, dst, thresh, False, alpha_at_node, n, max_iter, z_at_node
+        )
+
+    if failed_node >= 0:
+        raise RuntimeError(
+            "Failed to converge after {0} iterations (node {1})".format(
+                max_iter, failed_node
+            )
+        )
+
+    # Nothing is returned from this function as it serves to update the
+    # array z.
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def find_outlets(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
+                 np.ndarray[DTYPE_INT_t, ndim=1] dst_nodes,
+                 np.ndarray[DTYPE_INT_t, ndim=1] outlet):
+    """Find the outlet of the drainage basin of each node.
 
-                # If x is provided as a value greater than zero, calculate
-                # z at t=t+delta_t useing the values of x, z_downstream and
-                # z_old as given by the definition of x (see erode_fn for
-                # details). If x is equal to zero, set it as just slightly
-                # higher than x_downstream.
-                if x>0:
-                    z[src_id] = z_downstream + x * (z_old - z_downstream)
-                else:
-                    z[src_id] = z_downstream + 1.0e-15
+    Parameters
+    ----------
+    src_nodes : array_like
+        Ordered upstream node ids.
+    dst_nodes : array_like
+        Node ids of nodes receiving flow.
+    outlet : array_like
+        Output. Outlet node (a node that is its own receiver) of each node.
+    """
+    cdef long n_nodes = src_nodes.shape[0]
+    cdef long i, node
 
-                # Nothing is returned from this function as it serves to update
-                # the array z.
+    for i in range(n_nodes):
+        node = src_nodes[i]
+        if dst_nodes[node] == node:
+            outlet[node] = node
+        else:
+            outlet[node] = outlet[dst_nodes[node]]
 
 
 def erode_fn(DTYPE_FLOAT_t x,
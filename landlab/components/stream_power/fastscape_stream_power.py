@@ -5,6 +5,7 @@
 # power erosion.
 # Created DEJH, March 2014.
 
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -15,9 +16,80 @@ from ..depression_finder.lake_mapper import _FLOODED
 from .cfuncs import (
     brent_method_erode_fixed_threshold,
     brent_method_erode_variable_threshold,
+    find_outlets,
 )
 
 
+def _split_stack_by_basin(stack, receivers, n_parts):
+    """Split a stack into parts that are each made up of whole basins.
+
+    Nodes of a drainage basin (all the nodes that drain to the same
+    outlet) only depend on other nodes of the same basin, so each part
+    can be eroded independently of the others. Within each part, nodes
+    keep their downstream-to-upstream order. Parts are chosen so that
+    they have about the same number of nodes.
+
+    Parameters
+    ----------
+    stack : ndarray of int
+        Node IDs in downstream-to-upstream order.
+    receivers : ndarray of int
+        Receiver of each node.
+    n_parts : int
+        Number of parts to split the stack into. Fewer parts are returned
+        if there are too few basins.
+
+    Returns
+    -------
+    list of ndarray of int
+        The parts of the stack.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.stream_power.fastscape_stream_power import (
+    ...     _split_stack_by_basin
+    ... )
+
+    Nodes 0 and 3 are outlets. Interleave their basins in the stack.
+
+    >>> receivers = np.array([0, 0, 1, 3, 3, 4])
+    >>> stack = np.array([0, 3, 1, 4, 2, 5])
+    >>> _split_stack_by_basin(stack, receivers, 2)
+    [array([0, 1, 2]), array([3, 4, 5])]
+    >>> _split_stack_by_basin(stack, receivers, 1)
+    [array([0, 1, 2, 3, 4, 5])]
+    """
+    outlet = np.empty_like(receivers)
+    find_outlets(stack, receivers, outlet)
+    outlet_of_stack = outlet[stack]
+
+    is_first_of_basin = np.empty(len(stack), dtype=bool)
+    is_first_of_basin[0] = True
+    np.not_equal(outlet_of_stack[1:], outlet_of_stack[:-1], out=is_first_of_basin[1:])
+
+    # Braun-Willett stacks already list each basin in one piece; other
+    # orderings are grouped by outlet without upsetting the order within
+    # a basin.
+    if np.count_nonzero(is_first_of_basin) != np.count_nonzero(
+        receivers[stack] == stack
+    ):
+        sorted_by_outlet = np.argsort(outlet_of_stack, kind="stable")
+        stack = stack[sorted_by_outlet]
+        outlet_of_stack = outlet_of_stack[sorted_by_outlet]
+        np.not_equal(
+            outlet_of_stack[1:], outlet_of_stack[:-1], out=is_first_of_basin[1:]
+        )
+
+    first_of_basin = np.append(np.flatnonzero(is_first_of_basin), len(stack))
+    splits = first_of_basin[
+        np.searchsorted(first_of_basin, np.arange(1, n_parts) * len(stack) / n_parts)
+    ]
+    parts = np.split(stack, np.unique(splits))
+
+    return [part for part in parts if len(part) > 0]
+
+
 class FastscapeEroder(Component):
 
     r"""Fastscape stream power erosion.
@@ -196,6 +268,7 @@ class FastscapeEroder(Component):
         threshold_sp=0.0,
         discharge_field="drainage_area",
         erode_flooded_nodes=True,
+        n_threads=1,
     ):
         """Initialize the Fastscape stream power component. Note: a timestep,
         dt, can no longer be supplied to this component through the input file.
@@ -224,9 +297,20 @@ class FastscapeEroder(Component):
             depression/lake mapper (e.g., DepressionFinderAndRouter). When set
             to false, the field *flood_status_code* must be present on the grid
             (this is created by the DepressionFinderAndRouter). Default True.
+        n_threads : int, optional
+            Number of threads with which to erode. Drainage basins with
+            different outlets are independent of one another, so with more
+            than one thread, basins are eroded concurrently. Results are
+            identical to those with one thread. Default 1.
         """
         super().__init__(grid)
 
+        if int(n_threads) != n_threads or n_threads < 1:
+            raise ValueError(
+                "n_threads must be a positive integer ({0})".format(n_threads)
+            )
+        self._n_threads = int(n_threads)
+
         if "flow__receiver_node" in grid.at_node:
             if grid.at_node["flow__receiver_node"].size != grid.size("node"):
                 msg = (
@@ -337,10 +421,25 @@ class FastscapeEroder(Component):
 
         # solve using Brent's Method in Cython for Speed
         if isinstance(self._thresholds, float):
-            brent_method_erode_fixed_threshold(
+            erode = brent_method_erode_fixed_threshold
+        else:
+            erode = brent_method_erode_variable_threshold
+
+        if self._n_threads == 1:
+            erode(
                 upstream_order_IDs, flow_receivers, threshsdt, self._alpha, self._n, z
             )
         else:
-            brent_method_erode_variable_threshold(
-                upstream_order_IDs, flow_receivers, threshsdt, self._alpha, self._n, z
+            # The solver releases the GIL, so independent basins can be eroded
+            # concurrently. Use a few parts per thread to balance the load.
+            parts = _split_stack_by_basin(
+                upstream_order_IDs, flow_receivers, 4 * self._n_threads
             )
+            with ThreadPoolExecutor(max_workers=self._n_threads) as executor:
+                for _ in executor.map(
+                    lambda part: erode(
+                        part, flow_receivers, threshsdt, self._alpha, self._n, z
+                    ),
+                    parts,
+                ):
+                    pass
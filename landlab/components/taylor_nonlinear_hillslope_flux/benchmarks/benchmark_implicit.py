@@ -0,0 +1,46 @@
+import time
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import TaylorNonLinearDiffuser
+
+
+def _setup(shape, **kwds):
+    grid = RasterModelGrid(shape)
+    grid.set_closed_boundaries_at_grid_edges(False, True, False, True)
+    z = grid.add_zeros("topographic__elevation", at="node")
+    z += 0.01 * grid.x_of_node ** 2 + np.random.default_rng(1).random(z.size)
+    grid.link_at_face
+    return TaylorNonLinearDiffuser(grid, linear_diffusivity=0.1, **kwds)
+
+
+def bench_implicit_1e5():
+    _setup((316, 316), solver="implicit").run_one_step(10.0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for shape, dt in [((100, 100), 10.0), ((316, 316), 10.0), ((316, 316), 100.0)]:
+        explicit = _setup(shape, dynamic_dt=True)
+        implicit = _setup(shape, solver="implicit")
+
+        start = time.perf_counter()
+        explicit.run_one_step(dt)
+        explicit_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        implicit.run_one_step(dt)
+        implicit_time = time.perf_counter() - start
+
+        z_explicit = explicit.grid.at_node["topographic__elevation"]
+        z_implicit = implicit.grid.at_node["topographic__elevation"]
+        print(
+            "{0} nodes, dt={1}: explicit {2:.3f} s, implicit {3:.3f} s, "
+            "max difference {4:.3g} m".format(
+                explicit.grid.number_of_nodes,
+                dt,
+                explicit_time,
+                implicit_time,
+                np.abs(z_explicit - z_implicit).max(),
+            )
+        )
@@ -0,0 +1,35 @@
+import timeit
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import FlowDirectorSteepest, TransportLengthHillslopeDiffuser
+
+
+def _setup(shape):
+    grid = RasterModelGrid(shape, xy_spacing=2.0)
+    grid.set_closed_boundaries_at_grid_edges(False, True, False, True)
+    grid.add_field(
+        "topographic__elevation",
+        np.random.default_rng(2017).random(grid.number_of_nodes) * 3.0,
+        at="node",
+    )
+    FlowDirectorSteepest(grid).run_one_step()
+    return TransportLengthHillslopeDiffuser(grid, erodibility=0.01, slope_crit=0.6)
+
+
+def bench_tl_diffusion_1e6():
+    _setup((1000, 1000)).run_one_step(1.0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for shape in [(100, 100), (316, 316), (1000, 1000)]:
+        tl_diff = _setup(shape)
+        print(
+            "{0} nodes: {1:.3f} s".format(
+                tl_diff.grid.number_of_nodes,
+                min(
+                    timeit.repeat(lambda: tl_diff.run_one_step(1.0), number=1, repeat=3)
+                ),
+            )
+        )
@@ -270,18 +270,22 @@ class TransportLengthHillslopeDiffuser(Component):
 
         # Calculate influx rate on node i  = outflux of nodes
         # whose receiver is i
-        for i in self._grid.core_nodes:
-            self._flux_in[self._receiver[i]] += self._flux_out[i]
-
-            # Calculate transport coefficient
-            # When S ~ Scrit, d_coeff is set to "infinity", for stability and
-            # so that there is no deposition
-            if self._steepest[i] >= self._slope_crit:
-                self._d_coeff[i] = 1000000000.0
-            else:
-                self._d_coeff[i] = 1 / (
-                    1 - (np.power(((self._steepest[i]) / self._slope_crit), 2))
-                )
+        self._flux_in += np.bincount(
+            self._receiver[cores],
+            weights=self._flux_out[cores],
+            minlength=self._grid.number_of_nodes,
+        )
+
+        # Calculate transport coefficient
+        # When S ~ Scrit, d_coeff is set to "infinity", for stability and
+        # so that there is no deposition
+        slope = self._steepest[cores]
+        d_coeff = np.full(len(cores), 1000000000.0)
+        is_below_crit = slope < self._slope_crit
+        d_coeff[is_below_crit] = 1 / (
+            1 - np.power(slope[is_below_crit] / self._slope_crit, 2)
+        )
+        self._d_coeff[cores] = d_coeff
 
         # Calculate deposition rate on node
         self._depo[cores] = self._flux_in[cores] / self._d_coeff[cores]
@@ -289,16 +293,14 @@ class TransportLengthHillslopeDiffuser(Component):
         # Calculate erosion rate on node (positive value)
         # If S > Scrit, erosion is simply set for the slope to return to Scrit
         # Otherwise, erosion is slope times erodibility coefficent
-        for i in self._grid.core_nodes:
-            if self._steepest[i] > self._slope_crit:
-                self._erosion[i] = (
-                    dx * (self._steepest[i] - self._slope_crit) / (100 * dt)
-                )
-            else:
-                self._erosion[i] = self._k * self._steepest[i]
-
-            # Update elevation
-            self._elev[i] += (-self._erosion[i] + self._depo[i]) * dt
+        self._erosion[cores] = np.where(
+            slope > self._slope_crit,
+            dx * (slope - self._slope_crit) / (100 * dt),
+            self._k * slope,
+        )
+
+        # Update elevation
+        self._elev[cores] += (-self._erosion[cores] + self._depo[cores]) * dt
 
         # Calculate transfer rate over node
         self._trans[cores] = self._flux_in[cores] - self._depo[cores]
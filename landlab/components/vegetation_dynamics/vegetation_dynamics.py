@@ -521,94 +521,88 @@ class Vegetation(Component):
         else:
             PETthreshold = self._ETthresholddown
 
-        for cell in range(0, self._grid.number_of_cells):
-
-            WUE = self._WUE[cell]
-            LAImax = self._LAI_max[cell]
-            cb = self._cb[cell]
-            cd = self._cd[cell]
-            ksg = self._ksg[cell]
-            kdd = self._kdd[cell]
-            kws = self._kws[cell]
-            # ETdmax = self._ETdmax[cell]
-            LAIlive = min(cb * self._Blive_ini[cell], LAImax)
-            LAIdead = min(cd * self._Bdead_ini[cell], (LAImax - LAIlive))
-            NPP = max((ActualET[cell] / (Tb + Tr)) * WUE * 24.0 * self._w * 1000, 0.001)
-
-            if self._vegtype[cell] == 0:
-                if PET30_[cell] > PETthreshold:
-                    # Growing Season
-                    Bmax = (LAImax - LAIdead) / cb
-                    Yconst = 1 / (
-                        (1 / Bmax) + (((kws * Water_stress[cell]) + ksg) / NPP)
-                    )
-                    Blive = (self._Blive_ini[cell] - Yconst) * np.exp(
-                        -(NPP / Yconst) * ((Tb + Tr) / 24.0)
-                    ) + Yconst
-                    Bdead = (
-                        self._Bdead_ini[cell]
-                        + (Blive - max(Blive * np.exp(-1 * ksg * Tb / 24.0), 0.00001))
-                    ) * np.exp(-1 * kdd * min(PET[cell] / self._Tdmax, 1.0) * Tb / 24.0)
-                else:  # Senescense
-                    Blive = max(
-                        self._Blive_ini[cell] * np.exp((-2) * ksg * Tb / 24.0), 1
-                    )
-                    Bdead = max(
-                        (
-                            self._Bdead_ini[cell]
-                            + (
-                                self._Blive_ini[cell]
-                                - (
-                                    max(
-                                        self._Blive_ini[cell]
-                                        * np.exp((-2) * ksg * Tb / 24.0),
-                                        0.000001,
-                                    )
-                                )
+        WUE = self._WUE
+        LAImax = self._LAI_max
+        cb = self._cb
+        cd = self._cd
+        ksg = self._ksg
+        kdd = self._kdd
+        kws = self._kws
+        Blive_ini = self._Blive_ini
+        Bdead_ini = self._Bdead_ini
+
+        LAIlive = np.minimum(cb * Blive_ini, LAImax)
+        LAIdead = np.minimum(cd * Bdead_ini, (LAImax - LAIlive))
+        NPP = np.maximum((ActualET / (Tb + Tr)) * WUE * 24.0 * self._w * 1000, 0.001)
+        PET_factor = np.minimum(PET / self._Tdmax, 1.0)
+
+        is_grass = self._vegtype == 0
+        is_growing = PET30_ > PETthreshold
+
+        # Expressions are evaluated at all cells and picked per cell, so
+        # ignore floating point errors at cells where they are not used.
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            # Growing season for grass, where the maximum biomass leaves room
+            # for dead leaves
+            Bmax = (LAImax - LAIdead) / cb
+            Yconst = 1 / ((1 / Bmax) + (((kws * Water_stress) + ksg) / NPP))
+            Blive_grow = (Blive_ini - Yconst) * np.exp(
+                -(NPP / Yconst) * ((Tb + Tr) / 24.0)
+            ) + Yconst
+            Bdead_grow = (
+                Bdead_ini
+                + (
+                    Blive_grow
+                    - np.maximum(Blive_grow * np.exp(-1 * ksg * Tb / 24.0), 0.00001)
+                )
+            ) * np.exp(-1 * kdd * PET_factor * Tb / 24.0)
+
+            # Senescence of grass
+            Blive_senesce = np.maximum(Blive_ini * np.exp((-2) * ksg * Tb / 24.0), 1)
+            Bdead_senesce = np.maximum(
+                (
+                    Bdead_ini
+                    + (
+                        Blive_ini
+                        - (
+                            np.maximum(
+                                Blive_ini * np.exp((-2) * ksg * Tb / 24.0), 0.000001
                             )
-                            * np.exp(
-                                (-1)
-                                * kdd
-                                * min(PET[cell] / self._Tdmax, 1.0)
-                                * Tb
-                                / 24.0
-                            ),
-                            0.0,
                         )
                     )
+                    * np.exp((-1) * kdd * PET_factor * Tb / 24.0)
+                ),
+                0.0,
+            )
 
-            elif self._vegtype[cell] == 3:
-                Blive = 0.0
-                Bdead = 0.0
-
-            else:
-                Bmax = LAImax / cb
-                Yconst = 1.0 / (
-                    (1.0 / Bmax) + (((kws * Water_stress[cell]) + ksg) / NPP)
+            # Shrubs and trees
+            Bmax = LAImax / cb
+            Yconst = 1.0 / ((1.0 / Bmax) + (((kws * Water_stress) + ksg) / NPP))
+            Blive_woody = (Blive_ini - Yconst) * np.exp(
+                -(NPP / Yconst) * ((Tb + Tr) / 24.0)
+            ) + Yconst
+            Bdead_woody = (
+                Bdead_ini
+                + (
+                    Blive_woody
+                    - np.maximum(Blive_woody * np.exp(-ksg * Tb / 24.0), 0.00001)
                 )
-                Blive = (self._Blive_ini[cell] - Yconst) * np.exp(
-                    -(NPP / Yconst) * ((Tb + Tr) / 24.0)
-                ) + Yconst
-                Bdead = (
-                    self._Bdead_ini[cell]
-                    + (Blive - max(Blive * np.exp(-ksg * Tb / 24.0), 0.00001))
-                ) * np.exp(-kdd * min(PET[cell] / self._Tdmax, 1.0) * Tb / 24.0)
-
-            LAIlive = min(cb * (Blive + self._Blive_ini[cell]) / 2.0, LAImax)
-            LAIdead = min(
-                cd * (Bdead + self._Bdead_ini[cell]) / 2.0, (LAImax - LAIlive)
-            )
-            if self._vegtype[cell] == 0:
-                Vt = 1.0 - np.exp(-0.75 * (LAIlive + LAIdead))
-            else:
-                # Vt = 1 - np.exp(-0.75 * LAIlive)
-                Vt = 1.0
-
-            self._LAIlive[cell] = LAIlive
-            self._LAIdead[cell] = LAIdead
-            self._VegCov[cell] = Vt
-            self._Blive[cell] = Blive
-            self._Bdead[cell] = Bdead
+            ) * np.exp(-kdd * PET_factor * Tb / 24.0)
+
+        conditions = [is_grass & is_growing, is_grass, self._vegtype == 3]
+        Blive = np.select(conditions, [Blive_grow, Blive_senesce, 0.0], Blive_woody)
+        Bdead = np.select(conditions, [Bdead_grow, Bdead_senesce, 0.0], Bdead_woody)
+
+        LAIlive = np.minimum(cb * (Blive + Blive_ini) / 2.0, LAImax)
+        LAIdead = np.minimum(cd * (Bdead + Bdead_ini) / 2.0, (LAImax - LAIlive))
+        # Vt = 1 - np.exp(-0.75 * LAIlive) for shrubs and trees
+        Vt = np.where(is_grass, 1.0 - np.exp(-0.75 * (LAIlive + LAIdead)), 1.0)
+
+        self._LAIlive[:] = LAIlive
+        self._LAIdead[:] = LAIdead
+        self._VegCov[:] = Vt
+        self._Blive[:] = Blive
+        self._Bdead[:] = Bdead
 
         self._Blive_ini = self._Blive
         self._Bdead_ini = self._Bdead
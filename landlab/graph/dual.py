@@ -51,11 +51,11 @@ class DualGraph(metaclass=DualGraphMeta):
 
     @property
     def node_at_cell(self):
-        return self.ds["node_at_cell"].values
+        return self._ds["node_at_cell"].values
 
     @property
     def nodes_at_face(self):
-        return self.ds["nodes_at_face"].values
+        return self._ds["nodes_at_face"].values
 
     @property
     @lru_cache()
@@ -187,8 +187,8 @@ class NetworkGraph:
 
     def freeze(self):
         """Freeze the graph by making arrays read-only."""
-        for var in self.ds.variables:
-            array = self.ds[var].values
+        for var in self._ds.variables:
+            array = self._ds[var].values
             while array is not None:
                 array.flags.writeable = False
                 array = array.base
@@ -196,9 +196,9 @@ class NetworkGraph:
 
     def thaw(self):
         """Thaw the graph by making arrays writable."""
-        for var in self.ds.variables:
+        for var in self._ds.variables:
             arrays = []
-            array = self.ds[var].values
+            array = self._ds[var].values
             while array is not None:
                 arrays.append(array)
                 array = array.base
@@ -325,7 +325,7 @@ class NetworkGraph:
 
         LLCATS: NINF
         """
-        return self.ds["x_of_node"].values
+        return self._ds["x_of_node"].values
 
     @property
     def y_of_node(self):
@@ -341,7 +341,7 @@ class NetworkGraph:
 
         LLCATS: NINF
         """
-        return self.ds["y_of_node"].values
+        return self._ds["y_of_node"].values
 
     @property
     @lru_cache()
@@ -367,7 +367,7 @@ class NetworkGraph:
 
         LLCATS: NINF
         """
-        return self.ds["node"].values
+        return self._ds["node"].values
 
     @property
     @lru_cache()
@@ -402,7 +402,7 @@ class NetworkGraph:
 
         LLCATS: NINF
         """
-        return self.ds.dims["node"]
+        return self._ds.dims["node"]
 
     @property
     def nodes_at_link(self):
@@ -791,9 +791,9 @@ class Graph(NetworkGraph):
         self._dual = dual
 
         if node_at_cell is not None:
-            _update_node_at_cell(self.ds, node_at_cell)
+            _update_node_at_cell(self._ds, node_at_cell)
         if nodes_at_face is not None:
-            _update_nodes_at_face(self.ds, nodes_at_face)
+            _update_nodes_at_face(self._ds, nodes_at_face)
 
     def sort(self):
         with self.thawed():
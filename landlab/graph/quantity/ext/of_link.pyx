@@ -13,12 +13,14 @@ def calc_midpoint_of_link(np.ndarray[DTYPE_t, ndim=2] nodes_at_link,
                           np.ndarray[np.float_t, ndim=2] xy_of_link):
     cdef int link
     cdef int n_links = nodes_at_link.shape[0]
+    cdef DTYPE_t link_tail
+    cdef DTYPE_t link_head
 
     for link in range(n_links):
-        link_tail = nodes_at_link[link][0]
-        link_head = nodes_at_link[link][1]
+        link_tail = nodes_at_link[link, 0]
+        link_head = nodes_at_link[link, 1]
 
-        xy_of_link[link][0] = (x_of_node[link_tail] +
+        xy_of_link[link, 0] = (x_of_node[link_tail] +
                                x_of_node[link_head]) * .5
-        xy_of_link[link][1] = (y_of_node[link_tail] +
+        xy_of_link[link, 1] = (y_of_node[link_tail] +
                                y_of_node[link_head]) * .5
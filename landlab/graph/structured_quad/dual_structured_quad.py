@@ -1,6 +1,10 @@
+from functools import lru_cache
+
 import numpy as np
 
+from ...utils.decorators import read_only_array
 from ..dual import DualGraph
+from ..graph import _update_node_at_cell, _update_nodes_at_face
 from .structured_quad import (
     RectilinearGraph,
     StructuredQuadGraph,
@@ -110,6 +114,27 @@ class DualStructuredQuadGraph(DualGraph, StructuredQuadGraph):
 
         return nodes_at_face
 
+    @staticmethod
+    def get_link_at_face(shape):
+        """Set up an array that gives the link that crosses each face.
+
+        Examples
+        --------
+        >>> from landlab.graph.structured_quad import DualStructuredQuadGraph
+        >>> DualStructuredQuadGraph.get_link_at_face((3, 4))
+        array([ 4,  5,  7,  8,  9, 11, 12])
+        """
+        n_cols = shape[1]
+        nodes_at_face = DualStructuredQuadGraph.get_nodes_at_face(shape)
+        tail = nodes_at_face.min(axis=1)
+        is_vertical = nodes_at_face.max(axis=1) - tail != 1
+
+        return (
+            (tail // n_cols) * (2 * n_cols - 1)
+            + tail % n_cols
+            + is_vertical * (n_cols - 1)
+        )
+
 
 class DualRectilinearGraph(DualGraph, RectilinearGraph):
 
@@ -180,18 +205,57 @@ class DualUniformRectilinearGraph(DualGraph, UniformRectilinearGraph):
            [5, 6, 4, 3]])
     """
 
-    def __init__(self, shape, spacing=1.0, origin=(0.0, 0.0)):
+    def __init__(self, shape, spacing=1.0, origin=(0.0, 0.0), lazy=False):
         spacing = np.broadcast_to(spacing, 2)
         origin = np.broadcast_to(origin, 2)
 
-        UniformRectilinearGraph.__init__(self, shape, spacing=spacing, origin=origin)
+        UniformRectilinearGraph.__init__(
+            self, shape, spacing=spacing, origin=origin, lazy=lazy
+        )
 
         dual_graph = UniformRectilinearGraph(
-            (shape[0] - 1, shape[1] - 1), spacing=spacing, origin=origin + spacing * 0.5
+            (shape[0] - 1, shape[1] - 1),
+            spacing=spacing,
+            origin=origin + spacing * 0.5,
+            lazy=lazy,
         )
 
-        self.merge(
-            dual_graph,
-            node_at_cell=DualStructuredQuadGraph.get_node_at_cell(self.shape),
-            nodes_at_face=DualStructuredQuadGraph.get_nodes_at_face(self.shape),
-        )
+        if lazy:
+            self.merge(dual_graph)
+        else:
+            self.merge(
+                dual_graph,
+                node_at_cell=DualStructuredQuadGraph.get_node_at_cell(self.shape),
+                nodes_at_face=DualStructuredQuadGraph.get_nodes_at_face(self.shape),
+            )
+
+    def _create_link_at_face(self):
+        self._link_at_face = DualStructuredQuadGraph.get_link_at_face(self.shape)
+        return self._link_at_face
+
+    def _update_lazy_ds(self):
+        UniformRectilinearGraph._update_lazy_ds(self)
+        _update_node_at_cell(self._ds, self.node_at_cell)
+        _update_nodes_at_face(self._ds, self.nodes_at_face)
+
+    @property
+    def node_at_cell(self):
+        if self._lazy:
+            return self._lazy_node_at_cell()
+        return self._ds["node_at_cell"].values
+
+    @property
+    def nodes_at_face(self):
+        if self._lazy:
+            return self._lazy_nodes_at_face()
+        return self._ds["nodes_at_face"].values
+
+    @lru_cache()
+    @read_only_array
+    def _lazy_node_at_cell(self):
+        return DualStructuredQuadGraph.get_node_at_cell(self.shape)
+
+    @lru_cache()
+    @read_only_array
+    def _lazy_nodes_at_face(self):
+        return DualStructuredQuadGraph.get_nodes_at_face(self.shape)
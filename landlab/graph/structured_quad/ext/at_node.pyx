@@ -221,6 +221,9 @@ def fill_link_dirs_at_node(shape,
     cdef int n_nodes = n_rows * n_cols
     cdef int links_per_row = 2 * n_cols - 1
     cdef int patches_per_row = n_cols - 1
+    cdef int node
+    cdef int row
+    cdef int col
 
     # Bottom nodes
     for node in range(1, n_cols - 1):
@@ -5,6 +5,7 @@ import numpy as np
 
 from ...utils.decorators import read_only_array
 from ..graph import Graph
+from ..ugrid import _update_links_at_patch, _update_nodes_at_link
 
 
 class StructuredQuadLayout(ABC):
@@ -464,6 +465,12 @@ class StructuredQuadGraphTopology:
     def nodes_at_link(self):
         return self._layout.nodes_at_link(self.shape)
 
+    @property
+    @lru_cache()
+    @read_only_array
+    def links_at_patch(self):
+        return self._layout.links_at_patch(self.shape)
+
     @property
     @lru_cache()
     def horizontal_links(self):
@@ -510,20 +517,89 @@ class StructuredQuadGraphTopology:
 
 
 class StructuredQuadGraphExtras(StructuredQuadGraphTopology, Graph):
-    def __init__(self, node_y_and_x, sort=False):
+    def __init__(self, node_y_and_x, sort=False, lazy=False):
         StructuredQuadGraphTopology.__init__(self, node_y_and_x[0].shape)
-        Graph.__init__(
-            self,
-            node_y_and_x,
-            links=StructuredQuadLayoutCython.nodes_at_link(self.shape),
-            patches=StructuredQuadLayoutCython.links_at_patch(self.shape),
-            sort=sort,
-        )
+        if lazy and sort:
+            raise ValueError("a lazy graph can not be sorted")
+
+        self._lazy = lazy
+        if lazy:
+            Graph.__init__(self, node_y_and_x)
+        else:
+            Graph.__init__(
+                self,
+                node_y_and_x,
+                links=StructuredQuadLayoutCython.nodes_at_link(self.shape),
+                patches=StructuredQuadLayoutCython.links_at_patch(self.shape),
+                sort=sort,
+            )
+
+    @property
+    def lazy(self):
+        """Connectivity has not yet been added to the graph's dataset.
+
+        A lazy graph starts out holding only the coordinates of its nodes.
+        Arrays that describe its connectivity are calculated from the shape
+        of the graph the first time they are used, and are only added to the
+        graph's dataset when the dataset itself is asked for.
+
+        Examples
+        --------
+        >>> from landlab.graph import UniformRectilinearGraph
+        >>> graph = UniformRectilinearGraph((3, 4), lazy=True)
+        >>> graph.lazy
+        True
+        >>> graph.number_of_links
+        17
+        >>> graph.nodes_at_link[:3]
+        array([[0, 1],
+               [1, 2],
+               [2, 3]])
+        >>> graph.lazy
+        True
+        >>> graph.ds["nodes_at_link"].shape
+        (17, 2)
+        >>> graph.lazy
+        False
+        """
+        return self._lazy
+
+    def _update_lazy_ds(self):
+        _update_nodes_at_link(self._ds, self.nodes_at_link)
+        if self.number_of_patches > 0:
+            _update_links_at_patch(self._ds, self.links_at_patch)
+
+    @property
+    def ds(self):
+        if self._lazy:
+            self._update_lazy_ds()
+            self._lazy = False
+            if self._frozen:
+                self.freeze()
+        return self._ds
+
+    @property
+    def number_of_links(self):
+        n_rows, n_cols = self.shape
+        return n_rows * (n_cols - 1) + (n_rows - 1) * n_cols
+
+    @property
+    def number_of_patches(self):
+        n_rows, n_cols = self.shape
+        return (n_rows - 1) * (n_cols - 1)
 
     @property
     def nodes_at_link(self):
+        if self._lazy:
+            return StructuredQuadGraphTopology.nodes_at_link.fget(self)
         return self.ds["nodes_at_link"].values
 
+    @property
+    def links_at_patch(self):
+        if self._lazy:
+            return StructuredQuadGraphTopology.links_at_patch.fget(self)
+        return self.ds["links_at_patch"].values
+
 
 class StructuredQuadGraph(StructuredQuadGraphExtras):
     def __init__(self, coords, shape=None, sort=False):
@@ -642,7 +718,7 @@ class UniformRectilinearGraph(StructuredQuadGraphExtras):
            [10,  9,  6,  7], [11, 10,  7,  8]])
     """
 
-    def __init__(self, shape, spacing=1.0, origin=0.0, sort=False):
+    def __init__(self, shape, spacing=1.0, origin=0.0, sort=False, lazy=False):
         spacing = np.broadcast_to(spacing, 2)
         origin = np.broadcast_to(origin, 2)
 
@@ -651,7 +727,7 @@ class UniformRectilinearGraph(StructuredQuadGraphExtras):
 
         node_y_and_x = np.meshgrid(rows, cols, indexing="ij")
 
-        StructuredQuadGraphExtras.__init__(self, node_y_and_x, sort=sort)
+        StructuredQuadGraphExtras.__init__(self, node_y_and_x, sort=sort, lazy=lazy)
 
         self._spacing = tuple(spacing)
         self._origin = tuple(origin)
@@ -69,9 +69,14 @@ def _update_nodes_at_link(ugrid, node_links):
 def _update_links_at_patch(ugrid, patches):
     from .matrix.at_patch import links_at_patch
 
-    if len(patches) > 0:
-        patches = flatten_jagged_array(patches, dtype=int)
-    patch_links = links_at_patch(patches)
+    if isinstance(patches, np.ndarray) and patches.ndim == 2:
+        # Every patch already has the same number of links (padded with -1)
+        # so there is no need to flatten and then unravel it.
+        patch_links = np.array(patches, dtype=int)
+    else:
+        if len(patches) > 0:
+            patches = flatten_jagged_array(patches, dtype=int)
+        patch_links = links_at_patch(patches)
     links_at_patch = xr.DataArray(
         data=patch_links,
         dims=("patch", "max_patch_links"),
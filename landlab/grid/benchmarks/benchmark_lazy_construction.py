@@ -0,0 +1,58 @@
+import sys
+import timeit
+import tracemalloc
+
+from landlab import RasterModelGrid
+
+
+def _setup(shape, lazy=False):
+    grid = RasterModelGrid(shape, lazy=lazy)
+    grid.add_ones("topographic__elevation", at="node")
+    return grid
+
+
+def _step(grid, dt=0.1):
+    z = grid.at_node["topographic__elevation"]
+    flux = -grid.calc_grad_at_link(z)
+    z[grid.core_nodes] -= dt * grid.calc_flux_div_at_node(flux)[grid.core_nodes]
+
+
+def bench_eager_first_step():
+    _step(_setup((1000, 1000)))
+
+
+def bench_lazy_first_step():
+    _step(_setup((1000, 1000), lazy=True))
+
+
+def _time_and_memory(func):
+    tracemalloc.start()
+    elapsed = timeit.timeit(func, number=1)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == "__main__":  # pragma: no cover
+    # Pass sizes on the command line to try larger grids, for example,
+    # "python benchmark_lazy_construction.py 1e7 1e8".
+    sizes = [int(float(arg)) for arg in sys.argv[1:]] or [10 ** 6]
+    for n_nodes in sizes:
+        n_rows = int(n_nodes ** 0.5)
+        shape = (n_rows, n_nodes // n_rows)
+        for lazy in (False, True):
+            init_time, init_peak = _time_and_memory(lambda: _setup(shape, lazy=lazy))
+            step_time, step_peak = _time_and_memory(
+                lambda: _step(_setup(shape, lazy=lazy))
+            )
+            print(
+                "{0} nodes, {1}: construct {2:.2f} s ({3:.0f} MB), "
+                "to first step {4:.2f} s ({5:.0f} MB)".format(
+                    shape[0] * shape[1],
+                    "lazy" if lazy else "eager",
+                    init_time,
+                    init_peak / 2 ** 20,
+                    step_time,
+                    step_peak / 2 ** 20,
+                )
+            )
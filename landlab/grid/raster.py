@@ -189,6 +189,7 @@ class RasterModelGrid(
         xy_axis_name=("x", "y"),
         xy_axis_units="-",
         bc=None,
+        lazy=False,
     ):
         """Create a 2D grid with equal spacing.
 
@@ -215,6 +216,10 @@ class RasterModelGrid(
             Units for coordinates of each axis.
         bc : dict, optional
             Edge boundary conditions.
+        lazy : bool, optional
+            Calculate arrays that describe the grid's connectivity (links,
+            patches, faces) the first time they are used rather than when
+            the grid is created.
 
         Returns
         -------
@@ -236,7 +241,11 @@ class RasterModelGrid(
             raise ValueError("number of rows and columns must be positive")
 
         DualUniformRectilinearGraph.__init__(
-            self, shape, spacing=xy_spacing[::-1], origin=self.xy_of_lower_left[::-1]
+            self,
+            shape,
+            spacing=xy_spacing[::-1],
+            origin=self.xy_of_lower_left[::-1],
+            lazy=lazy,
         )
         ModelGrid.__init__(
             self,
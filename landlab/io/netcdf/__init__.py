@@ -2,9 +2,10 @@ from .dump import to_netcdf
 from .errors import NotRasterGridError
 from .load import from_netcdf
 from .read import read_netcdf
-from .write import write_netcdf, write_raster_netcdf
+from .write import create_raster_netcdf, write_netcdf, write_raster_netcdf
 
 __all__ = [
+    "create_raster_netcdf",
     "from_netcdf",
     "read_netcdf",
     "to_netcdf",
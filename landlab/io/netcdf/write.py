@@ -7,6 +7,7 @@ Write netcdf
 .. autosummary::
 
     ~landlab.io.netcdf.write.write_netcdf
+    ~landlab.io.netcdf.write.create_raster_netcdf
 """
 import pathlib
 
@@ -831,3 +832,111 @@ def write_raster_netcdf(
         time=time,
         raster=True,
     )
+
+
+def create_raster_netcdf(
+    path,
+    shape,
+    names,
+    xy_spacing=(1.0, 1.0),
+    xy_of_lower_left=(0.0, 0.0),
+    dtype="float64",
+    chunk_shape=None,
+    attrs=None,
+    format="NETCDF4",
+):
+
+    """Create a NetCDF file of raster variables to be written later.
+
+    The coordinates of the raster are written, but the variables named by
+    *names* are created without any values. Once the file is opened with
+    netCDF4, they can be written to a piece at a time. This is how fields
+    of rasters that are too large to be held in memory (as a
+    RasterModelGrid, for instance) are written, one tile at a time. The
+    file can be read back with read_netcdf.
+
+    Parameters
+    ----------
+    path : str
+        Path to output file.
+    shape : tuple of int
+        Number of rows and columns of nodes in the raster.
+    names : str or iterable of str
+        Names of the variables to create.
+    xy_spacing : tuple of float, optional
+        Spacing between columns and between rows of nodes.
+    xy_of_lower_left : tuple of float, optional
+        Coordinates of the lower-left node of the raster.
+    dtype : str, optional
+        Data type of the variables.
+    chunk_shape : tuple of int, optional
+        Shape of the chunks in which variables are stored. Chunks that
+        match the tiles that variables are written in make reading and
+        writing tiles fast. Only used by NETCDF4 files.
+    attrs : dict, optional
+        Attributes to add to netcdf file.
+    format : {'NETCDF4', 'NETCDF4_CLASSIC', 'NETCDF3_64BIT'}, optional
+        Format of output netcdf file.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import netCDF4
+    >>> from landlab.io.netcdf import create_raster_netcdf, read_netcdf
+
+    Create a temporary directory to write the netcdf file into.
+
+    >>> import tempfile, os
+    >>> temp_dir = tempfile.mkdtemp()
+    >>> os.chdir(temp_dir)
+
+    >>> create_raster_netcdf(
+    ...     "test.nc", (4, 3), "drainage_area", xy_spacing=(2.0, 1.0)
+    ... )
+
+    Write the values one row at a time.
+
+    >>> with netCDF4.Dataset("test.nc", "a") as root:
+    ...     for row in range(4):
+    ...         root["drainage_area"][row, :] = np.arange(3.0) + 3 * row
+
+    >>> grid = read_netcdf("test.nc")
+    >>> grid.shape
+    (4, 3)
+    >>> grid.dx, grid.dy
+    (2.0, 1.0)
+    >>> grid.at_node["drainage_area"]
+    array([  0.,   1.,   2.,   3.,   4.,   5.,   6.,   7.,   8.,   9.,  10.,
+            11.])
+    """
+    import netCDF4
+
+    if isinstance(names, str):
+        names = (names,)
+
+    dims = _get_dimension_names(shape)
+    x_of_col = xy_of_lower_left[0] + xy_spacing[0] * np.arange(shape[1])
+    y_of_row = xy_of_lower_left[1] + xy_spacing[1] * np.arange(shape[0])
+
+    with netCDF4.Dataset(path, "w", format=format) as root:
+        _set_netcdf_attributes(root, attrs or {})
+
+        for (name, size) in _get_dimension_sizes(shape).items():
+            root.createDimension(name, size)
+
+        coords = (("x", dims[1], x_of_col), ("y", dims[0], y_of_row))
+        for (name, dim, values) in coords:
+            var = root.createVariable(name, "f8", (dim,))
+            var.units = "-"
+            var[:] = values
+
+        for name in names:
+            if chunk_shape is not None and format == "NETCDF4":
+                root.createVariable(
+                    name,
+                    _NP_TO_NC_TYPE[str(np.dtype(dtype))],
+                    dims,
+                    chunksizes=tuple(min(n, m) for n, m in zip(chunk_shape, shape)),
+                )
+            else:
+                root.createVariable(name, _NP_TO_NC_TYPE[str(np.dtype(dtype))], dims)
@@ -0,0 +1,22 @@
+cimport numpy as np
+
+ctypedef np.int_t DTYPE_INT_t
+ctypedef np.double_t DTYPE_FLOAT_t
+
+
+cdef class NodePriorityQueue:
+    cdef DTYPE_FLOAT_t [:] _priority
+    cdef DTYPE_INT_t [:] _order
+    cdef DTYPE_INT_t [:] _node
+    cdef DTYPE_INT_t [:] _position
+    cdef DTYPE_INT_t _size
+    cdef DTYPE_INT_t _count
+
+    cdef void push(self, DTYPE_INT_t node, DTYPE_FLOAT_t priority)
+    cdef DTYPE_INT_t pop(self)
+    cdef DTYPE_INT_t peek(self)
+    cdef void discard(self, DTYPE_INT_t node)
+    cdef bint _less(self, DTYPE_INT_t slot_a, DTYPE_INT_t slot_b)
+    cdef void _swap(self, DTYPE_INT_t slot_a, DTYPE_INT_t slot_b)
+    cdef DTYPE_INT_t _sift_up(self, DTYPE_INT_t slot)
+    cdef DTYPE_INT_t _sift_down(self, DTYPE_INT_t slot)
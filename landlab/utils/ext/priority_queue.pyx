@@ -0,0 +1,218 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+
+
+cdef class NodePriorityQueue:
+    """A stable priority queue of node IDs, backed by arrays.
+
+    This is a compiled counterpart to
+    :py:class:`~landlab.utils.StablePriorityQueue` for tasks that are the IDs
+    of the nodes of a grid. Each node can be in the queue at most once;
+    adding a node that is already in the queue changes its priority (the
+    decrease-key operation of a priority queue). Ties in priority are broken
+    by the order in which the nodes were (last) added, so the queue is
+    stable.
+
+    The queue allocates all of its memory when it is created, so that adding
+    and removing nodes creates no Python objects. Compiled code can use the
+    ``push``, ``pop``, ``peek`` and ``discard`` methods of the queue directly.
+
+    Parameters
+    ----------
+    number_of_nodes : int
+        The number of nodes; nodes must be in the range
+        ``[0, number_of_nodes)``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.utils import NodePriorityQueue
+    >>> q = NodePriorityQueue(5)
+    >>> q.add_task(3, priority=2.)
+    >>> q.add_task(1, priority=1.)
+    >>> q.add_task(0, priority=0.)
+    >>> q.add_task(4, priority=2.)
+    >>> q.remove_task(0)
+    >>> len(q)
+    3
+    >>> q.pop_task()
+    1
+    >>> q.peek_at_task()
+    3
+    >>> np.sort(q.tasks_currently_in_queue())
+    array([3, 4])
+
+    Adding a node that is already in the queue changes its priority.
+
+    >>> q.add_task(4, priority=0.5)
+    >>> q.pop_task(), q.pop_task()
+    (4, 3)
+
+    Popping from (or peeking at) an empty queue raises a KeyError.
+
+    >>> q.pop_task()
+    Traceback (most recent call last):
+    ...
+    KeyError: 'pop from an empty priority queue'
+    """
+
+    def __init__(self, number_of_nodes):
+        self._priority = np.empty(number_of_nodes, dtype=float)
+        self._order = np.empty(number_of_nodes, dtype=int)
+        self._node = np.empty(number_of_nodes, dtype=int)
+        self._position = np.full(number_of_nodes, -1, dtype=int)
+        self._size = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, node):
+        return 0 <= node < self._position.shape[0] and self._position[node] != -1
+
+    @property
+    def number_of_nodes(self):
+        """The number of nodes that the queue can hold."""
+        return self._position.shape[0]
+
+    def add_task(self, node, priority=0.0):
+        """Add a node, or change the priority of a node already queued."""
+        if not 0 <= node < self._position.shape[0]:
+            raise ValueError("node is out of range: {0}".format(node))
+        self.push(node, priority)
+
+    def remove_task(self, node):
+        """Remove a node from the queue.
+
+        Raise KeyError if not found.
+        """
+        if node not in self:
+            raise KeyError(node)
+        self.discard(node)
+
+    def pop_task(self):
+        """Remove and return the node with the lowest priority.
+
+        Raise KeyError if empty.
+        """
+        if self._size == 0:
+            raise KeyError("pop from an empty priority queue")
+        return self.pop()
+
+    def peek_at_task(self):
+        """Return the node with the lowest priority without removal.
+
+        Raise KeyError if empty.
+        """
+        if self._size == 0:
+            raise KeyError("peeked at an empty priority queue")
+        return self.peek()
+
+    def tasks_currently_in_queue(self):
+        """Return array of nodes currently in the queue."""
+        return np.array(self._node[: self._size])
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void push(self, DTYPE_INT_t node, DTYPE_FLOAT_t priority):
+        cdef DTYPE_INT_t slot = self._position[node]
+
+        if slot == -1:
+            slot = self._size
+            self._size += 1
+            self._node[slot] = node
+            self._position[node] = slot
+        self._priority[slot] = priority
+        self._order[slot] = self._count
+        self._count += 1
+
+        self._sift_down(self._sift_up(slot))
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef DTYPE_INT_t pop(self):
+        cdef DTYPE_INT_t top
+
+        if self._size == 0:
+            return -1
+        top = self._node[0]
+        self.discard(top)
+        return top
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef DTYPE_INT_t peek(self):
+        if self._size == 0:
+            return -1
+        return self._node[0]
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void discard(self, DTYPE_INT_t node):
+        cdef DTYPE_INT_t slot = self._position[node]
+        cdef DTYPE_INT_t last
+
+        if slot == -1:
+            return
+        self._position[node] = -1
+        self._size -= 1
+        last = self._size
+        if slot != last:
+            self._priority[slot] = self._priority[last]
+            self._order[slot] = self._order[last]
+            self._node[slot] = self._node[last]
+            self._position[self._node[slot]] = slot
+            self._sift_down(self._sift_up(slot))
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef bint _less(self, DTYPE_INT_t slot_a, DTYPE_INT_t slot_b):
+        return self._priority[slot_a] < self._priority[slot_b] or (
+            self._priority[slot_a] == self._priority[slot_b]
+            and self._order[slot_a] < self._order[slot_b]
+        )
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _swap(self, DTYPE_INT_t slot_a, DTYPE_INT_t slot_b):
+        cdef DTYPE_FLOAT_t priority = self._priority[slot_a]
+        cdef DTYPE_INT_t order = self._order[slot_a]
+        cdef DTYPE_INT_t node = self._node[slot_a]
+
+        self._priority[slot_a] = self._priority[slot_b]
+        self._order[slot_a] = self._order[slot_b]
+        self._node[slot_a] = self._node[slot_b]
+        self._priority[slot_b] = priority
+        self._order[slot_b] = order
+        self._node[slot_b] = node
+        self._position[self._node[slot_a]] = slot_a
+        self._position[self._node[slot_b]] = slot_b
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef DTYPE_INT_t _sift_up(self, DTYPE_INT_t slot):
+        cdef DTYPE_INT_t parent
+
+        while slot > 0:
+            parent = (slot - 1) // 2
+            if not self._less(slot, parent):
+                break
+            self._swap(slot, parent)
+            slot = parent
+        return slot
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef DTYPE_INT_t _sift_down(self, DTYPE_INT_t slot):
+        cdef DTYPE_INT_t child = 2 * slot + 1
+
+        while child < self._size:
+            if child + 1 < self._size and self._less(child + 1, child):
+                child += 1
+            if not self._less(child, slot):
+                break
+            self._swap(slot, child)
+            slot = child
+            child = 2 * slot + 1
+        return slot
@@ -115,5 +115,53 @@ def test_shift_link_and_transition_data_upward():
         [0.75, 0.84, 2.6, 0.07, 0.09, 0.8, 0.02, 1.79, 1.51, 2.04, 3.85],
     )
     assert_equal(pq._queue[0][2], 14)  # new soonest event
-    assert_equal(pq._queue[9][2], 13)  # was previously 7, now shifted up...
-    assert_equal(round(pq._queue[9][0], 2), 0.8)  # ...still sched for t = 0.80
+    events = {link: time for (time, _, link) in pq._queue}
+    assert_equal(round(events[13], 2), 0.8)  # was previously 7, now shifted up
+
+
+def _check_events_and_link_states(ca, links):
+    events = {link: time for (time, _, link) in ca.priority_queue._queue}
+    for link, time in events.items():
+        assert_equal(time, ca.next_update[link])
+
+    tail = ca.node_state[ca.grid.node_at_link_tail[links]]
+    head = ca.node_state[ca.grid.node_at_link_head[links]]
+    assert_array_equal(
+        ca.link_state[links],
+        ca.link_orientation[links] * ca.num_node_states_sq
+        + tail * ca.num_node_states
+        + head,
+    )
+    for link in links:
+        assert (link in events) == (ca.next_trn_id[link] != -1)
+
+
+def test_repeated_offset_and_uplift():
+    """Test that batched offsets keep link states and events consistent."""
+    nsd = {0: "yes", 1: "no"}
+    xnlist = [
+        Transition((0, 1, 0), (1, 0, 0), 1.0, "", True),
+        Transition((0, 1, 1), (1, 0, 1), 1.0, "", True),
+        Transition((0, 1, 2), (1, 0, 2), 1.0, "", True),
+    ]
+
+    for Tectonicizer in (LatticeNormalFault, LatticeUplifter):
+        mg = HexModelGrid(
+            (12, 11), spacing=1.0, orientation="vertical", node_layout="rect"
+        )
+        nsg = np.random.RandomState(1945).randint(0, 2, mg.number_of_nodes)
+        ca = OrientedHexCTS(mg, nsd, xnlist, nsg)
+        pd = np.zeros(mg.number_of_nodes)
+        if Tectonicizer is LatticeNormalFault:
+            tect = LatticeNormalFault(2.0, mg, ca.node_state, ca.propid, pd, 0.0)
+            move = tect.do_offset
+        else:
+            tect = LatticeUplifter(mg, ca.node_state, ca.propid, pd, 0.0)
+            move = tect.uplift_interior_nodes
+
+        for i in range(10):
+            ca.run(0.5 * (i + 1))
+            move(ca=ca, current_time=ca.current_time, rock_state=1)
+            _check_events_and_link_states(ca, tect.links_to_update)
+
+        assert_array_equal(np.sort(ca.propid), np.arange(mg.number_of_nodes))
@@ -8,6 +8,7 @@ Created on Thu Jul  9 08:20:06 2015
 """
 
 import numpy as np
+import pytest
 from numpy.testing import assert_array_equal, assert_raises
 
 from landlab import HexModelGrid, RasterModelGrid
@@ -233,6 +234,227 @@ def test_priority_queue():
     assert item == 5, "incorrect item in PQ test"
 
 
+def test_link_priority_queue():
+    """Test that rescheduling a link replaces its event in the queue."""
+    from landlab.ca.cfuncs import LinkPriorityQueue
+
+    pq = LinkPriorityQueue(6)
+    for link, time in [(2, 2.2), (5, 5.5), (0, 0.11), (4, 4.4), (1, 1.1)]:
+        pq.push(link, time)
+    pq.push(5, 0.5)
+    pq.push(4, 0.5)
+    pq.discard(1)
+    pq.discard(3)
+
+    assert len(pq) == 4
+    assert [pq.pop()[2] for _ in range(4)] == [0, 5, 4, 2]
+    assert_raises(IndexError, pq.pop)
+    assert_raises(ValueError, pq.push, 6, 1.0)
+
+
+def test_link_priority_queue_matches_priority_queue():
+    """Test that events come off in the same order as with stale skipping."""
+    from landlab.ca.cfuncs import LinkPriorityQueue, PriorityQueue
+
+    rng = np.random.default_rng(1945)
+    links = rng.integers(0, 50, size=2000)
+    times = rng.random(2000).round(2)
+
+    pq, lpq = PriorityQueue(), LinkPriorityQueue(50)
+    next_update = np.full(50, -1.0)
+    pushed = set()
+    for link, time in zip(links, times):
+        if (link, time) in pushed:  # a stale event would look valid
+            continue
+        pushed.add((link, time))
+        pq.push(link, time)
+        lpq.push(link, time)
+        next_update[link] = time
+
+    expected = []
+    while pq._queue:
+        time, _, link = pq.pop()
+        if time == next_update[link]:
+            expected.append((time, link))
+    actual = []
+    while len(lpq) > 0:
+        time, _, link = lpq.pop()
+        actual.append((time, link))
+
+    assert actual == expected
+
+
+def test_link_priority_queue_relink():
+    """Test moving scheduled events to other links."""
+    from landlab.ca.cfuncs import LinkPriorityQueue
+
+    pq = LinkPriorityQueue(5)
+    for link in range(5):
+        pq.push(link, float(link))
+
+    next_update = np.array([0.0, 0.0, 1.0, 2.0, 9.0])
+    pq.relink(np.array([1, 2, 3, 4, 4]), next_update)
+
+    assert sorted((link, time) for (time, _, link) in pq._queue) == [
+        (1, 0.0),
+        (2, 1.0),
+        (3, 2.0),
+    ]
+
+
+def test_run_without_private_bit_generator(monkeypatch):
+    class _RandomStateWithoutBitGenerator:
+        pass
+
+    monkeypatch.setattr(np.random.mtrand, "_rand", _RandomStateWithoutBitGenerator())
+
+    grid = RasterModelGrid((3, 5))
+    nsd = {0: "zero", 1: "one"}
+    trn_list = [
+        Transition((0, 1, 0), (1, 0, 0), 1.0),
+        Transition((1, 0, 0), (0, 1, 0), 2.0),
+    ]
+    cts = RasterCTS(grid, nsd, trn_list, np.arange(15) % 2)
+    cts.run(1.0)
+    assert cts.current_time == 1.0
+    assert set(np.unique(cts.node_state)) <= {0, 1}
+
+
+def _partitioned_raster_cts(n_partitions=1, n_threads=1, seed=0):
+    mg = RasterModelGrid((40, 30))
+    nsd = {0: "empty", 1: "full"}
+    xnlist = [
+        Transition((0, 1, 0), (1, 0, 0), 1.0, swap_properties=True),
+        Transition((1, 0, 0), (0, 1, 0), 1.0, swap_properties=True),
+        Transition((0, 0, 0), (1, 0, 0), 0.1),
+        Transition((1, 1, 0), (0, 1, 0), 0.1),
+    ]
+    nsg = np.random.RandomState(1945).randint(0, 2, mg.number_of_nodes)
+    return RasterCTS(
+        mg,
+        nsd,
+        xnlist,
+        nsg,
+        prop_data=np.arange(mg.number_of_nodes, dtype=float),
+        prop_reset_value=-1.0,
+        seed=seed,
+        n_partitions=n_partitions,
+        n_threads=n_threads,
+    )
+
+
+def test_partitioned_run_is_reproducible():
+    ca = _partitioned_raster_cts(n_partitions=4)
+    ca.run(10.0)
+    assert ca.current_time == 10.0
+
+    for n_threads in (1, 3):
+        other = _partitioned_raster_cts(n_partitions=4, n_threads=n_threads)
+        other.run(10.0)
+        assert_array_equal(other.node_state, ca.node_state)
+        assert_array_equal(other.propid, ca.propid)
+        assert_array_equal(other.prop_data, ca.prop_data)
+        assert other.priority_queue._queue == ca.priority_queue._queue
+
+    other = _partitioned_raster_cts(n_partitions=4, seed=1)
+    other.run(10.0)
+    assert np.any(other.node_state != ca.node_state)
+
+
+def test_partitioned_run_is_consistent():
+    ca = _partitioned_raster_cts(n_partitions=3)
+    ca.run(10.0)
+
+    tail = ca.node_state[ca.grid.node_at_link_tail]
+    head = ca.node_state[ca.grid.node_at_link_head]
+    active = ca.grid.active_links
+    assert_array_equal(ca.link_state[active], (2 * tail + head)[active])
+
+    events = {link: time for time, _, link in ca.priority_queue._queue}
+    assert sorted(events) == list(np.flatnonzero(ca.next_trn_id != -1))
+    for link, time in events.items():
+        assert time == ca.next_update[link]
+        assert time > 10.0
+
+    assert sorted(ca.propid) == list(range(ca.grid.number_of_nodes))
+    reset = ca.prop_data == -1.0
+    assert np.any(reset)
+    assert_array_equal(ca.prop_data[~reset], np.flatnonzero(~reset))
+
+
+def test_partitioned_run_matches_serial_statistics():
+    serial = _partitioned_raster_cts()
+    parallel = _partitioned_raster_cts(n_partitions=3)
+    serial.run(10.0)
+    parallel.run(10.0)
+
+    core = serial.grid.core_nodes
+    assert (
+        abs(serial.node_state[core].mean() - parallel.node_state[core].mean())
+        < 0.05
+    )
+    n_serial = serial.priority_queue._n_popped
+    n_parallel = parallel.priority_queue._n_popped
+    assert abs(n_serial - n_parallel) < 0.05 * n_serial
+
+
+def test_partitioned_oriented_hex_cts():
+    mg = HexModelGrid((24, 8), node_layout="rect")
+    nsd = {0: "zero", 1: "one"}
+    xnlist = [
+        Transition((0, 1, 0), (1, 0, 0), 1.0, swap_properties=True),
+        Transition((0, 1, 1), (1, 0, 1), 2.0, swap_properties=True),
+        Transition((0, 1, 2), (1, 0, 2), 3.0),
+    ]
+    nsg = np.arange(mg.number_of_nodes) % 2
+    runs = [
+        OrientedHexCTS(
+            HexModelGrid((24, 8), node_layout="rect"),
+            nsd,
+            xnlist,
+            nsg,
+            n_partitions=2,
+            n_threads=n_threads,
+        )
+        for n_threads in (1, 2)
+    ]
+    for ca in runs:
+        ca.run(5.0)
+    assert_array_equal(runs[0].node_state, runs[1].node_state)
+    assert runs[0].priority_queue._n_popped > 0
+
+
+@pytest.mark.parametrize(
+    "kwds", [{"n_partitions": 3}, {"n_partitions": 0}, {"n_threads": 0}]
+)
+def test_partitioned_run_bad_keywords(kwds):
+    mg = RasterModelGrid((8, 3))
+    nsd = {0: "zero", 1: "one"}
+    nsg = np.zeros(mg.number_of_nodes, dtype=int)
+    xnlist = [Transition((0, 1, 0), (1, 0, 0), 1.0)]
+    with pytest.raises(ValueError):
+        RasterCTS(mg, nsd, xnlist, nsg, **kwds)
+
+
+def test_partitioned_run_errors():
+    nsd = {0: "zero", 1: "one"}
+    nsg = np.zeros(24, dtype=int)
+    xnlist = [Transition((0, 1, 0), (1, 0, 0), 1.0)]
+
+    with pytest.raises(ValueError):
+        RasterCTS(RasterModelGrid((8, 3)), nsd, xnlist, nsg, sync_interval=0.0)
+
+    ca = RasterCTS(RasterModelGrid((8, 3)), nsd, xnlist, nsg, n_partitions=2)
+    with pytest.raises(ValueError):
+        ca.run(1.0, plot_each_transition=True)
+
+    xnlist = [
+        Transition((0, 1, 0), (1, 0, 0), 1.0, True, prop_update_fn=callback_function)
+    ]
+    with pytest.raises(ValueError):
+        RasterCTS(RasterModelGrid((8, 3)), nsd, xnlist, nsg, n_partitions=2)
+
+
 def test_run_oriented_raster():
     """Test running with a small grid, 2 states, 4 transition types."""
 
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from landlab import RasterModelGrid
+from landlab.ca.celllab_cts import Transition
+from landlab.ca.node_state_recorder import NodeStateRecorder, read_node_state_frame
+from landlab.ca.raster_cts import RasterCTS
+
+
+def _raster_cts(shape=(20, 30)):
+    grid = RasterModelGrid(shape)
+    nsd = {0: "empty", 1: "full", 2: "other"}
+    xnlist = [
+        Transition((0, 1, 0), (1, 0, 0), 1.0),
+        Transition((1, 0, 0), (0, 1, 0), 1.0),
+        Transition((1, 2, 0), (2, 2, 0), 0.5),
+    ]
+    nsg = np.random.RandomState(1945).randint(0, 3, grid.number_of_nodes)
+    return RasterCTS(grid, nsd, xnlist, nsg)
+
+
+@pytest.mark.parametrize("keyframe_interval", [1, 3, 100])
+def test_frames_match_node_states(tmpdir, keyframe_interval):
+    ca = _raster_cts()
+    copies = [ca.node_state.copy()]
+    with tmpdir.as_cwd():
+        with NodeStateRecorder(ca, "states.nc", keyframe_interval) as recorder:
+            for time in np.linspace(0.1, 5.0, 20):
+                ca.run(time)
+                recorder.record()
+                copies.append(ca.node_state.copy())
+
+            assert len(recorder) == 21
+            for frame in (0, 1, 2, 3, 4, 7, 20, -1, -21):
+                assert_array_equal(recorder.frame(frame), copies[frame])
+
+        for frame, copy in enumerate(copies):
+            node_state, time = read_node_state_frame("states.nc", frame)
+            assert_array_equal(node_state, copy)
+        assert time == pytest.approx(5.0)
+
+
+def test_sparse_changes_make_small_file(tmpdir):
+    ca = _raster_cts((100, 100))
+    ca.trn_rate[:] = 1e-4
+    with tmpdir.as_cwd():
+        with NodeStateRecorder(ca, "states.nc") as recorder:
+            for time in range(1, 101):
+                ca.run(float(time))
+                recorder.record()
+        assert tmpdir.join("states.nc").size() < 0.01 * 101 * ca.node_state.nbytes
+
+
+def test_bad_keyframe_interval(tmpdir):
+    ca = _raster_cts()
+    with tmpdir.as_cwd():
+        with pytest.raises(ValueError):
+            NodeStateRecorder(ca, "states.nc", keyframe_interval=0)
+
+
+def test_frame_out_of_range(tmpdir):
+    ca = _raster_cts()
+    with tmpdir.as_cwd():
+        with NodeStateRecorder(ca, "states.nc") as recorder:
+            recorder.record()
+            with pytest.raises(IndexError):
+                recorder.frame(2)
+            with pytest.raises(IndexError):
+                recorder.frame(-3)
@@ -0,0 +1,150 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from landlab import HexModelGrid, RasterModelGrid
+from landlab.components import FlowAccumulator, PriorityFloodDepressionFinder
+
+
+def _noisy_grid(grid_type, seed):
+    if grid_type == "raster":
+        grid = RasterModelGrid((20, 25))
+    else:
+        grid = HexModelGrid((20, 25))
+    np.random.seed(seed)
+    z = grid.add_field(
+        "topographic__elevation",
+        0.01 * grid.x_of_node + np.random.rand(grid.number_of_nodes),
+        at="node",
+    )
+    return grid, z
+
+
+def _drains_to_boundary(grid):
+    receiver = grid.at_node["flow__receiver_node"]
+    node = np.arange(grid.number_of_nodes)
+    for _ in range(grid.number_of_nodes):
+        node = receiver[node]
+    return np.all(grid.status_at_node[node] != grid.BC_NODE_IS_CORE)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3, 4])
+@pytest.mark.parametrize(
+    "grid_type,director,routing",
+    [("raster", "D8", "D8"), ("raster", "D4", "D4"), ("hex", "Steepest", "D8")],
+)
+def test_matches_depression_finder_and_router(grid_type, director, routing, seed):
+    grid1, _ = _noisy_grid(grid_type, seed)
+    grid2, _ = _noisy_grid(grid_type, seed)
+
+    fa1 = FlowAccumulator(
+        grid1,
+        flow_director=director,
+        depression_finder="DepressionFinderAndRouter",
+        routing=routing,
+    )
+    fa1.run_one_step()
+    fa2 = FlowAccumulator(
+        grid2,
+        flow_director=director,
+        depression_finder="PriorityFloodDepressionFinder",
+        routing=routing,
+    )
+    fa2.run_one_step()
+
+    assert isinstance(fa2.depression_finder, PriorityFloodDepressionFinder)
+    assert fa2.depression_finder.number_of_lakes > 0
+    assert (
+        fa2.depression_finder.number_of_lakes == fa1.depression_finder.number_of_lakes
+    )
+    assert_array_almost_equal(
+        np.sort(fa2.depression_finder.lake_areas),
+        np.sort(fa1.depression_finder.lake_areas),
+    )
+    for name in ("flood_status_code", "depression__outlet_node"):
+        assert_array_equal(grid2.at_node[name], grid1.at_node[name])
+    assert_array_almost_equal(
+        grid2.at_node["depression__depth"], grid1.at_node["depression__depth"]
+    )
+
+    # DepressionFinderAndRouter chooses the receiver of an outlet before it
+    # has mapped all of the lakes around it, so only flow across the lakes
+    # themselves is expected to be the same
+    lake = fa2.depression_finder.lake_at_node
+    for name in ("flow__receiver_node", "flow__link_to_receiver_node"):
+        assert_array_equal(grid2.at_node[name][lake], grid1.at_node[name][lake])
+
+    outlets = fa2.depression_finder.lake_outlets
+    receivers = grid2.at_node["flow__receiver_node"][outlets]
+    assert np.all(grid2.at_node["depression__outlet_node"][receivers] != outlets)
+    assert _drains_to_boundary(grid2)
+
+
+def test_rerouting_with_supplied_pits(dans_grid3):
+    dans_grid3.fr.run_one_step()
+    df = PriorityFloodDepressionFinder(dans_grid3.mg)
+    df.map_depressions()
+
+    assert_array_equal(dans_grid3.mg.at_node["flow__receiver_node"], dans_grid3.r_new)
+    assert_array_almost_equal(dans_grid3.mg.at_node["drainage_area"], dans_grid3.A_new)
+    assert_array_equal(
+        dans_grid3.mg.at_node["flow__upstream_node_order"], dans_grid3.s_new
+    )
+    assert_array_equal(
+        dans_grid3.mg.at_node["flow__link_to_receiver_node"], dans_grid3.links_new
+    )
+    assert_array_equal(df.depression_outlet_map, dans_grid3.depr_outlet_target)
+
+
+@pytest.mark.parametrize("routing,n_lakes", [("D8", 1), ("D4", 3)])
+def test_d4_and_d8_routing(routing, n_lakes):
+    grid = RasterModelGrid((7, 7))
+    z = grid.add_field("topographic__elevation", grid.x_of_node + 1.0, at="node")
+    z[[10, 16, 17, 18, 24, 32, 33, 38, 40]] = 0.0
+    FlowAccumulator(grid, flow_director=routing).run_one_step()
+    df = PriorityFloodDepressionFinder(grid, routing=routing)
+    df.map_depressions()
+
+    assert df.number_of_lakes == n_lakes
+    assert _drains_to_boundary(grid)
+
+
+def test_lake_codes_are_deepest_nodes():
+    grid, z = _noisy_grid("raster", 3)
+    FlowAccumulator(grid, flow_director="D8").run_one_step()
+    df = PriorityFloodDepressionFinder(grid)
+    df.map_depressions()
+
+    for code, outlet in zip(df.lake_codes, df.lake_outlets):
+        lake = df.lake_map == code
+        assert np.all(df.depression_outlet_map[lake] == outlet)
+        assert z[code] == z[lake].min()
+    assert_array_equal(df.lake_codes, np.unique(df.lake_codes))
+
+
+def test_epsilon_makes_lakes_drain():
+    grid, z = _noisy_grid("raster", 4)
+    FlowAccumulator(grid, flow_director="D8").run_one_step()
+    df = PriorityFloodDepressionFinder(grid, epsilon=1e-6)
+    df.map_depressions()
+
+    lake = df.lake_at_node
+    receiver = grid.at_node["flow__receiver_node"]
+    assert np.all(df.water_level[lake] > df.water_level[receiver[lake]])
+    assert np.all(df.depression_depth >= 0.0)
+    assert _drains_to_boundary(grid)
+
+
+def test_negative_epsilon_raises():
+    grid, _ = _noisy_grid("raster", 0)
+    with pytest.raises(ValueError):
+        PriorityFloodDepressionFinder(grid, epsilon=-1.0)
+
+
+def test_all_boundaries_are_closed():
+    grid = RasterModelGrid((5, 5))
+    grid.add_zeros("topographic__elevation", at="node")
+    grid.set_closed_boundaries_at_grid_edges(True, True, True, True)
+    df = PriorityFloodDepressionFinder(grid)
+    with pytest.raises(ValueError):
+        df.map_depressions()
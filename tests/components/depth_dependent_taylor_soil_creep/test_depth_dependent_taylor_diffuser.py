@@ -68,6 +68,56 @@ def test_4x7_grid_vs_analytical_solution():
     )
 
 
+def test_4x7_grid_vs_analytical_solution_implicit():
+    """Test against known analytical solution, with ten times the time step."""
+    mg = RasterModelGrid((4, 7), xy_spacing=10.0)
+    mg.set_closed_boundaries_at_grid_edges(False, True, False, True)
+    z = mg.add_zeros("topographic__elevation", at="node")
+    mg.add_zeros("soil__depth", at="node")
+
+    weatherer = ExponentialWeatherer(
+        mg, soil_production__maximum_rate=0.0002, soil_production__decay_depth=0.5
+    )
+    diffuser = DepthDependentTaylorDiffuser(
+        mg,
+        linear_diffusivity=0.01,
+        slope_crit=0.8,
+        soil_transport_decay_depth=0.5,
+        solver="implicit",
+    )
+    z_bedrock = mg.at_node["bedrock__elevation"]
+
+    baselevel_rate = 0.0001
+    dt = 2500.0
+
+    # Run for 750 ky
+    for i in range(300):
+
+        z[mg.core_nodes] += baselevel_rate * dt
+        z_bedrock[mg.core_nodes] += baselevel_rate * dt
+
+        weatherer.calc_soil_prod_rate()
+        diffuser.run_one_step(dt)
+
+    my_nodes = mg.nodes[2, :]
+    np.testing.assert_allclose(
+        z[my_nodes], [0.0, 6.2, 10.7, 12.6, 10.7, 6.2, 0.0], atol=0.1
+    )
+    assert_array_equal(
+        np.round(mg.at_node["soil__depth"][8:13], 2),
+        np.array([0.35, 0.35, 0.35, 0.35, 0.35]),
+    )
+
+
+def test_bad_solver():
+    mg = RasterModelGrid((5, 5))
+    mg.add_zeros("soil__depth", at="node")
+    mg.add_zeros("topographic__elevation", at="node")
+    mg.add_zeros("soil_production__rate", at="node")
+    with pytest.raises(ValueError):
+        DepthDependentTaylorDiffuser(mg, solver="runge-kutta")
+
+
 def test_raise_stability_error():
     mg = RasterModelGrid((5, 5))
     soilTh = mg.add_zeros("soil__depth", at="node")
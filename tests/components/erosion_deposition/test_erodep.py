@@ -49,7 +49,8 @@ def test_extra_kwd_error_raised():
 
 def test_bad_solver_name():
     """
-    Test that any solver name besides 'basic' and 'adaptive' raises an error.
+    Test that any solver name besides 'basic', 'adaptive' and 'fused' raises
+    an error.
     """
 
     # set up a 5x5 grid with one open outlet node and low initial elevations.
@@ -211,3 +212,41 @@ def test_can_run_with_hex():
     s28 = sa_factor * (a28 ** -0.5)
     testing.assert_equal(np.round(s[18], 3), np.round(s18, 3))
     testing.assert_equal(np.round(s[28], 3), np.round(s28, 3))
+
+
+@pytest.mark.parametrize("depression_finder", [None, "DepressionFinderAndRouter"])
+@pytest.mark.parametrize("n_sp,sp_crit", [(1.0, 0.0), (1.5, 0.001)])
+def test_fused_matches_basic(depression_finder, n_sp, sp_crit):
+    """Test that the fused solver gives the same results as the basic one."""
+
+    def run(solver):
+        mg = RasterModelGrid((10, 12), xy_spacing=10.0)
+        mg.set_closed_boundaries_at_grid_edges(True, True, True, False)
+        z = mg.add_zeros("topographic__elevation", at="node")
+        z += (
+            np.random.default_rng(1945).random(z.size)
+            + 0.01 * mg.x_of_node
+            + 0.001 * mg.y_of_node
+        )
+
+        fa = FlowAccumulator(
+            mg, flow_director="D8", depression_finder=depression_finder
+        )
+        ed = ErosionDeposition(
+            mg,
+            K=0.01,
+            v_s=0.5,
+            m_sp=0.5,
+            n_sp=n_sp,
+            F_f=0.3,
+            sp_crit=sp_crit,
+            solver=solver,
+        )
+        for _ in range(10):
+            fa.run_one_step()
+            ed.run_one_step(dt=10.0)
+            z[mg.core_nodes] += 0.01
+        return z, mg.at_node["sediment__flux"]
+
+    for fused, basic in zip(run("fused"), run("basic")):
+        testing.assert_allclose(fused, basic, rtol=1e-12, atol=1e-15)
@@ -144,3 +144,31 @@ def test_subside_loads():
     out = np.zeros((n, n))
     dz = flex.subside_loads(load, out=out)
     assert dz is out
+
+
+def test_backend_names():
+    grid = RasterModelGrid((20, 20), xy_spacing=10e3)
+    grid.add_zeros("lithosphere__overlying_pressure_increment", at="node")
+    assert Flexure(grid).backend == "direct"
+    assert Flexure(grid, backend="fft").backend == "fft"
+    with pytest.raises(ValueError):
+        Flexure(grid, backend="bad-name")
+
+
+@pytest.mark.parametrize("shape", [(5, 4), (11, 11), (17, 30)])
+def test_fft_matches_direct(shape):
+    load = np.random.default_rng(1945).random(shape) * 1e7
+    load[::3] = 1e-7
+
+    dz = {}
+    for backend in ("direct", "fft"):
+        grid = RasterModelGrid(shape, xy_spacing=(1e4, 2e4))
+        grid.add_zeros("lithosphere__overlying_pressure_increment", at="node")
+        flex = Flexure(grid, method="flexure", eet=20e3, backend=backend)
+        dz[backend] = [flex.subside_loads(load)]
+
+        flex.eet = 30e3
+        dz[backend].append(flex.subside_loads(load))
+
+    for dz_fft, dz_direct in zip(dz["fft"], dz["direct"]):
+        assert dz_fft == pytest.approx(dz_direct, rel=1e-12, abs=1e-12)
@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from landlab import RasterModelGrid
+from landlab.components import FlowAccumulator
+from landlab.components.flow_accum import (
+    find_drainage_area_tiled,
+    find_flow_directions_tiled,
+)
+
+
+def _random_elevations(shape, seed=1945):
+    rng = np.random.default_rng(seed)
+    return rng.random(shape) + 0.05 * np.add.outer(
+        np.arange(shape[0]), np.arange(shape[1])
+    )
+
+
+def _drainage_area_of_grid(z, flow_director, xy_spacing=(1.0, 1.0), nodata=None):
+    grid = RasterModelGrid(z.shape, xy_spacing=xy_spacing)
+    grid.add_field("topographic__elevation", z.reshape(-1), at="node")
+    if nodata is not None:
+        grid.set_nodata_nodes_to_closed(grid.at_node["topographic__elevation"], nodata)
+    FlowAccumulator(grid, flow_director=flow_director).run_one_step()
+    return grid.at_node["drainage_area"].reshape(z.shape)
+
+
+@pytest.mark.parametrize("tile_shape", [(1, 1), (2, 3), (4, 4), (5, 100), (30, 41)])
+@pytest.mark.parametrize("method,flow_director", [("D8", "D8"), ("D4", "Steepest")])
+@pytest.mark.parametrize("xy_spacing", [(1.0, 1.0), (2.0, 3.0)])
+def test_matches_flow_accumulator(tile_shape, method, flow_director, xy_spacing):
+    z = _random_elevations((30, 41))
+    expected = _drainage_area_of_grid(z, flow_director, xy_spacing=xy_spacing)
+
+    actual = find_drainage_area_tiled(
+        z, tile_shape=tile_shape, xy_spacing=xy_spacing, method=method
+    )
+    assert_array_almost_equal(actual, expected)
+
+
+@pytest.mark.parametrize("tile_shape", [(1, 1), (3, 4), (12, 12)])
+def test_nodata_is_closed(tile_shape):
+    z = _random_elevations((12, 12))
+    z[3:6, 4] = -9999.0
+    expected = _drainage_area_of_grid(z, "D8", nodata=-9999.0)
+
+    z_with_nan = z.copy()
+    z_with_nan[3:6, 4] = np.nan
+    assert_array_almost_equal(
+        find_drainage_area_tiled(z, tile_shape=tile_shape, nodata=-9999.0), expected
+    )
+    assert_array_almost_equal(
+        find_drainage_area_tiled(z_with_nan, tile_shape=tile_shape), expected
+    )
+    assert np.all(
+        find_flow_directions_tiled(z, tile_shape=tile_shape, nodata=-9999.0)[3:6, 4]
+        == -1
+    )
+
+
+def test_flow_directions_are_independent_of_tiles():
+    z = _random_elevations((17, 13))
+    expected = find_flow_directions_tiled(z, tile_shape=z.shape)
+    for tile_shape in [(1, 1), (2, 5), (16, 3)]:
+        assert_array_equal(
+            find_flow_directions_tiled(z, tile_shape=tile_shape), expected
+        )
+
+
+def test_keep_flow_directions():
+    z = _random_elevations((9, 10))
+    flow_directions = np.empty(z.shape, dtype=np.int8)
+    find_drainage_area_tiled(z, tile_shape=(4, 4), flow_directions=flow_directions)
+    assert_array_equal(flow_directions, find_flow_directions_tiled(z))
+
+
+def test_memmap_in_and_out(tmpdir):
+    z = _random_elevations((20, 25))
+    with tmpdir.as_cwd():
+        z_on_disk = np.memmap("z.dat", dtype=float, mode="w+", shape=z.shape)
+        z_on_disk[:] = z
+        area_on_disk = np.memmap("area.dat", dtype=float, mode="w+", shape=z.shape)
+
+        out = find_drainage_area_tiled(z_on_disk, out=area_on_disk, tile_shape=(7, 6))
+
+        assert out is area_on_disk
+        assert_array_almost_equal(area_on_disk, _drainage_area_of_grid(z, "D8"))
+
+
+def test_netcdf_in_and_out(tmpdir):
+    netCDF4 = pytest.importorskip("netCDF4")
+    from landlab.io.netcdf import create_raster_netcdf, read_netcdf
+
+    z = _random_elevations((20, 25))
+    with tmpdir.as_cwd():
+        create_raster_netcdf("z.nc", z.shape, "topographic__elevation")
+        with netCDF4.Dataset("z.nc", "a") as root:
+            root["topographic__elevation"][:] = z
+        create_raster_netcdf(
+            "area.nc",
+            z.shape,
+            "drainage_area",
+            xy_spacing=(2.0, 2.0),
+            chunk_shape=(8, 8),
+        )
+
+        with netCDF4.Dataset("z.nc") as z_root, netCDF4.Dataset("area.nc", "a") as root:
+            find_drainage_area_tiled(
+                z_root["topographic__elevation"],
+                out=root["drainage_area"],
+                tile_shape=(8, 8),
+                xy_spacing=(2.0, 2.0),
+            )
+
+        grid = read_netcdf("area.nc")
+
+    assert grid.shape == z.shape
+    assert_array_almost_equal(
+        grid.at_node["drainage_area"].reshape(z.shape),
+        _drainage_area_of_grid(z, "D8", xy_spacing=(2.0, 2.0)),
+    )
+
+
+def test_bad_method():
+    with pytest.raises(ValueError):
+        find_flow_directions_tiled(np.zeros((3, 3)), method="MFD")
+
+
+def test_bad_tile_shape():
+    with pytest.raises(ValueError):
+        find_flow_directions_tiled(np.zeros((3, 3)), tile_shape=(0, 3))
@@ -1,9 +1,30 @@
 import numpy as np
+import pytest
 from numpy.testing import assert_array_equal
 
-from landlab.components.flow_accum import find_drainage_area_and_discharge
+from landlab import RasterModelGrid
+from landlab.components import FlowDirectorMFD, FlowDirectorSteepest
+from landlab.components.flow_accum import (
+    find_drainage_area_and_discharge,
+    make_ordered_node_array,
+)
+from landlab.components.flow_accum.flow_accum_bw import (
+    _DrainageStack,
+    _IncrementalStackBuilder,
+    _make_array_of_donors,
+    _make_delta_array,
+    _make_number_of_donors_array,
+    _StackBuilder,
+)
 from landlab.components.flow_accum.flow_accum_to_n import (
+    _make_array_of_donors_to_n,
+    _make_delta_array_to_n,
+    _make_number_of_donors_array_to_n,
+    _StackBuilderToN,
+    find_drainage_area_and_discharge_csr_to_n,
     find_drainage_area_and_discharge_to_n,
+    make_donor_csr_to_n,
+    make_ordered_node_array_to_n,
 )
 
 
@@ -49,3 +70,168 @@ def test_boundary_bw():
     a, q = find_drainage_area_and_discharge(s, r, boundary_nodes=[0])
     true_a = np.array([0.0, 2.0, 1.0, 1.0, 9.0, 4.0, 3.0, 2.0, 1.0, 1.0])
     assert_array_equal(a, true_a)
+
+
+def _recursive_stack(r):
+    nd = _make_number_of_donors_array(r)
+    delta = _make_delta_array(nd)
+    D = _make_array_of_donors(r, delta)
+    dstack = _DrainageStack(delta, D)
+    for k in np.where(r == np.arange(len(r)))[0]:
+        dstack.add_to_stack(k)
+    return dstack.s, nd, delta, D
+
+
+def test_stack_builder_matches_recursive():
+    grid = RasterModelGrid((20, 30))
+    grid.add_field(
+        "topographic__elevation",
+        np.random.RandomState(1973).rand(grid.number_of_nodes),
+        at="node",
+    )
+    FlowDirectorSteepest(grid).run_one_step()
+    r = grid.at_node["flow__receiver_node"]
+
+    s, nd, delta, D = _recursive_stack(r)
+
+    builder = _StackBuilder(grid.number_of_nodes)
+    for _ in range(2):
+        actual = builder.update(r)
+        assert_array_equal(actual[0], s)
+        assert_array_equal(actual[1], delta)
+        assert_array_equal(actual[2], D)
+        assert_array_equal(builder.nd, nd)
+
+    assert_array_equal(make_ordered_node_array(r), s)
+    assert_array_equal(make_ordered_node_array(r, nd, delta, D), s)
+
+
+def test_stack_builder_reuses_buffers():
+    r = np.array([2, 5, 2, 7, 5, 5, 6, 5, 7, 8]) - 1
+    builder = _StackBuilder(10)
+    first = builder.update(r)
+    second = builder.update(np.arange(10))
+    for a, b in zip(first, second):
+        assert a is b
+    assert_array_equal(builder.s, np.arange(10))
+    assert_array_equal(builder.nd, np.ones(10))
+
+
+def test_stack_builder_with_cycle():
+    r = np.array([2, 5, 2, 7, 5, 5, 6, 5, 7, 8]) - 1
+    builder = _StackBuilder(10)
+    builder.update(r)
+
+    r[[7, 8]] = [8, 7]
+    with pytest.raises(ValueError):
+        builder.update(r)
+
+
+def test_incremental_stack_builder_with_cycle():
+    r = np.array([2, 5, 2, 7, 5, 5, 6, 5, 7, 8]) - 1
+    a, q = np.zeros(10), np.zeros(10)
+    builder = _IncrementalStackBuilder(10)
+    builder.update(r)
+
+    r[[7, 8]] = [8, 7]
+    with pytest.raises(ValueError):
+        builder.update_and_accumulate(r, a, q, np.ones(10), np.ones(10))
+    with pytest.raises(RuntimeError):
+        builder.update_and_accumulate(r, a, q, np.ones(10), np.ones(10))
+    with pytest.raises(ValueError):
+        builder.update(r)
+
+
+def _mfd_receivers(shape, seed=1973):
+    grid = RasterModelGrid(shape)
+    grid.add_field(
+        "topographic__elevation",
+        grid.x_of_node + np.random.RandomState(seed).rand(grid.number_of_nodes),
+        at="node",
+    )
+    FlowDirectorMFD(grid, diagonals=True).run_one_step()
+    return (
+        grid.at_node["flow__receiver_node"],
+        grid.at_node["flow__receiver_proportions"],
+    )
+
+
+def test_donor_csr_matches_delta_and_donors():
+    r, p = _mfd_receivers((20, 30))
+    nd = _make_number_of_donors_array_to_n(r, p)
+    delta = _make_delta_array_to_n(nd)
+    D = _make_array_of_donors_to_n(r, p, delta)
+
+    indptr, indices, weights = make_donor_csr_to_n(r, p)
+
+    assert_array_equal(indptr, delta)
+    assert_array_equal(indices, D)
+    assert_array_equal(np.diff(indptr), nd)
+    for node in (0, 45, 311):
+        donors = indices[indptr[node] : indptr[node + 1]]
+        expected = [p[donor][r[donor] == node].sum() for donor in donors]
+        assert_array_equal(weights[indptr[node] : indptr[node + 1]], expected)
+
+
+def test_stack_to_n_is_topologically_sorted():
+    r, p = _mfd_receivers((20, 30))
+    s = make_ordered_node_array_to_n(r, p)
+
+    assert_array_equal(np.sort(s), np.arange(r.shape[0]))
+    position = np.empty_like(s)
+    position[s] = np.arange(len(s))
+    has_receiver = (p > 0) & (r != np.arange(r.shape[0]).reshape((-1, 1)))
+    donors, receivers = np.where(has_receiver)
+    assert np.all(position[r[donors, receivers]] < position[donors])
+
+
+def test_stack_to_n_with_cycle():
+    r = np.array([[0, -1], [2, -1], [1, -1], [1, 0]])
+    p = np.array([[1.0, 0.0], [1.0, 0.0], [1.0, 0.0], [0.5, 0.5]])
+    s = make_ordered_node_array_to_n(r, p)
+    assert_array_equal(s, [0, 1, 2, 3])
+
+
+def test_csr_accumulation_matches_to_n():
+    r, p = _mfd_receivers((20, 30))
+    runoff = np.random.RandomState(0).rand(r.shape[0])
+    indptr, indices, weights = make_donor_csr_to_n(r, p)
+    s = make_ordered_node_array_to_n(r, p, delta=indptr, D=indices)
+
+    expected = find_drainage_area_and_discharge_to_n(
+        s, r, p, runoff=runoff, boundary_nodes=[0]
+    )
+    actual = find_drainage_area_and_discharge_csr_to_n(
+        s, indptr, indices, weights, runoff=runoff, boundary_nodes=[0]
+    )
+    assert np.allclose(actual[0], expected[0])
+    assert np.allclose(actual[1], expected[1])
+
+
+def test_csr_accumulation_with_losses():
+    r, p = _mfd_receivers((20, 30))
+    indptr, indices, weights = make_donor_csr_to_n(r, p)
+    s = make_ordered_node_array_to_n(r, p)
+
+    a, q = find_drainage_area_and_discharge_csr_to_n(
+        s, indptr, indices, weights, runoff=-1.0
+    )
+    assert np.all(q == 0.0)
+    assert np.allclose(a, find_drainage_area_and_discharge_to_n(s, r, p)[0])
+
+
+def test_stack_builder_to_n_reuses_buffers():
+    r, p = _mfd_receivers((20, 30))
+    builder = _StackBuilderToN(r.shape[0])
+    first = builder.update(r, p)
+    indices = builder._indices
+
+    r_new, p_new = _mfd_receivers((20, 30), seed=1945)
+    second = builder.update(r_new, p_new)
+
+    assert first[0] is second[0]
+    assert first[1] is second[1]
+    assert builder._indices is indices
+    assert_array_equal(second[0], make_ordered_node_array_to_n(r_new, p_new))
+    assert_array_equal(builder.indices, make_donor_csr_to_n(r_new, p_new)[1])
+    assert_array_equal(builder.weights, make_donor_csr_to_n(r_new, p_new)[2])
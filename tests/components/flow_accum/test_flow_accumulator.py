@@ -12,7 +12,7 @@ from numpy.testing import assert_array_equal
 from landlab import FieldError, HexModelGrid, NetworkModelGrid, RasterModelGrid
 from landlab.components import LinearDiffuser
 from landlab.components.depression_finder.lake_mapper import DepressionFinderAndRouter
-from landlab.components.flow_accum import FlowAccumulator
+from landlab.components.flow_accum import FlowAccumulator, LossyFlowAccumulator
 from landlab.components.flow_director import (
     FlowDirectorD8,
     FlowDirectorDINF,
@@ -1216,3 +1216,115 @@ def test_with_lake_mapper_barnes():
     fa = FlowAccumulator(hmg_hole, depression_finder=LakeMapperBarnes)
     lmb = LakeMapperBarnes(hmg_hole)
     fa = FlowAccumulator(hmg_hole, depression_finder=lmb)
+
+
+@pytest.mark.parametrize(
+    "flow_director,depression_finder",
+    [("D8", None), ("Steepest", None), ("D8", "DepressionFinderAndRouter")],
+)
+def test_incremental_matches_full(flow_director, depression_finder):
+    grids = []
+    for _ in range(2):
+        grid = RasterModelGrid((20, 25))
+        z = grid.add_zeros("topographic__elevation", at="node")
+        z += grid.x_of_node + np.random.RandomState(42).rand(grid.number_of_nodes)
+        grids.append(grid)
+
+    full = FlowAccumulator(
+        grids[0], flow_director=flow_director, depression_finder=depression_finder
+    )
+    incremental = FlowAccumulator(
+        grids[1],
+        flow_director=flow_director,
+        depression_finder=depression_finder,
+        incremental=True,
+    )
+
+    rng = np.random.RandomState(1945)
+    for step in range(10):
+        perturbation = np.zeros(grids[0].number_of_nodes)
+        nodes = rng.choice(grids[0].core_nodes, size=5)
+        perturbation[nodes] = rng.uniform(-2.0, 2.0, size=5)
+        if step == 4:
+            perturbation[:] = 0.0
+        if step == 6:
+            for grid in grids:
+                grid.at_node["water__unit_flux_in"][nodes] = 3.0
+
+        for grid, fa in zip(grids, (full, incremental)):
+            grid.at_node["topographic__elevation"] += perturbation
+            fa.run_one_step()
+
+        for name in (
+            "drainage_area",
+            "surface_water__discharge",
+            "flow__upstream_node_order",
+            "flow__data_structure_delta",
+        ):
+            assert_array_equal(grids[1].at_node[name], grids[0].at_node[name])
+
+
+def test_incremental_not_allowed_with_losses():
+    grid = RasterModelGrid((5, 5))
+    grid.add_zeros("topographic__elevation", at="node")
+    with pytest.raises(ValueError):
+        LossyFlowAccumulator(grid, incremental=True)
+
+
+@pytest.mark.parametrize(
+    "flow_director,depression_finder",
+    [
+        ("D8", None),
+        ("D8", "DepressionFinderAndRouter"),
+        ("MFD", None),
+        ("DINF", None),
+    ],
+)
+def test_runoff_ensemble_matches_one_at_a_time(flow_director, depression_finder):
+    grid = RasterModelGrid((20, 25))
+    z = grid.add_zeros("topographic__elevation", at="node")
+    z += grid.x_of_node + np.random.RandomState(42).rand(grid.number_of_nodes)
+    fa = FlowAccumulator(
+        grid, flow_director=flow_director, depression_finder=depression_finder
+    )
+    fa.run_one_step()
+
+    runoff = np.random.RandomState(1945).rand(6, grid.number_of_nodes)
+    runoff[-1] -= 0.5
+    q = fa.accumulate_runoff_ensemble(runoff)
+
+    assert q.shape == runoff.shape
+    for scenario in range(runoff.shape[0]):
+        grid.at_node["water__unit_flux_in"][:] = runoff[scenario]
+        _, expected = fa.accumulate_flow(
+            update_flow_director=False, update_depression_finder=False
+        )
+        assert np.allclose(q[scenario], expected, atol=1e-5)
+
+
+def test_runoff_ensemble_before_accumulation():
+    grid = RasterModelGrid((5, 5))
+    grid.add_zeros("topographic__elevation", at="node")
+    fa = FlowAccumulator(grid)
+    with pytest.raises(RuntimeError):
+        fa.accumulate_runoff_ensemble(np.ones((2, 25)))
+
+
+def test_runoff_ensemble_bad_shape():
+    grid = RasterModelGrid((5, 5))
+    grid.add_zeros("topographic__elevation", at="node")
+    fa = FlowAccumulator(grid)
+    fa.run_one_step()
+    with pytest.raises(ValueError):
+        fa.accumulate_runoff_ensemble(np.ones(25))
+    with pytest.raises(ValueError):
+        fa.accumulate_runoff_ensemble(np.ones((2, 24)))
+
+
+def test_runoff_ensemble_not_allowed_with_losses():
+    grid = RasterModelGrid((5, 5))
+    grid.add_zeros("topographic__elevation", at="node")
+    fa = LossyFlowAccumulator(grid)
+    fa.run_one_step()
+    with pytest.raises(ValueError):
+        fa.accumulate_runoff_ensemble(np.ones((2, 25)))
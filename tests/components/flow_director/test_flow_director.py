@@ -394,3 +394,81 @@ def test_flow_director_steepest_flow__link_dir_field_creation():
     assert_array_equal(
         fd.flow_link_direction, np.array([1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1])
     )
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "flow_link_direction_at_node",
+        "flow_link_incoming_at_node",
+        "upstream_node_at_link",
+        "downstream_node_at_link",
+    ],
+)
+def test_flow_director_steepest_link_direction_cache(method):
+    mg = RasterModelGrid((5, 6))
+    z = mg.add_field("topographic__elevation", mg.node_x + mg.node_y, at="node")
+    fd = FlowDirectorSteepest(mg)
+    fd.run_one_step()
+
+    first = getattr(fd, method)()
+    assert getattr(fd, method)() is first
+    with pytest.raises(ValueError):
+        first[0] = 1
+
+    z[:] = -(mg.node_x + mg.node_y)
+    fd.run_one_step()
+    second = getattr(fd, method)()
+    assert second is not first
+    assert not np.array_equal(second, first)
+
+    expected = getattr(fd, "_calc_" + method)()
+    assert_array_equal(second, expected)
+
+
+@pytest.mark.parametrize("xy_spacing", [(1.0, 1.0), (2.0, 0.5)])
+@pytest.mark.parametrize("integer_elevations", [True, False])
+def test_flow_director_d8_matches_link_based_directions(xy_spacing, integer_elevations):
+    from landlab import LinkStatus
+    from landlab.components.flow_director import flow_directions
+
+    rng = np.random.default_rng(1973)
+    mg = RasterModelGrid((9, 11), xy_spacing=xy_spacing)
+    for node, status in zip(
+        rng.choice(mg.number_of_nodes, 20, replace=False),
+        rng.choice(
+            [
+                mg.BC_NODE_IS_FIXED_VALUE,
+                mg.BC_NODE_IS_FIXED_GRADIENT,
+                mg.BC_NODE_IS_CLOSED,
+            ],
+            20,
+        ),
+    ):
+        mg.status_at_node[node] = status
+
+    if integer_elevations:
+        z = rng.integers(0, 4, mg.number_of_nodes).astype(float)
+    else:
+        z = rng.random(mg.number_of_nodes)
+    mg.add_field("topographic__elevation", z, at="node")
+    FlowDirectorD8(mg).run_one_step()
+
+    link_slope = -mg.calc_grad_at_d8(z)
+    link_slope[mg.status_at_d8 != LinkStatus.ACTIVE] = 0
+    receiver, steepest_slope, sink, receiver_link = flow_directions(
+        z,
+        np.arange(mg.number_of_d8),
+        mg.nodes_at_d8[:, 0],
+        mg.nodes_at_d8[:, 1],
+        link_slope,
+        baselevel_nodes=np.where(
+            (mg.status_at_node == mg.BC_NODE_IS_FIXED_VALUE)
+            | (mg.status_at_node == mg.BC_NODE_IS_FIXED_GRADIENT)
+        )[0],
+    )
+
+    assert_array_equal(mg.at_node["flow__receiver_node"], receiver)
+    assert_array_almost_equal(mg.at_node["topographic__steepest_slope"], steepest_slope)
+    assert_array_equal(mg.at_node["flow__link_to_receiver_node"], receiver_link)
+    assert_array_equal(np.flatnonzero(mg.at_node["flow__sink_flag"]), sink)
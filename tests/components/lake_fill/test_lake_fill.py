@@ -1,5 +1,6 @@
 #!/usr/env/python
 
+import heapq
 from collections import deque
 
 import numpy as np
@@ -12,6 +13,7 @@ from landlab.components import (
     FlowDirectorSteepest,
     LakeMapperBarnes,
 )
+from landlab.components.lake_fill.lake_fill_barnes import LARGE_ELEV
 from landlab.utils import StablePriorityQueue
 
 
@@ -21,6 +23,78 @@ various docstrings.
 """
 
 
+def _fill_one_node_to_flat(fill_surface, all_neighbors, pitq, openq, closedq, dummy):
+    """Fill a single node to flat with the Barnes et al. algorithm.
+
+    A pure-Python reference for the compiled fill. Assumes openq and closedq
+    have already been set up per Barnes algos 2&3, lns 1-7. Raises KeyError
+    once both queues are exhausted.
+    """
+    try:
+        c = heapq.heappop(pitq)
+    except IndexError:
+        c = openq.pop_task()
+    cneighbors = all_neighbors[c]
+    openneighbors = cneighbors[np.logical_not(closedq[cneighbors])]
+    closedq[openneighbors] = True
+    for n in openneighbors:
+        if fill_surface[n] <= fill_surface[c]:
+            fill_surface[n] = fill_surface[c]
+            heapq.heappush(pitq, n)
+        else:
+            openq.add_task(n, priority=fill_surface[n])
+
+
+class _FillOneNodeToSlant:
+    """Fill a single node to a slant with the Barnes et al. algorithm.
+
+    A pure-Python reference for the compiled fill, called with the same
+    arguments as _fill_one_node_to_flat. It keeps the elevation of the top of
+    the current pit between calls, so that overfilling can be detected.
+    """
+
+    def __init__(self):
+        self.pit_top = LARGE_ELEV
+        self.overfill_flag = False
+
+    def __call__(
+        self, fill_surface, all_neighbors, pitq, openq, closedq, ignore_overfill
+    ):
+        try:
+            topopen = openq.peek_at_task()
+        except KeyError:
+            noopen = True
+        else:
+            noopen = False
+        nopit = len(pitq) == 0
+        if not (nopit or noopen) and topopen == pitq[0]:
+            c = openq.pop_task()
+            self.pit_top = LARGE_ELEV
+        if not nopit:
+            c = heapq.heappop(pitq)
+            if np.isclose(self.pit_top, LARGE_ELEV):
+                self.pit_top = fill_surface[c]
+        else:
+            c = openq.pop_task()
+            self.pit_top = LARGE_ELEV
+
+        for n in all_neighbors[c]:
+            if closedq[n]:
+                continue
+            closedq[n] = True
+            nextval = np.nextafter(fill_surface[c], LARGE_ELEV)
+            if fill_surface[n] <= nextval:
+                if self.pit_top < fill_surface[n] and nextval >= fill_surface[n]:
+                    if ignore_overfill:
+                        self.overfill_flag = True
+                    else:
+                        raise ValueError("Pit is overfilled")
+                fill_surface[n] = nextval
+                heapq.heappush(pitq, n)
+            else:
+                openq.add_task(n, priority=fill_surface[n])
+
+
 def test_route_to_multiple_error_raised_init():
     mg = RasterModelGrid((10, 10))
     z = mg.add_zeros("topographic__elevation", at="node")
@@ -164,13 +238,14 @@ def test_permitted_overfill():
     for edgenode in edges:
         open.add_task(edgenode, priority=z[edgenode])
     lmb._closed[edges] = True
+    fill_one_node = _FillOneNodeToSlant()
+    pit = []
     while True:
         try:
-            lmb._fill_one_node_to_slant(
-                z, mg.adjacent_nodes_at_node, lmb._pit, open, lmb._closed, True
-            )
+            fill_one_node(z, mg.adjacent_nodes_at_node, pit, open, lmb._closed, True)
         except KeyError:
             break
+    assert fill_one_node.overfill_flag
 
 
 def test_no_reroute():
@@ -201,3 +276,37 @@ def test_no_reroute():
     assert mg.at_node["flow__receiver_node"][6] == 1
     assert mg.at_node["flow__receiver_node"][17] == 18
     assert mg.at_node["flow__receiver_node"][18] == 19
+
+
+@pytest.mark.parametrize("fill_flat", [True, False])
+@pytest.mark.parametrize("method", ["Steepest", "D8"])
+def test_compiled_fill_matches_one_node_fill(fill_flat, method):
+    mg = RasterModelGrid((20, 25))
+    np.random.seed(0)
+    z = mg.add_field(
+        "topographic__elevation",
+        0.01 * mg.x_of_node + np.random.rand(mg.number_of_nodes),
+        at="node",
+    )
+    z_init = z.copy()
+    FlowAccumulator(mg)
+    lmb = LakeMapperBarnes(mg, method=method, fill_flat=fill_flat, ignore_overfill=True)
+    lmb.run_one_step()
+
+    fill_one_node = _fill_one_node_to_flat if fill_flat else _FillOneNodeToSlant()
+    z_ref = z_init.copy()
+    closed = lmb._closed.copy()
+    open = StablePriorityQueue()
+    for edgenode in lmb._edges:
+        open.add_task(edgenode, priority=z_ref[edgenode])
+    pit = []
+    while True:
+        try:
+            fill_one_node(z_ref, lmb._allneighbors, pit, open, closed, True)
+        except KeyError:
+            break
+
+    assert np.all(z == z_ref)
+    assert np.any(z > z_init)
+    lake_nodes = np.concatenate([list(lake) for lake in lmb.lake_dict.values()])
+    assert np.all(np.sort(lake_nodes) == np.where(z > z_init)[0])
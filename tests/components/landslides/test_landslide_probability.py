@@ -256,3 +256,87 @@ def test_calculate_landslide_probability_lognormal_spatial_method():
     np.testing.assert_almost_equal(
         grid_3.at_node["landslide__probability_of_failure"][9], 0.29999999
     )
+
+
+def _grid_for_chunks():
+    grid = RasterModelGrid((12, 10), xy_spacing=10.0)
+    rng = np.random.default_rng(1945)
+    n_nodes = grid.number_of_nodes
+    grid.at_node["topographic__slope"] = rng.uniform(0.3, 1.0, n_nodes)
+    grid.at_node["topographic__specific_contributing_area"] = rng.uniform(
+        30.0, 900.0, n_nodes
+    )
+    grid.at_node["soil__transmissivity"] = rng.uniform(5.0, 20.0, n_nodes)
+    grid.add_zeros("soil__saturated_hydraulic_conductivity", at="node")
+    cohesion = rng.uniform(1000.0, 10000.0, n_nodes)
+    grid.at_node["soil__mode_total_cohesion"] = cohesion
+    grid.at_node["soil__minimum_total_cohesion"] = cohesion - 500.0
+    grid.at_node["soil__maximum_total_cohesion"] = cohesion + 500.0
+    grid.at_node["soil__internal_friction_angle"] = rng.uniform(26.0, 40.0, n_nodes)
+    grid.at_node["soil__thickness"] = rng.uniform(1.0, 3.0, n_nodes)
+    grid.at_node["soil__density"] = np.full(n_nodes, 2000.0)
+    return grid
+
+
+_OUT_NAMES = (
+    "landslide__probability_of_failure",
+    "soil__probability_of_saturation",
+    "soil__mean_relative_wetness",
+)
+
+
+@pytest.mark.parametrize("n_threads", [1, 3])
+def test_chunks_are_reproducible(n_threads):
+    grid_serial, grid_chunks = _grid_for_chunks(), _grid_for_chunks()
+    LandslideProbability(
+        grid_serial, number_of_iterations=50, chunk_size=7, seed=3
+    ).calculate_landslide_probability()
+    LandslideProbability(
+        grid_chunks, number_of_iterations=50, chunk_size=7, seed=3, n_threads=n_threads
+    ).calculate_landslide_probability()
+    for name in _OUT_NAMES:
+        np.testing.assert_array_equal(
+            grid_chunks.at_node[name], grid_serial.at_node[name]
+        )
+
+
+@pytest.mark.parametrize(
+    "distribution,kwds",
+    [
+        ("uniform", {}),
+        (
+            "lognormal_spatial",
+            {
+                "groundwater__recharge_mean": np.full(120, 50.0),
+                "groundwater__recharge_standard_deviation": np.full(120, 20.0),
+            },
+        ),
+    ],
+)
+def test_chunks_match_node_by_node(distribution, kwds):
+    grid_nodes, grid_chunks = _grid_for_chunks(), _grid_for_chunks()
+    for grid, chunk_size in [(grid_nodes, None), (grid_chunks, 25)]:
+        LandslideProbability(
+            grid,
+            number_of_iterations=5000,
+            groundwater__recharge_distribution=distribution,
+            chunk_size=chunk_size,
+            **kwds
+        ).calculate_landslide_probability()
+
+    for name in _OUT_NAMES:
+        np.testing.assert_allclose(
+            grid_chunks.at_node[name], grid_nodes.at_node[name], atol=0.05
+        )
+    np.testing.assert_array_equal(
+        grid_chunks.at_node["soil__mean_relative_wetness"][grid_chunks.boundary_nodes],
+        0.0,
+    )
+
+
+@pytest.mark.parametrize(
+    "kwds", [{"chunk_size": 0}, {"chunk_size": 2.5}, {"n_threads": 0}]
+)
+def test_bad_chunk_args(kwds):
+    with pytest.raises(ValueError):
+        LandslideProbability(_grid_for_chunks(), **kwds)
@@ -11,6 +11,7 @@ to prevent grid changes damaging core component functionality.
 """
 
 import numpy as np
+import pytest
 from numpy.testing import assert_array_almost_equal
 
 from landlab import RasterModelGrid
@@ -245,3 +246,28 @@ def test_sniff_Perron():
         elapsed_time += dt
 
     assert_array_almost_equal(mg.at_node["topographic__elevation"], t_z)
+
+
+def _run_Perron(n_steps=10, **kwds):
+    mg = RasterModelGrid((12, 15), xy_spacing=(10.0, 12.0))
+    mg.set_closed_boundaries_at_grid_edges(True, False, True, False)
+    z = mg.add_zeros("topographic__elevation", at="node")
+    z[mg.core_nodes] = np.random.default_rng(1945).random(mg.number_of_core_nodes)
+    diffusion_component = PerronNLDiffuse(mg, nonlinear_diffusivity=0.5, **kwds)
+    for _ in range(n_steps):
+        z[mg.core_nodes] += 0.1
+        diffusion_component.run_one_step(200.0)
+    return z
+
+
+def test_Perron_iterative_solver():
+    assert_array_almost_equal(
+        _run_Perron(solver="iterative"), _run_Perron(solver="direct"), decimal=8
+    )
+
+
+def test_Perron_bad_solver():
+    mg = RasterModelGrid((5, 5))
+    mg.add_zeros("topographic__elevation", at="node")
+    with pytest.raises(ValueError):
+        PerronNLDiffuse(mg, solver="cholesky")
@@ -5,6 +5,7 @@ Unit tests for landlab.components.overland_flow.OverlandFlow
 last updated: 3/14/16
 """
 import numpy as np
+import pytest
 
 from landlab import RasterModelGrid
 from landlab.components.overland_flow import OverlandFlow
@@ -147,3 +148,116 @@ def test_deAlm_analytical_imposed_dt_long():
     hdeAlm = hdeAlm[1][1:]
     hdeAlm = np.append(hdeAlm, [0])
     np.testing.assert_almost_equal(h_analytical, hdeAlm, decimal=1)
+
+
+def _lake_grid(closed=False):
+    grid = RasterModelGrid((30, 40), xy_spacing=10.0)
+    grid.set_closed_boundaries_at_grid_edges(True, True, True, closed)
+    grid.add_field(
+        "topographic__elevation",
+        0.005 * grid.y_of_node
+        + 0.02 * np.random.default_rng(1945).random(grid.number_of_nodes),
+        at="node",
+    )
+    h = grid.add_zeros("surface_water__depth", at="node")
+    h[np.hypot(grid.x_of_node - 200.0, grid.y_of_node - 150.0) < 40.0] = 3.0
+    return grid
+
+
+@pytest.mark.parametrize("max_time_step_level", [-1, 1.5, "4"])
+def test_bad_max_time_step_level(max_time_step_level):
+    grid = _lake_grid()
+    with pytest.raises(ValueError):
+        OverlandFlow(
+            grid, local_time_stepping=True, max_time_step_level=max_time_step_level
+        )
+
+
+def test_local_time_stepping_level_zero_matches_global():
+    grid_global, grid_local = _lake_grid(), _lake_grid()
+    OverlandFlow(grid_global, steep_slopes=True).run_one_step(300.0)
+    OverlandFlow(
+        grid_local, steep_slopes=True, local_time_stepping=True, max_time_step_level=0
+    ).run_one_step(300.0)
+    np.testing.assert_array_equal(
+        grid_local.at_node["surface_water__depth"],
+        grid_global.at_node["surface_water__depth"],
+    )
+
+
+def test_local_time_stepping_conserves_mass():
+    grid = _lake_grid(closed=True)
+    h = grid.at_node["surface_water__depth"]
+    volume = h[grid.core_nodes].sum()
+    deAlm = OverlandFlow(grid, steep_slopes=True, local_time_stepping=True)
+    for _ in range(30):
+        deAlm.run_one_step(10.0)
+    assert np.all(np.isfinite(h))
+    assert h[grid.core_nodes].sum() == pytest.approx(volume, rel=0.01)
+
+
+def test_local_time_stepping_close_to_global():
+    grid_global, grid_local = _lake_grid(), _lake_grid()
+    OverlandFlow(grid_global, steep_slopes=True).run_one_step(300.0)
+    OverlandFlow(
+        grid_local, steep_slopes=True, local_time_stepping=True
+    ).run_one_step(300.0)
+    h_global = grid_global.at_node["surface_water__depth"]
+    h_local = grid_local.at_node["surface_water__depth"]
+    assert np.all(h_local >= 0.0)
+    assert np.abs(h_local - h_global).max() < 0.1
+    assert h_local.sum() == pytest.approx(h_global.sum(), rel=0.05)
+
+
+def test_active_set_with_local_time_stepping():
+    with pytest.raises(ValueError):
+        OverlandFlow(_lake_grid(), active_set=True, local_time_stepping=True)
+
+
+def test_negative_rainfall_at_nodes():
+    grid = _lake_grid()
+    with pytest.raises(ValueError):
+        OverlandFlow(grid, rainfall_intensity=np.full(grid.number_of_nodes, -1.0))
+
+
+def test_active_set_all_wet_matches_global():
+    grid_global, grid_active = _lake_grid(), _lake_grid()
+    OverlandFlow(grid_global, steep_slopes=True).run_one_step(300.0)
+    OverlandFlow(
+        grid_active, steep_slopes=True, active_set=True, wet_depth=0.0
+    ).run_one_step(300.0)
+    np.testing.assert_array_equal(
+        grid_active.at_node["surface_water__depth"],
+        grid_global.at_node["surface_water__depth"],
+    )
+
+
+def test_active_set_localized_rainfall():
+    grid_global, grid_active = _lake_grid(), _lake_grid()
+    grid_global.at_node["surface_water__depth"][:] = 0.0
+    grid_active.at_node["surface_water__depth"][:] = 0.0
+    rain = np.where(
+        np.hypot(grid_global.x_of_node - 200.0, grid_global.y_of_node - 150.0)
+        < 50.0,
+        1e-4,
+        0.0,
+    )
+    OverlandFlow(
+        grid_global, steep_slopes=True, rainfall_intensity=rain
+    ).run_one_step(600.0)
+    deAlm = OverlandFlow(
+        grid_active, steep_slopes=True, rainfall_intensity=rain, active_set=True
+    )
+    deAlm.run_one_step(600.0)
+
+    h_global = grid_global.at_node["surface_water__depth"]
+    h_active = grid_active.at_node["surface_water__depth"]
+    np.testing.assert_allclose(h_active, h_global, atol=0.005)
+
+    q = grid_active.at_link["surface_water__discharge"]
+    is_wet = h_active > 0.001
+    is_wet_link = (
+        is_wet[grid_active.node_at_link_tail] | is_wet[grid_active.node_at_link_head]
+    )
+    assert np.all(q[~is_wet_link] == 0.0)
+    assert np.count_nonzero(is_wet_link) < grid_active.number_of_links / 2
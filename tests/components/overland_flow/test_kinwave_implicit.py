@@ -9,9 +9,15 @@ Created on Sat Apr  1 10:49:33 2017
 """
 
 import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from scipy.optimize import newton
 
 from landlab import RasterModelGrid
 from landlab.components import KinwaveImplicitOverlandFlow
+from landlab.components.overland_flow.generate_overland_flow_implicit_kinwave import (
+    water_fn,
+)
 
 
 def test_initialization():
@@ -142,3 +148,50 @@ if __name__ == "__main__":
     test_first_iteration()
     test_steady_basic_ramp()
     test_curved_surface()
+
+
+@pytest.mark.parametrize("weight", [1.0, 0.6])
+@pytest.mark.parametrize("depth_exp", [1.5, 5.0 / 3.0])
+def test_matches_scipy_newton(weight, depth_exp):
+    """Compare against a node-by-node solution with scipy.optimize.newton."""
+    grid = RasterModelGrid((12, 15), xy_spacing=5.0)
+    np.random.seed(1973)
+    grid.add_field(
+        "topographic__elevation",
+        0.01 * grid.x_of_node
+        + 0.02 * grid.y_of_node
+        + 0.3 * np.random.rand(grid.number_of_nodes),
+        at="node",
+    )
+    kw = KinwaveImplicitOverlandFlow(
+        grid, runoff_rate=20.0, depth_exp=depth_exp, weight=weight
+    )
+
+    depth = np.zeros(grid.number_of_nodes)
+    for _ in range(5):
+        kw.run_one_step(10.0)
+
+        proportions = kw._flow_accum.flow_director._proportions
+        disch_in = np.zeros(grid.number_of_nodes)
+        for node in kw._nodes_ordered[::-1]:
+            if grid.status_at_node[node] != grid.BC_NODE_IS_CORE:
+                continue
+            area = grid.area_of_cell[grid.cell_at_node[node]]
+            old_depth = depth[node]
+            depth[node] = newton(
+                water_fn,
+                depth[node],
+                args=(
+                    kw._alpha[node],
+                    weight,
+                    old_depth,
+                    depth_exp,
+                    10.0 * kw.runoff_rate + 10.0 * disch_in[node] / area,
+                ),
+            )
+            h_eff = weight * depth[node] + (1.0 - weight) * old_depth
+            outflow = kw.vel_coef * h_eff ** depth_exp * kw._grad_width_sum[node]
+            disch_in[grid.adjacent_nodes_at_node[node]] += outflow * proportions[node]
+
+        assert_array_equal(grid.at_node["surface_water__depth"], depth)
+        assert_array_equal(grid.at_node["surface_water_inflow__discharge"], disch_in)
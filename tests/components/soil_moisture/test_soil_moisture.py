@@ -6,6 +6,9 @@ import numpy as np
 import pytest
 from numpy.testing import assert_array_almost_equal
 
+from landlab import RasterModelGrid
+from landlab.components import SoilMoisture
+
 (_SHAPE, _SPACING, _ORIGIN) = ((20, 20), (10e0, 10e0), (0.0, 0.0))
 _ARGS = (_SHAPE, _SPACING, _ORIGIN)
 
@@ -92,3 +95,71 @@ def test_field_initialized_to_zero(sm):
     for name in sm.grid["cell"]:
         field = sm.grid["cell"][name]
         assert_array_almost_equal(field, np.zeros(sm.grid.number_of_cells))
+
+
+def _grid_with_all_cover_types():
+    grid = RasterModelGrid((4, 6))
+    grid.at_cell["vegetation__plant_functional_type"] = np.array(
+        [0, 1, 2, 3, 4, 5, 0, 1]
+    )
+    grid.at_cell["vegetation__cover_fraction"] = np.array(
+        [0.2, 0.5, 0.8, 0.0, 0.3, 0.6, 0.9, 0.4]
+    )
+    grid.at_cell["vegetation__live_leaf_area_index"] = np.array(
+        [0.5, 1.0, 2.0, 0.0, 1.5, 3.0, 2.5, 0.8]
+    )
+    grid.at_cell["surface__potential_evapotranspiration_rate"] = np.array(
+        [2.0, 3.0, 4.0, 5.0, 6.0, 1.0, 3.5, 4.5]
+    )
+    grid.at_cell["soil_moisture__initial_saturation_fraction"] = np.array(
+        [0.9, 0.6, 0.45, 0.2, 0.12, 0.3, 0.5, 0.7]
+    )
+    grid.at_cell["rainfall__daily_depth"] = np.array(
+        [20.0, 0.0, 5.0, 0.0, 0.0, 40.0, 0.0, 10.0]
+    )
+    return grid
+
+
+@pytest.mark.parametrize(
+    "Tb,saturation,leakage,evapotranspiration",
+    [
+        (
+            2.0,
+            [0.876932193546, 0.59854749405, 0.455813953488, 0.19835150325]
+            + [0.119974176892, 0.3694096452, 0.497828515289, 0.735926460528],
+            [15.767066476962, 0.09978877927, 0.0, 0.0, 0.0, 0.0, 0.0, 1.418310986378],
+            [0.108680555556, 0.2125, 0.15, 0.106328040364]
+            + [0.00555196824, 0.00000833333, 0.280121527778, 0.2575],
+        ),
+        (
+            24.0,
+            [0.709647266098, 0.583864554412, 0.452862254025, 0.182418589688]
+            + [0.119692313808, 0.369409481216, 0.473942183463, 0.679490719213],
+            [36.151336006687, 0.91912080146, 0.0, 0.0, 0.0, 0.0, 0.0, 10.719495369172],
+            [1.304166666667, 2.55, 1.8, 1.134000965107]
+            + [0.066152531261, 0.0001, 3.361458333333, 3.09],
+        ),
+        (
+            400.0,
+            [0.471344010878, 0.395578996124, 0.402415026834, 0.120932187767]
+            + [0.115445757045, 0.369406678593, 0.191565980226, 0.409680489447],
+            [46.853518900883, 1.450515833315, 0.0, 0.0, 0.0, 0.0, 0.0, 20.318694768881],
+            [21.343103695893, 42.5, 30.0, 5.099873889009]
+            + [0.979162235228, 0.001666666667, 39.787988550883, 51.5],
+        ),
+    ],
+)
+def test_update_all_branches(Tb, saturation, leakage, evapotranspiration):
+    grid = _grid_with_all_cover_types()
+    SoilMoisture(grid, Tb=Tb).update()
+
+    assert_array_almost_equal(
+        grid.at_cell["soil_moisture__saturation_fraction"], saturation
+    )
+    assert_array_almost_equal(grid.at_cell["soil_moisture__root_zone_leakage"], leakage)
+    assert_array_almost_equal(
+        grid.at_cell["surface__evapotranspiration"], evapotranspiration
+    )
+    assert_array_almost_equal(
+        grid.at_cell["surface__runoff"], [6.9, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+    )
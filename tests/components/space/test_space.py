@@ -31,7 +31,8 @@ def test_route_to_multiple_error_raised():
 
 def test_bad_solver_name():
     """
-    Test that any solver name besides 'basic' and 'adaptive' raises an error.
+    Test that any solver name besides 'basic', 'adaptive' and 'fused' raises
+    an error.
     """
 
     # set up a 5x5 grid with one open outlet node and low initial elevations.
@@ -528,3 +529,47 @@ def test_can_run_with_hex():
         fa.run_one_step()
         sp.run_one_step(dt=dt)
         z[mg.core_nodes] += U * dt
+
+
+@pytest.mark.parametrize("depression_finder", [None, "DepressionFinderAndRouter"])
+@pytest.mark.parametrize("n_sp,sp_crit", [(1.0, 0.0), (1.5, 0.001)])
+@pytest.mark.parametrize("soil_depth", [0.0, 0.5, 200.0])
+def test_fused_matches_basic(depression_finder, n_sp, sp_crit, soil_depth):
+    """Test that the fused solver gives the same results as the basic one."""
+
+    def run(solver):
+        mg = RasterModelGrid((10, 12), xy_spacing=10.0)
+        mg.set_closed_boundaries_at_grid_edges(True, True, True, False)
+        z = mg.add_zeros("topographic__elevation", at="node")
+        rng = np.random.default_rng(1945)
+        z += rng.random(z.size) + 0.01 * mg.x_of_node + 0.001 * mg.y_of_node
+        h = mg.add_zeros("soil__depth", at="node")
+        h += soil_depth * rng.random(h.size)
+        br = mg.add_field("bedrock__elevation", z - h, at="node")
+
+        fa = FlowAccumulator(
+            mg, flow_director="D8", depression_finder=depression_finder
+        )
+        sp = Space(
+            mg,
+            K_sed=0.01,
+            K_br=0.001,
+            F_f=0.5,
+            phi=0.1,
+            H_star=1.0,
+            v_s=5.0,
+            m_sp=0.5,
+            n_sp=n_sp,
+            sp_crit_sed=sp_crit,
+            sp_crit_br=sp_crit,
+            solver=solver,
+        )
+        for _ in range(10):
+            fa.run_one_step()
+            sp.run_one_step(dt=10.0)
+            br[mg.core_nodes] += 0.01
+            z[mg.core_nodes] += 0.01
+        return z, h, mg.at_node["sediment__flux"]
+
+    for fused, basic in zip(run("fused"), run("basic")):
+        testing.assert_allclose(fused, basic, rtol=1e-10, atol=1e-12)
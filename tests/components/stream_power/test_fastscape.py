@@ -7,11 +7,16 @@ fastscape stream power component.
 import os
 
 import numpy
-from numpy.testing import assert_array_almost_equal
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 
 from landlab import RasterModelGrid
 from landlab.components import FlowAccumulator
 from landlab.components.stream_power import FastscapeEroder as Fsc
+from landlab.components.stream_power.cfuncs import (
+    brent_method_erode_fixed_threshold,
+    brent_method_erode_variable_threshold,
+)
 
 _THIS_DIR = os.path.abspath(os.path.dirname(__file__))
 
@@ -179,3 +184,63 @@ def test_fastscape_new():
     )
 
     assert_array_almost_equal(mg.at_node["topographic__elevation"], z_trg)
+
+
+@pytest.mark.parametrize("n_sp", [1.0, 2.0])
+@pytest.mark.parametrize("threshold", ["fixed", "variable"])
+def test_fastscape_threads_match_serial(n_sp, threshold):
+    elevations = []
+    for n_threads in (1, 4):
+        mg = RasterModelGrid((40, 30), xy_spacing=10.0)
+        numpy.random.seed(0)
+        z = mg.add_field(
+            "topographic__elevation", numpy.random.rand(mg.number_of_nodes), at="node"
+        )
+        if threshold == "fixed":
+            threshold_sp = 1.0e-4
+        else:
+            threshold_sp = mg.add_field(
+                "threshold", numpy.random.rand(mg.number_of_nodes) * 1.0e-4, at="node"
+            )
+        fa = FlowAccumulator(mg, flow_director="D8")
+        sp = Fsc(
+            mg, K_sp=0.01, n_sp=n_sp, threshold_sp=threshold_sp, n_threads=n_threads
+        )
+        for _ in range(5):
+            fa.run_one_step()
+            sp.run_one_step(10.0)
+            z[mg.core_nodes] += 0.1
+        elevations.append(z.copy())
+
+    assert_array_equal(elevations[0], elevations[1])
+
+
+@pytest.mark.parametrize("n_threads", [0, -1, 1.5])
+def test_fastscape_bad_n_threads(n_threads):
+    mg = RasterModelGrid((5, 5))
+    mg.add_zeros("topographic__elevation", at="node")
+    FlowAccumulator(mg)
+    with pytest.raises(ValueError):
+        Fsc(mg, n_threads=n_threads)
+
+
+@pytest.mark.parametrize("threshold", ["fixed", "variable"])
+def test_brent_failure_stops_before_writing(threshold):
+    # A single stream, 0 <- 1 <- 2 <- 3. With few iterations, Brent's method
+    # converges for the small alpha at node 1 but not for the large alpha at
+    # node 2.
+    src_nodes = numpy.array([0, 1, 2, 3])
+    dst_nodes = numpy.array([0, 0, 1, 2])
+    alpha = numpy.array([0.0, 1.0e-3, 10.0, 1.0e-3])
+    z = numpy.array([0.0, 1.0, 2.0, 3.0])
+
+    if threshold == "fixed":
+        erode, thresholds = brent_method_erode_fixed_threshold, 0.0
+    else:
+        erode, thresholds = brent_method_erode_variable_threshold, numpy.zeros(4)
+
+    with pytest.raises(RuntimeError, match="node 2"):
+        erode(src_nodes, dst_nodes, thresholds, alpha, 2.0, z, max_iter=5)
+
+    assert z[1] < 1.0
+    assert_array_equal(z[[0, 2, 3]], [0.0, 2.0, 3.0])
@@ -5,10 +5,13 @@ Created on Fri Mar  3 10:39:32 2017
 
 @author: KRB
 """
+import numpy as np
 import pytest
+from numpy.testing import assert_array_almost_equal
 
 from landlab import RasterModelGrid
 from landlab.components import TaylorNonLinearDiffuser
+from landlab.utils import make_core_node_matrix
 
 
 def test_raise_stability_error():
@@ -37,6 +40,68 @@ def test_infinite_taylor_error():
         Cdiff.soilflux(10)
 
 
+def test_bad_solver():
+    mg = RasterModelGrid((5, 5))
+    mg.add_zeros("topographic__elevation", at="node")
+    with pytest.raises(ValueError):
+        TaylorNonLinearDiffuser(mg, solver="runge-kutta")
+
+
+def test_implicit_linear_is_backward_euler():
+    mg = RasterModelGrid((5, 6), xy_spacing=2.0)
+    z = mg.add_field(
+        "topographic__elevation", np.random.rand(mg.number_of_nodes), at="node"
+    )
+    z_initial = z.copy()
+    diffuser = TaylorNonLinearDiffuser(
+        mg, linear_diffusivity=0.5, nterms=1, solver="implicit"
+    )
+    diffuser.run_one_step(10.0)
+
+    mat, rhs = make_core_node_matrix(mg, z_initial)
+    alpha = 0.5 * 10.0 / mg.dx ** 2
+    expected = np.linalg.solve(
+        np.eye(mg.number_of_core_nodes) - alpha * mat,
+        z_initial[mg.core_nodes] - alpha * rhs[:, 0],
+    )
+
+    assert_array_almost_equal(z[mg.core_nodes], expected)
+    assert_array_almost_equal(z[mg.boundary_nodes], z_initial[mg.boundary_nodes])
+
+
+def test_implicit_converges_to_explicit():
+    elevations = []
+    for solver, dt, n_steps, kwds in [
+        ("explicit", 1.0, 1, {"dynamic_dt": True, "courant_factor": 0.01}),
+        ("implicit", 1.0 / 32, 32, {}),
+    ]:
+        mg = RasterModelGrid((10, 12))
+        mg.set_closed_boundaries_at_grid_edges(False, True, False, True)
+        z = mg.add_zeros("topographic__elevation", at="node")
+        z += 0.05 * mg.x_of_node ** 2
+        diffuser = TaylorNonLinearDiffuser(
+            mg, linear_diffusivity=0.1, solver=solver, **kwds
+        )
+        for _ in range(n_steps):
+            diffuser.run_one_step(dt)
+        elevations.append(z)
+
+    np.testing.assert_allclose(elevations[0], elevations[1], atol=0.01)
+
+
+def test_implicit_large_step_is_stable():
+    mg = RasterModelGrid((5, 5))
+    z = mg.add_zeros("topographic__elevation", at="node")
+    z += mg.node_x.copy() ** 2
+    diffuser = TaylorNonLinearDiffuser(mg, solver="implicit")
+    diffuser.run_one_step(1000.0)
+
+    assert np.all(np.isfinite(z))
+    assert np.all(np.abs(mg.at_link["topographic__slope"]) <= 7.0)
+    assert np.all(z[mg.core_nodes] >= z[mg.boundary_nodes].min())
+    assert np.all(z[mg.core_nodes] <= z[mg.boundary_nodes].max())
+
+
 # def test_warn():
 #    mg = RasterModelGrid((5, 5))
 #    z = mg.add_zeros("topographic__elevation", at="node")
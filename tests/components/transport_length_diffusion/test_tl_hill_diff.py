@@ -8,7 +8,7 @@ Created on Thu Sep 21 16:52:10 2017
 
 import numpy as np
 import pytest
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_almost_equal, assert_array_equal
 
 from landlab import RasterModelGrid
 from landlab.components import (
@@ -318,3 +318,49 @@ def test_tl_hill_diff():
     )
     elev_out = mg.at_node["topographic__elevation"]
     assert_almost_equal(elev_out, elev_test, decimal=10)
+
+
+def test_tl_hill_diff_matches_node_by_node():
+    mg = RasterModelGrid((20, 25), xy_spacing=2.0)
+    mg.set_closed_boundaries_at_grid_edges(False, True, False, True)
+    z = mg.add_field(
+        "topographic__elevation",
+        np.random.RandomState(1945).rand(mg.number_of_nodes) * 3.0,
+        at="node",
+    )
+    fdir = FlowDirectorSteepest(mg)
+    tl_diff = TransportLengthHillslopeDiffuser(mg, erodibility=0.01, slope_crit=0.6)
+
+    receiver = mg.at_node["flow__receiver_node"]
+    slope = mg.at_node["topographic__steepest_slope"]
+    core = mg.core_nodes
+    dt = 1.0
+    flux_out = np.zeros(mg.number_of_nodes)
+    for _ in range(3):
+        fdir.run_one_step()
+        z_expected = z.copy()
+        flux_in = np.zeros(mg.number_of_nodes)
+        erosion = np.zeros(mg.number_of_nodes)
+        d_coeff = np.zeros(mg.number_of_nodes)
+        for i in core:
+            flux_in[receiver[i]] += flux_out[i]
+            if slope[i] >= 0.6:
+                d_coeff[i] = 1000000000.0
+            else:
+                d_coeff[i] = 1 / (1 - (np.power((slope[i] / 0.6), 2)))
+        depo = np.zeros(mg.number_of_nodes)
+        depo[core] = flux_in[core] / d_coeff[core]
+        for i in core:
+            if slope[i] > 0.6:
+                erosion[i] = mg.dx * (slope[i] - 0.6) / (100 * dt)
+            else:
+                erosion[i] = 0.01 * slope[i]
+            z_expected[i] += (-erosion[i] + depo[i]) * dt
+        trans = np.zeros(mg.number_of_nodes)
+        trans[core] = flux_in[core] - depo[core]
+        flux_out = erosion + trans
+
+        tl_diff.run_one_step(dt)
+
+        assert_array_equal(z, z_expected)
+        assert_array_equal(mg.at_node["sediment__flux_out"], flux_out)
@@ -6,6 +6,9 @@ import numpy as np
 import pytest
 from numpy.testing import assert_array_almost_equal
 
+from landlab import RasterModelGrid
+from landlab.components import Vegetation
+
 (_SHAPE, _SPACING, _ORIGIN) = ((20, 20), (10e0, 10e0), (0.0, 0.0))
 _ARGS = (_SHAPE, _SPACING, _ORIGIN)
 
@@ -90,3 +93,43 @@ def test_field_initialized_to_zero(veg):
     for name in veg.grid["cell"]:
         field = veg.grid["cell"][name]
         assert_array_almost_equal(field, np.zeros(veg.grid.number_of_cells))
+
+
+def test_update_all_branches():
+    grid = RasterModelGrid((4, 5))
+    grid.at_cell["vegetation__plant_functional_type"] = np.array([0, 0, 1, 2, 3, 5])
+    grid.at_cell["surface__potential_evapotranspiration_rate"] = np.array(
+        [4.0, 2.0, 3.0, 5.0, 1.0, 6.0]
+    )
+    grid.at_cell["surface__potential_evapotranspiration_30day_mean"] = np.array(
+        [5.0, 1.0, 3.0, 5.0, 1.0, 6.0]
+    )
+    grid.at_cell["surface__evapotranspiration"] = np.array(
+        [3.0, 0.5, 2.0, 4.0, 0.0, 1.5]
+    )
+    grid.at_cell["vegetation__water_stress"] = np.array([0.1, 0.9, 0.5, 0.2, 0.0, 0.7])
+
+    veg = Vegetation(grid, Tb=24.0, Tr=2.0, PETthreshold_switch=1)
+    veg.update()
+    veg.update()
+
+    assert_array_almost_equal(
+        grid.at_cell["vegetation__live_biomass"],
+        [99.185514909, 97.219646282, 103.6944592, 118.658173761, 0.0, 106.616225192],
+    )
+    assert_array_almost_equal(
+        grid.at_cell["vegetation__dead_biomass"],
+        [447.708588485, 454.767940942, 446.91393657, 444.641111351, 0.0, 443.451049024],
+    )
+    assert_array_almost_equal(
+        grid.at_cell["vegetation__live_leaf_area_index"],
+        [0.469453965, 0.462481853, 0.413099051, 0.45809307, 0.0, 0.421879748],
+    )
+    assert_array_almost_equal(
+        grid.at_cell["vegetation__dead_leaf_area_index"],
+        [1.530546035, 1.537518147, 1.586900949, 3.54190693, 0.0, 3.578120252],
+    )
+    assert_array_almost_equal(
+        grid.at_cell["vegetation__cover_fraction"],
+        [0.77686984, 0.77686984, 1.0, 1.0, 1.0, 1.0],
+    )
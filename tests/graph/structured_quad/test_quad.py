@@ -373,3 +373,39 @@ def test_link_dirs_at_node_raster():
         ],
     )
     assert graph.link_dirs_at_node.dtype == np.int8
+
+
+@mark.parametrize("shape", [(3, 4), (5, 2), (2, 2)])
+def test_lazy_graph_matches_eager_graph(shape):
+    eager = UniformRectilinearGraph(shape, spacing=(2.0, 3.0), origin=(1.0, -1.0))
+    lazy = UniformRectilinearGraph(
+        shape, spacing=(2.0, 3.0), origin=(1.0, -1.0), lazy=True
+    )
+    assert lazy.lazy
+
+    for name in (
+        "x_of_node",
+        "y_of_node",
+        "nodes_at_link",
+        "links_at_patch",
+        "links_at_node",
+        "link_dirs_at_node",
+        "patches_at_node",
+        "nodes_at_patch",
+        "number_of_links",
+        "number_of_patches",
+    ):
+        assert_array_equal(getattr(lazy, name), getattr(eager, name))
+    assert lazy.lazy
+
+    with raises(ValueError):
+        lazy.nodes_at_link[0] = [1, 0]
+
+    assert lazy.ds.equals(eager.ds)
+    assert not lazy.lazy
+    assert_array_equal(lazy.nodes_at_link, eager.nodes_at_link)
+
+
+def test_lazy_graph_can_not_be_sorted():
+    with raises(ValueError):
+        UniformRectilinearGraph((3, 4), sort=True, lazy=True)
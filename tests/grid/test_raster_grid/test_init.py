@@ -484,3 +484,26 @@ def test_diagonal_adjacent_nodes_at_node():
             ]
         )
     )
+
+
+def test_lazy_grid_matches_eager_grid():
+    eager = RasterModelGrid((5, 6), xy_spacing=(2.0, 3.0))
+    lazy = RasterModelGrid((5, 6), xy_spacing=(2.0, 3.0), lazy=True)
+
+    for name in (
+        "nodes_at_link",
+        "links_at_patch",
+        "node_at_cell",
+        "nodes_at_face",
+        "faces_at_cell",
+        "x_of_corner",
+        "link_at_face",
+        "status_at_link",
+        "d8s_at_node",
+        "cell_area_at_node",
+    ):
+        assert np.all(getattr(lazy, name) == getattr(eager, name))
+    assert lazy.lazy
+
+    assert lazy.ds.equals(eager.ds)
+    assert lazy.dual.ds.equals(eager.dual.ds)
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal
+
+from landlab import HexModelGrid, RasterModelGrid
+from landlab.utils import get_core_node_matrix, make_core_node_matrix_var_coef
+
+
+@pytest.mark.parametrize(
+    "grid", [RasterModelGrid((5, 6)), HexModelGrid((5, 4)), RasterModelGrid((3, 3))]
+)
+def test_sparse_matches_dense(grid):
+    grid.status_at_node[grid.perimeter_nodes[::3]] = grid.BC_NODE_IS_CLOSED
+    value = np.random.rand(grid.number_of_nodes)
+    coef = np.random.rand(grid.number_of_links)
+
+    mat, rhs = get_core_node_matrix(grid, value, coef_at_link=coef)
+    expected, _ = make_core_node_matrix_var_coef(grid, value, coef)
+
+    assert mat.shape == (grid.number_of_core_nodes, grid.number_of_core_nodes)
+    assert_array_almost_equal(mat.toarray(), expected)
+    assert rhs.shape == (grid.number_of_core_nodes, 1)
+
+
+def test_sparse_rhs_is_added_to():
+    grid = RasterModelGrid((3, 4))
+    value = np.arange(grid.number_of_nodes, dtype=float)
+    rhs = np.ones((grid.number_of_core_nodes, 1))
+
+    _, out = get_core_node_matrix(grid, value, rhs=rhs, coef_at_link=0.5)
+
+    assert out is rhs
+    assert_array_almost_equal(rhs.flatten(), [1.0 - 0.5 * 14.0, 1.0 - 0.5 * 19.0])
@@ -0,0 +1,106 @@
+#! /usr/bin/env python
+
+import numpy as np
+import pytest
+
+from landlab.utils import NodePriorityQueue, StablePriorityQueue
+
+
+def test_add_subtract_examine():
+    q = NodePriorityQueue(5)
+    q.add_task(2, priority=2)
+    q.add_task(1, priority=1)
+    q.add_task(0, priority=0)
+    q.add_task(3, priority=2)
+    q.remove_task(0)
+    assert len(q) == 3
+    assert 0 not in q
+    assert q.pop_task() == 1
+
+    assert q.peek_at_task() == 2
+
+    assert np.all(np.sort(q.tasks_currently_in_queue()) == np.array([2, 3]))
+
+    assert q.pop_task() == 2
+    assert q.pop_task() == 3
+    assert len(q) == 0
+
+
+def test_type_return():
+    q = NodePriorityQueue(3)
+    q.add_task(2, priority=2)
+    q.add_task(1, priority=1)
+    assert np.issubdtype(q.tasks_currently_in_queue().dtype, np.integer)
+
+
+def test_empty_pop():
+    q = NodePriorityQueue(3)
+    with pytest.raises(KeyError):
+        q.pop_task()
+
+
+def test_empty_peek():
+    q = NodePriorityQueue(3)
+    with pytest.raises(KeyError):
+        q.peek_at_task()
+
+
+def test_remove_missing():
+    q = NodePriorityQueue(3)
+    q.add_task(1)
+    with pytest.raises(KeyError):
+        q.remove_task(2)
+
+
+@pytest.mark.parametrize("node", [-1, 3])
+def test_out_of_range(node):
+    q = NodePriorityQueue(3)
+    with pytest.raises(ValueError):
+        q.add_task(node)
+    assert node not in q
+
+
+def test_overwrite():
+    q = NodePriorityQueue(2)
+    q.add_task(0, priority=5)
+    q.add_task(1, priority=1)
+    q.add_task(0, priority=0)
+    assert q.pop_task() == 0
+    assert len(q.tasks_currently_in_queue()) == 1
+
+
+def test_stable_for_equal_priorities():
+    q = NodePriorityQueue(10)
+    for node in [7, 2, 9, 0, 4]:
+        q.add_task(node, priority=1.0)
+    assert [q.pop_task() for _ in range(5)] == [7, 2, 9, 0, 4]
+
+
+def test_same_order_as_stable_priority_queue():
+    np.random.seed(42)
+    n_nodes = 50
+    q = NodePriorityQueue(n_nodes)
+    ref = StablePriorityQueue()
+    in_queue = set()
+    for _ in range(2000):
+        action = np.random.randint(3)
+        if action == 0 or not in_queue:
+            node = np.random.randint(n_nodes)
+            priority = float(np.random.randint(10))
+            q.add_task(node, priority=priority)
+            ref.add_task(node, priority=priority)
+            in_queue.add(node)
+        elif action == 1:
+            node = ref.pop_task()
+            assert q.pop_task() == node
+            in_queue.remove(node)
+        else:
+            node = list(in_queue)[np.random.randint(len(in_queue))]
+            q.remove_task(node)
+            ref.remove_task(node)
+            in_queue.remove(node)
+        assert len(q) == len(in_queue)
+    while in_queue:
+        node = ref.pop_task()
+        assert q.pop_task() == node
+        in_queue.remove(node)